@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QProgressDialog, QWidget
+
+# progress(done, total=None, text=None) – volatelné z pracovního vlákna
+ProgressFn = Callable[..., None]
+
+
+def run_with_progress(
+    parent: Optional[QWidget],
+    label: str,
+    fn: Callable[[ProgressFn, threading.Event], Any],
+    total: int = 0,
+    title: str = "Please wait",
+    minimum_duration_ms: int = 300,
+) -> Tuple[Any, bool]:
+    """Spustí ``fn(progress, cancel)`` v pracovním vlákně a mezitím ukazuje
+    modální QProgressDialog s tlačítkem Cancel; GUI vlákno dál zpracovává
+    události (okno se nezasekne).
+
+    ``progress(done, total=None, text=None)`` smí volat pracovní vlákno – jen
+    zapíše stav, dialog ho převezme v GUI vlákně. Cancel nastaví ``cancel``
+    (threading.Event); ``fn`` ho má průběžně kontrolovat a skončit.
+
+    Vrací ``(výsledek fn, zda bylo zrušeno)``. Výjimka z ``fn`` se znovu
+    vyhodí v GUI vlákně.
+    """
+    cancel = threading.Event()
+    state = {"done": 0, "total": int(total or 0), "text": None}
+    outcome: dict = {}
+
+    def progress(done: int, total: Optional[int] = None, text: Optional[str] = None) -> None:
+        state["done"] = int(done)
+        if total is not None:
+            state["total"] = int(total)
+        if text is not None:
+            state["text"] = text
+
+    def _run() -> None:
+        try:
+            outcome["result"] = fn(progress, cancel)
+        except BaseException as e:  # předá se do GUI vlákna
+            outcome["error"] = e
+
+    dlg = QProgressDialog(label, "Cancel", 0, max(state["total"], 0), parent)
+    dlg.setWindowTitle(title)
+    dlg.setWindowModality(Qt.WindowModal)
+    dlg.setMinimumDuration(minimum_duration_ms)
+    dlg.setAutoClose(False)
+    dlg.setAutoReset(False)
+    dlg.setValue(0)
+
+    worker = threading.Thread(target=_run, name="background-task", daemon=True)
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.03)
+            if dlg.maximum() != state["total"]:
+                dlg.setMaximum(max(state["total"], 0))
+            if state["total"]:
+                dlg.setValue(min(state["done"], state["total"]))
+            if state["text"]:
+                dlg.setLabelText(state["text"])
+            QApplication.processEvents()
+            if dlg.wasCanceled() and not cancel.is_set():
+                cancel.set()
+                dlg.setLabelText("Cancelling…")
+    finally:
+        dlg.close()
+        dlg.deleteLater()
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result"), cancel.is_set()
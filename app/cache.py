@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+# (size, mtime_ns) – stejný klíč jako manifest skenu (PdfScanner.file_stat)
+StatKey = Tuple[int, int]
+
+
+def file_stat(path: PathLike) -> Optional[StatKey]:
+    """(size, mtime_ns) souboru, nebo None, když neexistuje / nejde číst."""
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+    except OSError:
+        return None
+
+
+class FileCache:
+    """Omezená LRU cache hodnot odvozených ze souboru (hash, parsovaný záznam …).
+
+    Klíčem je cesta (tak, jak ji volající předá – typicky ``Path.resolve()``),
+    ke každé hodnotě se ukládá (size, mtime_ns) souboru v době výpočtu.
+    ``get`` soubor znovu stat-ne a při neshodě (změna, přesun, smazání)
+    položku zahodí – zastaralá hodnota se nikdy nevrátí. Nad ``maxsize``
+    položek se vyhazují nejdéle nepoužité. Počítadla ``hits`` / ``misses``
+    (z toho ``stale``) / ``evictions`` čte instrumentace (``counters``).
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._data: "OrderedDict[str, Tuple[StatKey, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, path: PathLike) -> bool:
+        # bez validace a bez počítadel (jen pro diagnostiku)
+        return str(path) in self._data
+
+    def get(self, path: PathLike, default: Any = None, stat: Optional[StatKey] = None) -> Any:
+        """Hodnota pro ``path``, pokud soubor od uložení nezměnil (size, mtime_ns).
+        ``stat`` = už známý stat (ušetří syscall), jinak se zjistí."""
+        key = str(path)
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        current = stat if stat is not None else file_stat(path)
+        if current is None or current != entry[0]:
+            del self._data[key]
+            self.stale += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, path: PathLike, value: Any, stat: Optional[StatKey] = None) -> None:
+        """Uloží hodnotu; ``stat`` by měl pocházet z doby, kdy se hodnota
+        počítala (jinak se zjistí teď). Neexistující soubor se neukládá."""
+        if stat is None:
+            stat = file_stat(path)
+            if stat is None:
+                return
+        key = str(path)
+        self._data[key] = (stat, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, path: PathLike, compute: Callable[[], Any]) -> Any:
+        """Hodnota z cache, jinak ``compute()``; stat se bere PŘED výpočtem,
+        takže změna souboru během výpočtu vede při příštím ``get`` na přepočet."""
+        stat = file_stat(path)
+        if stat is not None:
+            value = self.get(path, stat=stat)
+            if value is not None:
+                return value
+        else:
+            self.misses += 1
+        value = compute()
+        if stat is not None and value is not None:
+            self.put(path, value, stat)
+        return value
+
+    def invalidate(self, path: PathLike) -> None:
+        self._data.pop(str(path), None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def counters(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale,
+                "evictions": self.evictions, "size": len(self._data), "maxsize": self.maxsize}
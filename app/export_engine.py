@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import csv
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Kolik prvních řádků XLSX se podrží v paměti pro odhad šířek sloupců
+# (write-only list musí mít šířky nastavené před prvním řádkem).
+XLSX_WIDTH_SAMPLE = 500
+
+# tick(počet zapsaných řádků) – volá se po každém řádku; smí vyhodit ExportCancelled
+TickFn = Callable[[int], None]
+
+
+class ExportCancelled(Exception):
+    """Export byl přerušen uživatelem (Cancel v progress dialogu)."""
+
+
+def write_csv(path: str, headers: Sequence[str], rows: Iterable[Sequence[str]],
+              encoding: str = "utf-8", tick: Optional[TickFn] = None) -> int:
+    """Streamuje řádky do CSV (``csv.writer``); v paměti je vždy jen jeden řádek.
+    Vrací počet zapsaných datových řádků."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    n = 0
+    with open(path, "w", encoding=encoding, newline="") as f:
+        w = csv.writer(f)
+        w.writerow(headers)
+        for row in rows:
+            w.writerow(row)
+            n += 1
+            if tick is not None:
+                tick(n)
+    return n
+
+
+def write_xlsx(path: str, headers: Sequence[str], rows: Iterable[Sequence[str]],
+               sheet_title: str = "Export", bold_header: bool = True,
+               min_width: int = 0, max_width: int = 80,
+               tick: Optional[TickFn] = None) -> int:
+    """Streamuje řádky do XLSX přes openpyxl ``Workbook(write_only=True)``.
+
+    Buňky se neudržují v paměti (openpyxl je průběžně zapisuje do dočasného
+    souboru), hlavička sdílí jeden Font objekt. Šířky sloupců se odhadnou
+    z prvních ``XLSX_WIDTH_SAMPLE`` řádků. Bez openpyxl vyhodí ImportError.
+    Vrací počet zapsaných datových řádků.
+    """
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
+    except Exception as e:
+        raise ImportError("openpyxl not available") from e
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_title)
+
+    it = iter(rows)
+    sample: List[Sequence[str]] = []
+    for row in it:
+        sample.append(row)
+        if len(sample) >= XLSX_WIDTH_SAMPLE:
+            break
+
+    for col_idx, head in enumerate(headers, start=1):
+        max_len = len(str(head))
+        for row in sample:
+            if col_idx - 1 < len(row):
+                max_len = max(max_len, len(str(row[col_idx - 1])))
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max(min_width, max_len + 2), max_width)
+
+    if bold_header:
+        bold = Font(bold=True)  # jeden sdílený styl pro celou hlavičku
+
+        def _head(v):
+            c = WriteOnlyCell(ws, value=v)
+            c.font = bold
+            return c
+
+        ws.append([_head(h) for h in headers])
+    else:
+        ws.append(list(headers))
+
+    n = 0
+    for row in sample:
+        ws.append(list(row))
+        n += 1
+        if tick is not None:
+            tick(n)
+    sample.clear()
+    for row in it:
+        ws.append(list(row))
+        n += 1
+        if tick is not None:
+            tick(n)
+    wb.save(path)
+    return n
+
+
+# ---- Fan-out: jeden průchod daty → více writerů současně ----
+
+# Kolik řádků se posílá writerům najednou (jedna položka fronty)
+FANOUT_CHUNK = 256
+
+_END = object()
+_CANCEL = object()
+
+
+class Sink:
+    """Jeden výstupní soubor fan-out exportu.
+
+    ``write(rows)`` dostane iterable řádků (konzumuje ho ve vlastním vlákně),
+    ``key`` omezí sink na řádky s daným klíčem (např. board pro soubory po
+    boardech); ``None`` = všechny řádky.
+    """
+
+    def __init__(self, name: str, filename: str, write: Callable[[Iterable[Sequence[str]]], Any],
+                 key: Optional[str] = None) -> None:
+        self.name = name
+        self.filename = filename
+        self.write = write
+        self.key = key
+        self.error: Optional[BaseException] = None
+        self.rows = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._finished = threading.Event()
+
+    def _rows(self):
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            if item is _CANCEL:
+                raise ExportCancelled(self.filename)
+            self.rows += len(item)
+            yield from item
+
+    def _run(self) -> None:
+        try:
+            self.write(self._rows())
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._finished.set()
+
+    def _put(self, item) -> None:
+        # writer, který skončil chybou, už nic nečte → nečekej na plnou frontu
+        while not self._finished.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def fan_out(items: Iterable[Tuple[Optional[str], Sequence[str]]], sinks: List[Sink],
+            tick: Optional[TickFn] = None, cancel: Optional[threading.Event] = None,
+            chunk_size: int = FANOUT_CHUNK, queue_size: int = 16) -> bool:
+    """Přečte ``items`` (páry ``(klíč, řádek)``) **jednou** a každý řádek pošle
+    všem odpovídajícím sinkům. Každý sink zapisuje ve vlastním vlákně přes
+    omezenou frontu, takže formáty (a soubory po boardech) se píší souběžně a
+    paměť drží nanejvýš ``queue_size`` dávek po ``chunk_size`` řádcích na sink.
+
+    ``tick(n)`` se volá po každém přečteném řádku. Vrací False, pokud byl
+    export zrušen přes ``cancel`` (sinky pak dostanou ExportCancelled).
+    Chyby jednotlivých writerů jsou v ``Sink.error``.
+    """
+    for sink in sinks:
+        sink._queue = queue.Queue(maxsize=queue_size)
+    threads = [threading.Thread(target=s._run, name=f"export-{s.name}", daemon=True) for s in sinks]
+    for t in threads:
+        t.start()
+
+    # řádky se do front posílají po dávkách (fronta/zámek na řádek je drahý)
+    common = [s for s in sinks if s.key is None]
+    keyed: Dict[Optional[str], List[Sink]] = {}
+    for s in sinks:
+        if s.key is not None:
+            keyed.setdefault(s.key, []).append(s)
+    pending: Dict[Optional[str], list] = {}
+
+    def _flush(key) -> None:
+        chunk = pending.pop(key, None)
+        if chunk:
+            for sink in (common if key is None else keyed[key]):
+                sink._put(chunk)
+
+    cancelled = False
+    n = 0
+    try:
+        for key, row in items:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            for k in ((None,) if common else ()) + ((key,) if key in keyed else ()):
+                chunk = pending.setdefault(k, [])
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    _flush(k)
+            n += 1
+            if tick is not None:
+                tick(n)
+        if not cancelled:
+            for k in list(pending):
+                _flush(k)
+    except BaseException:
+        cancelled = True
+        raise
+    finally:
+        for sink in sinks:
+            sink._put(_CANCEL if cancelled else _END)
+        for t in threads:
+            t.join()
+    return not cancelled
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Manifest leží vedle exportu: "<export bez přípony>.manifest.json"
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(export_path: str) -> str:
+    """Cesta k manifestu pro export ``export_path`` (přípona formátu se zahodí)."""
+    base, _sep, ext = export_path.rpartition(".")
+    if not base or "/" in ext or "\\" in ext:
+        base = export_path
+    return base + MANIFEST_SUFFIX
+
+
+def row_digest(row: Sequence[str]) -> str:
+    """Hash exportovaných hodnot jednoho záznamu (mění se jen se změnou obsahu)."""
+    h = hashlib.sha1()
+    h.update("\x1f".join(row).encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+class ExportManifest:
+    """Per-record content hashes of one export.
+
+    ``records`` maps a stable record key (the source PDF path) to the digest of
+    its exported row and keeps the row order of the written file, so a later
+    delta export can tell added / modified / removed records apart and merge
+    them into the existing CSV/XLSX without re-reading any PDF.
+    """
+
+    def __init__(self, fields: Sequence[str], records: Optional[Dict[str, str]] = None,
+                 exported_at: Optional[str] = None) -> None:
+        self.fields: List[str] = list(fields)
+        self.records: Dict[str, str] = dict(records or {})
+        self.exported_at = exported_at or datetime.now().isoformat(timespec="seconds")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ExportManifest"]:
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+            if not isinstance(raw, dict) or raw.get("version") != MANIFEST_VERSION:
+                return None
+            return cls(raw.get("fields") or [], {k: d for k, d in raw.get("records") or []},
+                       raw.get("exported_at"))
+        except Exception:
+            return None
+
+    def save(self, path: str) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "exported_at": self.exported_at,
+            "fields": self.fields,
+            # list párů – zachová pořadí řádků v exportu
+            "records": [[k, d] for k, d in self.records.items()],
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def diff(self, current: "ExportManifest") -> Tuple[List[str], List[str], List[str]]:
+        """(přidané, změněné, odebrané) klíče ``current`` oproti tomuto manifestu."""
+        added, modified = [], []
+        for key, digest in current.records.items():
+            old = self.records.get(key)
+            if old is None:
+                added.append(key)
+            elif old != digest:
+                modified.append(key)
+        removed = [k for k in self.records if k not in current.records]
+        return added, modified, removed
+
+
+def read_export_rows(path: str) -> Tuple[List[str], List[List[str]]]:
+    """Načte (hlavička, řádky) existujícího CSV/XLSX exportu (pro merge delty)."""
+    if path.lower().endswith(".xlsx"):
+        try:
+            from openpyxl import load_workbook
+        except Exception as e:
+            raise ImportError("openpyxl not available") from e
+        wb = load_workbook(path, read_only=True)
+        try:
+            it = wb.active.iter_rows(values_only=True)
+            header = ["" if v is None else str(v) for v in next(it, ())]
+            rows = [["" if v is None else str(v) for v in r][:len(header)] for r in it]
+        finally:
+            wb.close()
+        # write-only XLSX ukládá prázdné buňky jako None → doplň na šířku hlavičky
+        return header, [r + [""] * (len(header) - len(r)) for r in rows]
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return header, [r for r in reader]
+
+
+def merge_rows(old_keys: Iterable[str], old_rows: Iterable[List[str]],
+               changed: Dict[str, List[str]], removed: Iterable[str],
+               added: Iterable[str]) -> Tuple[List[str], List[List[str]]]:
+    """Aplikuje změny na řádky dřívějšího exportu.
+
+    Zachová pořadí původního souboru, změněné řádky nahradí, odebrané vynechá
+    a nové připojí na konec. Vrací (klíče, řádky) v pořadí výsledného souboru.
+    """
+    gone = set(removed)
+    keys: List[str] = []
+    rows: List[List[str]] = []
+    for key, row in zip(old_keys, old_rows):
+        if key in gone:
+            continue
+        keys.append(key)
+        rows.append(changed.get(key, row))
+    for key in added:
+        keys.append(key)
+        rows.append(changed[key])
+    return keys, rows
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Velikost bloku při kopírování (čtení → hash → zápis)
+COPY_CHUNK = 1024 * 1024
+
+
+class CopyCancelled(Exception):
+    """Kopírování bylo přerušeno uživatelem (Cancel v progress dialogu)."""
+
+
+def copy_with_hash(src: Path, dst: Path, cancel: Optional[threading.Event] = None) -> str:
+    """Zkopíruje ``src`` → ``dst`` a zároveň spočítá SHA-256 zapisovaných dat.
+
+    Soubor se čte jen jednou (hash cílové kopie netřeba počítat dalším čtením).
+    Zapisuje se do ``<dst>.part`` a po dokončení se atomicky přejmenuje, takže
+    přerušená kopie nezanechá poloviční PDF. Metadata (mtime, práva) se
+    přenesou jako u ``shutil.copy2``. Vrací hex digest.
+    """
+    src = Path(src)
+    dst = Path(dst)
+    tmp = dst.with_name(dst.name + ".part")
+    h = hashlib.sha256()
+    try:
+        with src.open("rb") as fin, tmp.open("wb") as fout:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise CopyCancelled(str(src))
+                chunk = fin.read(COPY_CHUNK)
+                if not chunk:
+                    break
+                h.update(chunk)
+                fout.write(chunk)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    return h.hexdigest()
+
+
+# ---- Režimy exportu do Sorted PDFs (nastavení "sorted_copy_mode") ----
+#   copy    – plná kopie (výchozí, chování do 0.16h)
+#   reflink – reflink/clone (btrfs, XFS, APFS), jinak plná kopie
+#   link    – reflink → hardlink (stejný svazek) → plná kopie
+COPY_MODES = ("copy", "reflink", "link")
+
+# Linux: ioctl FICLONE = _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+def _sha256_file(path: Path, cancel: Optional[threading.Event] = None) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled(str(path))
+            chunk = fh.read(COPY_CHUNK)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _reflink(src: Path, tmp: Path) -> bool:
+    """Reflink ``src`` → ``tmp`` (sdílené bloky, copy-on-write). False = FS to neumí."""
+    import sys
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with src.open("rb") as fin, tmp.open("wb") as fout:
+                fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+            return True
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+    if sys.platform == "darwin":
+        # APFS: clonefile(2) z libSystem
+        import ctypes
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            clonefile = libc.clonefile
+        except (OSError, AttributeError):
+            return False
+        clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int)
+        return clonefile(os.fsencode(str(src)), os.fsencode(str(tmp)), 0) == 0
+    return False
+
+
+def _hardlink(src: Path, tmp: Path) -> bool:
+    try:
+        if src.stat().st_dev != tmp.parent.stat().st_dev:
+            return False
+        os.link(src, tmp)
+        return True
+    except OSError:
+        return False
+
+
+def export_file(src: Path, dst: Path, mode: str = "copy",
+                cancel: Optional[threading.Event] = None) -> Tuple[str, str]:
+    """Umístí ``src`` do ``dst`` podle režimu (viz COPY_MODES) a vrátí
+    ``(sha256, použitá metoda)``, metoda je ``reflink`` / ``hardlink`` / ``copy``.
+
+    Hash se počítá vždy: u kopie při zápisu, u reflinku/hardlinku jedním
+    čtením zdroje (obsah je identický), takže Sorted indikátor funguje ve
+    všech režimech. Cíl vzniká jako ``<dst>.part`` a atomicky se přejmenuje.
+    Pozor: hardlink sdílí data se zdrojem – změna zdrojového PDF na místě se
+    projeví i v Sorted PDFs (reflink je copy-on-write, tam to neplatí).
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if mode in ("reflink", "link"):
+        tmp = dst.with_name(dst.name + ".part")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        for method, fn in (("reflink", _reflink), ("hardlink", _hardlink)):
+            if method == "hardlink" and mode != "link":
+                break
+            if fn(src, tmp):
+                try:
+                    if method == "reflink":
+                        shutil.copystat(src, tmp)
+                    digest = _sha256_file(tmp, cancel)
+                    os.replace(tmp, dst)
+                    if tmp.exists():
+                        # rename() mezi dvěma hardlinky téhož souboru nic neudělá
+                        tmp.unlink()
+                except BaseException:
+                    try:
+                        tmp.unlink()
+                    except OSError:
+                        pass
+                    raise
+                return digest, method
+    return copy_with_hash(src, dst, cancel), "copy"
@@ -12,6 +12,7 @@ from PySide6.QtWidgets import (
 )
 
 from .pdf_scanner import PdfScanner, PdfRecord
+from .record_store import RecordStore
 from .istqb_boards import KNOWN_BOARDS
 
 
@@ -30,6 +31,18 @@ from .istqb_boards import KNOWN_BOARDS
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QApplication, QStyle
 
+# Role na buňce "File name" v Overview: celočíselné ID záznamu v RecordStore
+# (UserRole + 1 drží absolutní cestu).
+ROLE_RECORD_ID = Qt.UserRole + 2
+
+# Paralelní kopírování při exportu do Sorted PDFs (I/O-bound → pár vláken stačí)
+EXPORT_COPY_WORKERS = 4
+
+# Max. počet SHA-256 v cache (_hash_cache); nejdéle nepoužité se vyhazují
+HASH_CACHE_SIZE = 20000
+# Naposledy parsované soubory pro detail panelů (_parse_cache)
+PARSE_CACHE_SIZE = 256
+
 class BoardHidingDelegate(QStyledItemDelegate):
     """
     Vykreslovací delegát pro sloupec 'Board':
@@ -87,6 +100,14 @@ class RecordsModel(QSortFilterProxyModel):
         self.headers = headers
         self.search = ""
         self.board_filter = "All"
+        # Sdílený sloupcový store (řádek zdrojového modelu == ID záznamu).
+        # Když je k dispozici, filtr čte hodnoty z něj, ne z buněk modelu.
+        self.store: Optional[RecordStore] = None
+        self._extra_cols: Optional[list[int]] = None
+
+    def set_store(self, store: Optional[RecordStore]) -> None:
+        self.store = store
+        self._extra_cols = None
 
     def set_search(self, text: str) -> None:
         self.search = text.lower().strip()
@@ -100,6 +121,9 @@ class RecordsModel(QSortFilterProxyModel):
         model = self.sourceModel()
         if model is None:
             return True
+        store = self.store
+        if store is not None and 0 <= source_row < len(store) and not source_parent.isValid():
+            return self._accepts_from_store(store, model, source_row)
         # Board filter is based on column 0 (Board)
         idx_board = model.index(source_row, 0, source_parent)
         board_val = (model.data(idx_board, Qt.DisplayRole) or "").strip()
@@ -117,6 +141,26 @@ class RecordsModel(QSortFilterProxyModel):
                 return True
         return False
 
+    def _accepts_from_store(self, store: RecordStore, model, source_row: int) -> bool:
+        if self.board_filter != "All":
+            if (store.column("board")[source_row] or "").strip() != self.board_filter:
+                return False
+        if not self.search:
+            return True
+        if self.search in store.search_text(source_row):
+            return True
+        # Sloupce mimo záznam (Sorted, Status) žijí jen v modelu
+        if self._extra_cols is None:
+            self._extra_cols = [
+                c for c in range(model.columnCount())
+                if str(model.headerData(c, Qt.Horizontal) or "").strip() in ("Sorted", "Status")
+            ]
+        for c in self._extra_cols:
+            val = (model.data(model.index(source_row, c), Qt.DisplayRole) or "").lower()
+            if self.search in val:
+                return True
+        return False
+
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         """Řazení: Board → Application Type → Candidate Name."""
         model = self.sourceModel()
@@ -154,6 +198,25 @@ class MainWindow(QMainWindow):
         self.settings = AppSettings()
         self.settings.load()
 
+        # Časy fází pomalých cest (rescan …) – dialog Performance, perf_log.jsonl
+        from app.perf import PerfRecorder, perf_log_path
+        self.perf = PerfRecorder(perf_log_path(self.settings.path), on_finish=self._perf_show_summary)
+        # SHA-256 souborů (Sorted indikátor, export): omezená LRU, platnost
+        # ověřená (size, mtime_ns) při čtení – změněný/přesunutý soubor se přepočte
+        from app.cache import FileCache
+        self._hash_cache = FileCache(HASH_CACHE_SIZE)
+        self.perf.register_cache("hash", self._hash_cache)
+        # Klíče Sorted DB, jejichž hash se doplnit nepodařilo → (size, mtime_ns) v té
+        # době (None = soubor chyběl); znovu se zkusí až po změně souboru
+        self._hash_backfill_failed: dict = {}
+        # Záznamy jednotlivě parsovaných PDF (detail PDF Browser / Sorted PDFs)
+        self._parse_cache = FileCache(PARSE_CACHE_SIZE)
+        self.perf.register_cache("parse", self._parse_cache)
+        # Volitelně i paměť (tracemalloc) kolem měřených běhů – memory_log.jsonl
+        self.memtrack = None
+        if self.settings.get("memory_tracking", False):
+            self._start_memory_tracking()
+
         # PDF root precedence: CLI argument > saved setting > default
         saved_pdf = self.settings.get("pdf_root")
         if cli_pdf_root is not None:
@@ -176,10 +239,8 @@ class MainWindow(QMainWindow):
             self.sorted_root = (Path.cwd() / "Sorted PDFs").resolve()
         self.settings.set("sorted_root", str(self.sorted_root))
 
-        # DB pro Sorted PDFs
-        from app.sorted_db import SortedDb
-        self.sorted_db = SortedDb(self.sorted_root)
-        self.sorted_db.load()
+        # DB pro Sorted PDFs (backend JSON / SQLite dle nastavení)
+        self.sorted_db = self._open_sorted_db()
 
         # Workflow status store (per-PDF stav)
         from app.status_store import StatusStore
@@ -187,6 +248,8 @@ class MainWindow(QMainWindow):
         self.status_store.load()
 
         self.records: List[PdfRecord] = []
+        # Sloupcový store nad self.records – společný zdroj dat pro všechny záložky
+        self.store = RecordStore()
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
@@ -206,14 +269,27 @@ class MainWindow(QMainWindow):
 
         self._build_menu()
         self._build_overview_tab()
-        self._build_browser_tab()
-        self._build_sorted_tab()
-        self._build_contacts_tab()
-        self._build_recognized_tab()
-        self._build_summary_tab()
+        # Ostatní záložky se sestaví až při první aktivaci (viz _ensure_tab_built):
+        # (modul app.tabs.* a jeho mixin – importuje se až tehdy, stavba,
+        # co po sestavení dotáhnout (data, rozměry)).
+        self._lazy_tabs = {
+            self.browser_tab: ("pdf_browser", "BrowserTab", "_build_browser_tab", "_apply_browser_sizes"),
+            self.sorted_tab: ("sorted_pdfs", "SortedTab", "_build_sorted_tab", "rescan_sorted"),
+            self.contacts_tab: ("board_contacts", "ContactsTab", "_build_contacts_tab", None),
+            self.recognized_tab: ("recognized_people", "RecognizedTab", "_build_recognized_tab", None),
+            self.summary_tab: (None, None, "_build_summary_tab", "_refresh_summary"),
+        }
+        self.tabs.currentChanged.connect(self._on_tab_activated)
 
-        self.rescan()
-        self.rescan_sorted()
+        # Overview hned z posledního snapshotu; sladění s diskem (jen změněné
+        # soubory) běží na pozadí až po zobrazení okna (_start_background_scan).
+        try:
+            from app.scan_snapshot import load_snapshot, snapshot_path
+            self._warm_snapshot = load_snapshot(snapshot_path(self.settings.path), self.pdf_root)
+        except Exception:
+            self._warm_snapshot = None
+        if self._warm_snapshot is not None:
+            self.rescan(snapshot=self._warm_snapshot)
         self._init_fs_watcher()
 
         self._restore_window_geometry()
@@ -221,6 +297,518 @@ class MainWindow(QMainWindow):
 
         from PySide6.QtCore import QTimer
         QTimer.singleShot(0, self._apply_global_sizing_once)
+        QTimer.singleShot(0, self._start_background_scan)
+        # watchdog až s běžícím event loopem (stavba okna není zaseknutí)
+        QTimer.singleShot(0, self._start_watchdog)
+
+    def _start_watchdog(self) -> None:
+        """Hlídání zaseknutí GUI (app/watchdog.py): stack GUI vlákna + aktivní
+        handler do stall_log.jsonl, po uvolnění hláška ve status baru."""
+        try:
+            threshold = int(self.settings.get("stall_threshold_ms", 750) or 0)
+        except (TypeError, ValueError):
+            threshold = 0
+        if threshold <= 0 or getattr(self, "_watchdog", None) is not None:
+            return
+        from app.watchdog import GuiWatchdog, stall_log_path
+        self._watchdog = GuiWatchdog(self, threshold, stall_log_path(self.settings.path), parent=self)
+        self._watchdog.stalled.connect(self._on_gui_stalled)
+        self._watchdog.start()
+
+    def _on_gui_stalled(self, seconds: float, handler: str) -> None:
+        try:
+            self.statusBar().showMessage(
+                f"GUI was blocked for {seconds:.1f} s" + (f" in {handler}" if handler else "")
+                + " (details in stall_log.jsonl)", 10000)
+        except Exception:
+            pass
+
+    def _measured(self, name: str, fn, *args) -> None:
+        """Uživatelská akce (export, refresh) jako jeden měřený běh – čas
+        v dialogu Performance, při sledování paměti i snapshoty tracemalloc."""
+        with self.perf.run(name):
+            fn(*args)
+
+    def _start_memory_tracking(self) -> None:
+        from app.memtrack import MemoryTracker, memory_log_path
+        if self.memtrack is None:
+            self.memtrack = MemoryTracker(memory_log_path(self.settings.path), gauges=self._memory_gauges)
+        self.memtrack.start()
+        self.perf.memory = self.memtrack
+
+    def _stop_memory_tracking(self) -> None:
+        if self.memtrack is not None:
+            self.memtrack.stop()
+        self.perf.memory = None
+
+    def _memory_gauges(self) -> dict:
+        """Velikosti struktur, které rostou s daty (pro paměťový report)."""
+        def _items(model) -> int:
+            return model.rowCount() * model.columnCount() if model is not None else 0
+        return {
+            "records": len(self.records or []),
+            "hash_cache": len(self._hash_cache),
+            "parse_cache": len(self._parse_cache),
+            "overview_items": _items(getattr(self, "_source_model", None)),
+            "recognized_items": _items(getattr(self, "_recognized_model", None)),
+            "sorted_tree_items": len(getattr(self, "_sorted_tree_items", None) or {}),
+            "parse_profiles": len(getattr(self, "_parse_profiles", None) or []),
+        }
+
+    def _perf_add_scan(self, timings: dict, file_times: dict, counts: dict,
+                       profiles: Optional[dict] = None) -> None:
+        """Fáze skenu (PdfScanner.timings / counts / file_times) do aktuálního
+        měření; rozpad po souborech (file_profiles) si drží report Slowest files."""
+        self.perf.add_phase("walk", timings.get("walk", 0.0), counts.get("walk", 0))
+        self.perf.add_phase("parse", timings.get("parse", 0.0), counts.get("parse", 0))
+        self.perf.add_files(file_times)
+        if profiles:
+            # warm start bez změn nic neparsuje → zůstává poslední profil
+            self._parse_profiles = list(profiles.values())
+
+    def _perf_show_summary(self, run) -> None:
+        """Souhrn posledního měření trvale vpravo ve status baru (detail v tooltipu)."""
+        from PySide6.QtWidgets import QLabel
+        label = getattr(self, "_perf_label", None)
+        if label is None:
+            label = self._perf_label = QLabel()
+            self.statusBar().addPermanentWidget(label)
+        label.setText(run.summary())
+        label.setToolTip("\n".join(
+            [f"{run.name} @ {run.started_at}: {run.total:.3f} s"]
+            + [f"{n}: {sec:.3f} s" + (f" ({c})" if c is not None else "") for n, sec, c in run.phases]
+            + ["Details: Performance…"]))
+
+    def show_performance_report(self) -> None:
+        """
+        Dialog Performance: posledních několik měřených běhů (rescan, sken na
+        pozadí) – fáze s časem, počtem položek a podílem, a nejpomalejší soubory.
+        """
+        from PySide6.QtWidgets import (
+            QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+            QTreeWidget, QTreeWidgetItem, QPushButton
+        )
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QDesktopServices
+        from PySide6.QtCore import QUrl
+
+        runs = list(reversed(self.perf.recent))
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Performance")
+        dlg.resize(800, 560)
+        lay = QVBoxLayout(dlg)
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Run:"))
+        combo = QComboBox()
+        for run in runs:
+            combo.addItem(f"{run.started_at} • {run.name} • {run.total:.2f} s")
+        top.addWidget(combo, 1)
+        lay.addLayout(top)
+
+        phases = QTreeWidget()
+        phases.setHeaderLabels(["Phase", "Seconds", "Count", "Share"])
+        phases.setRootIsDecorated(False)
+        lay.addWidget(phases, 1)
+        caches = QLabel()
+        lay.addWidget(caches)
+
+        lay.addWidget(QLabel("Slowest files (parse):"))
+        files = QTreeWidget()
+        files.setHeaderLabels(["Seconds", "File"])
+        files.setRootIsDecorated(False)
+        lay.addWidget(files, 1)
+
+        def _show(i: int) -> None:
+            phases.clear()
+            files.clear()
+            if not (0 <= i < len(runs)):
+                return
+            run = runs[i]
+            caches.setText("Caches: " + "; ".join(
+                f"{n} {c.get('hits', 0)} hits / {c.get('misses', 0)} misses "
+                f"({c.get('stale', 0)} stale, {c.get('evictions', 0)} evicted), {c.get('size', 0)} entries"
+                for n, c in run.caches.items()) if run.caches else "")
+            for name, sec, count in run.phases:
+                share = f"{100.0 * sec / run.total:.1f} %" if run.total > 0 else ""
+                it = QTreeWidgetItem([name, f"{sec:.3f}", "" if count is None else str(count), share])
+                for c in (1, 2, 3):
+                    it.setTextAlignment(c, Qt.AlignRight | Qt.AlignVCenter)
+                phases.addTopLevelItem(it)
+            for path, sec in run.slowest_files(50):
+                it = QTreeWidgetItem([f"{sec:.3f}", path])
+                it.setTextAlignment(0, Qt.AlignRight | Qt.AlignVCenter)
+                files.addTopLevelItem(it)
+            for tree in (phases, files):
+                for c in range(tree.columnCount()):
+                    tree.resizeColumnToContents(c)
+
+        combo.currentIndexChanged.connect(_show)
+        _show(0)
+        if not runs:
+            phases.addTopLevelItem(QTreeWidgetItem(["No measured runs yet – use Rescan."]))
+
+        btns = QHBoxLayout()
+        btn_files = QPushButton("Slowest files…")
+        btn_files.clicked.connect(self.show_parse_profile_report)
+        btn_memory = QPushButton("Memory…")
+        btn_memory.clicked.connect(self.show_memory_report)
+        btn_log = QPushButton("Open log folder")
+        log_path = self.perf.log_path
+        btn_log.setEnabled(log_path is not None)
+        btn_log.clicked.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_path.parent))))
+        btn_close = QPushButton("Close")
+        btn_close.clicked.connect(dlg.accept)
+        btns.addWidget(btn_files)
+        btns.addWidget(btn_memory)
+        btns.addWidget(btn_log)
+        btns.addStretch(1)
+        btns.addWidget(btn_close)
+        lay.addLayout(btns)
+
+        dlg.exec()
+
+    def show_memory_report(self) -> None:
+        """
+        Dialog Memory: paměťové reporty posledních měřených běhů (rescan, export,
+        refresh) – přírůstek operace, růst od začátku sledování, nejvíc alokující
+        místa a velikosti cache/modelů. Sledování (tracemalloc) jde zapnout
+        i tady; trvale přes "memory_tracking" v settings.json.
+        """
+        from PySide6.QtWidgets import (
+            QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPlainTextEdit, QPushButton
+        )
+        from PySide6.QtGui import QFontDatabase
+        from app.memtrack import format_report
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Memory")
+        dlg.resize(900, 560)
+        lay = QVBoxLayout(dlg)
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Operation:"))
+        combo = QComboBox()
+        top.addWidget(combo, 1)
+        lay.addLayout(top)
+        view = QPlainTextEdit()
+        view.setReadOnly(True)
+        view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        lay.addWidget(view, 1)
+
+        reports: list = []
+
+        def _fill() -> None:
+            reports[:] = list(reversed(self.memtrack.recent)) if self.memtrack is not None else []
+            combo.clear()
+            for r in reports:
+                combo.addItem(f"{r['at']} • {r['op']} • {r['growth'] / 1024:+,.0f} KiB")
+            if not reports:
+                active = self.memtrack is not None and self.memtrack.active
+                view.setPlainText("Memory tracking is on – run Rescan, an export or Refresh." if active
+                                  else "Memory tracking is off. Start it here, or set \"memory_tracking\": true "
+                                       "in settings.json to track from application start.")
+
+        def _show(i: int) -> None:
+            if 0 <= i < len(reports):
+                view.setPlainText(format_report(reports[i]))
+
+        combo.currentIndexChanged.connect(_show)
+        _fill()
+
+        btns = QHBoxLayout()
+        btn_toggle = QPushButton()
+
+        def _label() -> None:
+            on = self.memtrack is not None and self.memtrack.active
+            btn_toggle.setText("Stop tracking" if on else "Start tracking")
+
+        def _toggle() -> None:
+            if self.memtrack is not None and self.memtrack.active:
+                self._stop_memory_tracking()
+            else:
+                self._start_memory_tracking()
+            _label()
+            _fill()
+
+        btn_toggle.clicked.connect(_toggle)
+        _label()
+        btn_close = QPushButton("Close")
+        btn_close.clicked.connect(dlg.accept)
+        btns.addWidget(btn_toggle)
+        btns.addStretch(1)
+        btns.addWidget(btn_close)
+        lay.addLayout(btns)
+        dlg.exec()
+
+    def show_parse_profile_report(self) -> None:
+        """
+        Report Slowest files: PDF z posledního parsingu seřazená podle času
+        (nebo velikosti) s rozpadem na etapy read/fields/text/parse/hash,
+        backendem a – při zapnutém tracemalloc – špičkou paměti po etapách.
+        Stejný report na příkazové řádce: ``python -m app.parse_profile``.
+        """
+        from PySide6.QtWidgets import (
+            QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+            QTreeWidget, QTreeWidgetItem, QPushButton, QApplication
+        )
+        from PySide6.QtCore import Qt
+        from app.parse_profile import STAGES, format_report, largest, slowest
+
+        profiles = list(getattr(self, "_parse_profiles", []) or [])
+        memory = any(p.memory for p in profiles)
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Slowest files")
+        dlg.resize(1000, 600)
+        lay = QVBoxLayout(dlg)
+
+        totals = {s: sum(p.stages.get(s, 0.0) for p in profiles) for s in STAGES}
+        lay.addWidget(QLabel(
+            f"Parsed files in last scan: {len(profiles)} • "
+            + " • ".join(f"{s} {totals[s]:.2f} s" for s in STAGES)
+            + ("" if memory else " • memory: not traced")))
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Order by:"))
+        order = QComboBox()
+        order.addItems(["Parse time", "File size"])
+        top.addWidget(order)
+        top.addStretch(1)
+        lay.addLayout(top)
+
+        headers = ["Seconds", "MiB"] + [f"{s} s" for s in STAGES]
+        if memory:
+            headers += [f"{s} MiB" for s in STAGES]
+        headers += ["Fields", "Text", "File"]
+        tree = QTreeWidget()
+        tree.setHeaderLabels(headers)
+        tree.setRootIsDecorated(False)
+        lay.addWidget(tree, 1)
+
+        def _fill(i: int) -> None:
+            tree.clear()
+            rows = (slowest if i == 0 else largest)(profiles, 200)
+            for p in rows:
+                vals = [f"{p.total:.3f}", f"{p.size_bytes / 1048576:.2f}"]
+                vals += [f"{p.stages.get(s, 0.0):.3f}" for s in STAGES]
+                if memory:
+                    vals += [f"{p.memory.get(s, 0) / 1048576:.2f}" for s in STAGES]
+                vals += [p.backends.get("fields", ""), p.backends.get("text", ""),
+                         p.path + (f"  [{p.error}]" if p.error else "")]
+                it = QTreeWidgetItem(vals)
+                for c in range(len(vals) - 3):
+                    it.setTextAlignment(c, Qt.AlignRight | Qt.AlignVCenter)
+                tree.addTopLevelItem(it)
+            for c in range(tree.columnCount()):
+                tree.resizeColumnToContents(c)
+
+        order.currentIndexChanged.connect(_fill)
+        _fill(0)
+
+        btns = QHBoxLayout()
+        btn_copy = QPushButton("Copy report")
+        btn_copy.clicked.connect(lambda: QApplication.clipboard().setText(format_report(profiles)))
+        btn_close = QPushButton("Close")
+        btn_close.clicked.connect(dlg.accept)
+        btns.addWidget(btn_copy)
+        btns.addStretch(1)
+        btns.addWidget(btn_close)
+        lay.addLayout(btns)
+
+        dlg.exec()
+
+    def _save_warm_snapshot(self) -> None:
+        from PySide6.QtCore import Qt
+        from app.scan_snapshot import ScanSnapshot, save_snapshot, snapshot_path
+
+        model = getattr(self, "_source_model", None)
+        if not self.records or model is None or model.rowCount() != len(self.records):
+            return
+        sorted_col = self._overview_find_col("Sorted")
+        status_col = self._overview_find_col("Status")
+
+        def _column(col) -> list:
+            if col is None:
+                return []
+            return [str(model.index(r, col).data(Qt.DisplayRole) or "") for r in range(model.rowCount())]
+
+        stats = dict(getattr(self, "_record_stats", {}) or {})
+        save_snapshot(snapshot_path(self.settings.path), ScanSnapshot(
+            root=str(self.pdf_root),
+            records=self.records,
+            stats=stats,
+            sorted_marks=_column(sorted_col),
+            statuses=_column(status_col),
+        ))
+
+    def _on_tab_activated(self, index: int) -> None:
+        self._ensure_tab_built(self.tabs.widget(index))
+
+    def _ensure_tab_built(self, tab) -> bool:
+        """Sestaví líně vytvářenou záložku (jen poprvé). Vrací True, pokud se stavěla."""
+        entry = getattr(self, "_lazy_tabs", {}).pop(tab, None)
+        if entry is None:
+            return False
+        module, mixin, build, after = entry
+        if module is not None:
+            self._load_tab_mixin(module, mixin)
+        getattr(self, build)()
+        if after:
+            try:
+                getattr(self, after)()
+            except Exception:
+                pass
+        return True
+
+    @staticmethod
+    def _load_tab_mixin(module: str, name: str) -> None:
+        """Naimportuje modul záložky ``app.tabs.<module>`` a jeho mixin zařadí
+        mezi předky MainWindow (jen poprvé). Metody záložky volá jen kód
+        záložky samotné, proto stačí načíst ho při její stavbě."""
+        import importlib
+        mixin = getattr(importlib.import_module(f"app.tabs.{module}"), name)
+        if mixin not in MainWindow.__mro__:
+            MainWindow.__bases__ = (mixin,) + MainWindow.__bases__
+
+    def _start_background_scan(self) -> None:
+        """
+        Spustí sken PDF kořene v pracovním vlákně; GUI (a Overview ze snapshotu)
+        zůstává použitelné. Výsledek převezme ``_poll_background_scan`` v GUI vlákně.
+        Po warm startu se jen porovná manifest adresáře (size, mtime_ns) se
+        snapshotem a parsují se pouze nové/změněné soubory.
+        """
+        import threading
+        import time
+        from PySide6.QtCore import QTimer
+
+        if getattr(self, "_bg_scan", None) is not None:
+            return
+        root = Path(self.pdf_root) if isinstance(self.pdf_root, (str, Path)) else None
+        if not root or not root.exists():
+            self.rescan()
+            return
+        snap, self._warm_snapshot = getattr(self, "_warm_snapshot", None), None
+        state: dict = {"root": root, "base": self.records, "started": time.perf_counter()}
+        workers = self._scan_workers()
+
+        def _run() -> None:
+            try:
+                from app.pdf_scanner import PdfScanner
+                scanner = PdfScanner(root, workers=workers)
+                if snap is not None:
+                    state["diff"] = scanner.rescan_changed(snap.records, snap.stats)
+                else:
+                    state["records"] = scanner.scan()
+                state["stats"] = scanner.stats
+                state["timings"] = (scanner.timings, scanner.counts, scanner.file_times, scanner.file_profiles)
+            except BaseException as e:
+                state["error"] = e
+
+        state["thread"] = threading.Thread(target=_run, name="pdf-scan", daemon=True)
+        self._bg_scan = state
+        state["thread"].start()
+        try:
+            self.statusBar().showMessage("Scanning PDFs in background…")
+        except Exception:
+            pass
+        if not hasattr(self, "_bg_scan_timer"):
+            self._bg_scan_timer = QTimer(self)
+            self._bg_scan_timer.setInterval(50)
+            self._bg_scan_timer.timeout.connect(self._poll_background_scan)
+        self._bg_scan_timer.start()
+
+    def _scan_workers(self) -> int:
+        """Počet procesů pro parsing při skenu (nastavení ``scan_workers``)."""
+        try:
+            return max(1, int(self.settings.get("scan_workers", 1) or 1))
+        except (TypeError, ValueError):
+            return 1
+
+    def _poll_background_scan(self) -> None:
+        state = getattr(self, "_bg_scan", None)
+        if state is None:
+            self._bg_scan_timer.stop()
+            return
+        if state["thread"].is_alive():
+            return
+        self._bg_scan_timer.stop()
+        self._bg_scan = None
+        if "error" in state:
+            try:
+                self.statusBar().showMessage(f"Background scan failed: {state['error']}")
+            except Exception:
+                pass
+            return
+        if Path(self.pdf_root) != state["root"]:
+            # kořen se mezitím změnil (Open PDF folder) – výsledek je neplatný
+            return
+        with self.perf.run("background scan", started=state["started"]):
+            timings, counts, file_times, profiles = state["timings"]
+            self._perf_add_scan(timings, file_times, counts, profiles)
+            if "diff" not in state:
+                self.rescan(records=state["records"], stats=state["stats"])
+            elif self.records is not state["base"]:
+                # Overview se mezitím přeskenovalo jinudy → převezmi celý výsledek
+                self.rescan(records=state["diff"][0], stats=state["stats"])
+            else:
+                self._overview_apply_scan_diff(*state["diff"], stats=state["stats"])
+        try:
+            self._rebuild_board_combo()
+        except Exception:
+            pass
+
+    def _overview_apply_scan_diff(self, records: List[PdfRecord], added: list, changed: list,
+                                  removed: list, stats: Optional[dict] = None) -> None:
+        """
+        Aplikuje výsledek ``PdfScanner.rescan_changed`` na Overview bez
+        přestavby modelu: odebrané řádky se smažou, změněné přepíšou, nové
+        připojí. Pak se jednou dopočte Sorted/Status ze Sorted DB a status store
+        (snapshot mohl být zastaralý i bez změny PDF).
+        """
+        model = getattr(self, "_source_model", None)
+        if model is None or model.rowCount() != len(self.records):
+            self.rescan(records=records, stats=stats)
+            return
+        file_col = self._overview_find_col("File name")
+        if added or changed or removed:
+            with self.perf.phase("model diff", len(added) + len(changed) + len(removed)):
+                gone = set(removed)
+                for row in range(len(self.records) - 1, -1, -1):
+                    if str(self.records[row].path) in gone:
+                        model.removeRow(row)
+                self.records = records
+                self.store = RecordStore.from_records(records)
+                self._proxy.set_store(self.store)
+                stats = stats or {}
+                fresh = set(changed) | set(added)
+                for rid, rec in enumerate(records):
+                    key = str(rec.path)
+                    if rid >= model.rowCount():
+                        model.appendRow(self._overview_row_items(rid, rec, file_col))
+                    elif key in fresh:
+                        for c, item in enumerate(self._overview_row_items(rid, rec, file_col)):
+                            model.setItem(rid, c, item)
+                    elif gone and file_col is not None:
+                        model.setData(model.index(rid, file_col), rid, ROLE_RECORD_ID)
+                    if key in fresh and rec.content_hash:
+                        self._hash_cache.put(rec.path.resolve(), rec.content_hash, stats.get(key))
+        self._record_stats = dict(stats or {})
+        for phase, fn in (("sorted flags", self._overview_update_sorted_flags),
+                          ("sorted flags", self._overview_apply_sorted_row_hiding),
+                          ("statuses", self._overview_apply_statuses),
+                          ("summary", self._refresh_summary)):
+            try:
+                with self.perf.phase(phase):
+                    fn()
+            except Exception:
+                pass
+        try:
+            self.statusBar().showMessage(
+                f"PDF found: {len(records)} • Changed on disk: {len(added)} new, "
+                f"{len(changed)} modified, {len(removed)} removed • Root: {self.pdf_root}")
+        except Exception:
+            pass
 
     def _restore_window_geometry(self) -> None:
         geo = self.settings.get("window_geometry")
@@ -270,934 +858,190 @@ class MainWindow(QMainWindow):
             self.settings.save()
         except Exception:
             pass
+        try:
+            # warm-start snapshot (záznamy + manifest + Sorted/Status) → příští
+            # start vykreslí Overview hned a na disku sladí jen rozdíly
+            self._save_warm_snapshot()
+        except Exception:
+            pass
+        try:
+            if getattr(self, "_watchdog", None) is not None:
+                self._watchdog.stop()
+        except Exception:
+            pass
+        try:
+            # dopiš žurnál / zavři SQLite spojení
+            db = getattr(self, "sorted_db", None)
+            if db is not None and hasattr(db, "close"):
+                db.close()
+        except Exception:
+            pass
         try:
             super().closeEvent(event)
         except Exception:
             pass
 
-    def _build_recognized_tab(self) -> None:
+    def _overview_iter_records_as_dicts(self) -> list[dict]:
         """
-        Recognized People List:
-          - Tabulka: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link
-          - Filtrace: fulltext + checkboxy (Valid / Near expiry / Expired)
-          - Akce: Add…, Edit…, Delete, Reload, Save
-          - JSON perzistence (recognized_people.json)
-          - Fitting sloupců + barevné zvýraznění řádků při přepnutí do záložky
+        Data z Overview jako list dictů se standardizovanými klíči: board,
+        contact_full_name, contact_email, contact_postal_address,
+        recognition_academia, recognition_certified.
+        Čte se ze sdíleného RecordStore (efektivní hodnoty vč. ručních úprav
+        ze Sorted PDFs), ne z QStandardItem buněk modelu.
         """
-        from PySide6.QtWidgets import (
-            QVBoxLayout, QHBoxLayout, QWidget, QTableView, QPushButton, QHeaderView,
-            QLineEdit, QCheckBox, QLabel
-        )
-        from PySide6.QtGui import QStandardItemModel
-        from PySide6.QtCore import Qt, QTimer, QSortFilterProxyModel
-        from datetime import datetime, date
-    
-        layout = QVBoxLayout(self.recognized_tab)
-    
-        # Ovládací lišta
-        bar = QHBoxLayout()
-        self.btn_rec_add = QPushButton("Add person…")
-        self.btn_rec_edit = QPushButton("Edit…")
-        self.btn_rec_del  = QPushButton("Delete")
-        self.btn_rec_reload = QPushButton("Reload")
-        self.btn_rec_save = QPushButton("Save")
-        bar.addWidget(self.btn_rec_add)
-        bar.addWidget(self.btn_rec_edit)
-        bar.addWidget(self.btn_rec_del)
-        bar.addStretch(1)
-        bar.addWidget(self.btn_rec_reload)
-        bar.addWidget(self.btn_rec_save)
-        layout.addLayout(bar)
-    
-        # FILTRAČNÍ ŘÁDEK (fulltext + 3 checkboxy)
-        filt = QHBoxLayout()
-        self.rec_search = QLineEdit(self.recognized_tab)
-        self.rec_search.setPlaceholderText("Search…")
-        self.rec_chk_valid   = QCheckBox("Valid")
-        self.rec_chk_warning = QCheckBox("Near expiry")
-        self.rec_chk_expired = QCheckBox("Expired")
-        self.rec_chk_valid.setChecked(True)
-        self.rec_chk_warning.setChecked(True)
-        self.rec_chk_expired.setChecked(True)
-        filt.addWidget(QLabel("Filter:"))
-        filt.addWidget(self.rec_search, 1)
-        filt.addSpacing(12)
-        filt.addWidget(self.rec_chk_valid)
-        filt.addWidget(self.rec_chk_warning)
-        filt.addWidget(self.rec_chk_expired)
-        layout.addLayout(filt)
-    
-        # Tabulka + MODEL
-        self.tbl_recognized = QTableView(self.recognized_tab)
-        self.tbl_recognized.setSelectionBehavior(QTableView.SelectRows)
-        self.tbl_recognized.setSelectionMode(QTableView.ExtendedSelection)
-        self.tbl_recognized.setSortingEnabled(True)
-    
-        # Pořadí sloupců (0.10d)
-        self._recognized_headers = [
-            "Board", "Full Name", "Email", "Address",
-            "Recognition Date", "Valid Until", "Badge Types", "Badge Link"
-        ]
-        self._recognized_model = QStandardItemModel(0, len(self._recognized_headers), self)
-        self._recognized_model.setHorizontalHeaderLabels(self._recognized_headers)
-    
-        # PROXY MODEL pro filtraci
-        class _RecognizedProxy(QSortFilterProxyModel):
-            def __init__(self, parent=None):
-                super().__init__(parent)
-                self.search = ""
-                self.show_valid = True
-                self.show_warn = True
-                self.show_expired = True
-    
-            def _status_for_row(self, row: int) -> str:
-                """Vrátí 'valid' / 'warn' / 'expired' dle 'Valid Until' (col 5)."""
-                try:
-                    idx = self.sourceModel().index(row, 5)
-                    s = self.sourceModel().data(idx)
-                    if not s:
-                        return "valid"
-                    vuntil = datetime.strptime(str(s), "%Y-%m-%d").date()
-                    days_left = (vuntil - date.today()).days
-                    if days_left > 30:
-                        return "valid"
-                    elif days_left >= 0:
-                        return "warn"
-                    else:
-                        return "expired"
-                except Exception:
-                    return "valid"
-    
-            def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
-                # 1) Validitní checkboxy
-                st = self._status_for_row(source_row)
-                if st == "valid" and not self.show_valid:
-                    return False
-                if st == "warn" and not self.show_warn:
-                    return False
-                if st == "expired" and not self.show_expired:
-                    return False
-                # 2) Fulltext přes všechny sloupce
-                if self.search:
-                    s = self.search.lower()
-                    cols = self.sourceModel().columnCount()
-                    found = False
-                    for c in range(cols):
-                        idx = self.sourceModel().index(source_row, c)
-                        val = self.sourceModel().data(idx)
-                        if val and s in str(val).lower():
-                            found = True
-                            break
-                    if not found:
-                        return False
-                return True
-    
-        self._rec_proxy = _RecognizedProxy(self)
-        self._rec_proxy.setSourceModel(self._recognized_model)
-        self.tbl_recognized.setModel(self._rec_proxy)
-    
-        # Fit sloupců
-        hdr = self.tbl_recognized.horizontalHeader()
-        hdr.setStretchLastSection(True)
-        try:
-            hdr.setSectionResizeMode(QHeaderView.ResizeToContents)
-        except Exception:
-            try:
-                hdr.setResizeMode(0, QHeaderView.ResizeToContents)
-            except Exception:
-                pass
-    
-        layout.addWidget(self.tbl_recognized, 1)
-    
-        # Naplň data
-        self._recognized_rebuild_model()
-    
-        # Akce
-        self.btn_rec_add.clicked.connect(self._recognized_add)
-        self.btn_rec_edit.clicked.connect(self._recognized_edit)
-        self.btn_rec_del.clicked.connect(self._recognized_delete)
-        self.btn_rec_reload.clicked.connect(self._recognized_rebuild_model)
-        self.btn_rec_save.clicked.connect(lambda: self._save_recognized_json(self._recognized_collect_data()))
-    
-        # Filtrační signály
-        self.rec_search.textChanged.connect(lambda _t: self._recognized_update_filter())
-        self.rec_chk_valid.toggled.connect(lambda _b: self._recognized_update_filter())
-        self.rec_chk_warning.toggled.connect(lambda _b: self._recognized_update_filter())
-        self.rec_chk_expired.toggled.connect(lambda _b: self._recognized_update_filter())
-    
-        # Po vykreslení dofituj a aplikuj barvy
-        QTimer.singleShot(0, self._recognized_fit_columns)
-        QTimer.singleShot(0, self._recognized_apply_row_colors)
+        keys = ("board", "contact_full_name", "contact_email", "contact_postal_address",
+                "recognition_academia", "recognition_certified")
+        store = getattr(self, "store", None)
+        if store is None:
+            return []
+        return [{k: (v or "") for k, v in d.items()} for d in store.iter_dicts(keys=keys)]
     
-        # Spusť zvýraznění při přepnutí do záložky (napoj jednorázově)
-        if hasattr(self, "tabs") and not getattr(self, "_rec_tab_hooked", False):
-            try:
-                self.tabs.currentChanged.connect(self._recognized_on_tab_changed)
-                self._rec_tab_hooked = True
-            except Exception:
-                pass
-            
-    def _recognized_update_filter(self) -> None:
-        """Aplikuje hodnoty z fulltextu a checkboxů do proxy a invaliduje filtr."""
+    # ----- Menu / actions -----
+    def _build_menu(self) -> None:
+        rescan_action = QAction("Rescan", self)
+        rescan_action.triggered.connect(lambda _checked=False: self.rescan())
+
+        open_action = QAction("Open Selected PDF", self)
+        open_action.triggered.connect(self.open_selected_pdf)
+
+        export_csv_action = QAction("Export CSV (visible rows)…", self)
+        export_csv_action.triggered.connect(lambda _checked=False: self._measured("export CSV", self.export_csv))
+
+        export_xlsx_action = QAction("Export XLSX (visible rows)…", self)
+        export_xlsx_action.triggered.connect(lambda _checked=False: self._measured("export XLSX", self.export_xlsx))
+
+        about_action = QAction("About", self)
+        about_action.triggered.connect(self._about)
+
+        perf_action = QAction("Performance…", self)
+        perf_action.triggered.connect(self.show_performance_report)
+
+        # File menu: selectable PDF / Sorted PDFs folders (persisted)
+        open_pdf_folder_action = QAction("Open PDF folder…", self)
+        open_pdf_folder_action.triggered.connect(self._choose_pdf_folder)
+        open_sorted_folder_action = QAction("Open Sorted PDFs folder…", self)
+        open_sorted_folder_action.triggered.connect(self._choose_sorted_folder)
+
+        # Backend DB pro Sorted PDFs (persistováno v nastavení)
+        from PySide6.QtGui import QActionGroup
+        backend_group = QActionGroup(self)
+        backend_group.setExclusive(True)
+        current_backend = self.settings.get("sorted_db_backend", "json")
+        backend_actions = []
+        for key, label in (("json", "JSON (sorted_db.json)"),
+                           ("journal", "JSON + append-only journal"),
+                           ("sqlite", "SQLite (sorted_db.sqlite3)")):
+            act = QAction(label, self)
+            act.setCheckable(True)
+            act.setChecked(key == current_backend)
+            act.triggered.connect(lambda _checked=False, k=key: self._set_sorted_db_backend(k))
+            backend_group.addAction(act)
+            backend_actions.append(act)
+
+        # Režim exportu do Sorted PDFs: kopie / reflink / hardlink
+        copy_group = QActionGroup(self)
+        copy_group.setExclusive(True)
+        current_copy = self.settings.get("sorted_copy_mode", "copy")
+        copy_actions = []
+        for key, label in (("copy", "Full copy"),
+                           ("reflink", "Reflink/clone if supported, else copy"),
+                           ("link", "Reflink, else hardlink, else copy")):
+            act = QAction(label, self)
+            act.setCheckable(True)
+            act.setChecked(key == current_copy)
+            act.triggered.connect(lambda _checked=False, k=key: self._set_sorted_copy_mode(k))
+            copy_group.addAction(act)
+            copy_actions.append(act)
+
+        file_menu = self.menuBar().addMenu("File")
+        file_menu.addAction(open_pdf_folder_action)
+        file_menu.addAction(open_sorted_folder_action)
+        file_menu.addSeparator()
+        backend_menu = file_menu.addMenu("Sorted DB storage")
+        for act in backend_actions:
+            backend_menu.addAction(act)
+        copy_menu = file_menu.addMenu("Export to Sorted PDFs as")
+        for act in copy_actions:
+            copy_menu.addAction(act)
+
+        # Minimal-change: zbývající akce přímo na menubaru
+        self.menuBar().addAction(rescan_action)
+        self.menuBar().addAction(open_action)
+        self.menuBar().addAction(export_csv_action)
+        self.menuBar().addAction(export_xlsx_action)
+        self.menuBar().addAction(perf_action)
+        self.menuBar().addAction(about_action)
+
+    def _choose_pdf_folder(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+        start = str(self.pdf_root) if self.pdf_root and Path(self.pdf_root).exists() else str(Path.home())
+        chosen = QFileDialog.getExistingDirectory(self, "Select PDF folder", start)
+        if not chosen:
+            return
+        self.pdf_root = Path(chosen)
+        self.settings.set("pdf_root", str(self.pdf_root))
+        self.settings.save()
+        # Přesměruj browser strom + FS watcher na nový kořen a přeskenuj
         try:
-            proxy = getattr(self, "_rec_proxy", None)
-            if not proxy:
-                return
-            proxy.search = (self.rec_search.text() or "").strip()
-            proxy.show_valid = bool(self.rec_chk_valid.isChecked())
-            proxy.show_warn = bool(self.rec_chk_warning.isChecked())
-            proxy.show_expired = bool(self.rec_chk_expired.isChecked())
-            proxy.invalidateFilter()
+            if getattr(self, "fs_model", None) is not None:
+                self.fs_model.setRootPath(str(self.pdf_root))
+                self.tree_browser.setRootIndex(self.fs_model.index(str(self.pdf_root)))
         except Exception:
             pass
-            
-    def _recognized_on_tab_changed(self, index: int) -> None:
-        """
-        Při přepnutí na Recognized tab obnov barvy (a můžeš i dofit sloupce).
-        """
         try:
-            w = self.tabs.widget(index)
-            if w is self.recognized_tab:
-                self._recognized_apply_row_colors()
-                self._recognized_fit_columns()
+            self._rebuild_watch_list()
         except Exception:
             pass
+        self.rescan()
 
-    def _recognized_json_path(self):
-        """Cesta k JSONu s recognized osobami (repo root)."""
-        from pathlib import Path
-        return Path(__file__).resolve().parents[2] / "recognized_people.json"
-
-    def _load_recognized_json(self) -> list[dict]:
-        """Načti JSON (list dictů). Neexistuje-li, vrať []."""
-        import json
-        p = self._recognized_json_path()
+    def _choose_sorted_folder(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+        start = str(self.sorted_root) if self.sorted_root and Path(self.sorted_root).exists() else str(Path.home())
+        chosen = QFileDialog.getExistingDirectory(self, "Select Sorted PDFs folder", start)
+        if not chosen:
+            return
+        self.sorted_root = Path(chosen)
+        self.settings.set("sorted_root", str(self.sorted_root))
+        self.settings.save()
+        # Přepoj DB na nový kořen a přeskenuj Sorted
         try:
-            if p.exists():
-                with p.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-                    if isinstance(data, list):
-                        return data
+            self.sorted_db = self._open_sorted_db()
         except Exception:
             pass
-        return []
-    
-    def _save_recognized_json(self, data: list[dict]) -> None:
-        """Ulož JSON s recognized osobami."""
-        import json
-        p = self._recognized_json_path()
-        try:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            with p.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, ensure_ascii=False, indent=2)
-            try:
-                self.statusBar().showMessage("Recognized people saved.")
-            except Exception:
-                pass
-        except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Save recognized", f"Failed to save recognized_people.json:\n{e}")    
-    
-    def _recognized_rebuild_model(self) -> None:
-        """
-        Načti JSON a naplň model.
-        - Pokud záznam obsahuje oba badge (academia & certified), zobraz ho jako DVA řádky (sdruženě).
-        - 'Valid Until' = 'Recognition Date' + 365 dní (přepočet na load).
-        - POŘADÍ SLOUPCŮ: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link
-        """
-        from PySide6.QtGui import QStandardItem
-        from PySide6.QtCore import Qt
-        from datetime import datetime, timedelta
-    
-        data = self._load_recognized_json()
-        self._recognized_model.setRowCount(0)
-    
-        def _valid_until(date_str: str) -> str:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-                return (dt + timedelta(days=365)).isoformat()
-            except Exception:
-                return ""
-    
-        def _append_row(board, full, mail, addr, rdate, acad, cert, blink):
-            badges = "; ".join([s for s, b in (("Academia", acad), ("Certified", cert)) if b])
-            vuntil = _valid_until(rdate)
-            # nový pořadník
-            vals = [board, full, mail, addr, rdate, vuntil, badges, blink]
-            items = [QStandardItem(str(v)) for v in vals]
-            for it in items:
-                it.setEditable(False)
-            self._recognized_model.appendRow(items)
-    
-        for rec in data:
-            board = rec.get("board", "") or ""
-            full  = rec.get("full_name", "") or ""
-            mail  = rec.get("email", "") or ""
-            addr  = rec.get("address", "") or ""
-            rdate = rec.get("recognition_date", "") or ""
-            acad  = bool(rec.get("academia", False))
-            cert  = bool(rec.get("certified", False))
-            blink = rec.get("badge_link", "") or ""
-    
-            if acad and cert:
-                _append_row(board, full, mail, addr, rdate, True,  False, blink)
-                _append_row(board, full, mail, addr, rdate, False, True,  blink)
-            else:
-                _append_row(board, full, mail, addr, rdate, acad, cert, blink)
-    
-        self._recognized_fit_columns()
-    
-    def _recognized_collect_data(self) -> list[dict]:
-        """Převeď model -> JSON list."""
-        from PySide6.QtCore import Qt
-        out = []
-        for r in range(self._recognized_model.rowCount()):
-            board = self._recognized_model.index(r, 0).data(Qt.DisplayRole) or ""
-            full  = self._recognized_model.index(r, 1).data(Qt.DisplayRole) or ""
-            mail  = self._recognized_model.index(r, 2).data(Qt.DisplayRole) or ""
-            addr  = self._recognized_model.index(r, 3).data(Qt.DisplayRole) or ""
-            rdate = self._recognized_model.index(r, 4).data(Qt.DisplayRole) or ""
-            badges= (self._recognized_model.index(r, 5).data(Qt.DisplayRole) or "").lower()
-            blink = self._recognized_model.index(r, 6).data(Qt.DisplayRole) or ""
-            vuntil= self._recognized_model.index(r, 7).data(Qt.DisplayRole) or ""
-    
-            acad = "academia" in badges
-            cert = "certified" in badges
-    
-            out.append({
-                "board": board,
-                "full_name": full,
-                "email": mail,
-                "address": addr,
-                "recognition_date": rdate,
-                "academia": acad,
-                "certified": cert,
-                "badge_link": blink,
-                "valid_until": vuntil,
-            })
-        return out    
-    
-    def _recognized_candidates_from_sorted(self) -> list[dict]:
-        """
-        Najdi kandidáty pro Recognized Add dialog.
-        Preferujeme 'Sorted DB' v paměti; pokud není, zkusíme běžné JSON cesty.
-        Jako poslední fallback odvodíme kandidáty z Overview tabulky.
-    
-        Vrací list dictů:
-          { "board": str, "full_name": str, "email": str, "address": str,
-            "academia": bool, "certified": bool }
-        """
-        from pathlib import Path
-        candidates: list[dict] = []
-        seen: set[tuple] = set()
-    
-        def _add(board, full, mail, addr, acad, cert):
-            key = (str(board or ""), str(full or ""), str(mail or ""), str(addr or ""), bool(acad), bool(cert))
-            if key in seen:
-                return
-            seen.add(key)
-            candidates.append({
-                "board": str(board or ""),
-                "full_name": str(full or ""),
-                "email": str(mail or ""),
-                "address": str(addr or ""),
-                "academia": bool(acad),
-                "certified": bool(cert),
-            })
-    
-        # 1) In-memory zdroje – různé názvy používané v projektu
-        for attr in ("sorted_db", "_sorted_db", "sorted_records", "_sorted_records", "sorted_data", "_sorted_data"):
-            container = getattr(self, attr, None)
-            if not container:
-                continue
-    
-            def _iter(container):
-                if isinstance(container, dict):
-                    for v in container.values():
-                        yield v
-                elif isinstance(container, list):
-                    for v in container:
-                        yield v
-    
-            for rec in _iter(container):
-                # rec může být objekt i dict
-                try:
-                    get = (lambda k, default="": getattr(rec, k, getattr(rec, k.replace(" ", "_"), None))
-                           if hasattr(rec, k) or hasattr(rec, k.replace(" ", "_"))
-                           else rec.get(k, rec.get(k.replace(" ", "_"), default)))
-                except Exception:
-                    # rec je nejspíš dict
-                    def get(k, default=""):
-                        return rec.get(k, rec.get(k.replace(" ", "_"), default))
-    
-                board = get("board", "")
-                full  = get("contact_full_name", "") or get("full_name", "")
-                mail  = get("contact_email", "") or get("email", "")
-                addr  = get("contact_postal_address", "") or get("address", "")
-    
-                acad_raw = get("recognition_academia", "")
-                cert_raw = get("recognition_certified", "")
-                # Interpretuj jakýkoli neprázdný string/true hodnotu jako True
-                acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
-                cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
-    
-                if full or mail:
-                    _add(board, full, mail, addr, acad, cert)
-    
-            if candidates:
-                return candidates  # máme výsledky, dál nehledáme
-    
-        # 2) JSON soubory – pár běžných cest/jmen (pokud existují)
-        try_paths = []
-        try:
-            repo_root = Path(__file__).resolve().parents[2]
-            try_paths.extend([
-                repo_root / "sorted_db.json",
-                repo_root / "sorted_records.json",
-                repo_root / "data" / "sorted_db.json",
-                repo_root / "Sorted PDFs" / "sorted_db.json",
-            ])
-        except Exception:
-            pass
-    
-        import json
-        for p in try_paths:
-            try:
-                if p.exists():
-                    with p.open("r", encoding="utf-8") as fh:
-                        data = json.load(fh)
-                    # projdi stejným způsobem jako in-memory
-                    def _iter2(container):
-                        if isinstance(container, dict):
-                            for v in container.values():
-                                yield v
-                        elif isinstance(container, list):
-                            for v in container:
-                                yield v
-                    for rec in _iter2(data):
-                        if isinstance(rec, dict):
-                            board = rec.get("board", "")
-                            full  = rec.get("contact_full_name", "") or rec.get("full_name", "")
-                            mail  = rec.get("contact_email", "") or rec.get("email", "")
-                            addr  = rec.get("contact_postal_address", "") or rec.get("address", "")
-                            acad_raw = rec.get("recognition_academia", "")
-                            cert_raw = rec.get("recognition_certified", "")
-                            acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
-                            cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
-                            if full or mail:
-                                _add(board, full, mail, addr, acad, cert)
-                    if candidates:
-                        return candidates
-            except Exception:
-                continue
-    
-        # 3) Fallback: odvoď z Overview tabulky (_source_model) — pokud existuje
-        for d in self._overview_iter_records_as_dicts():
-            board = d.get("board", "")
-            full  = d.get("contact_full_name", "") or d.get("full_name", "")
-            mail  = d.get("contact_email", "") or d.get("email", "")
-            addr  = d.get("contact_postal_address", "") or d.get("address", "")
-            acad_raw = d.get("recognition_academia", "")
-            cert_raw = d.get("recognition_certified", "")
-            acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
-            cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
-            if full or mail:
-                _add(board, full, mail, addr, acad, cert)
-    
-        return candidates
-    
-    def _overview_iter_records_as_dicts(self) -> list[dict]:
-        """
-        Přečti data z Overview (pokud existuje _source_model) a vrať list dictů
-        se standardizovanými klíči: board, contact_full_name, contact_email,
-        contact_postal_address, recognition_academia, recognition_certified.
-        Pokud model neexistuje, vrať [].
-        """
-        from PySide6.QtCore import Qt
-        out: list[dict] = []
-        src = getattr(self, "_source_model", None)
-        if not src:
-            return out
-    
-        # mapuj indexy sloupců podle _headers
-        idx = {}
-        headers = getattr(self, "_headers", [])
-        def _find(col_label_suffix: str) -> int | None:
-            # hledáme poslední řádek popisku po \n
-            for i, h in enumerate(headers):
-                tail = h.split("\n")[-1].strip() if "\n" in h else h.strip()
-                if tail.lower() == col_label_suffix.lower():
-                    return i
-            return None
-    
-        col_board = _find("Board")
-        col_full  = _find("Full Name")
-        col_mail  = _find("Email Address")
-        col_addr  = _find("Postal Address")
-        col_acad  = _find("Academia Recognition")
-        col_cert  = _find("Certified Recognition")
-    
-        rows = src.rowCount()
-        for r in range(rows):
-            def _val(c):
-                if c is None: return ""
-                return src.index(r, c).data(Qt.DisplayRole) or ""
-            out.append({
-                "board": _val(col_board),
-                "contact_full_name": _val(col_full),
-                "contact_email": _val(col_mail),
-                "contact_postal_address": _val(col_addr),
-                "recognition_academia": _val(col_acad),
-                "recognition_certified": _val(col_cert),
-            })
-        return out
-    
-    def _recognized_open_add_dialog(self, initial: dict | None = None) -> dict | None:
-        """
-        Add/Edit dialog pro recognized osobu.
-        - ADD: volba zdroje (From Sorted PDFs / Manual), badge typy editovatelné.
-        - EDIT: zdroj i badge typy jsou irelevantní → skryté/disable; typy zůstávají dle řádku.
-        Vrací dict se stejnými klíči jako JSON nebo None při Cancel.
-        """
-        from PySide6.QtWidgets import (
-            QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit, QPlainTextEdit,
-            QDialogButtonBox, QRadioButton, QComboBox, QDateEdit, QCheckBox, QMessageBox
-        )
-        from PySide6.QtCore import Qt, QDate
-        from datetime import timedelta, datetime as _dt
-    
-        is_edit = initial is not None
-    
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Edit recognized person" if is_edit else "Add recognized person")
-        lay = QVBoxLayout(dlg)
-    
-        # Zdroj dat (Sorted vs Manual) – v EDIT režimu skryjeme
-        src_row = QHBoxLayout()
-        rb_sorted = QRadioButton("From Sorted PDFs")
-        rb_manual = QRadioButton("Manual entry")
-        if not is_edit:
-            src_row.addWidget(rb_sorted); src_row.addWidget(rb_manual); src_row.addStretch(1)
-            lay.addLayout(src_row)
-    
-        # Kandidáti ze Sorted DB – v EDIT režimu neukazujeme
-        cb_sorted = QComboBox()
-        lbl_no_sorted = QLabel("No candidates found in Sorted PDFs database.")
-        lbl_no_sorted.setStyleSheet("color: #999;")
-        if not is_edit:
-            candidates = self._recognized_candidates_from_sorted()
-            for c in candidates:
-                disp = f"{c.get('full_name','')} — {c.get('email','')} — [{c.get('board','')}]"
-                cb_sorted.addItem(disp, c)
-            lay.addWidget(cb_sorted)
-            lay.addWidget(lbl_no_sorted)
-            # výchozí stav
-            if candidates:
-                rb_sorted.setChecked(True)
-            else:
-                rb_manual.setChecked(True)
-    
-        # Form
-        form = QFormLayout()
-        ed_board = QLineEdit()
-        ed_full  = QLineEdit()
-        ed_mail  = QLineEdit()
-        ed_addr  = QPlainTextEdit(); ed_addr.setMinimumHeight(64)
-    
-        ed_date  = QDateEdit(); ed_date.setCalendarPopup(True); ed_date.setDate(QDate.currentDate())
-        chk_acad = QCheckBox("Academia Recognition")
-        chk_cert = QCheckBox("Certified Recognition")
-        ed_link  = QLineEdit()
-    
-        form.addRow("Board:", ed_board)
-        form.addRow("Full Name:", ed_full)
-        form.addRow("Email:", ed_mail)
-        form.addRow("Address:", ed_addr)
-        form.addRow("Recognition Date:", ed_date)
-        # Badge types – v EDIT režimu jen zobrazíme/disable, v ADD editovatelné
-        if not is_edit:
-            form.addRow("Badge Types:", QLabel(""))
-            form.addRow("", chk_acad)
-            form.addRow("", chk_cert)
-        else:
-            # jen informativní řádek s textem badge, bez checků
-            self._lbl_badges_info = QLabel("(badge type unchanged in Edit)")
-            form.addRow("Badge Types:", self._lbl_badges_info)
-            chk_acad.setVisible(False)
-            chk_cert.setVisible(False)
-    
-        form.addRow("Badge Link:", ed_link)
-        lay.addLayout(form)
-    
-        # Předvyplnění z initial (Edit)
-        if is_edit:
-            ed_board.setText(initial.get("board", ""))
-            ed_full.setText(initial.get("full_name", ""))
-            ed_mail.setText(initial.get("email", ""))
-            ed_addr.setPlainText(initial.get("address", ""))
+        self.rescan_sorted()
+
+    def _open_sorted_db(self):
+        """DB pro aktuální sorted_root; backend podle nastavení 'sorted_db_backend'."""
+        from app.sorted_db import open_sorted_db
+        old = getattr(self, "sorted_db", None)
+        if old is not None and hasattr(old, "close"):
+            old.close()
+        db = open_sorted_db(self.sorted_root, self.settings.get("sorted_db_backend", "json"))
+        if getattr(db, "broken", False):
             try:
-                y, m, d = map(int, (initial.get("recognition_date","") or "2000-01-01").split("-"))
-                ed_date.setDate(QDate(y, m, d))
+                self.statusBar().showMessage(
+                    f"Sorted DB {db.db_path.name} cannot be opened (corrupt?) – shown empty and read-only. "
+                    "Switch File → Sorted DB storage to JSON to use sorted_db.json.", 15000)
             except Exception:
                 pass
-            # Badge typy ponecháváme; jen je držíme v initial
-            chk_acad.setChecked(bool(initial.get("academia", False)))
-            chk_cert.setChecked(bool(initial.get("certified", False)))
-            ed_link.setText(initial.get("badge_link", ""))
-        else:
-            # ADD: předvyplnění po výběru kandidáta ze Sorted
-            def _apply_candidate():
-                data = cb_sorted.currentData()
-                if not data:
-                    return
-                ed_board.setText(data.get("board",""))
-                ed_full.setText(data.get("full_name",""))
-                ed_mail.setText(data.get("email",""))
-                ed_addr.setPlainText(data.get("address",""))
-                chk_acad.setChecked(bool(data.get("academia", False)))
-                chk_cert.setChecked(bool(data.get("certified", False)))
-            cb_sorted.currentIndexChanged.connect(_apply_candidate)
-            # přepínání zdroje
-            def _toggle_src():
-                use_sorted = rb_sorted.isChecked() if not is_edit else False
-                has_data = (cb_sorted.count() > 0) if not is_edit else False
-                if not is_edit:
-                    cb_sorted.setEnabled(use_sorted and has_data)
-                    lbl_no_sorted.setVisible(use_sorted and not has_data)
-            if not is_edit:
-                rb_sorted.toggled.connect(_toggle_src)
-                rb_manual.toggled.connect(_toggle_src)
-                # init
-                if cb_sorted.count() > 0:
-                    rb_sorted.setChecked(True)
-                    _apply_candidate()
-                _toggle_src()
-    
-        # Tlačítka
-        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, dlg)
-        lay.addWidget(btns)
-    
-        result: dict | None = None
-    
-        def _accept():
-            # Collect
-            board = ed_board.text().strip()
-            full  = ed_full.text().strip()
-            mail  = ed_mail.text().strip()
-            addr  = ed_addr.toPlainText().strip()
-            date_str = ed_date.date().toString("yyyy-MM-dd")
-            # v EDIT režimu použij původní typy, v ADD podle checkboxů
-            if is_edit:
-                acad = bool(initial.get("academia", False))
-                cert = bool(initial.get("certified", False))
-            else:
-                acad = chk_acad.isChecked()
-                cert = chk_cert.isChecked()
-            link = ed_link.text().strip()
-    
-            # Validate
-            if not full:
-                QMessageBox.information(dlg, "Validation", "Full Name is required.")
-                return
-            if not (acad or cert):
-                QMessageBox.information(dlg, "Validation", "Select at least one badge type.")
-                return
-            if not date_str:
-                QMessageBox.information(dlg, "Validation", "Recognition Date is required.")
-                return
-            if not link:
-                QMessageBox.information(dlg, "Validation", "Badge Link is required.")
-                return
-    
-            # Valid Until (+365 dní) – počítáme až při ukládání do modelu
-            nonlocal result
-            result = {
-                "board": board,
-                "full_name": full,
-                "email": mail,
-                "address": addr,
-                "recognition_date": date_str,
-                "academia": bool(acad),
-                "certified": bool(cert),
-                "badge_link": link,
-            }
-            dlg.accept()
-    
-        btns.accepted.connect(_accept)
-        btns.rejected.connect(dlg.reject)
-    
-        dlg.resize(640, 520)
-        return result if dlg.exec_() == QDialog.Accepted else None
-    
-    def _recognized_add(self) -> None:
-        """
-        Přidání osoby. Při volbě obou badge vloží DVA řádky (po kontrole duplicit per-badge).
-        Duplikát: (full_name + badge_link) NEBO (full_name + recognition_date + badge-typ).
-        Nový pořádek sloupců: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link.
-        """
-        from PySide6.QtWidgets import QMessageBox
-        from PySide6.QtGui import QStandardItem
-        from PySide6.QtCore import Qt
-        from datetime import datetime, timedelta
-    
-        new = self._recognized_open_add_dialog(None)
-        if not new:
-            return
-    
-        def _badge_rows(n: dict) -> list[tuple[bool, bool]]:
-            a = bool(n.get("academia"))
-            c = bool(n.get("certified"))
-            if a and c:
-                return [(True, False), (False, True)]
-            return [(a, c)]
-    
-        def _dup_exists(full_l, link_l, dstr, acad, cert) -> bool:
-            bkey = f"{int(bool(acad))}-{int(bool(cert))}"
-            for r in range(self._recognized_model.rowCount()):
-                f2 = (self._recognized_model.index(r, 1).data(Qt.DisplayRole) or "").strip().lower()
-                l2 = (self._recognized_model.index(r, 7).data(Qt.DisplayRole) or "").strip().lower()  # Badge Link
-                d2 = (self._recognized_model.index(r, 4).data(Qt.DisplayRole) or "").strip()          # Recognition Date
-                b2s= (self._recognized_model.index(r, 6).data(Qt.DisplayRole) or "").lower()          # Badge Types
-                b2 = f"{int('academia' in b2s)}-{int('certified' in b2s)}"
-                if f2 == full_l and (l2 == link_l or (d2 == dstr and b2 == bkey)):
-                    return True
-            return False
-    
-        board = new.get("board","")
-        full  = new.get("full_name","")
-        mail  = new.get("email","")
-        addr  = new.get("address","")
-        rdate = new.get("recognition_date","")
-        link  = new.get("badge_link","")
-    
-        full_l = (full or "").strip().lower()
-        link_l = (link or "").strip().lower()
-        dstr   = (rdate or "").strip()
-    
-        rows_to_add = []
-        for acad, cert in _badge_rows(new):
-            if _dup_exists(full_l, link_l, dstr, acad, cert):
-                continue
-            try:
-                dt = datetime.strptime(rdate, "%Y-%m-%d").date()
-                vuntil = (dt + timedelta(days=365)).isoformat()
-            except Exception:
-                vuntil = ""
-            badges = "; ".join([s for s,b in (("Academia", acad), ("Certified", cert)) if b])
-            vals = [board, full, mail, addr, rdate, vuntil, badges, link]
-            rows_to_add.append([QStandardItem(str(v)) for v in vals])
-    
-        if not rows_to_add:
-            QMessageBox.information(self, "Duplicate", "This person/badge already exists.")
-            return
-    
-        for items in rows_to_add:
-            for it in items:
-                it.setEditable(False)
-            self._recognized_model.appendRow(items)
-    
-        self._recognized_fit_columns()
-        self._recognized_apply_row_colors()
-    
-    def _recognized_edit(self) -> None:
-        """
-        Edit vybraného řádku.
-        V EDIT režimu jsou badge typy i volba Sorted zdroje irelevantní (skryty).
-        Výběr z tabulky mapujeme z proxy na zdrojový model.
-        """
-        from PySide6.QtWidgets import QMessageBox
-        from PySide6.QtCore import Qt
-        from datetime import datetime, timedelta
-    
-        sel = self.tbl_recognized.selectionModel().selectedRows()
-        if not sel:
-            QMessageBox.information(self, "Edit", "Select a row to edit.")
-            return
-        # map proxy -> source row
-        proxy_idx = sel[0]
-        try:
-            src_idx = self._rec_proxy.mapToSource(proxy_idx)
-            r = src_idx.row()
-        except Exception:
-            r = proxy_idx.row()
-    
-        # Původní hodnoty
-        cur = {
-            "board": self._recognized_model.index(r,0).data(Qt.DisplayRole) or "",
-            "full_name": self._recognized_model.index(r,1).data(Qt.DisplayRole) or "",
-            "email": self._recognized_model.index(r,2).data(Qt.DisplayRole) or "",
-            "address": self._recognized_model.index(r,3).data(Qt.DisplayRole) or "",
-            "recognition_date": self._recognized_model.index(r,4).data(Qt.DisplayRole) or "",
-            "badge_link": self._recognized_model.index(r,7).data(Qt.DisplayRole) or "",
-        }
-        btxt = (self._recognized_model.index(r,6).data(Qt.DisplayRole) or "").lower()
-        cur["academia"]  = "academia"  in btxt
-        cur["certified"] = "certified" in btxt
-    
-        upd = self._recognized_open_add_dialog(cur)
-        if not upd:
-            return
-    
-        # Přepočítej Valid Until = +365 dní
-        try:
-            dt = datetime.strptime(upd.get("recognition_date",""), "%Y-%m-%d").date()
-            vuntil = (dt + timedelta(days=365)).isoformat()
-        except Exception:
-            vuntil = ""
-    
-        # Badge typy se v EDIT režimu nemění (ponecháme původní)
-        acad_keep = cur["academia"]; cert_keep = cur["certified"]
-        badges_txt = "; ".join([s for s,b in (("Academia", acad_keep), ("Certified", cert_keep)) if b])
-    
-        vals = [
-            upd.get("board",""), upd.get("full_name",""), upd.get("email",""), upd.get("address",""),
-            upd.get("recognition_date",""), vuntil, badges_txt, upd.get("badge_link",""),
-        ]
-        for c, v in enumerate(vals):
-            self._recognized_model.setData(self._recognized_model.index(r, c), str(v))
-    
-        self._recognized_fit_columns()
-        self._recognized_apply_row_colors()
-        
-    def _recognized_apply_row_colors(self) -> None:
-        """
-        Podbarvení řádků podle platnosti (Valid Until vs dnešek):
-          - > 30 dnů: zelená
-          - 0..30 dnů: žlutá
-          - < 0 dnů: červená
-        (Valid Until je ve sloupci index 5.)
-        """
-        from PySide6.QtGui import QColor, QBrush
-        from PySide6.QtCore import Qt
-        from datetime import datetime, date
-    
-        try:
-            today = date.today()
-            rows = self._recognized_model.rowCount()
-            for r in range(rows):
-                vuntil_s = self._recognized_model.index(r, 5).data(Qt.DisplayRole) or ""
-                col_brush = None
-                try:
-                    vuntil = datetime.strptime(vuntil_s, "%Y-%m-%d").date()
-                    days_left = (vuntil - today).days
-                    if days_left > 30:
-                        col_brush = QBrush(QColor(40, 140, 60, 60))    # zelená (jemná)
-                    elif days_left >= 0:
-                        col_brush = QBrush(QColor(200, 160, 20, 70))   # žlutá
-                    else:
-                        col_brush = QBrush(QColor(200, 60, 60, 80))    # červená
-                except Exception:
-                    col_brush = None
-    
-                if col_brush:
-                    for c in range(self._recognized_model.columnCount()):
-                        self._recognized_model.item(r, c).setBackground(col_brush)
-                else:
-                    for c in range(self._recognized_model.columnCount()):
-                        self._recognized_model.item(r, c).setBackground(QBrush())
-        except Exception:
-            pass
-    
-    def _recognized_delete(self) -> None:
-        """Smazání vybraných řádků (s potvrzením). Mapování výběru z proxy na zdrojový model."""
-        from PySide6.QtWidgets import QMessageBox
-        sel = self.tbl_recognized.selectionModel().selectedRows()
-        if not sel:
-            QMessageBox.information(self, "Delete", "Select one or more rows to delete.")
-            return
-        if QMessageBox.question(self, "Delete", f"Delete {len(sel)} selected item(s)?") != QMessageBox.Yes:
-            return
-        # proxy -> source rows
-        rows = []
-        for pidx in sel:
-            try:
-                sidx = self._rec_proxy.mapToSource(pidx)
-                rows.append(sidx.row())
-            except Exception:
-                rows.append(pidx.row())
-        for r in sorted(set(rows), reverse=True):
-            self._recognized_model.removeRow(r)
-
-    def _recognized_fit_columns(self) -> None:
-        """Do-fit sloupců po naplnění/změnách."""
-        try:
-            hdr = self.tbl_recognized.horizontalHeader()
-            for c in range(self._recognized_model.columnCount()):
-                self.tbl_recognized.resizeColumnToContents(c)
-            hdr.setStretchLastSection(True)
-        except Exception:
-            pass
-
-    # ----- Menu / actions -----
-    def _build_menu(self) -> None:
-        rescan_action = QAction("Rescan", self)
-        rescan_action.triggered.connect(self.rescan)
-
-        open_action = QAction("Open Selected PDF", self)
-        open_action.triggered.connect(self.open_selected_pdf)
-
-        export_csv_action = QAction("Export CSV (visible rows)…", self)
-        export_csv_action.triggered.connect(self.export_csv)
-
-        export_xlsx_action = QAction("Export XLSX (visible rows)…", self)
-        export_xlsx_action.triggered.connect(self.export_xlsx)
-
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self._about)
-
-        # File menu: selectable PDF / Sorted PDFs folders (persisted)
-        open_pdf_folder_action = QAction("Open PDF folder…", self)
-        open_pdf_folder_action.triggered.connect(self._choose_pdf_folder)
-        open_sorted_folder_action = QAction("Open Sorted PDFs folder…", self)
-        open_sorted_folder_action.triggered.connect(self._choose_sorted_folder)
-
-        file_menu = self.menuBar().addMenu("File")
-        file_menu.addAction(open_pdf_folder_action)
-        file_menu.addAction(open_sorted_folder_action)
-
-        # Minimal-change: zbývající akce přímo na menubaru
-        self.menuBar().addAction(rescan_action)
-        self.menuBar().addAction(open_action)
-        self.menuBar().addAction(export_csv_action)
-        self.menuBar().addAction(export_xlsx_action)
-        self.menuBar().addAction(about_action)
+        return db
 
-    def _choose_pdf_folder(self) -> None:
-        from PySide6.QtWidgets import QFileDialog
-        start = str(self.pdf_root) if self.pdf_root and Path(self.pdf_root).exists() else str(Path.home())
-        chosen = QFileDialog.getExistingDirectory(self, "Select PDF folder", start)
-        if not chosen:
-            return
-        self.pdf_root = Path(chosen)
-        self.settings.set("pdf_root", str(self.pdf_root))
+    def _set_sorted_copy_mode(self, mode: str) -> None:
+        """File → Export to Sorted PDFs as: copy / reflink / link (persistováno)."""
+        self.settings.set("sorted_copy_mode", mode)
         self.settings.save()
-        # Přesměruj browser strom + FS watcher na nový kořen a přeskenuj
-        try:
-            if getattr(self, "fs_model", None) is not None:
-                self.fs_model.setRootPath(str(self.pdf_root))
-                self.tree_browser.setRootIndex(self.fs_model.index(str(self.pdf_root)))
-        except Exception:
-            pass
-        try:
-            self._rebuild_watch_list()
-        except Exception:
-            pass
-        self.rescan()
 
-    def _choose_sorted_folder(self) -> None:
-        from PySide6.QtWidgets import QFileDialog
-        start = str(self.sorted_root) if self.sorted_root and Path(self.sorted_root).exists() else str(Path.home())
-        chosen = QFileDialog.getExistingDirectory(self, "Select Sorted PDFs folder", start)
-        if not chosen:
+    def _set_sorted_db_backend(self, backend: str) -> None:
+        """File → Sorted DB storage: přepne backend (json / journal / sqlite).
+        Starý backend se při zavření zapíše do sorted_db.json (žurnál se sloučí,
+        SQLite se vyexportuje); SQLite JSON převezme, kdykoli se od posledního
+        exportu změnil."""
+        if backend == self.settings.get("sorted_db_backend", "json"):
             return
-        self.sorted_root = Path(chosen)
-        self.settings.set("sorted_root", str(self.sorted_root))
+        self.settings.set("sorted_db_backend", backend)
         self.settings.save()
-        # Přepoj DB na nový kořen a přeskenuj Sorted
         try:
-            from app.sorted_db import SortedDb
-            self.sorted_db = SortedDb(self.sorted_root)
-            self.sorted_db.load()
+            self.sorted_db = self._open_sorted_db()
         except Exception:
             pass
         self.rescan_sorted()
@@ -1226,7 +1070,7 @@ class MainWindow(QMainWindow):
 
         out: list[PdfRecord] = []
         for p in paths:
-            rec = next((x for x in self.records if str(x.path) == p), None)
+            rec = self.store.record(self.store.id_for_path(p))
             if rec:
                 out.append(rec)
         return out
@@ -1247,9 +1091,9 @@ class MainWindow(QMainWindow):
             sidx = index
             src = self.table.model()
         path_str = src.index(sidx.row(), FILE_COL).data(Qt.UserRole + 1)
-        for r in self.records:
-            if str(r.path) == path_str:
-                return r
+        rec = self.store.record(self.store.id_for_path(path_str))
+        if rec is not None:
+            return rec
         # Fallback: match by file name shown in the cell
         fname = src.index(sidx.row(), FILE_COL).data(Qt.DisplayRole)
         if fname:
@@ -1272,7 +1116,6 @@ class MainWindow(QMainWindow):
 
     def export_csv(self) -> None:
         from PySide6.QtWidgets import QFileDialog
-        import csv
 
         model = self.table.model()
         if model is None:
@@ -1295,24 +1138,23 @@ class MainWindow(QMainWindow):
             h = model.headerData(c, Qt.Horizontal, Qt.DisplayRole) or ""
             headers_list.append(str(h).replace("\n", " • "))
 
+        from app.export_engine import write_csv
+        n_rows, rows = self._overview_visible_rows(visible_cols)
         try:
-            with open(path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers_list)
-                for r in range(model.rowCount()):
-                    row_vals = []
-                    for c in visible_cols:
-                        val = model.index(r, c).data(Qt.DisplayRole)
-                        row_vals.append("" if val is None else str(val))
-                    writer.writerow(row_vals)
-            QMessageBox.information(self, "Export CSV", f"Exported {model.rowCount()} rows to:\n{path}")
+            ok, errs, cancelled = self._run_export_jobs(
+                [("CSV", path, lambda tick: write_csv(path, headers_list, rows(), encoding="utf-8-sig", tick=tick))],
+                n_rows, "Export CSV")
+            if errs:
+                raise RuntimeError(errs[0])
+            if not cancelled:
+                QMessageBox.information(self, "Export CSV", f"Exported {n_rows} rows to:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export CSV", f"Failed to write CSV:\n{e}")
 
     def export_xlsx(self) -> None:
         from PySide6.QtWidgets import QFileDialog
         try:
-            from openpyxl import Workbook
+            import openpyxl  # noqa: F401 – jen kontrola dostupnosti
         except Exception:
             QMessageBox.critical(
                 self, "Export XLSX",
@@ -1341,26 +1183,150 @@ class MainWindow(QMainWindow):
             h = model.headerData(c, Qt.Horizontal, Qt.DisplayRole) or ""
             headers_list.append(str(h).replace("\n", " • "))
 
+        from app.export_engine import write_xlsx
+        n_rows, rows = self._overview_visible_rows(visible_cols)
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "ISTQB Applications"
-            ws.append(headers_list)
-            for r in range(model.rowCount()):
-                row_vals = []
-                for c in visible_cols:
-                    val = model.index(r, c).data(Qt.DisplayRole)
-                    row_vals.append("" if val is None else str(val))
-                ws.append(row_vals)
-            # Auto width
-            for col in ws.columns:
-                max_len = max(len(str(c.value)) if c.value is not None else 0 for c in col)
-                ws.column_dimensions[col[0].column_letter].width = min(max(12, max_len + 2), 60)
-            wb.save(path)
-            QMessageBox.information(self, "Export XLSX", f"Exported {model.rowCount()} rows to:\n{path}")
+            ok, errs, cancelled = self._run_export_jobs(
+                [("XLSX", path, lambda tick: write_xlsx(path, headers_list, rows(), sheet_title="ISTQB Applications",
+                                                         bold_header=False, min_width=12, max_width=60, tick=tick))],
+                n_rows, "Export XLSX")
+            if errs:
+                raise RuntimeError(errs[0])
+            if not cancelled:
+                QMessageBox.information(self, "Export XLSX", f"Exported {n_rows} rows to:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export XLSX", f"Failed to write XLSX:\n{e}")
             
+    def _overview_visible_rows(self, visible_cols: list[int]):
+        """
+        Řádky Overview (pořadí a filtr proxy, jen ``visible_cols``) pro streamovaný
+        export: vrací ``(počet, factory)``; ``factory()`` je generátor řádků.
+
+        Datové sloupce se čtou ze sdíleného RecordStore (efektivní hodnoty), takže
+        generátor může běžet v pracovním vlákně. V GUI vlákně se tu posbírá jen
+        pořadí řádků a hodnoty sloupců mimo záznam (Sorted, Status).
+        """
+        from app.pdf_scanner import ROW_FIELDS
+        proxy = self.table.model()
+        src_model = getattr(self, "_source_model", None)
+        store = getattr(self, "store", None)
+        if (proxy is None or src_model is None or store is None
+                or len(store) != src_model.rowCount() or not hasattr(proxy, "mapToSource")):
+            # fallback: hodnoty přímo z modelu (v GUI vlákně)
+            data = []
+            if proxy is not None:
+                for r in range(proxy.rowCount()):
+                    data.append(["" if v is None else str(v)
+                                 for v in (proxy.index(r, c).data(Qt.DisplayRole) for c in visible_cols)])
+            return len(data), lambda: iter(data)
+
+        order = [proxy.mapToSource(proxy.index(r, 0)).row() for r in range(proxy.rowCount())]
+        getters = []
+        for c in visible_cols:
+            if c < len(ROW_FIELDS):
+                getters.append(("store", ROW_FIELDS[c]))
+            else:
+                vals = {}
+                for srow in order:
+                    v = src_model.index(srow, c).data(Qt.DisplayRole)
+                    vals[srow] = "" if v is None else str(v)
+                getters.append(("model", vals))
+
+        def _rows():
+            for rid in order:
+                row = []
+                for kind, g in getters:
+                    if kind == "store":
+                        v = store.value(rid, g)
+                        row.append("" if v is None else str(v))
+                    else:
+                        row.append(g.get(rid, ""))
+                yield row
+
+        return len(order), _rows
+
+    def _run_export_jobs(self, jobs: list, total_rows: int, title: str) -> tuple[list, list, bool]:
+        """
+        Spustí exportní úlohy ``(název, soubor, fn(tick))`` v pracovním vlákně
+        s progress dialogem (``run_with_progress``); GUI se během exportu nezasekne.
+        Vrací (hotové soubory, chyby, zrušeno?). Soubor přerušený přes Cancel se smaže.
+        """
+        import os
+        from app.background import run_with_progress
+        from app.export_engine import ExportCancelled
+
+        def _work(progress, cancel):
+            ok, errs = [], []
+            for n_job, (name, filename, fn) in enumerate(jobs):
+                base = n_job * total_rows
+
+                def tick(n: int, base=base) -> None:
+                    if cancel.is_set():
+                        raise ExportCancelled(filename)
+                    if n % 64 == 0:
+                        progress(base + n)
+
+                progress(base, text=f"Writing {name}: {os.path.basename(filename)}")
+                try:
+                    fn(tick)
+                    ok.append(filename)
+                except ExportCancelled:
+                    try:
+                        os.remove(filename)
+                    except OSError:
+                        pass
+                    break
+                except ImportError:
+                    errs.append(f"{name}: optional dependency 'openpyxl' not installed.")
+                except Exception as e:
+                    errs.append(f"{name}: {e}")
+            return ok, errs
+
+        result, cancelled = run_with_progress(self, "Exporting…", _work,
+                                              total=max(1, total_rows * len(jobs)), title=title)
+        ok, errs = result or ([], [])
+        return ok, errs, cancelled
+
+    def _run_fanout_export(self, sinks: list, items, total_rows: int, title: str) -> tuple[list, list, bool]:
+        """
+        Jako ``_run_export_jobs``, ale data se čtou jen jednou: ``items()`` vrací
+        páry ``(board, řádek)`` a ``export_engine.fan_out`` je rozešle všem
+        sinkům (formáty / soubory po boardech), které zapisují souběžně.
+        Vrací (hotové soubory, chyby, zrušeno?). Při Cancel se smažou rozepsané
+        soubory, které tento běh založil (dřív existující soubor se nemaže).
+        """
+        import os
+        from app.background import run_with_progress
+        from app.export_engine import ExportCancelled, fan_out
+        existed = {sink.filename for sink in sinks if os.path.exists(sink.filename)}
+
+        def _work(progress, cancel):
+            def tick(n: int) -> None:
+                if n % 64 == 0:
+                    progress(n)
+
+            progress(0, text=f"Writing {len(sinks)} file(s)…")
+            return fan_out(items(), sinks, tick=tick, cancel=cancel)
+
+        _completed, cancelled = run_with_progress(self, "Exporting…", _work,
+                                                  total=max(1, total_rows), title=title)
+        ok, errs = [], []
+        for sink in sinks:
+            if sink.error is None and not cancelled:
+                ok.append(sink.filename)
+                continue
+            if cancelled or isinstance(sink.error, ExportCancelled):
+                if sink.filename not in existed:
+                    try:
+                        os.remove(sink.filename)
+                    except OSError:
+                        pass
+            elif isinstance(sink.error, ImportError):
+                errs.append(f"{sink.name}: optional dependency 'openpyxl' not installed.")
+            else:
+                errs.append(f"{sink.name}: {sink.error}")
+        return ok, errs, cancelled
+
     def _about(self) -> None:
         QMessageBox.information(
             self, "About",
@@ -1370,9 +1336,17 @@ class MainWindow(QMainWindow):
         )
 
     def export_selected_to_sorted(self) -> None:
+        """
+        Zkopíruje vybrané řádky Overview do 'Sorted PDFs/<board>/' a zapíše je do DB.
+
+        1. úlohy se sestaví v GUI vlákně (záznam přes ID řádku, cílová složka),
+        2. kopie běží paralelně na thread poolu s progress dialogem a Cancel,
+           SHA-256 cíle se počítá rovnou při kopírování,
+        3. všechny upserty se zapíšou jednou dávkou (jeden save / transakce),
+           pak se jednou obnoví strom Sorted PDFs.
+        """
         from PySide6.QtWidgets import QMessageBox
         from pathlib import Path
-        import shutil
 
         sel = self.table.selectionModel()
         if not sel or not sel.hasSelection():
@@ -1392,24 +1366,27 @@ class MainWindow(QMainWindow):
         if col_file is None:
             col_file = model.columnCount() - 1
 
-        exported = 0
-        
         rows = sorted(list(set(i.row() for i in sel.selectedRows())))
 
+        # (src_path, dest_file, target_board, found_rec)
+        jobs: list[tuple] = []
+        seen_dest: set[str] = set()
         try:
             for r in rows:
-                # 2. Cesta k souboru
+                # 2. Záznam a cesta k souboru – primárně přes ID řádku (O(1),
+                #    jednoznačné i při stejném názvu souboru ve více boardech)
                 idx_file = model.index(r, col_file)
-                src_path_str = idx_file.data(Qt.UserRole + 1)
+                found_rec = self.store.record(idx_file.data(ROLE_RECORD_ID))
+                src_path_str = str(found_rec.path) if found_rec else idx_file.data(Qt.UserRole + 1)
                 
                 if not src_path_str:
                     src_path_str = idx_file.data(Qt.UserRole)
                 if not src_path_str:
                     filename_only = idx_file.data(Qt.DisplayRole)
                     if filename_only:
-                        rec = next((x for x in self.records if x.path.name == filename_only), None)
-                        if rec:
-                            src_path_str = str(rec.path)
+                        p = self._find_record_path_for_filename(str(filename_only))
+                        if p:
+                            src_path_str = str(p)
 
                 if not src_path_str:
                     print(f"[Export Skip] Row {r}: No path found.")
@@ -1427,43 +1404,105 @@ class MainWindow(QMainWindow):
                 if not target_board:
                     target_board = "Unsorted"
 
-                # 4. Data (originál z paměti)
-                record_data = {}
-                found_rec = next((rec for rec in self.records if str(rec.path.resolve()) == str(src_path.resolve())), None)
-                if found_rec:
-                    record_data = found_rec.to_dict()
-                else:
-                    record_data = {"file_name": src_path.name}
+                if found_rec is None:
+                    found_rec = self.store.record(self.store.id_for_path(src_path))
 
-                # 5. Kopírování
+                # 4. Cíl (složky se zakládají tady, workery jen kopírují)
                 dest_dir = (self.sorted_root / target_board).resolve()
                 dest_dir.mkdir(parents=True, exist_ok=True)
                 dest_file = dest_dir / src_path.name
-
-                try:
-                    shutil.copy2(src_path, dest_file)
-                except Exception as e:
-                    print(f"[Export Error] Copy failed: {e}")
+                if str(dest_file) in seen_dest:
                     continue
-
-                # 6. Zápis do DB jako PARSED (edited=False). 'Edited' v Overview
-                #    se objeví až po ruční editaci v záložce Sorted PDFs.
-                #    upsert_parsed navíc respektuje již ručně editované záznamy.
-                record_data["board"] = target_board
-                record_data["file_name"] = src_path.name
-                self.sorted_db.upsert_parsed(dest_file, target_board, src_path.name, record_data)
-
-                exported += 1
-
-            if exported > 0:
-                self.sorted_db.save()
-                self.rescan_sorted()
-                self.statusBar().showMessage(f"Exported {exported} file(s) to 'Sorted PDFs'.")
-            else:
-                QMessageBox.warning(self, "Export Failed", "No files were exported.")
-
+                seen_dest.add(str(dest_file))
+                jobs.append((src_path, dest_file, target_board, found_rec))
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Critical error: {e}")
+            return
+
+        if not jobs:
+            QMessageBox.warning(self, "Export Failed", "No files were exported.")
+            return
+
+        # 5. Kopírování (paralelně, s hashem cíle)
+        try:
+            digests, methods, cancelled = self._copy_files_to_sorted([(j[0], j[1]) for j in jobs])
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Critical error: {e}")
+            return
+
+        # 6. Zápis do DB jako PARSED (edited=False) – jednou dávkou. 'Edited'
+        #    v Overview se objeví až po ruční editaci v záložce Sorted PDFs.
+        #    upsert_parsed navíc respektuje již ručně editované záznamy.
+        exported = 0
+        try:
+            with self.sorted_db.batch():
+                for i, (src_path, dest_file, target_board, found_rec) in enumerate(jobs):
+                    dig = digests.get(i)
+                    if not dig:
+                        continue
+                    # hash kopie známe z kopírování → Sorted indikátor nečte soubor znovu
+                    self._hash_cache.put(dest_file, dig)
+                    record_data = found_rec.to_dict() if found_rec else {"file_name": src_path.name}
+                    record_data["board"] = target_board
+                    record_data["file_name"] = src_path.name
+                    self.sorted_db.upsert_parsed(dest_file, target_board, src_path.name, record_data,
+                                                 content_hash=dig)
+                    exported += 1
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Critical error: {e}")
+            return
+
+        if exported > 0:
+            self.rescan_sorted()
+            msg = f"Exported {exported} file(s) to 'Sorted PDFs'."
+            linked = {m: n for m, n in methods.items() if m != "copy" and n}
+            if linked:
+                msg += " (" + ", ".join(f"{n}× {m}" for m, n in sorted(linked.items())) + ")"
+            if cancelled:
+                msg += f" Cancelled – {len(jobs) - exported} file(s) skipped."
+            self.statusBar().showMessage(msg)
+        elif not cancelled:
+            QMessageBox.warning(self, "Export Failed", "No files were exported.")
+
+    def _copy_files_to_sorted(self, pairs: list) -> tuple[dict, dict, bool]:
+        """
+        Umístí (src, dst) páry do Sorted PDFs paralelně (thread pool, I/O-bound)
+        s progress dialogem; kopie / reflink / hardlink podle 'sorted_copy_mode'.
+        Vrací ({index páru: sha256 cíle}, {metoda: počet}, zrušeno?). Chybné
+        kopie v dict chybí (a vypíšou se do konzole jako dřív).
+        """
+        import os
+        from collections import Counter
+        from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
+        from app.background import run_with_progress
+        from app.fs_copy import export_file, CopyCancelled
+
+        workers = max(1, min(len(pairs), EXPORT_COPY_WORKERS))
+        mode = self.settings.get("sorted_copy_mode", "copy")
+        methods: Counter = Counter()
+
+        def _work(progress, cancel):
+            out: dict = {}
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sorted-copy") as pool:
+                futs = {pool.submit(export_file, src, dst, mode, cancel): i for i, (src, dst) in enumerate(pairs)}
+                for n, fut in enumerate(as_completed(futs), 1):
+                    i = futs[fut]
+                    try:
+                        out[i], method = fut.result()
+                        methods[method] += 1
+                    except (CopyCancelled, CancelledError):
+                        pass
+                    except Exception as e:
+                        print(f"[Export Error] Copy failed: {pairs[i][0]}: {e}")
+                    progress(n, text=f"Copying {n}/{len(pairs)}: {os.path.basename(str(pairs[i][0]))}")
+                    if cancel.is_set():
+                        for f in futs:
+                            f.cancel()
+            return out
+
+        digests, cancelled = run_with_progress(self, "Copying PDFs to 'Sorted PDFs'…", _work,
+                                               total=len(pairs), title="Export to Sorted PDFs")
+        return digests or {}, dict(methods), cancelled
 
 
     # ----- Overview tab -----
@@ -1512,7 +1551,8 @@ class MainWindow(QMainWindow):
         # ===== NOVÉ TLAČÍTKO: Export to Sorted PDFs =====
         self.btn_export_sorted = QPushButton("Export to Sorted PDFs")
         self.btn_export_sorted.setToolTip("Copy selected PDFs to Sorted PDFs/{Board}/")
-        self.btn_export_sorted.clicked.connect(self.export_selected_to_sorted)
+        self.btn_export_sorted.clicked.connect(
+            lambda _checked=False: self._measured("export to Sorted", self.export_selected_to_sorted))
     
         # Checkbox Sorted (filtr ve view)
         self.chk_overview_sorted = QCheckBox("Sorted")
@@ -1644,7 +1684,7 @@ class MainWindow(QMainWindow):
             if chosen == act_edit:
                 self._overview_edit_selected()
             elif chosen == act_export_sorted:
-                self.export_selected_to_sorted()
+                self._measured("export to Sorted", self.export_selected_to_sorted)
                 # minimální doplněk: po exportu přepočti Sorted + aplikuj hiding (tiché, bez zásahu do výběru)
                 try:
                     self._overview_update_sorted_flags()
@@ -1701,6 +1741,16 @@ class MainWindow(QMainWindow):
         from pathlib import Path
         names: set[str] = set()
     
+        # 0) SortedDb – názvy přímo z indexu/DB
+        db = getattr(self, "sorted_db", None)
+        if db is not None and hasattr(db, "file_names"):
+            try:
+                names = set(db.file_names())
+            except Exception:
+                names = set()
+            if names:
+                return names
+
         # 1) In-memory
         for attr in ("sorted_db", "_sorted_db", "sorted_records", "_sorted_records", "sorted_data", "_sorted_data"):
             cnt = getattr(self, attr, None)
@@ -1790,6 +1840,8 @@ class MainWindow(QMainWindow):
         def _yes(v: str) -> bool:
             return (v or "").strip().lower() in {"yes", "on", "true", "1", "checked"}
 
+        store = self.store
+        store.clear_overlay()
         rows = self._source_model.rowCount()
         for r in range(rows):
             idx_fn = self._source_model.index(r, fn_col)
@@ -1800,10 +1852,12 @@ class MainWindow(QMainWindow):
             edited = False
             in_sorted = False
             edit_data = None
+            rid = self._source_model.data(idx_fn, ROLE_RECORD_ID)
+            rec = store.record(rid)
             try:
-                path = self._find_record_path_for_filename(fname)
+                path = rec.path if rec is not None else self._find_record_path_for_filename(fname)
                 if path:
-                    dig = self._hash_file(path)
+                    dig = (rec.content_hash if rec is not None else None) or self._hash_file(path)
                     info = sorted_edits.get(dig) if dig else None
                     if info is not None:
                         in_sorted = True
@@ -1811,7 +1865,7 @@ class MainWindow(QMainWindow):
                         mark = "Edited" if edited else "Yes"
                         if edited:
                             edit_data = info.get("data", {}) or {}
-                            tooltip = self._sorted_filled_tooltip(fname, edit_data)
+                            tooltip = self._sorted_filled_tooltip(rid, edit_data)
                         else:
                             tooltip = "In Sorted PDFs"
             except Exception:
@@ -1839,6 +1893,8 @@ class MainWindow(QMainWindow):
             # Wished Recognition se text nezobrazuje (jen ikona), proto je nutné
             # zvýraznit pozadím – jinak by úprava nebyla vidět.
             if edited and edit_data is not None:
+                if rec is not None:
+                    store.set_overlay(rid, {k: edit_data.get(k) for k in field_cols})
                 for key, col in field_cols.items():
                     new_val = str(edit_data.get(key, "") or "").strip()
                     cell = self._source_model.index(r, col)
@@ -1852,6 +1908,35 @@ class MainWindow(QMainWindow):
                     if col in recog_cols:
                         self._source_model.setData(cell, icon_yes if _yes(new_val) else icon_no, Qt.DecorationRole)
             
+    def _overview_apply_sorted_marks(self, marks: list) -> None:
+        """
+        Warm start: sloupec 'Sorted' ze snapshotu ('Yes'/'Edited'/'No' po řádcích
+        zdrojového modelu) – stejné ikony a barvy jako _overview_update_sorted_flags,
+        ale bez Sorted DB a hashů. Přesný stav (včetně editovaných hodnot v buňkách)
+        dopočte _overview_update_sorted_flags po sladění s diskem.
+        """
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QStyle
+        from PySide6.QtGui import QBrush, QColor
+
+        sorted_col = self._overview_find_col("Sorted")
+        m = getattr(self, "_source_model", None)
+        if sorted_col is None or m is None or len(marks) != m.rowCount():
+            return
+        look = {
+            "Yes": (self.style().standardIcon(QStyle.SP_DialogApplyButton), QBrush(QColor(56, 96, 64)), "In Sorted PDFs"),
+            "Edited": (self.style().standardIcon(QStyle.SP_FileDialogDetailedView), QBrush(QColor(64, 110, 72)), None),
+            "No": (self.style().standardIcon(QStyle.SP_DialogCancelButton), QBrush(QColor(110, 64, 64)), "Not in Sorted PDFs"),
+        }
+        for r, mark in enumerate(marks):
+            icon, brush, tip = look.get(mark, look["No"])
+            idx = m.index(r, sorted_col)
+            m.setData(idx, mark if mark in look else "No", Qt.DisplayRole)
+            m.setData(idx, Qt.AlignCenter, Qt.TextAlignmentRole)
+            m.setData(idx, icon, Qt.DecorationRole)
+            m.setData(idx, brush, Qt.BackgroundRole)
+            m.setData(idx, tip, Qt.ToolTipRole)
+
     def _overview_apply_sorted_row_hiding(self) -> None:
         """
         Skryje/ukáže řádky podle checkboxu 'Sorted'.
@@ -1905,8 +1990,9 @@ class MainWindow(QMainWindow):
             except Exception:
                 return str(path)
 
-    def _overview_apply_statuses(self) -> None:
-        """Fill the 'Status' column from the status store, with color coding."""
+    def _overview_apply_statuses(self, statuses: Optional[list] = None) -> None:
+        """Fill the 'Status' column from the status store, with color coding.
+        ``statuses`` = hodnoty po ID záznamů (warm-start snapshot) místo dotazů do store."""
         from PySide6.QtCore import Qt
         from PySide6.QtGui import QBrush, QColor
         status_col = self._overview_find_col("Status")
@@ -1914,13 +2000,18 @@ class MainWindow(QMainWindow):
         if status_col is None or fn_col is None or not hasattr(self, "_source_model"):
             return
         m = self._source_model
+        if statuses is not None and len(statuses) != m.rowCount():
+            statuses = None
         for r in range(m.rowCount()):
-            abs_p = m.index(r, fn_col).data(Qt.UserRole + 1)
-            if not abs_p:
-                fname = (m.index(r, fn_col).data(Qt.DisplayRole) or "").strip()
-                abs_p = self._find_record_path_for_filename(fname)
-            key = self._status_key_for_path(abs_p) if abs_p else ""
-            status = self.status_store.get(key)
+            if statuses is not None:
+                status = statuses[r]
+            else:
+                abs_p = m.index(r, fn_col).data(Qt.UserRole + 1)
+                if not abs_p:
+                    fname = (m.index(r, fn_col).data(Qt.DisplayRole) or "").strip()
+                    abs_p = self._find_record_path_for_filename(fname)
+                key = self._status_key_for_path(abs_p) if abs_p else ""
+                status = self.status_store.get(key)
             idx = m.index(r, status_col)
             m.setData(idx, status, Qt.DisplayRole)
             m.setData(idx, Qt.AlignCenter, Qt.TextAlignmentRole)
@@ -2063,15 +2154,15 @@ class MainWindow(QMainWindow):
         (matched by file content hash). Returns a dict of field -> value."""
         from pathlib import Path
         data = {}
+        rec = None
         try:
-            rec = next((x for x in getattr(self, "records", [])
-                        if str(x.path.resolve()) == str(Path(abs_path).resolve())), None)
+            rec = self.store.record(self.store.id_for_path(abs_path))
             if rec is not None:
                 data = rec.to_dict()
         except Exception:
             data = {}
         try:
-            dig = self._hash_file(abs_path)
+            dig = (rec.content_hash if rec is not None else None) or self._hash_file(abs_path)
             edits = self._collect_sorted_edits_by_hash()
             info = edits.get(dig) if dig else None
             if info and info.get("edited"):
@@ -2246,7 +2337,7 @@ class MainWindow(QMainWindow):
         bar.addWidget(QLabel("Dataset summary"))
         bar.addStretch(1)
         btn = QPushButton("Refresh")
-        btn.clicked.connect(self._refresh_summary)
+        btn.clicked.connect(lambda _checked=False: self._measured("refresh summary", self._refresh_summary))
         bar.addWidget(btn)
         layout.addLayout(bar)
         self.summary_view = QTextBrowser()
@@ -2261,8 +2352,8 @@ class MainWindow(QMainWindow):
         if not hasattr(self, "summary_view"):
             return
         from app.status_store import STATUSES
-        records = getattr(self, "records", []) or []
-        total = len(records)
+        store = self.store
+        total = len(store)
 
         auto_complete = 0
         processed_complete = 0
@@ -2270,12 +2361,18 @@ class MainWindow(QMainWindow):
         by_board = {}                 # board -> [count, processed_count]
         by_status = {s: 0 for s in STATUSES}
 
-        for rec in records:
-            try:
-                parsed = rec.to_dict()
-            except Exception:
-                parsed = {}
-            effective = self._overview_effective_data(rec.path)
+        # ruční úpravy ze Sorted DB stačí posbírat jednou (dřív 1× na záznam)
+        edits = self._collect_sorted_edits_by_hash()
+        hashes = store.column("content_hash")
+        for rid, rec in enumerate(store.records):
+            parsed = store.row_dict(rid, effective=False)
+            effective = parsed
+            info = edits.get(hashes[rid] or self._hash_file(rec.path))
+            if info and info.get("edited"):
+                effective = dict(parsed)
+                for k, v in (info.get("data") or {}).items():
+                    if v not in (None, ""):
+                        effective[k] = v
 
             parsed_missing = self._missing_core_fields(parsed)
             eff_missing = self._missing_core_fields(effective)
@@ -2335,60 +2432,30 @@ class MainWindow(QMainWindow):
 
     def _find_record_path_for_filename(self, fname: str):
         """
-        Zjisti Path k PDF pro Overview řádek:
-          1) pokud v self.records existuje rec.path s tímto názvem,
-          2) pokud 'fname' v buňce je už plná cesta a existuje,
-          3) rekurzivně vyhledej pod pdf_root (case-insensitive podle názvu).
-        Cache: self._fname_to_path_cache
+        Zjisti Path k PDF pro Overview řádek podle názvu souboru:
+          1) index názvů v RecordStore (O(1)); při duplicitním názvu napříč
+             boardy vrací None – volající má použít ID řádku (ROLE_RECORD_ID),
+          2) pokud 'fname' v buňce je už plná cesta a existuje.
         """
         from pathlib import Path
     
         if not fname:
             return None
-        if not hasattr(self, "_fname_to_path_cache"):
-            self._fname_to_path_cache = {}
-    
-        if fname in self._fname_to_path_cache:
-            return self._fname_to_path_cache[fname]
+        store = getattr(self, "store", None)
+        if store is not None:
+            ids = store.ids_for_name(fname)
+            if len(ids) == 1:
+                return store.record(ids[0]).path
+            if len(ids) > 1:
+                return None
     
         # plná cesta v buňce?
         try:
             p = Path(fname)
-            if p.exists() and p.is_file():
-                self._fname_to_path_cache[fname] = p
+            if p.is_absolute() and p.is_file():
                 return p
         except Exception:
             pass
-    
-        # záznamy -> path
-        try:
-            for rec in (getattr(self, "records", None) or []):
-                p = getattr(rec, "path", None)
-                if p:
-                    pp = Path(p)
-                    if pp.name == fname or str(pp) == fname:
-                        self._fname_to_path_cache[fname] = pp
-                        return pp
-        except Exception:
-            pass
-    
-        # vyhledat pod pdf_root
-        try:
-            root = getattr(self, "pdf_root", None)
-            if root:
-                root = Path(root)
-                target = fname.lower()
-                for pp in root.rglob("*.pdf"):
-                    try:
-                        if pp.name.lower() == target:
-                            self._fname_to_path_cache[fname] = pp
-                            return pp
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-    
-        self._fname_to_path_cache[fname] = None
         return None
     
     def _enumerate_all_pdfs(self) -> list[str]:
@@ -2442,6 +2509,43 @@ class MainWindow(QMainWindow):
         'Sorted PDFs' tab (edited=True) and which fields were filled there.
         """
         out: dict = {}
+        db = self.sorted_db
+        if hasattr(db, "hash_index"):
+            # Hash je uložen v DB (od 0.16g) → jen doplnění starších záznamů
+            # a průchod indexem hash → klíče, bez hashování všech souborů.
+            try:
+                from pathlib import Path
+                from app.cache import file_stat
+                sroot = Path(db.sorted_root)
+                backfilled = False
+                failed = self._hash_backfill_failed
+                for key in db.keys_without_hash():
+                    abs_p = sroot / key
+                    st = file_stat(abs_p)
+                    if key in failed and failed[key] == st:
+                        continue  # chybějící/nečitelný soubor se od minula nezměnil
+                    dig = self._hash_file(abs_p) if st is not None else ""
+                    if dig:
+                        db.set_content_hash(abs_p, dig)
+                        failed.pop(key, None)
+                        backfilled = True
+                    else:
+                        failed[key] = st
+                if backfilled:
+                    db.save()
+                for dig, keys in db.hash_index().items():
+                    recs = [r for r in (db.get_key(k) for k in keys) if r]
+                    if not recs:
+                        continue
+                    # při více kopiích stejného PDF má přednost ručně editovaná
+                    rec = next((r for r in recs if r.get("edited")), recs[-1])
+                    out[dig] = {
+                        "edited": bool(rec.get("edited")),
+                        "data": rec.get("data", {}) or {},
+                    }
+                return out
+            except Exception:
+                out = {}
         try:
             from pathlib import Path
             sroot = Path(self.sorted_db.sorted_root)
@@ -2487,12 +2591,12 @@ class MainWindow(QMainWindow):
         "validity_end_date": "Validity End Date",
     }
 
-    def _sorted_filled_tooltip(self, fname: str, edited_data: dict) -> str:
+    def _sorted_filled_tooltip(self, rid: Optional[int], edited_data: dict) -> str:
         """Tooltip listing fields that were filled/changed in the Sorted PDFs tab
-        relative to what was auto-parsed for this PDF."""
+        relative to what was auto-parsed for this PDF (record ``rid`` in the store)."""
         try:
             parsed = {}
-            rec = next((x for x in getattr(self, "records", []) if x.path.name == fname), None)
+            rec = self.store.record(rid)
             if rec is not None:
                 parsed = rec.to_dict()
             filled = []
@@ -2545,28 +2649,57 @@ class MainWindow(QMainWindow):
         
     def _hash_file(self, path) -> str:
         """
-        SHA-256 daného souboru (čtení po 1 MiB blocích). Výsledek cache-uje.
+        SHA-256 daného souboru (čtení po 1 MiB blocích). Výsledek cache-uje
+        (``_hash_cache``, platnost podle size + mtime souboru).
         """
         from pathlib import Path
         import hashlib
-    
-        try:
-            p = Path(path)
-            if not hasattr(self, "_hash_cache"):
-                self._hash_cache = {}
-            key = str(p.resolve())
-            if key in self._hash_cache:
-                return self._hash_cache[key]
+
+        def _digest() -> str:
             h = hashlib.sha256()
             with p.open("rb") as fh:
                 for chunk in iter(lambda: fh.read(1024 * 1024), b""):
                     h.update(chunk)
-            dig = h.hexdigest()
-            self._hash_cache[key] = dig
-            return dig
+            return h.hexdigest()
+
+        try:
+            p = Path(path).resolve()
+            return self._hash_cache.get_or_compute(p, _digest)
         except Exception:
             return ""
         
+    def _parsed_record(self, path) -> Optional[PdfRecord]:
+        """
+        Záznam jednoho PDF pro detail panelů bez skenu celé složky:
+          1) z posledního skenu (Overview / warm-start snapshot), pokud se soubor
+             od té doby nezměnil – (size, mtime_ns) souhlasí s manifestem,
+          2) z LRU naposledy parsovaných souborů (``_parse_cache``),
+          3) parsing jediného souboru (výsledek jde do LRU).
+        """
+        from app.cache import file_stat
+        from app.pdf_scanner import PdfScanner
+
+        p = Path(path)
+        stat = file_stat(p)
+        if stat is None:
+            return None
+        store = getattr(self, "store", None)
+        rid = store.id_for_path(p) if store is not None else None
+        if rid is not None:
+            rec = store.record(rid)
+            if rec is not None and (getattr(self, "_record_stats", None) or {}).get(str(rec.path)) == stat:
+                return rec
+        key = p.resolve()
+        rec = self._parse_cache.get(key, stat=stat)
+        if rec is None:
+            try:
+                rec = PdfScanner(p.parent).parse_file(p)
+            except Exception:
+                return None
+            # stat z doby před parsingem → změna během parsingu = příště přepočet
+            self._parse_cache.put(key, rec, stat)
+        return rec
+
     def _rebuild_board_combo(self) -> None:
         """
         Sestaví combobox se dvěma sekcemi:
@@ -2815,6 +2948,7 @@ class MainWindow(QMainWindow):
         # --- pomocné: zjisti počet vybraných řádků + sadu vybraných názvů souborů z tabulky ---
         selected_count = 0
         selected_file_names: set[str] = set()
+        selected_ids: set[int] = set()
         try:
             view = getattr(self, "table", None)
             model = view.model() if view else None
@@ -2842,10 +2976,14 @@ class MainWindow(QMainWindow):
                     val = model.data(idx, Qt.DisplayRole)
                     if val:
                         selected_file_names.add(str(val))
-            selected_count = len(selected_file_names)
+                    rid = model.data(idx, ROLE_RECORD_ID)
+                    if rid is not None:
+                        selected_ids.add(int(rid))
+            selected_count = len(selected_ids) or len(selected_file_names)
         except Exception:
             selected_count = 0
             selected_file_names = set()
+            selected_ids = set()
     
         # --- dialog ---
         class ExportDialog(QDialog):
@@ -2881,7 +3019,31 @@ class MainWindow(QMainWindow):
                     self.rb_all.setChecked(True)
                 scope_lay.addWidget(self.rb_selected)
                 scope_lay.addWidget(self.rb_all)
+                # soubory po boardech se zapisují souběžně (jeden průchod daty)
+                self.chk_per_board = QCheckBox("Separate file per board")
+                scope_lay.addWidget(self.chk_per_board)
                 main.addWidget(grp_scope)
+
+                # --- Delta export (manifest s hashi záznamů) ---
+                grp_delta = QGroupBox("Incremental")
+                delta_lay = QVBoxLayout(grp_delta)
+                self.chk_delta = QCheckBox("Only changes since last export")
+                self.chk_merge = QCheckBox("Merge changes into an existing CSV/XLSX export")
+                self.chk_merge.setEnabled(False)
+                delta_lay.addWidget(self.chk_delta)
+                delta_lay.addWidget(self.chk_merge)
+
+                def _toggle_delta():
+                    on = self.chk_delta.isChecked()
+                    self.chk_merge.setEnabled(on)
+                    self.chk_per_board.setEnabled(not on)
+                    if not on:
+                        self.chk_merge.setChecked(False)
+                    else:
+                        self.chk_per_board.setChecked(False)
+
+                self.chk_delta.toggled.connect(_toggle_delta)
+                main.addWidget(grp_delta)
     
                 # --- Boardy ---
                 grp_b = QGroupBox("Boards to export")
@@ -3000,6 +3162,9 @@ class MainWindow(QMainWindow):
                     "boards": boards,   # None = All
                     "fields": fields,   # list of (label, key)
                     "scope": scope,     # "selected" | "all"
+                    "per_board": self.chk_per_board.isChecked(),
+                    "delta": self.chk_delta.isChecked(),
+                    "merge": self.chk_delta.isChecked() and self.chk_merge.isChecked(),
                 }
                 self.accept()
     
@@ -3013,6 +3178,9 @@ class MainWindow(QMainWindow):
         boards_sel: list[str] | None = dlg.result["boards"]
         fields: list[tuple[str, str]] = dlg.result["fields"]
         scope: str = dlg.result.get("scope", "all")
+        per_board: bool = bool(dlg.result.get("per_board"))
+        delta: bool = bool(dlg.result.get("delta"))
+        merge: bool = bool(dlg.result.get("merge"))
     
         # výběr cesty (jeden dialog – základní soubor, ostatní formáty vedle)
         # navržený název podle času a případných boardů
@@ -3023,8 +3191,13 @@ class MainWindow(QMainWindow):
         first_ext = formats[0]
         default_name = f"{base_name}.{first_ext}"
     
-        path, _ = QFileDialog.getSaveFileName(self, "Save export as…", default_name,
-                                              "All files (*.*)")
+        if merge:
+            # merge: cílem je dřívější export (vedle něj leží jeho manifest)
+            path, _ = QFileDialog.getOpenFileName(self, "Merge changes into export…", "",
+                                                  "Exports (*.csv *.xlsx)")
+        else:
+            path, _ = QFileDialog.getSaveFileName(self, "Save export as…", default_name,
+                                                  "All files (*.*)")
         if not path:
             return
     
@@ -3033,75 +3206,204 @@ class MainWindow(QMainWindow):
             # uživatel nedal příponu → použij base_name z dialogu
             base_no_ext = path
     
-        # vyber záznamy dle boards + (NOVĚ) dle scope "selected"
-        records = list(getattr(self, "records", []))
+        # vyber záznamy dle boards + (NOVĚ) dle scope "selected" – filtry nad sloupci store
+        store = self.store
+        ids = None
         if boards_sel is not None:
-            wh = set(boards_sel)
-            records = [r for r in records if (getattr(r, "board", None) in wh)]
+            ids = store.ids_where_in("board", boards_sel)
     
-        if scope == "selected" and selected_file_names:
-            # porovnáme podle názvu souboru (rec.path.name), jak je zobrazen v tabulce
-            names = set(selected_file_names)
-            def _match_selected(rec) -> bool:
-                try:
-                    p = getattr(rec, "path", None)
-                    return bool(p and p.name in names)
-                except Exception:
-                    return False
-            records = [r for r in records if _match_selected(r)]
+        if scope == "selected" and selected_ids:
+            # ID záznamů vybraných řádků – jednoznačné i při duplicitních názvech
+            ids = sorted(selected_ids) if ids is None else [i for i in ids if i in selected_ids]
+        elif scope == "selected" and selected_file_names:
+            # porovnáme podle názvu souboru, jak je zobrazen v tabulce
+            ids = store.ids_where_in("file_name", selected_file_names, ids)
     
-        # připrav řádky (jen vybraná pole)
-        # každý řádek → list hodnot podle (label, key) pořadí
-        rows: list[list[str]] = []
+        # řádky (jen vybraná pole) se generují ze store až při zápisu – nic se
+        # nematerializuje; každý řádek → list hodnot podle (label, key) pořadí
         headers = [lab for (lab, _key) in fields]
+        keys = [key for (_lab, key) in fields]
+        ids = list(range(len(store))) if ids is None else list(ids)
     
-        def _get_val(rec, key: str) -> str:
-            if key == "file_name":
-                try:
-                    return rec.path.name if getattr(rec, "path", None) else ""
-                except Exception:
-                    return ""
-            v = getattr(rec, key, None)
-            return "" if v is None else str(v)
-    
-        for rec in records:
-            rows.append([_get_val(rec, key) for (_lab, key) in fields])
-    
-        if not rows:
+        if not ids:
             QMessageBox.information(self, "Export", "No rows to export for the chosen scope/filters.")
             return
-    
-        # exporty
-        ok, errs = [], []
-    
-        if "csv" in formats:
-            try:
-                fn = base_no_ext + ".csv"
-                self._export_to_csv(fn, headers, rows)
-                ok.append(fn)
-            except Exception as e:
-                errs.append(f"CSV: {e}")
-    
-        if "txt" in formats:
+
+        from pathlib import Path
+        from app.export_manifest import (
+            MANIFEST_SUFFIX, ExportManifest, manifest_path_for, merge_rows, read_export_rows, row_digest,
+        )
+        board_col = store.column("board")
+        path_col = store.column("path")
+        # jen část záznamů (boardy / vybrané řádky) – delta se počítá jen uvnitř
+        # scope a manifest se slučuje s předchozím (jinak by zbytek vypadal jako odebraný)
+        scoped = len(ids) < len(store)
+        # manifest tohoto exportu: cesta PDF → hash exportovaných hodnot
+        current = ExportManifest(keys)
+        mpath = manifest_path_for(path) if merge else base_no_ext + MANIFEST_SUFFIX
+
+        prev = None
+        if delta:
+            prev_path = mpath if merge else self.settings.get("export_last_manifest")
+            prev = ExportManifest.load(prev_path) if prev_path else None
+            if prev is None or prev.fields != keys:
+                if merge:
+                    QMessageBox.warning(self, "Export",
+                                        "No matching export manifest next to this file.\n"
+                                        "Merging needs a CSV/XLSX written by this export with the same fields.")
+                    return
+                QMessageBox.information(self, "Export",
+                                        "No previous export with the same fields – writing a full export.")
+                prev = None
+
+        # sinky: formát × (celý export | jeden soubor na board); všechny se
+        # plní z jednoho průchodu a zapisují souběžně v pracovních vláknech
+        import re
+        from app.export_engine import Sink
+        writers = {
+            "csv": ("CSV", self._export_to_csv),
+            "txt": ("TXT", self._export_to_txt),
+            "xlsx": ("XLSX", self._export_to_xlsx),
+        }
+        out_headers = headers
+        replace_into: list[tuple[str, str]] = []  # merge: (dočasný soubor, cíl)
+        summary = ""
+        if prev is None:
+            def items():
+                # každý záznam se přečte jednou; board slouží k rozdělení po
+                # souborech, hash řádku jde rovnou do manifestu
+                for rid, row in zip(ids, store.iter_rows(keys, ids)):
+                    current.records[path_col[rid]] = row_digest(row)
+                    yield board_col[rid], row
+            n_rows = len(ids)
+        else:
+            for rid, row in zip(ids, store.iter_rows(keys, ids)):
+                current.records[path_col[rid]] = row_digest(row)
+            added, modified, removed = prev.diff(current)
+            if scoped:
+                # odebrané záznamy nejde přiřadit ke scope – zůstanou v manifestu
+                # a ukáže je až delta přes všechny řádky
+                removed = []
+            summary = (f"Changes since {prev.exported_at}{' (within the chosen scope)' if scoped else ''}: "
+                       f"{len(added)} new, {len(modified)} modified, {len(removed)} removed.")
+            if not (added or modified or removed):
+                QMessageBox.information(self, "Export", f"No changes since last export ({prev.exported_at}).")
+                return
+            rid_by_key = {path_col[rid]: rid for rid in ids}
+            changed_keys = added + modified
+            changed = dict(zip(changed_keys,
+                               store.iter_rows(keys, [rid_by_key[k] for k in changed_keys])))
+            if merge:
+                try:
+                    old_headers, old_rows = read_export_rows(path)
+                except ImportError:
+                    QMessageBox.warning(self, "Export", "Optional dependency 'openpyxl' not installed.")
+                    return
+                except Exception as e:
+                    QMessageBox.warning(self, "Export", f"Cannot read {path}:\n{e}")
+                    return
+                if old_headers != headers or len(old_rows) != len(prev.records):
+                    QMessageBox.warning(self, "Export",
+                                        "The file does not match its manifest (edited since export?).")
+                    return
+                merged_keys, merged_rows = merge_rows(prev.records, old_rows, changed, removed, added)
+                # řádky mimo scope zůstávají v souboru beze změny (hash z předchozího manifestu)
+                current = ExportManifest(keys, {k: current.records.get(k, prev.records.get(k, ""))
+                                                for k in merged_keys})
+
+                def items():
+                    for row in merged_rows:
+                        yield None, row
+                n_rows = len(merged_rows)
+                # slučují se jen formáty zvolené v dialogu; každý musí mít
+                # dřívější export se stejným základem (sourozenci se nemění)
+                missing = [f"{base_no_ext}.{e}" for e in formats if not os.path.exists(f"{base_no_ext}.{e}")]
+                if missing:
+                    QMessageBox.warning(self, "Export",
+                                        "Nothing merged – no earlier export to merge into for:\n- "
+                                        + "\n- ".join(missing)
+                                        + "\nUncheck these formats or write a full export first.")
+                    return
+                stale = [f"{base_no_ext}.{e}" for e in ("csv", "txt", "xlsx")
+                         if e not in formats and os.path.exists(f"{base_no_ext}.{e}")]
+                if stale:
+                    summary += ("\nNot merged (format not selected, now behind the manifest):\n- "
+                                + "\n- ".join(stale))
+                tmp_stem = base_no_ext + ".merge-tmp"
+                replace_into = [(f"{tmp_stem}.{e}", f"{base_no_ext}.{e}") for e in formats]
+                base_no_ext = tmp_stem
+            else:
+                # jen změněné záznamy + sloupec Change; odebrané nesou jen název souboru
+                out_headers = ["Change"] + headers
+                tags = dict.fromkeys(added, "new")
+                tags.update(dict.fromkeys(modified, "modified"))
+
+                def items():
+                    for key in changed_keys:
+                        yield board_col[rid_by_key[key]], [tags[key]] + changed[key]
+                    for key in removed:
+                        yield None, ["removed"] + [Path(key).name if k == "file_name" else "" for k in keys]
+                n_rows = len(changed_keys) + len(removed)
+                if scoped:
+                    # záznamy mimo scope si ponechají stav z předchozího exportu
+                    current = ExportManifest(keys, {**prev.records, **current.records})
+
+        targets: list[tuple[str | None, str]] = [(None, base_no_ext)]
+        if per_board and prev is None:
+            targets = [(b, f"{base_no_ext}-{re.sub(r'[^0-9A-Za-z._-]+', '_', str(b or 'unknown'))}")
+                       for b in sorted(store.count_by("board", ids), key=lambda b: str(b or ""))]
+        sinks = []
+        for ext in ("csv", "txt", "xlsx"):
+            if ext not in formats:
+                continue
+            name, write = writers[ext]
+            for board, stem in targets:
+                fn = f"{stem}.{ext}"
+                if not merge and os.path.exists(fn):
+                    # existující soubor se přepíše až po dokončení – Cancel/chyba ho nechá být
+                    tmp = f"{stem}.export-tmp.{ext}"
+                    replace_into.append((tmp, fn))
+                    fn = tmp
+                sinks.append(Sink(name if board is None else f"{name} [{board}]", fn,
+                                  lambda rows, fn=fn, write=write: write(fn, out_headers, rows),
+                                  key=board))
+        ok, errs, cancelled = self._run_fanout_export(sinks, items, n_rows, "Export")
+        if cancelled:
+            errs.append("Export cancelled.")
+
+        if ok and not cancelled and not errs:
+            # jen když se zapsaly všechny soubory – jinak zůstávají původní
+            # soubory i předchozí manifest (příští delta nic nepřeskočí)
+            if replace_into:
+                targets_of = dict(replace_into)
+                done, ok = ok, []
+                for fn in done:
+                    if fn in targets_of:
+                        os.replace(fn, targets_of[fn])
+                        fn = targets_of[fn]
+                    ok.append(fn)
+            # manifest k exportu (stav všech záznamů) → základ příštího delta exportu
             try:
-                fn = base_no_ext + ".txt"
-                self._export_to_txt(fn, headers, rows)
-                ok.append(fn)
+                current.save(mpath)
+                self.settings.set("export_last_manifest", mpath)
             except Exception as e:
-                errs.append(f"TXT: {e}")
-    
-        if "xlsx" in formats:
+                errs.append(f"Manifest: {e}")
+        else:
+            # dočasné soubory se zahodí (níže) – nevykazuj je jako exportované
+            unused = {tmp for tmp, _dst in replace_into}
+            ok = [fn for fn in ok if fn not in unused]
+            if errs and not cancelled:
+                errs.append("Existing files and the export manifest were left unchanged.")
+        # nepoužité dočasné soubory (Cancel, chyba zápisu)
+        for tmp, _dst in replace_into:
             try:
-                fn = base_no_ext + ".xlsx"
-                self._export_to_xlsx(fn, headers, rows)
-                ok.append(fn)
-            except ImportError:
-                errs.append("XLSX: optional dependency 'openpyxl' not installed.")
-            except Exception as e:
-                errs.append(f"XLSX: {e}")
-    
+                os.remove(tmp)
+            except OSError:
+                pass
+
         # výsledek
         msg = []
+        if summary: msg.append(summary)
         if ok:   msg.append("Exported:\n- " + "\n- ".join(ok))
         if errs: msg.append("\nIssues:\n- " + "\n- ".join(errs))
         from PySide6.QtWidgets import QMessageBox
@@ -3111,19 +3413,15 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _export_to_csv(self, filename: str, headers: list[str], rows: list[list[str]]) -> None:
-        import csv
-        from pathlib import Path
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        with open(filename, "w", encoding="utf-8", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(headers)
-            for r in rows:
-                w.writerow(r)
+    def _export_to_csv(self, filename: str, headers: list[str], rows, tick=None) -> None:
+        # rows: libovolný iterable (i generátor) – zapisuje se průběžně
+        from app.export_engine import write_csv
+        write_csv(filename, headers, rows, tick=tick)
                 
-    def _export_to_txt(self, path: str, headers: list[str], rows: list[list[str]]) -> None:
+    def _export_to_txt(self, path: str, headers: list[str], rows, tick=None) -> None:
         """
         Rich TXT report shared by Overview & Sorted exports.
+        ``rows`` may be any iterable (streamed, one record in memory at a time).
     
         Structure per record:
           Title:  Institution — Candidate — [Board]  (fallback to File name)
@@ -3224,6 +3522,10 @@ class MainWindow(QMainWindow):
     
         with open(path, "w", encoding="utf-8") as fh:
             for idx, row in enumerate(rows, start=1):
+                # Separator between records
+                if idx > 1:
+                    fh.write("-----\n\n")
+
                 board   = _get(row, h2i, "Board")
                 inst    = _get(row, h2i, "Institution Name")
                 cand    = _get(row, h2i, "Candidate Name")
@@ -3261,47 +3563,18 @@ class MainWindow(QMainWindow):
                         if lab in h2i:
                             _write_bullet(fh, lab, _get(row, h2i, lab))
                     fh.write("\n")
-    
-                # Separator between records
-                if idx < len(rows):
-                    fh.write("-----\n\n")
+
+                if tick is not None:
+                    tick(idx)
                 
-    def _export_to_xlsx(self, filename: str, headers: list[str], rows: list[list[str]]) -> None:
+    def _export_to_xlsx(self, filename: str, headers: list[str], rows, tick=None) -> None:
         """
-        XLSX export přes optional dependency 'openpyxl'.
-        Bez přidávání závislostí do projektu – pokud není k dispozici, vyhodí ImportError.
+        XLSX export přes optional dependency 'openpyxl' (write-only režim, streamuje
+        řádky z libovolného iterable). Bez přidávání závislostí do projektu – pokud
+        není k dispozici, vyhodí ImportError.
         """
-        from pathlib import Path
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-    
-        try:
-            import openpyxl
-            from openpyxl.styles import Font
-        except Exception as e:
-            raise ImportError("openpyxl not available") from e
-    
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Export"
-    
-        ws.append(headers)
-        # tučný header
-        bold = Font(bold=True)
-        for c in range(1, len(headers) + 1):
-            ws.cell(row=1, column=c).font = bold
-    
-        for r in rows:
-            ws.append(r)
-    
-        # auto šířky (jednoduše dle max délky)
-        for col_idx, head in enumerate(headers, start=1):
-            max_len = len(head)
-            for row in rows:
-                if col_idx - 1 < len(row):
-                    max_len = max(max_len, len(str(row[col_idx - 1])))
-            ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = min(max_len + 2, 80)
-    
-        wb.save(filename)
+        from app.export_engine import write_xlsx
+        write_xlsx(filename, headers, rows, sheet_title="Export", tick=tick)
 
     def _filter_board(self, txt: str) -> None:
         proxy = self.table.model()
@@ -3313,583 +3586,84 @@ class MainWindow(QMainWindow):
         if isinstance(proxy, RecordsModel):
             proxy.set_search(txt)
             
-    def _build_contacts_tab(self) -> None:
-        """
-        Backward-compat shim: původní jméno zavolá aktuální builder.
-        """
-        self._build_board_contacts_tab()
-
-    def _build_board_contacts_tab(self) -> None:
+    def export_sorted_db(self) -> None:
         """
-        Board Contacts tab: Board -> (Full Name, Email)
-        - QStandardItemModel (3 sloupce: Board, Full Name, Email)
-        - Board = needitovatelný; Full Name/Email = editovatelné
-        - JSON perzistence (contacts.json), import CSV
-        - auto-fit sloupců
-        - NOVĚ: tlačítko Help s nápovědou a ukázkovým CSV (náhled + uložení)
+        Export CURRENT dataset from 'Sorted PDFs' tab using data stored in DB (self.sorted_db),
+        s nezávislostí na SortedDb.boards().
         """
         from PySide6.QtWidgets import (
-            QVBoxLayout, QHBoxLayout, QWidget, QTableView, QPushButton, QMessageBox
+            QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox,
+            QListWidget, QListWidgetItem, QDialogButtonBox, QFileDialog, QMessageBox
         )
-        from PySide6.QtGui import QStandardItemModel, QStandardItem
-        from PySide6.QtCore import Qt, QTimer
-        from PySide6.QtWidgets import QHeaderView
-    
-        # Najdi/usel tab widget:
-        tab_widget = getattr(self, "board_contacts_tab", None)
-        if tab_widget is None:
-            tab_widget = getattr(self, "contacts_tab", None)
-        if tab_widget is None:
-            tab_widget = QWidget()
-            self.board_contacts_tab = tab_widget
-            try:
-                self.tabs.addTab(tab_widget, "Board Contacts")
-            except Exception:
-                pass
-        else:
-            # přejmenuj tab (pokud existuje v QTabWidget)
-            try:
-                idx = self.tabs.indexOf(tab_widget)
-                if idx >= 0:
-                    self.tabs.setTabText(idx, "Board Contacts")
-            except Exception:
-                pass
-    
-        layout = QVBoxLayout(tab_widget)
-    
-        # Ovládací řádek
-        bar = QHBoxLayout()
-        self.btn_contacts_help = QPushButton("Help")
-        self.btn_contacts_import = QPushButton("Import CSV…")
-        self.btn_contacts_save = QPushButton("Save")
-        self.btn_contacts_reload = QPushButton("Reload")
-        bar.addWidget(self.btn_contacts_help)
-        bar.addSpacing(8)
-        bar.addWidget(self.btn_contacts_import)
-        bar.addStretch(1)
-        bar.addWidget(self.btn_contacts_reload)
-        bar.addWidget(self.btn_contacts_save)
-        layout.addLayout(bar)
-    
-        # Tabulka
-        self.tbl_contacts = QTableView(tab_widget)
-        self.tbl_contacts.setSelectionBehavior(QTableView.SelectRows)
-        self.tbl_contacts.setSelectionMode(QTableView.ExtendedSelection)
-        self.tbl_contacts.setSortingEnabled(True)
-    
-        # Model
-        self._contacts_headers = ["Board", "Full Name", "Email"]
-        self._contacts_model = QStandardItemModel(0, len(self._contacts_headers), self)
-        self._contacts_model.setHorizontalHeaderLabels(self._contacts_headers)
-        self.tbl_contacts.setModel(self._contacts_model)
-    
-        # Fitting sloupců
-        hdr = self.tbl_contacts.horizontalHeader()
-        hdr.setStretchLastSection(True)
-        try:
-            hdr.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-            hdr.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-            hdr.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        except Exception:
-            hdr.setResizeMode(0, QHeaderView.ResizeToContents)
-            hdr.setResizeMode(1, QHeaderView.ResizeToContents)
-            hdr.setResizeMode(2, QHeaderView.ResizeToContents)
-    
-        layout.addWidget(self.tbl_contacts, 1)
-    
-        # Data -> model
-        self._contacts_rebuild_model()
+        from PySide6.QtCore import Qt
+        from datetime import datetime
+        import os
+        from pathlib import Path
     
-        # Akce
-        self.btn_contacts_save.clicked.connect(lambda: self._save_contacts_json(self._contacts_collect_data()))
-        self.btn_contacts_reload.clicked.connect(self._contacts_rebuild_model)
-        self.btn_contacts_import.clicked.connect(self._contacts_import_csv)
-        self.btn_contacts_help.clicked.connect(self._contacts_show_help)
+        # Columns (labels/keys) – stejné jako v Overview
+        FIELDS: list[tuple[str, str]] = [
+            ("Board", "board"),
+            ("Application Type", "application_type"),
+            ("Institution Name", "institution_name"),
+            ("Candidate Name", "candidate_name"),
+            ("Academia Recognition", "recognition_academia"),
+            ("Certified Recognition", "recognition_certified"),
+            ("Full Name", "contact_full_name"),
+            ("Email Address", "contact_email"),
+            ("Phone Number", "contact_phone"),
+            ("Postal Address", "contact_postal_address"),
+            ("Syllabi Integration", "syllabi_integration_description"),
+            ("Courses/Modules", "courses_modules_list"),
+            ("Proof of ISTQB Certifications", "proof_of_istqb_certifications"),
+            ("University Links", "university_links"),
+            ("Additional Info/Documents", "additional_information_documents"),
+            ("Printed Name, Title", "printed_name_title"),
+            ("Signature Date", "signature_date"),
+            ("Receiving Member Board", "receiving_member_board"),
+            ("Date Received", "date_received"),
+            ("Validity Start Date", "validity_start_date"),
+            ("Validity End Date", "validity_end_date"),
+            ("File name", "file_name"),
+        ]
     
-        # Finální doladění velikostí po vykreslení
-        def _refit():
+        # Pomocná: iterace DB položek (nezávisle na boards())
+        def _iter_sorted_items():
+            it = getattr(self.sorted_db, "iter_items", None)
+            if callable(it):
+                yield from it()
+                return
             try:
-                for c in range(self._contacts_model.columnCount()):
-                    self.tbl_contacts.resizeColumnToContents(c)
+                for k, v in self.sorted_db.items():
+                    yield Path(k), v
             except Exception:
-                pass
-        QTimer.singleShot(0, _refit)
-        
-    def _contacts_show_help(self) -> None:
-        """
-        Zobrazí dialog s nápovědou/importními tipy a ukázkovým CSV.
-        Umožní uložit šablonu CSV do souboru.
-        """
-        from PySide6.QtWidgets import (
-            QDialog, QVBoxLayout, QLabel, QPlainTextEdit,
-            QDialogButtonBox, QPushButton, QFileDialog, QWidget, QHBoxLayout
-        )
-        from PySide6.QtCore import Qt
-    
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Board Contacts — Help")
-        lay = QVBoxLayout(dlg)
-    
-        help_text = (
-            "CSV columns (case-insensitive):\n"
-            "  - board\n"
-            "  - full_name (or 'Full Name' / 'Name')\n"
-            "  - email (or 'E-mail')\n\n"
-            "Rows are matched by 'board'. Unknown boards are ignored (not added).\n"
-            "Empty values are allowed.\n\n"
-            "Example CSV:\n"
-        )
-        lay.addWidget(QLabel(help_text))
-    
-        sample = self._contacts_sample_csv()
-    
-        viewer = QPlainTextEdit()
-        viewer.setReadOnly(True)
-        viewer.setPlainText(sample)
-        viewer.setLineWrapMode(QPlainTextEdit.NoWrap)
-        lay.addWidget(viewer, 1)
-    
-        # Buttons: Save template… + Close
-        btns_bar = QHBoxLayout()
-        btn_save = QPushButton("Save CSV template…")
-        btns_bar.addWidget(btn_save)
-        btns_bar.addStretch(1)
-        lay.addLayout(btns_bar)
-    
-        def _save():
-            path, _ = QFileDialog.getSaveFileName(dlg, "Save CSV template…", "board_contacts_template.csv", "CSV Files (*.csv);;All Files (*)")
-            if not path:
                 return
+    
+        # Zjisti dostupné boardy z dat
+        boards_avail = set()
+        for abs_path, rec in _iter_sorted_items():
             try:
-                with open(path, "w", encoding="utf-8") as fh:
-                    fh.write(sample)
-            except Exception as e:
-                # Plain info — nenaruší běh
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(dlg, "Save CSV template", f"Failed to save:\n{e}")
+                data = rec.get("data", {}) if isinstance(rec, dict) else {}
+                board = data.get("board")
+                if board:
+                    boards_avail.add(board)
+            except Exception:
+                continue
+        boards_avail = sorted(boards_avail)
     
-        btn_save.clicked.connect(_save)
+        # Dialog – jednoduchá verze (formáty + výběr boards + výběr polí)
+        class ExportDialog(QDialog):
+            def __init__(self, boards_avail: list[str], parent=None):
+                super().__init__(parent)
+                self.setWindowTitle("Export options")
+                main = QVBoxLayout(self)
     
-        buttons = QDialogButtonBox(QDialogButtonBox.Close)
-        buttons.rejected.connect(dlg.reject)
-        buttons.accepted.connect(dlg.accept)
-        lay.addWidget(buttons)
-    
-        dlg.resize(720, 420)
-        dlg.exec_()
-        
-    def _contacts_sample_csv(self) -> str:
-        """
-        Vrátí ukázkové CSV s hlavičkou a několika boardy.
-        """
-        try:
-            boards = sorted(KNOWN_BOARDS)
-        except Exception:
-            boards = ["ATB", "CSTB", "ISTQB"]
-        # Vezmi prvních pár pro příklad
-        sample_boards = boards[:3] if len(boards) >= 3 else boards
-        lines = ["board,full_name,email"]
-        for b in sample_boards:
-            email = f"{''.join(ch for ch in b.lower() if ch.isalnum())}-liaison@example.org"
-            lines.append(f"{b},Contact for {b},{email}")
-        return "\n".join(lines) + "\n"
-        
-    def _contacts_json_path(self):
-        """
-        Umístění JSONu s kontakty v kořeni repozitáře (vedle zdrojáků).
-        Vhodné pro .gitignore.
-        """
-        from pathlib import Path
-        # repo_root ≈ dva levely nad tímto souborem: app/main_window.py -> repo/
-        repo_root = Path(__file__).resolve().parents[2]
-        return repo_root / "contacts.json"
-    
-    def _load_contacts_json(self) -> dict:
-        """
-        Načti JSON kontaktů: { "<BOARD>": { "full_name": str, "email": str }, ... }
-        Neexistuje-li soubor, vrať {}.
-        """
-        import json
-        p = self._contacts_json_path()
-        try:
-            if p.exists():
-                with p.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-                    if isinstance(data, dict):
-                        return data
-        except Exception:
-            pass
-        return {}
-    
-    def _save_contacts_json(self, data: dict) -> None:
-        """
-        Ulož JSON kontaktů. Vytvoří/aktualizuje contacts.json.
-        """
-        import json
-        from pathlib import Path
-        p = self._contacts_json_path()
-        try:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            with p.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, ensure_ascii=False, indent=2)
-            try:
-                self.statusBar().showMessage("Contacts saved.")
-            except Exception:
-                pass
-        except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Save contacts", f"Failed to save contacts.json:\n{e}")
-            
-    def _contacts_rebuild_model(self) -> None:
-        """
-        Naplní model kontakty pro všechny KNOWN_BOARDS.
-        Výchozí hodnoty prázdné, pokud nejsou v JSON.
-        """
-        from PySide6.QtGui import QStandardItem
-        from PySide6.QtCore import Qt
-    
-        data = self._load_contacts_json()  # dict
-        self._contacts_model.setRowCount(0)
-    
-        # Vždy zobraz všechny boardy; jméno/email mohou být prázdné
-        boards = sorted(KNOWN_BOARDS)
-        for b in boards:
-            full = ""
-            mail = ""
-            try:
-                rec = data.get(b, {})
-                full = rec.get("full_name", "") or ""
-                mail = rec.get("email", "") or ""
-            except Exception:
-                pass
-    
-            it_board = QStandardItem(b)
-            it_board.setEditable(False)
-            it_board.setData(b, Qt.DisplayRole)
-    
-            it_full = QStandardItem(full)
-            it_full.setEditable(True)
-    
-            it_mail = QStandardItem(mail)
-            it_mail.setEditable(True)
-    
-            self._contacts_model.appendRow([it_board, it_full, it_mail])
-    
-        # sloupce přizpůsob po naplnění
-        try:
-            view = self.tbl_contacts
-            for c in range(self._contacts_model.columnCount()):
-                view.resizeColumnToContents(c)
-        except Exception:
-            pass
-        
-    def _contacts_collect_data(self) -> dict:
-        """
-        Čti aktuální hodnoty z modelu a vytvoř JSON strukturu:
-        { "BOARD": {"full_name": "...", "email": "..."}, ... }
-        Prázdné dvojice ukládám také (výslovně prázdné).
-        """
-        from PySide6.QtCore import Qt
-        out: dict = {}
-        rows = self._contacts_model.rowCount()
-        for r in range(rows):
-            board = self._contacts_model.index(r, 0).data(Qt.DisplayRole) or ""
-            full  = self._contacts_model.index(r, 1).data(Qt.DisplayRole) or ""
-            mail  = self._contacts_model.index(r, 2).data(Qt.DisplayRole) or ""
-            if board:
-                out[board] = {"full_name": str(full), "email": str(mail)}
-        return out
-    
-    def _contacts_import_csv(self) -> None:
-        """
-        Import CSV s hlavičkami (case-insensitive; varianty akceptované):
-          - board | Board
-          - full_name | Full Name | Name
-          - email | Email | E-mail
-        Řádky se mapují podle 'board'. Nematchnuté boardy se ignorují (nepřidáváme nové).
-        """
-        import csv
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-    
-        path, _ = QFileDialog.getOpenFileName(self, "Import contacts (CSV)", "", "CSV Files (*.csv);;All Files (*)")
-        if not path:
-            return
-    
-        # přečti CSV
-        rows = []
-        try:
-            with open(path, "r", encoding="utf-8-sig", newline="") as fh:
-                rdr = csv.DictReader(fh)
-                # normalizace klíčů
-                norm = lambda s: (s or "").strip().lower()
-                for rec in rdr:
-                    if not isinstance(rec, dict):
-                        continue
-                    row = {norm(k): (v or "").strip() for k, v in rec.items()}
-                    rows.append(row)
-        except Exception as e:
-            QMessageBox.warning(self, "Import CSV", f"Failed to read CSV:\n{e}")
-            return
-    
-        if not rows:
-            QMessageBox.information(self, "Import CSV", "No rows found in the CSV file.")
-            return
-    
-        # mapování názvů sloupců
-        def pick(d: dict, keys: list[str]) -> str:
-            for k in keys:
-                if k in d and d[k]:
-                    return d[k]
-            return ""
-    
-        # Pro rychlý update – vytvoř mapu board -> (full, mail)
-        updates: dict[str, tuple[str, str]] = {}
-        for d in rows:
-            b = pick(d, ["board"])
-            if not b:
-                continue
-            full = pick(d, ["full_name", "full name", "name"])
-            mail = pick(d, ["email", "e-mail", "mail"])
-            updates[b] = (full, mail)
-    
-        if not updates:
-            QMessageBox.information(self, "Import CSV", "No usable data (missing 'board' column).")
-            return
-    
-        # aplikuj do modelu – jen u existujících boardů
-        from PySide6.QtCore import Qt
-        changed = 0
-        for r in range(self._contacts_model.rowCount()):
-            board = self._contacts_model.index(r, 0).data(Qt.DisplayRole)
-            if board in updates:
-                full, mail = updates[board]
-                if full:
-                    self._contacts_model.setData(self._contacts_model.index(r, 1), full, Qt.EditRole)
-                if mail:
-                    self._contacts_model.setData(self._contacts_model.index(r, 2), mail, Qt.EditRole)
-                changed += 1
-    
-        QMessageBox.information(self, "Import CSV", f"Imported/updated contacts for {changed} board(s).")
-
-    def _build_sorted_tab(self) -> None:
-        """
-        Záložka 'Sorted PDFs': vlevo strom, vpravo formulář.
-        Přidány editory pro: Printed Name, Title; Receiving Member Board; Date Received; Validity Start/End.
-        DOPLNĚNO: File name (read-only) + lbl_sorted_status.
-        """
-        from PySide6.QtWidgets import (
-            QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem, QSplitter,
-            QWidget, QFormLayout, QLineEdit, QPlainTextEdit, QPushButton, QSizePolicy, QLabel
-        )
-        from PySide6.QtCore import Qt
-    
-        layout = QVBoxLayout()
-        self.split_sorted = QSplitter(self.sorted_tab)
-        self.split_sorted.setOrientation(Qt.Horizontal)
-    
-        # LEVÁ strana – strom
-        self.tree_sorted = QTreeWidget()
-        self.tree_sorted.setHeaderLabels(["Board / PDF"])
-        self.tree_sorted.itemSelectionChanged.connect(self._sorted_on_item_changed)
-        # Abecední řazení (boards i soubory)
-        self.tree_sorted.setSortingEnabled(True)
-        self.tree_sorted.sortItems(0, Qt.AscendingOrder)
-    
-        # PRAVÁ strana – formulář
-        right = QWidget()
-        right_layout = QVBoxLayout(right)
-        self.form_sorted = QFormLayout()
-        self.form_sorted.setRowWrapPolicy(QFormLayout.WrapLongRows)
-        self.form_sorted.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
-    
-        def _mkline() -> QLineEdit:
-            e = QLineEdit()
-            e.setClearButtonEnabled(True)
-            return e
-    
-        def _mktxt() -> QPlainTextEdit:
-            t = QPlainTextEdit()
-            t.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            t.setMaximumBlockCount(100000)
-            return t
-    
-        # Základní pole
-        self.ed_board = _mkline(); self.ed_board.setReadOnly(True)
-        self.ed_app_type = _mkline()
-        self.ed_inst_name = _mkline()
-        self.ed_cand_name = _mkline()
-        self.ed_rec_acad = _mkline()
-        self.ed_rec_cert = _mkline()
-        self.ed_fullname = _mkline()
-        self.ed_email = _mkline()
-        self.ed_phone = _mkline()
-        self.ed_address = _mktxt()
-        self.ed_syllabi = _mktxt()
-        self.ed_courses = _mktxt()
-        self.ed_proof = _mktxt()
-        self.ed_links = _mktxt()
-        self.ed_additional = _mktxt()
-        # Consent
-        self.ed_printed_name_title = _mkline()   # NOVĚ
-        self.ed_sigdate = _mkline()
-        # ISTQB internal
-        self.ed_receiving_member_board = _mkline()  # NOVĚ
-        self.ed_date_received = _mkline()           # NOVĚ
-        self.ed_validity_start_date = _mkline()     # NOVĚ
-        self.ed_validity_end_date = _mkline()       # NOVĚ
-        # File name (read-only) – DOPLNĚNO
-        self.ed_filename = _mkline()
-        self.ed_filename.setReadOnly(True)
-    
-        # Alias (stávající jména používaná jinde v kódu nechávám)
-        self.ed_contact_full_name = self.ed_fullname
-        self.ed_contact_email = self.ed_email
-        self.ed_contact_phone = self.ed_phone
-        self.ed_postal_address = self.ed_address
-        self.ed_syllabi_integration_description = self.ed_syllabi
-        self.ed_courses_modules_list = self.ed_courses
-        self.ed_proof_of_istqb_certifications = self.ed_proof
-        self.ed_university_links = self.ed_links
-        self.ed_additional_information_documents = self.ed_additional
-    
-        # Form – pořadí (Printed Name před Signature Date; sekce 7 za ním)
-        self.form_sorted.addRow("File name:", self.ed_filename)  # DOPLNĚNO – read-only
-        self.form_sorted.addRow("Board:", self.ed_board)
-        self.form_sorted.addRow("Application Type:", self.ed_app_type)
-        self.form_sorted.addRow("Institution Name:", self.ed_inst_name)
-        self.form_sorted.addRow("Candidate Name:", self.ed_cand_name)
-        self.form_sorted.addRow("Academia Recognition:", self.ed_rec_acad)
-        self.form_sorted.addRow("Certified Recognition:", self.ed_rec_cert)
-        self.form_sorted.addRow("Full Name:", self.ed_fullname)
-        self.form_sorted.addRow("Email Address:", self.ed_email)
-        self.form_sorted.addRow("Phone Number:", self.ed_phone)
-        self.form_sorted.addRow("Postal Address:", self.ed_address)
-        self.form_sorted.addRow("Syllabi Integration:", self.ed_syllabi)
-        self.form_sorted.addRow("Courses/Modules:", self.ed_courses)
-        self.form_sorted.addRow("Proof of ISTQB Certifications:", self.ed_proof)
-        self.form_sorted.addRow("University Links:", self.ed_links)
-        self.form_sorted.addRow("Additional Info/Documents:", self.ed_additional)
-        # Consent
-        self.form_sorted.addRow("Printed Name, Title:", self.ed_printed_name_title)
-        self.form_sorted.addRow("Signature Date:", self.ed_sigdate)
-        # ISTQB internal
-        self.form_sorted.addRow("Receiving Member Board:", self.ed_receiving_member_board)
-        self.form_sorted.addRow("Date Received:", self.ed_date_received)
-        self.form_sorted.addRow("Validity Start Date:", self.ed_validity_start_date)
-        self.form_sorted.addRow("Validity End Date:", self.ed_validity_end_date)
-    
-        right_layout.addLayout(self.form_sorted)
-    
-        # Tlačítka + stav (DOPLNĚNO lbl_sorted_status)
-        btn_row = QHBoxLayout()
-        self.lbl_sorted_status = QLabel("—")  # DOPLNĚNO: používá _sorted_set_status(...)
-        self.btn_sorted_edit = QPushButton("Edit")
-        self.btn_sorted_save = QPushButton("Save to DB")
-        self.btn_sorted_export = QPushButton("Export…")
-        self.btn_sorted_rescan = QPushButton("Rescan Sorted")
-        btn_row.addWidget(self.lbl_sorted_status)   # jemný status vlevo
-        btn_row.addSpacing(12)
-        btn_row.addWidget(self.btn_sorted_edit)
-        btn_row.addWidget(self.btn_sorted_save)
-        btn_row.addStretch(1)
-        btn_row.addWidget(self.btn_sorted_export)
-        btn_row.addWidget(self.btn_sorted_rescan)
-        right_layout.addLayout(btn_row)
-    
-        self.btn_sorted_edit.clicked.connect(lambda: self._sorted_set_editable(True))
-        self.btn_sorted_save.clicked.connect(self._sorted_save_changes)
-        self.btn_sorted_export.clicked.connect(self.export_sorted_db)
-        self.btn_sorted_rescan.clicked.connect(self.rescan_sorted)
-    
-        # Výchozí – read-only; Board a File name vždy read-only
-        self._sorted_set_editable(False)
-    
-        # Osazení splitteru a layoutu
-        self.split_sorted.addWidget(self.tree_sorted)
-        self.split_sorted.addWidget(right)
-        self.split_sorted.setStretchFactor(0, 2)
-        self.split_sorted.setStretchFactor(1, 1)
-        layout.addWidget(self.split_sorted, 1)
-        self.sorted_tab.setLayout(layout)
-        
-    def export_sorted_db(self) -> None:
-        """
-        Export CURRENT dataset from 'Sorted PDFs' tab using data stored in DB (self.sorted_db),
-        s nezávislostí na SortedDb.boards().
-        """
-        from PySide6.QtWidgets import (
-            QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox,
-            QListWidget, QListWidgetItem, QDialogButtonBox, QFileDialog, QMessageBox
-        )
-        from PySide6.QtCore import Qt
-        from datetime import datetime
-        import os
-        from pathlib import Path
-    
-        # Columns (labels/keys) – stejné jako v Overview
-        FIELDS: list[tuple[str, str]] = [
-            ("Board", "board"),
-            ("Application Type", "application_type"),
-            ("Institution Name", "institution_name"),
-            ("Candidate Name", "candidate_name"),
-            ("Academia Recognition", "recognition_academia"),
-            ("Certified Recognition", "recognition_certified"),
-            ("Full Name", "contact_full_name"),
-            ("Email Address", "contact_email"),
-            ("Phone Number", "contact_phone"),
-            ("Postal Address", "contact_postal_address"),
-            ("Syllabi Integration", "syllabi_integration_description"),
-            ("Courses/Modules", "courses_modules_list"),
-            ("Proof of ISTQB Certifications", "proof_of_istqb_certifications"),
-            ("University Links", "university_links"),
-            ("Additional Info/Documents", "additional_information_documents"),
-            ("Printed Name, Title", "printed_name_title"),
-            ("Signature Date", "signature_date"),
-            ("Receiving Member Board", "receiving_member_board"),
-            ("Date Received", "date_received"),
-            ("Validity Start Date", "validity_start_date"),
-            ("Validity End Date", "validity_end_date"),
-            ("File name", "file_name"),
-        ]
-    
-        # Pomocná: iterace DB položek (nezávisle na boards())
-        def _iter_sorted_items():
-            it = getattr(self.sorted_db, "iter_items", None)
-            if callable(it):
-                yield from it()
-                return
-            try:
-                for k, v in self.sorted_db.items():
-                    yield Path(k), v
-            except Exception:
-                return
-    
-        # Zjisti dostupné boardy z dat
-        boards_avail = set()
-        for abs_path, rec in _iter_sorted_items():
-            try:
-                data = rec.get("data", {}) if isinstance(rec, dict) else {}
-                board = data.get("board")
-                if board:
-                    boards_avail.add(board)
-            except Exception:
-                continue
-        boards_avail = sorted(boards_avail)
-    
-        # Dialog – jednoduchá verze (formáty + výběr boards + výběr polí)
-        class ExportDialog(QDialog):
-            def __init__(self, boards_avail: list[str], parent=None):
-                super().__init__(parent)
-                self.setWindowTitle("Export options")
-                main = QVBoxLayout(self)
-    
-                gb_formats = QGroupBox("Formats")
-                lay_f = QHBoxLayout(gb_formats)
-                self.cb_xlsx = QCheckBox("XLSX"); self.cb_xlsx.setChecked(True)
-                self.cb_csv  = QCheckBox("CSV")
-                self.cb_txt  = QCheckBox("TXT")
-                lay_f.addWidget(self.cb_xlsx); lay_f.addWidget(self.cb_csv); lay_f.addWidget(self.cb_txt)
-                main.addWidget(gb_formats)
+                gb_formats = QGroupBox("Formats")
+                lay_f = QHBoxLayout(gb_formats)
+                self.cb_xlsx = QCheckBox("XLSX"); self.cb_xlsx.setChecked(True)
+                self.cb_csv  = QCheckBox("CSV")
+                self.cb_txt  = QCheckBox("TXT")
+                lay_f.addWidget(self.cb_xlsx); lay_f.addWidget(self.cb_csv); lay_f.addWidget(self.cb_txt)
+                main.addWidget(gb_formats)
     
                 gb_board = QGroupBox("Boards")
                 lay_b = QVBoxLayout(gb_board)
@@ -3897,923 +3671,252 @@ class MainWindow(QMainWindow):
                 self.list_boards.setSelectionMode(QListWidget.MultiSelection)
                 for b in boards_avail:
                     it = QListWidgetItem(b)
-                    it.setSelected(True)  # defaultně všechny
-                    self.list_boards.addItem(it)
-                lay_b.addWidget(self.list_boards)
-                main.addWidget(gb_board)
-    
-                gb_fields = QGroupBox("Fields (order)")
-                lay_fi = QVBoxLayout(gb_fields)
-                self.list_fields = QListWidget()
-                self.list_fields.setSelectionMode(QListWidget.MultiSelection)
-                for label, key in FIELDS:
-                    it = QListWidgetItem(label)
-                    it.setData(Qt.UserRole, key)
-                    it.setSelected(True)
-                    self.list_fields.addItem(it)
-                lay_fi.addWidget(self.list_fields)
-                main.addWidget(gb_fields)
-    
-                btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-                btns.accepted.connect(self.accept)
-                btns.rejected.connect(self.reject)
-                main.addWidget(btns)
-    
-        dlg = ExportDialog(boards_avail, self)
-        if dlg.exec() != QDialog.Accepted:
-            return
-    
-        fmt_xlsx = dlg.cb_xlsx.isChecked()
-        fmt_csv  = dlg.cb_csv.isChecked()
-        fmt_txt  = dlg.cb_txt.isChecked()
-        selected_fields = [(dlg.list_fields.item(i).text(), dlg.list_fields.item(i).data(Qt.UserRole))
-                           for i in range(dlg.list_fields.count())
-                           if dlg.list_fields.item(i).isSelected()]
-        if not selected_fields:
-            QMessageBox.warning(self, "Export", "No fields selected.")
-            return
-    
-        boards_sel = {dlg.list_boards.item(i).text()
-                      for i in range(dlg.list_boards.count())
-                      if dlg.list_boards.item(i).isSelected()}
-        if not boards_sel:
-            boards_sel = set(boards_avail)
-    
-        headers = [label for (label, _) in selected_fields]
-        rows = []
-        for abs_path, rec in _iter_sorted_items():
-            try:
-                data = rec.get("data", {}) if isinstance(rec, dict) else {}
-                b = data.get("board")
-                if b not in boards_sel:
-                    continue
-                row = [str(data.get(k, "") or "") for (_, k) in selected_fields]
-                rows.append(row)
-            except Exception:
-                continue
-    
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename_base = f"sorted_export_{now}"
-        dlg_dir = os.getcwd()
-        path, _ = QFileDialog.getSaveFileName(self, "Save export", os.path.join(dlg_dir, filename_base + ".xlsx"),
-                                              "XLSX (*.xlsx);;CSV (*.csv);;TXT (*.txt)")
-        if not path:
-            return
-    
-        if fmt_xlsx:
-            self._export_to_xlsx(path if path.lower().endswith(".xlsx") else path + ".xlsx", headers, rows)
-        if fmt_csv:
-            self._export_to_csv(path if path.lower().endswith(".csv") else path + ".csv", headers, rows)
-        if fmt_txt:
-            self._export_to_txt(path if path.lower().endswith(".txt") else path + ".txt", headers, rows)
-    
-        QMessageBox.information(self, "Export", "Export finished.")
-        
-    def rescan_sorted(self) -> None:
-        """
-        Sestaví strom 'Sorted PDFs' z DB (edited i parsed).
-        Reloaduje DB z disku, aby se projevily změny po exportu.
-        """
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QTreeWidgetItem
-        from pathlib import Path
-
-        # 1. Reload DB (Nutné, aby se zobrazil nově exportovaný soubor!)
-        if hasattr(self, "sorted_db"):
-            self.sorted_db.load()
-
-        if not hasattr(self, "tree_sorted"):
-            return
-
-        self.tree_sorted.clear()
-
-        sorted_root = getattr(self.sorted_db, "sorted_root", None)
-        sorted_root = Path(sorted_root).resolve() if sorted_root else None
-
-        # Iterace položek z DB.
-        # iter_items() vrací (rel_key, rec); rel_key převedeme na absolutní cestu
-        # pod sorted_root, aby výběr/edit/uložení fungovaly (jinak relative_to selže).
-        def _iter_sorted_items():
-            it = getattr(self.sorted_db, "iter_items", None)
-            if callable(it):
-                for rel_key, rec in it():
-                    abs_sorted = (sorted_root / rel_key).resolve() if sorted_root else Path(rel_key)
-                    yield abs_sorted, rec
-                return
-            # fallback
-            try:
-                for rel_key, rec in self.sorted_db.items():
-                    abs_sorted = (sorted_root / rel_key).resolve() if sorted_root else Path(rel_key).resolve()
-                    yield abs_sorted, rec
-            except Exception:
-                return
-
-        root_items: dict[str, QTreeWidgetItem] = {}
-
-        def _ensure_board_node(board_name: str) -> QTreeWidgetItem:
-            node = root_items.get(board_name)
-            if node is None:
-                node = QTreeWidgetItem([board_name])
-                node.setData(0, Qt.UserRole, None)
-                self.tree_sorted.addTopLevelItem(node)
-                root_items[board_name] = node
-            return node
-
-        for abs_sorted_path, rec in _iter_sorted_items():
-            try:
-                if isinstance(abs_sorted_path, str):
-                    abs_sorted_path = Path(abs_sorted_path)
-                    
-                data = rec.get("data", {}) if isinstance(rec, dict) else {}
-                board = data.get("board") or abs_sorted_path.parent.name
-                name = data.get("file_name") or abs_sorted_path.name
-
-                # DB klíč
-                db_key = None
-                if sorted_root:
-                    try:
-                        db_key = str(abs_sorted_path.resolve().relative_to(sorted_root))
-                    except Exception:
-                        db_key = None
-
-                parent = _ensure_board_node(board)
-                child = QTreeWidgetItem([name])
-                
-                # UserRole: DB klíč
-                child.setData(0, Qt.UserRole, db_key or "")
-                # UserRole + 1: Absolutní cesta
-                child.setData(0, Qt.UserRole + 1, str(abs_sorted_path.resolve()))
-                
-                parent.addChild(child)
-            except Exception:
-                continue
-
-        self.tree_sorted.expandAll()
-
-
-    def _sorted_db_path(self) -> Path:
-        return self.sorted_db.db_path
-    
-    def _sorted_key_for(self, abs_path: Path) -> str:
-        return self.sorted_db.key_for(abs_path)
-    
-    def _sorted_on_item_changed(self) -> None:
-        """Výběr ve stromu 'Sorted PDFs' → ulož kontext a naplň detail."""
-        from pathlib import Path
-        from PySide6.QtCore import Qt
-    
-        sel = self.tree_sorted.selectedItems()
-        if not sel:
-            self._sorted_fill_details(None)
-            return
-    
-        item = sel[0]
-        parent = item.parent()
-        board = parent.text(0) if parent else ""
-        file_name = item.text(0)
-    
-        db_key = item.data(0, Qt.UserRole)            # relativní klíč vůči sorted_root
-        abs_sorted = item.data(0, Qt.UserRole + 1)    # absolutní cesta v 'Sorted PDFs'
-    
-        # ulož pro _sorted_fill_details
-        self._sorted_sel_db_key = db_key or ""
-        self._sorted_sel_abs_sorted = abs_sorted or ""
-        self._sorted_sel_board = board or ""
-        self._sorted_sel_file_name = file_name or ""
-    
-        # preferuj ABS cestu v sorted_root, ale vlastní naplnění si ještě dopočítá kandidátní cesty
-        self._sorted_fill_details(Path(abs_sorted) if abs_sorted else None)
-    
-    def _sorted_fill_details(self, abs_path: Optional[Path]) -> None:
-        from pathlib import Path
-    
-        def _set(w, val: str):
-            if hasattr(w, "setPlainText"):
-                w.setPlainText(val or "")
-            else:
-                w.setText(val or "")
-    
-        def _blank():
-            for w in (self.ed_board, self.ed_app_type, self.ed_inst_name, self.ed_cand_name,
-                      self.ed_rec_acad, self.ed_rec_cert, self.ed_fullname, self.ed_email,
-                      self.ed_phone, self.ed_address, self.ed_syllabi, self.ed_courses,
-                      self.ed_proof, self.ed_links, self.ed_additional,
-                      self.ed_printed_name_title, self.ed_sigdate,
-                      self.ed_receiving_member_board, self.ed_date_received,
-                      self.ed_validity_start_date, self.ed_validity_end_date):
-                _set(w, "")
-            _set(self.ed_filename, "")
-            self._sorted_set_editable(False)
-            self._sorted_set_status(None)
-    
-        if abs_path is None:
-            # zkusí si ještě složit kandidáty z uloženého kontextu
-            pass
-    
-        # 1) načti DB, pokud to jde (pouze pokud je cesta v sorted_root)
-        rec = None
-        try:
-            if abs_path is not None:
-                rec = self.sorted_db.get(abs_path)  # může vyžadovat path pod sorted_root
-        except Exception:
-            rec = None
-    
-        data = rec.get("data", {}) if rec else {}
-    
-        # 2) sestav KANDIDÁTNÍ cesty k PDF v pořadí:
-        #    a) původní cesta uložená v DB (data["path"])
-        #    b) absolutní cesta v sorted_root (UserRole+1 / abs_path)
-        #    c) odvozená cesta: pdf_root / <board> / <file_name>
-        candidates: list[Path] = []
-        if isinstance(data, dict):
-            p = data.get("path")
-            if p:
-                try:
-                    pp = Path(p)
-                    candidates.append(pp)
-                except Exception:
-                    pass
-    
-        if abs_path:
-            candidates.append(abs_path)
-    
-        try:
-            board = getattr(self, "_sorted_sel_board", "") or ""
-            fname = getattr(self, "_sorted_sel_file_name", "") or ""
-            if getattr(self, "pdf_root", None) and board and fname:
-                p3 = Path(self.pdf_root) / board / fname
-                candidates.append(p3)
-        except Exception:
-            pass
-    
-        # 3) pokud je DB nekompletní nebo prázdná, zkus parse prvního existujícího kandidáta
-        REQUIRED_KEYS = [
-            "board", "application_type", "institution_name", "candidate_name",
-            "recognition_academia", "recognition_certified",
-            "contact_full_name", "contact_email", "contact_phone", "contact_postal_address",
-            "syllabi_integration_description", "courses_modules_list",
-            "proof_of_istqb_certifications", "university_links", "additional_information_documents",
-            "printed_name_title", "signature_date",
-            "receiving_member_board", "date_received",
-            "validity_start_date", "validity_end_date",
-            "file_name",
-        ]
-    
-        def _is_incomplete(d: dict) -> bool:
-            if not d:
-                return True
-            for k in REQUIRED_KEYS:
-                if k not in d:  # klíč chybí → doplnit z parsingu
-                    return True
-            return False
-    
-        merged = dict(data) if isinstance(data, dict) else {}
-    
-        if _is_incomplete(merged):
-            try:
-                from app.pdf_scanner import PdfScanner
-                from dataclasses import asdict
-                # projdi kandidáty, první existující zparsuj a doplň chybějící klíče
-                for cand in candidates:
-                    try:
-                        if not cand:
-                            continue
-                        cpath = Path(cand).resolve()
-                        if not cpath.exists():
-                            continue
-                        for r in PdfScanner(cpath.parent).scan():
-                            try:
-                                rp = Path(r.path).resolve() if getattr(r, "path", None) else None
-                            except Exception:
-                                rp = None
-                            if rp and rp == cpath:
-                                parsed = asdict(r)
-                                # slouč: existující DB hodnoty nechme, doplňme jen chybějící
-                                for k, v in parsed.items():
-                                    if (k not in merged) or (merged.get(k) in (None, "")):
-                                        merged[k] = v
-                                break
-                        if not _is_incomplete(merged):
-                            break
-                    except Exception:
-                        continue
-            except Exception:
-                pass  # když parse selže, zobrazíme co je
-    
-        # 4) Naplň UI — prázdné zůstává prázdné
-        def get(k: str) -> str:
-            return "" if not merged else str(merged.get(k, "") or "")
-    
-        _set(self.ed_board, get("board"))
-        _set(self.ed_app_type, get("application_type"))
-        _set(self.ed_inst_name, get("institution_name"))
-        _set(self.ed_cand_name, get("candidate_name"))
-        _set(self.ed_rec_acad, get("recognition_academia"))
-        _set(self.ed_rec_cert, get("recognition_certified"))
-        _set(self.ed_fullname, get("contact_full_name"))
-        _set(self.ed_email, get("contact_email"))
-        _set(self.ed_phone, get("contact_phone"))
-        _set(self.ed_address, get("contact_postal_address"))
-        _set(self.ed_syllabi, get("syllabi_integration_description"))
-        _set(self.ed_courses, get("courses_modules_list"))
-        _set(self.ed_proof, get("proof_of_istqb_certifications"))
-        _set(self.ed_links, get("university_links"))
-        _set(self.ed_additional, get("additional_information_documents"))
-        _set(self.ed_printed_name_title, get("printed_name_title"))
-        _set(self.ed_sigdate, get("signature_date"))
-        _set(self.ed_receiving_member_board, get("receiving_member_board"))
-        _set(self.ed_date_received, get("date_received"))
-        _set(self.ed_validity_start_date, get("validity_start_date"))
-        _set(self.ed_validity_end_date, get("validity_end_date"))
-        # File name: vždy smysluplná hodnota
-        fname = merged.get("file_name") if isinstance(merged, dict) else None
-        if not fname:
-            try:
-                fname = getattr(self, "_sorted_sel_file_name", "") or (abs_path.name if abs_path else "")
-            except Exception:
-                fname = ""
-        _set(self.ed_filename, fname)
-    
-        self._sorted_set_editable(False)
-        _identity_empty = not any(
-            get(k) for k in (
-                "candidate_name", "contact_full_name", "contact_email",
-                "contact_phone", "signature_date", "printed_name_title",
-            )
-        )
-        if rec and rec.get("edited"):
-            self._sorted_set_status("Edited")
-        elif bool(merged.get("needs_manual_entry")) or _identity_empty:
-            self._sorted_set_status("⚠ Scanned/empty form – fill in manually (Edit → Save to DB)")
-        else:
-            self._sorted_set_status("Parsed (unmodified)")
-        self._sorted_current_path = abs_path if abs_path else None
-    
-    def _sorted_set_status(self, txt: Optional[str]) -> None:
-        self.lbl_sorted_status.setText("—" if not txt else txt)
-    
-    def _sorted_set_editable(self, can_edit: bool) -> None:
-        # Board a File name necháme read-only; ostatní podle can_edit
-        ro_lines = (self.ed_board, self.ed_filename)
-        for w in ro_lines:
-            w.setReadOnly(True)
-    
-        lines = (self.ed_app_type, self.ed_inst_name, self.ed_cand_name,
-                 self.ed_rec_acad, self.ed_rec_cert, self.ed_fullname,
-                 self.ed_email, self.ed_phone,
-                 self.ed_printed_name_title, self.ed_sigdate,
-                 self.ed_receiving_member_board, self.ed_date_received,
-                 self.ed_validity_start_date, self.ed_validity_end_date)
-        for w in lines:
-            w.setReadOnly(not can_edit)
-    
-        texts = (self.ed_address, self.ed_syllabi, self.ed_courses,
-                 self.ed_proof, self.ed_links, self.ed_additional)
-        for w in texts:
-            w.setReadOnly(not can_edit)
-
-    def _sorted_save_changes(self) -> None:
-        from PySide6.QtWidgets import QMessageBox
-        from pathlib import Path
-    
-        abs_path = getattr(self, "_sorted_current_path", None)
-        if not abs_path:
-            QMessageBox.information(self, "Save to DB", "No PDF selected.")
-            return
-    
-        def _get(w):
-            return w.toPlainText() if hasattr(w, "toPlainText") else w.text()
-    
-        file_name_value = None
-        if hasattr(self, "ed_filename"):
-            try:
-                file_name_value = _get(self.ed_filename).strip()
-            except Exception:
-                file_name_value = None
-        if not file_name_value:
-            file_name_value = Path(abs_path).name  # fallback, aby to nikdy nepadalo
-    
-        new_data = {
-            "board": self.ed_board.text().strip(),
-            "application_type": _get(self.ed_app_type).strip(),
-            "institution_name": _get(self.ed_inst_name).strip(),
-            "candidate_name": _get(self.ed_cand_name).strip(),
-            "recognition_academia": _get(self.ed_rec_acad).strip(),
-            "recognition_certified": _get(self.ed_rec_cert).strip(),
-            "contact_full_name": _get(self.ed_fullname).strip(),
-            "contact_email": _get(self.ed_email).strip(),
-            "contact_phone": _get(self.ed_phone).strip(),
-            "contact_postal_address": _get(self.ed_address).strip(),
-            "syllabi_integration_description": _get(self.ed_syllabi).strip(),
-            "courses_modules_list": _get(self.ed_courses).strip(),
-            "proof_of_istqb_certifications": _get(self.ed_proof).strip(),
-            "university_links": _get(self.ed_links).strip(),
-            "additional_information_documents": _get(self.ed_additional).strip(),
-            # NOVÁ POLE
-            "printed_name_title": _get(self.ed_printed_name_title).strip(),
-            "signature_date": _get(self.ed_sigdate).strip(),
-            "receiving_member_board": _get(self.ed_receiving_member_board).strip(),
-            "date_received": _get(self.ed_date_received).strip(),
-            "validity_start_date": _get(self.ed_validity_start_date).strip(),
-            "validity_end_date": _get(self.ed_validity_end_date).strip(),
-            # meta
-            "file_name": file_name_value,
-            "path": str(Path(abs_path).resolve()),
-        }
-    
-        self.sorted_db.mark_edited(Path(abs_path), new_data)
-        self.sorted_db.save()
-
-        self._sorted_set_editable(False)
-        self._sorted_set_status("Edited")
-        # Promítni úpravu zpět do Overview (hodnoty + 'Edited' indikátor) a souhrn.
-        try:
-            self._overview_update_sorted_flags()
-            self._overview_apply_sorted_row_hiding()
-            self._overview_apply_statuses()
-            self._refresh_summary()
-        except Exception:
-            pass
-        try:
-            self.statusBar().showMessage("Saved to DB.")
-        except Exception:
-            pass
-        
-    def _filter_board_sorted(self, txt: str) -> None:
-        proxy = self.table_sorted.model()
-        if isinstance(proxy, RecordsModel):
-            proxy.set_board(txt)
-            
-    def _filter_text_sorted(self, txt: str) -> None:
-        proxy = self.table_sorted.model()
-        if isinstance(proxy, RecordsModel):
-            proxy.set_search(txt)
-
-    def _selected_sorted_record(self) -> Optional[PdfRecord]:
-        sel = self.table_sorted.selectionModel()
-        if not sel or not sel.hasSelection():
-            return None
-        index = sel.selectedRows()[0]
-        FILE_COL = 16
-        proxy = self.table_sorted.model()
-        if isinstance(proxy, QSortFilterProxyModel):
-            sidx = proxy.mapToSource(proxy.index(index.row(), FILE_COL))
-            src = proxy.sourceModel()
-        else:
-            sidx = index
-            src = self.table_sorted.model()
-        path_str = src.index(sidx.row(), FILE_COL).data(Qt.UserRole + 1)
-        for r in self.records_sorted:
-            if str(r.path) == path_str:
-                return r
-        return None
-        
-    from typing import Optional
-    from PySide6.QtWidgets import QMessageBox
-    from PySide6.QtGui import QDesktopServices
-    from PySide6.QtCore import QUrl
-    
-    def open_selected_pdf(self) -> None:
-        """Open the PDF file of the currently selected row in Overview."""
-        rec = self._selected_record()
-        if not rec:
-            QMessageBox.information(self, "Open PDF", "Please select a row first.")
-            return
-        # macOS-safe: QDesktopServices.openUrl requires QUrl, not a string
-        QDesktopServices.openUrl(QUrl.fromLocalFile(str(rec.path)))
-
-    # ----- Browser tab -----
-    def _build_browser_tab(self) -> None:
-        """
-        PDF Browser: TOP = strom, BOTTOM = detail (formulář s lbl_*).
-        Přidány položky:
-          - Printed Name, Title (před Signature Date)
-          - Receiving Member Board, Date Received, Validity Start/End (za Signature Date)
-        """
-        from PySide6.QtCore import Qt, QTimer
-        from PySide6.QtWidgets import (
-            QSplitter, QWidget, QVBoxLayout, QTreeView, QFormLayout, QLabel,
-            QScrollArea, QFileSystemModel, QSizePolicy, QHeaderView
-        )
-    
-        vsplit = QSplitter(Qt.Vertical, self.browser_tab)
-    
-        # Nahoře strom
-        top_widget = QWidget()
-        top_layout = QVBoxLayout(top_widget)
-    
-        self.tree_browser = QTreeView()
-        self.tree_browser.setObjectName("tree_browser")
-        self.tree_browser.setHeaderHidden(False)
-        self.tree_browser.header().setStretchLastSection(True)
-        self.tree_browser.header().setSectionResizeMode(QHeaderView.ResizeToContents)
-    
-        # QFileSystemModel pro procházení kořene PDF
-        self.fs_model = QFileSystemModel(self.tree_browser)
-        self.fs_model.setRootPath(str(self.pdf_root))
-        self.fs_model.setReadOnly(True)
-        # Bez filtrů – ponecháme původní chování, jen abecedně řadíme
-    
-        self.tree_browser.setModel(self.fs_model)
-        self.tree_browser.setRootIndex(self.fs_model.index(str(self.pdf_root)))
-        self.tree_browser.setSortingEnabled(True)
-        self.tree_browser.sortByColumn(0, Qt.AscendingOrder)
-    
-        self.tree_browser.doubleClicked.connect(self._browser_on_double_clicked)
-        self.tree_browser.selectionModel().selectionChanged.connect(self._browser_on_selection_changed)
-    
-        top_layout.addWidget(self.tree_browser)
-    
-        # Dole detail s formulářem (scrollovatelný)
-        bottom_widget = QWidget()
-        bottom_layout = QVBoxLayout(bottom_widget)
-    
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-    
-        form_host = QWidget()
-        form_host.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.form_browser = QFormLayout(form_host)
-        self.form_browser.setRowWrapPolicy(QFormLayout.WrapLongRows)
-        self.form_browser.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
-    
-        # ----- Labely v pravém detailu (jen UI prvky; naplňování jinde) -----
-    
-        # Varovný banner: PDF bez vytěžitelných hodnot (sken/prázdný formulář)
-        self.lbl_browser_warning = QLabel()
-        self.lbl_browser_warning.setWordWrap(True)
-        self.lbl_browser_warning.setStyleSheet(
-            "QLabel { color: #ffae42; font-weight: bold; padding: 4px; }"
-        )
-        self.lbl_browser_warning.setVisible(False)
-        self.form_browser.addRow(self.lbl_browser_warning)
-
-        # Application / Institution / Recognition
-        self.lbl_board = QLabel()
-        self.lbl_app_type = QLabel()
-        self.lbl_inst_name = QLabel()
-        self.lbl_cand_name = QLabel()
-        self.lbl_rec_acad = QLabel()
-        self.lbl_rec_cert = QLabel()
-    
-        self.lbl_board.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_app_type.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_inst_name.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_cand_name.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_rec_acad.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_rec_cert.setTextInteractionFlags(Qt.TextSelectableByMouse)
-    
-        self.form_browser.addRow("Board:", self.lbl_board)
-        self.form_browser.addRow("Application Type:", self.lbl_app_type)
-        self.form_browser.addRow("Institution Name:", self.lbl_inst_name)
-        self.form_browser.addRow("Candidate Name:", self.lbl_cand_name)
-        self.form_browser.addRow("Academia Recognition:", self.lbl_rec_acad)
-        self.form_browser.addRow("Certified Recognition:", self.lbl_rec_cert)
-    
-        # Contact
-        self.lbl_fullname = QLabel()
-        self.lbl_email = QLabel()
-        self.lbl_phone = QLabel()
-        self.lbl_address = QLabel()
-        self.lbl_fullname.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_email.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_phone.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_address.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_address.setWordWrap(True)
-    
-        self.form_browser.addRow("Full Name:", self.lbl_fullname)
-        self.form_browser.addRow("Email Address:", self.lbl_email)
-        self.form_browser.addRow("Phone Number:", self.lbl_phone)
-        self.form_browser.addRow("Postal Address:", self.lbl_address)
-    
-        # Eligibility evidence
-        self.lbl_syllabi = QLabel()
-        self.lbl_courses = QLabel()
-        self.lbl_proof = QLabel()
-        self.lbl_links = QLabel()
-        self.lbl_additional = QLabel()
-        for _lbl in (self.lbl_syllabi, self.lbl_courses, self.lbl_proof, self.lbl_links, self.lbl_additional):
-            _lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            _lbl.setWordWrap(True)
-    
-        self.form_browser.addRow("Syllabi Integration:", self.lbl_syllabi)
-        self.form_browser.addRow("Courses/Modules:", self.lbl_courses)
-        self.form_browser.addRow("Proof of ISTQB Certifications:", self.lbl_proof)
-        self.form_browser.addRow("University Links:", self.lbl_links)
-        self.form_browser.addRow("Additional Info/Documents:", self.lbl_additional)
-    
-        # Declaration & Consent
-        self.lbl_printed_name_title = QLabel()
-        self.lbl_signature_date = QLabel()
-        self.lbl_printed_name_title.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.lbl_signature_date.setTextInteractionFlags(Qt.TextSelectableByMouse)
-    
-        self.form_browser.addRow("Printed Name, Title:", self.lbl_printed_name_title)
-        self.form_browser.addRow("Signature Date:", self.lbl_signature_date)
-    
-        # For ISTQB Academia Use Only
-        self.lbl_receiving_member_board = QLabel()
-        self.lbl_date_received = QLabel()
-        self.lbl_validity_start_date = QLabel()
-        self.lbl_validity_end_date = QLabel()
-        for _lbl in (self.lbl_receiving_member_board, self.lbl_date_received, self.lbl_validity_start_date, self.lbl_validity_end_date):
-            _lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
-    
-        self.form_browser.addRow("Receiving Member Board:", self.lbl_receiving_member_board)
-        self.form_browser.addRow("Date Received:", self.lbl_date_received)
-        self.form_browser.addRow("Validity Start Date:", self.lbl_validity_start_date)
-        self.form_browser.addRow("Validity End Date:", self.lbl_validity_end_date)
-    
-        # technické doplňky – oddalé načtení fitu/resize, pokud to UI používá
-        try:
-            QTimer.singleShot(0, lambda: self._browser_fit_columns())
-        except Exception:
-            pass
-    
-        scroll.setWidget(form_host)
-        bottom_layout.addWidget(scroll)
-    
-        vsplit.addWidget(top_widget)
-        vsplit.addWidget(bottom_widget)
-        vsplit.setStretchFactor(0, 2)
-        vsplit.setStretchFactor(1, 1)
-        vsplit.setCollapsible(1, False)
+                    it.setSelected(True)  # defaultně všechny
+                    self.list_boards.addItem(it)
+                lay_b.addWidget(self.list_boards)
+                main.addWidget(gb_board)
     
-        from PySide6.QtWidgets import QVBoxLayout as _VBL
-        outer = _VBL(self.browser_tab)
-        outer.addWidget(vsplit)
+                gb_fields = QGroupBox("Fields (order)")
+                lay_fi = QVBoxLayout(gb_fields)
+                self.list_fields = QListWidget()
+                self.list_fields.setSelectionMode(QListWidget.MultiSelection)
+                for label, key in FIELDS:
+                    it = QListWidgetItem(label)
+                    it.setData(Qt.UserRole, key)
+                    it.setSelected(True)
+                    self.list_fields.addItem(it)
+                lay_fi.addWidget(self.list_fields)
+                main.addWidget(gb_fields)
     
-        # vlož sekční hlavičky (idempotentní)
-        try:
-            self._browser_add_section_headers()
-        except Exception:
-            pass
-        
-    def _browser_add_section_headers(self) -> None:
-        """
-        Vloží do self.form_browser vizuální záhlaví pro sekce PDF (1–7).
-        Nepracuje s daty, jen s labely existujícího QFormLayoutu. Idempotentní.
-        """
-        from PySide6.QtWidgets import QLabel, QFormLayout
+                btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+                btns.accepted.connect(self.accept)
+                btns.rejected.connect(self.reject)
+                main.addWidget(btns)
     
-        if not hasattr(self, "form_browser") or self.form_browser is None:
+        dlg = ExportDialog(boards_avail, self)
+        if dlg.exec() != QDialog.Accepted:
             return
-        form = self.form_browser
     
-        # Pokud už jsou sekční hlavičky přítomné, skonči
-        try:
-            for i in range(form.rowCount()):
-                it = form.itemAt(i, QFormLayout.LabelRole)
-                if it is None:
-                    continue
-                w = it.widget()
-                if isinstance(w, QLabel) and w.property("class") == "sectionHeader":
-                    return
-        except Exception:
-            pass
+        fmt_xlsx = dlg.cb_xlsx.isChecked()
+        fmt_csv  = dlg.cb_csv.isChecked()
+        fmt_txt  = dlg.cb_txt.isChecked()
+        selected_fields = [(dlg.list_fields.item(i).text(), dlg.list_fields.item(i).data(Qt.UserRole))
+                           for i in range(dlg.list_fields.count())
+                           if dlg.list_fields.item(i).isSelected()]
+        if not selected_fields:
+            QMessageBox.warning(self, "Export", "No fields selected.")
+            return
     
-        def _header(text: str) -> QLabel:
-            lbl = QLabel(text)
-            lbl.setProperty("class", "sectionHeader")
-            lbl.setStyleSheet("QLabel { font-weight: 600; padding: 6px 4px; }")
-            return lbl
-    
-        anchors = [
-            ("1) Application Type", "Application Type:"),
-            ("2) Academic Institution", "Institution Name:"),
-            ("3) Recognition", "Academia Recognition:"),
-            ("4) Contact Details", "Full Name:"),
-            ("5) Eligibility Evidence", "Syllabi Integration:"),
-            ("6) Declaration & Consent", "Printed Name, Title:"),
-            ("7) For ISTQB Academia Use Only", "Receiving Member Board:"),
-        ]
+        boards_sel = {dlg.list_boards.item(i).text()
+                      for i in range(dlg.list_boards.count())
+                      if dlg.list_boards.item(i).isSelected()}
+        if not boards_sel:
+            boards_sel = set(boards_avail)
     
-        rows = []
-        for i in range(form.rowCount()):
-            rows.append((
-                i,
-                form.itemAt(i, QFormLayout.LabelRole),
-                form.itemAt(i, QFormLayout.FieldRole),
-            ))
-    
-        for title, anchor_label in reversed(anchors):
-            for i, l_it, _ in rows:
-                if l_it is None:
-                    continue
-                w = l_it.widget()
-                if not w:
+        headers = [label for (label, _) in selected_fields]
+        # jen klíče vybraných záznamů; řádky se generují až při zápisu
+        keys = []
+        for rel_key, rec in _iter_sorted_items():
+            try:
+                data = rec.get("data", {}) if isinstance(rec, dict) else {}
+                if data.get("board") in boards_sel:
+                    keys.append(rel_key)
+            except Exception:
+                continue
+
+        def rows():
+            get_key = getattr(self.sorted_db, "get_key", None)
+            for rel_key in keys:
+                try:
+                    rec = get_key(rel_key) if callable(get_key) else None
+                    data = (rec or {}).get("data", {}) or {}
+                    yield [str(data.get(k, "") or "") for (_, k) in selected_fields]
+                except Exception:
                     continue
-                text = w.text() if hasattr(w, "text") else ""
-                if text.strip() == anchor_label:
-                    form.insertRow(i, _header(title))
-                    break
     
-    def _pdfbrowser_enable_sorting(self) -> None:
-        """Zapne abecední řazení pro strom v PDF Browseru (safe no-op, když strom není)."""
-        from PySide6.QtCore import Qt
-        tree = getattr(self, "tree_browser", None)
-        if tree is None:
+        now = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename_base = f"sorted_export_{now}"
+        dlg_dir = os.getcwd()
+        path, _ = QFileDialog.getSaveFileName(self, "Save export", os.path.join(dlg_dir, filename_base + ".xlsx"),
+                                              "XLSX (*.xlsx);;CSV (*.csv);;TXT (*.txt)")
+        if not path:
             return
-        try:
-            tree.setSortingEnabled(True)
-            tree.sortByColumn(0, Qt.AscendingOrder)
-        except Exception:
-            pass
-        
-    def _browser_fit_columns(self) -> None:
-        """Jemné přizpůsobení šířky sloupců pro QTreeView v PDF Browseru (safe no-op)."""
-        try:
-            header = self.tree_browser.header()
-            for i in range(header.count()):
-                self.tree_browser.resizeColumnToContents(i)
-        except Exception:
-            pass
-        
-    def _browser_on_double_clicked(self, index) -> None:
-        """Dvojklik ve stromu: složka expand/collapse; soubor = zobraz detail."""
-        try:
-            model = self.tree_browser.model()
-            path_str = model.filePath(index)
-            if getattr(model, "isDir", lambda *_: False)(index):
-                if self.tree_browser.isExpanded(index):
-                    self.tree_browser.collapse(index)
-                else:
-                    self.tree_browser.expand(index)
-                return
-            from pathlib import Path
-            p = Path(path_str)
-            if p.exists() and p.suffix.lower() == ".pdf":
-                self._browser_show_pdf_details(p)
-        except Exception:
-            pass
-    
-    def _browser_on_selection_changed(self, selected, deselected) -> None:
-        """Změna výběru ve stromu → pokud je vybrán PDF soubor, naplň detail; jinak prázdno."""
-        try:
-            sel = self.tree_browser.selectionModel().selectedIndexes()
-            if not sel:
-                self._browser_show_pdf_details(None)
-                return
-            index = sel[0]
-            model = self.tree_browser.model()
-            if getattr(model, "isDir", lambda *_: False)(index):
-                self._browser_show_pdf_details(None)
-                return
-            from pathlib import Path
-            p = Path(model.filePath(index))
-            if p.exists() and p.suffix.lower() == ".pdf":
-                self._browser_show_pdf_details(p)
-            else:
-                self._browser_show_pdf_details(None)
-        except Exception:
-            self._browser_show_pdf_details(None)
     
-    def _browser_show_pdf_details(self, path) -> None:
+        # jeden průchod DB → souběžné writery vybraných formátů
+        from app.export_engine import Sink
+        sinks = []
+        if fmt_xlsx:
+            fn_xlsx = path if path.lower().endswith(".xlsx") else path + ".xlsx"
+            sinks.append(Sink("XLSX", fn_xlsx, lambda r: self._export_to_xlsx(fn_xlsx, headers, r)))
+        if fmt_csv:
+            fn_csv = path if path.lower().endswith(".csv") else path + ".csv"
+            sinks.append(Sink("CSV", fn_csv, lambda r: self._export_to_csv(fn_csv, headers, r)))
+        if fmt_txt:
+            fn_txt = path if path.lower().endswith(".txt") else path + ".txt"
+            sinks.append(Sink("TXT", fn_txt, lambda r: self._export_to_txt(fn_txt, headers, r)))
+        ok, errs, cancelled = self._run_fanout_export(
+            sinks, lambda: ((None, row) for row in rows()), len(keys), "Export")
+        if errs:
+            QMessageBox.warning(self, "Export", "Issues:\n- " + "\n- ".join(errs))
+        elif not cancelled:
+            QMessageBox.information(self, "Export", "Export finished.")
+        
+    def rescan_sorted(self) -> None:
         """
-        Naplní pravý náhled v 'PDF Browser' z DB (pokud existuje) nebo z parsingu PDF.
-        Prázdné hodnoty zůstávají prázdné.
+        Sestaví/aktualizuje strom 'Sorted PDFs' z DB (edited i parsed).
+        DB se z disku znovu načte jen pokud ji změnil jiný proces (mtime/size);
+        vlastní změny (export, edit) už v paměti jsou. Strom se aktualizuje
+        inkrementálně – přidané/odebrané/přesunuté záznamy, ne clear() + rebuild.
         """
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QTreeWidgetItem
         from pathlib import Path
-        from dataclasses import asdict
-    
-        def _set(lbl, text: str) -> None:
-            try:
-                lbl.setText(text or "")
-            except Exception:
-                pass
-    
-        # Když není soubor, vyčisti panel
-        if not path:
-            for w in (
-                self.lbl_board, self.lbl_app_type, self.lbl_inst_name, self.lbl_cand_name,
-                self.lbl_rec_acad, self.lbl_rec_cert, self.lbl_fullname, self.lbl_email,
-                self.lbl_phone, self.lbl_address, self.lbl_syllabi, self.lbl_courses,
-                self.lbl_proof, self.lbl_links, self.lbl_additional,
-                self.lbl_printed_name_title, self.lbl_signature_date,
-                self.lbl_receiving_member_board, self.lbl_date_received,
-                self.lbl_validity_start_date, self.lbl_validity_end_date
-            ):
-                _set(w, "")
+
+        # 1. Reload DB jen při změně zvenku (nový export/edit zvýší generaci sám)
+        db = getattr(self, "sorted_db", None)
+        if db is not None:
+            reload = getattr(db, "reload_if_changed", None)
+            if callable(reload):
+                reload()
+            else:
+                db.load()
+
+        if not hasattr(self, "tree_sorted"):
+            return
+
+        # DB ani její obsah se od posledního sestavení stromu nezměnily → hotovo
+        generation = getattr(db, "generation", None)
+        if (generation is not None and getattr(self, "_sorted_tree_db", None) is db
+                and getattr(self, "_sorted_tree_gen", None) == generation):
+            return
+
+        if getattr(self, "_sorted_tree_db", None) is not db:
+            # jiná DB (nový kořen / backend) → stavíme od nuly
+            self.tree_sorted.clear()
+            self._sorted_tree_items = {}
+            self._sorted_tree_boards = {}
+        items: dict[str, QTreeWidgetItem] = self._sorted_tree_items
+        root_items: dict[str, QTreeWidgetItem] = self._sorted_tree_boards
+
+        sorted_root = getattr(db, "sorted_root", None)
+        sorted_root = Path(sorted_root).resolve() if sorted_root else None
+
+        # Iterace položek z DB.
+        # iter_items() vrací (rel_key, rec); rel_key převedeme na absolutní cestu
+        # pod sorted_root, aby výběr/edit/uložení fungovaly (jinak relative_to selže).
+        def _iter_sorted_items():
+            it = getattr(db, "iter_items", None)
+            if callable(it):
+                for rel_key, rec in it():
+                    # sorted_root je už resolvovaný a klíč je relativní POSIX → bez resolve()
+                    abs_sorted = (sorted_root / rel_key) if sorted_root else Path(rel_key)
+                    yield abs_sorted, rec
+                return
+            # fallback
             try:
-                self.lbl_browser_warning.setVisible(False)
+                for rel_key, rec in db.items():
+                    abs_sorted = (sorted_root / rel_key).resolve() if sorted_root else Path(rel_key).resolve()
+                    yield abs_sorted, rec
             except Exception:
-                pass
-            return
-    
-        p = Path(path)
-    
-        # 1) DB (pokud existuje a zná tento soubor pod sorted_root)
-        data = {}
-        try:
-            rec = self.sorted_db.get(p)
-            if rec and isinstance(rec, dict):
-                data = rec.get("data", {}) or {}
-        except Exception:
-            data = {}
-    
-        # 2) Doplň parsováním, pokud DB nemá klíče
-        def _need_parse(d: dict) -> bool:
-            REQUIRED = [
-                "board", "application_type", "institution_name", "candidate_name",
-                "recognition_academia", "recognition_certified",
-                "contact_full_name", "contact_email", "contact_phone", "contact_postal_address",
-                "syllabi_integration_description", "courses_modules_list",
-                "proof_of_istqb_certifications", "university_links", "additional_information_documents",
-                "printed_name_title", "signature_date",
-                "receiving_member_board", "date_received",
-                "validity_start_date", "validity_end_date",
-            ]
-            if not d:
-                return True
-            for k in REQUIRED:
-                if k not in d:
-                    return True
-            return False
-    
-        if _need_parse(data):
+                return
+
+        def _ensure_board_node(board_name: str) -> QTreeWidgetItem:
+            node = root_items.get(board_name)
+            if node is None:
+                node = QTreeWidgetItem([board_name])
+                node.setData(0, Qt.UserRole, None)
+                self.tree_sorted.addTopLevelItem(node)
+                node.setExpanded(True)
+                root_items[board_name] = node
+            return node
+
+        def _detach(child: QTreeWidgetItem) -> None:
+            parent = child.parent()
+            if parent is not None:
+                parent.removeChild(child)
+
+        seen: set[str] = set()
+        for abs_sorted_path, rec in _iter_sorted_items():
             try:
-                from app.pdf_scanner import PdfScanner
-                parsed = {}
-                for r in PdfScanner(p.parent).scan():
+                if isinstance(abs_sorted_path, str):
+                    abs_sorted_path = Path(abs_sorted_path)
+                    
+                data = rec.get("data", {}) if isinstance(rec, dict) else {}
+                board = data.get("board") or abs_sorted_path.parent.name
+                name = data.get("file_name") or abs_sorted_path.name
+
+                # DB klíč (abs_sorted_path je už resolvovaná)
+                db_key = None
+                if sorted_root:
                     try:
-                        rp = Path(r.path)
+                        db_key = str(abs_sorted_path.relative_to(sorted_root))
                     except Exception:
-                        rp = None
-                    if rp and rp.resolve() == p.resolve():
-                        parsed = asdict(r)
-                        break
-                if parsed:
-                    merged = dict(parsed)
-                    for k, v in (data or {}).items():
-                        if v not in (None, ""):
-                            merged[k] = v
-                    data = merged
+                        db_key = None
+                item_key = db_key or str(abs_sorted_path)
+                seen.add(item_key)
+
+                child = items.get(item_key)
+                if child is not None:
+                    if child.parent() is root_items.get(board):
+                        if child.text(0) != name:
+                            child.setText(0, name)
+                        continue
+                    # záznam se přesunul do jiného boardu
+                    _detach(child)
+
+                parent = _ensure_board_node(board)
+                child = QTreeWidgetItem([name])
+                
+                # UserRole: DB klíč
+                child.setData(0, Qt.UserRole, db_key or "")
+                # UserRole + 1: Absolutní cesta
+                child.setData(0, Qt.UserRole + 1, str(abs_sorted_path))
+                
+                parent.addChild(child)
+                items[item_key] = child
             except Exception:
-                pass
+                continue
+
+        # odebrané záznamy a prázdné board uzly
+        for item_key in [k for k in items if k not in seen]:
+            _detach(items.pop(item_key))
+        for board_name in [b for b, node in root_items.items() if node.childCount() == 0]:
+            node = root_items.pop(board_name)
+            self.tree_sorted.takeTopLevelItem(self.tree_sorted.indexOfTopLevelItem(node))
+
+        self._sorted_tree_db = db
+        self._sorted_tree_gen = generation
+
+
+    from typing import Optional
+    from PySide6.QtWidgets import QMessageBox
+    from PySide6.QtGui import QDesktopServices
+    from PySide6.QtCore import QUrl
     
-        # 3) Odvoď board, když chybí
-        if not data.get("board"):
-            try:
-                rel = p.resolve().relative_to(Path(self.pdf_root).resolve())
-                data["board"] = rel.parts[0] if len(rel.parts) >= 2 else p.parent.name
-            except Exception:
-                data["board"] = p.parent.name
-    
-        # 4) Naplň UI
-        def get(k: str) -> str:
-            return "" if not data else str(data.get(k, "") or "")
-    
-        _set(self.lbl_board, get("board"))
-        _set(self.lbl_app_type, get("application_type"))
-        _set(self.lbl_inst_name, get("institution_name"))
-        _set(self.lbl_cand_name, get("candidate_name"))
-        _set(self.lbl_rec_acad, get("recognition_academia"))
-        _set(self.lbl_rec_cert, get("recognition_certified"))
-    
-        _set(self.lbl_fullname, get("contact_full_name"))
-        _set(self.lbl_email, get("contact_email"))
-        _set(self.lbl_phone, get("contact_phone"))
-        _set(self.lbl_address, get("contact_postal_address"))
-    
-        _set(self.lbl_syllabi, get("syllabi_integration_description"))
-        _set(self.lbl_courses, get("courses_modules_list"))
-        _set(self.lbl_proof, get("proof_of_istqb_certifications"))
-        _set(self.lbl_links, get("university_links"))
-        _set(self.lbl_additional, get("additional_information_documents"))
-    
-        _set(self.lbl_printed_name_title, get("printed_name_title"))
-        _set(self.lbl_signature_date, get("signature_date"))
-    
-        _set(self.lbl_receiving_member_board, get("receiving_member_board"))
-        _set(self.lbl_date_received, get("date_received"))
-        _set(self.lbl_validity_start_date, get("validity_start_date"))
-        _set(self.lbl_validity_end_date, get("validity_end_date"))
-
-        # Varování pro naskenovaná / prázdná PDF bez vytěžitelných hodnot.
-        # Odvozeno z prázdnosti identifikačních polí, aby to fungovalo i pro
-        # záznamy z DB a samo zmizelo po ručním vyplnění.
-        try:
-            identity_empty = not any(
-                get(k) for k in (
-                    "candidate_name", "contact_full_name", "contact_email",
-                    "contact_phone", "signature_date", "printed_name_title",
-                )
-            )
-            if bool(data.get("needs_manual_entry")) or identity_empty:
-                self.lbl_browser_warning.setText(
-                    "⚠ Scanned PDF or empty form with no text layer – "
-                    "values cannot be extracted automatically. Fill in manually in the Sorted PDFs tab."
-                )
-                self.lbl_browser_warning.setVisible(True)
-            else:
-                self.lbl_browser_warning.setVisible(False)
-        except Exception:
-            pass
+    def open_selected_pdf(self) -> None:
+        """Open the PDF file of the currently selected row in Overview."""
+        rec = self._selected_record()
+        if not rec:
+            QMessageBox.information(self, "Open PDF", "Please select a row first.")
+            return
+        # macOS-safe: QDesktopServices.openUrl requires QUrl, not a string
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(rec.path)))
 
+    # ----- Browser tab -----
     # ----- Data -----
-    def rescan(self) -> None:
+    def rescan(self, records: Optional[List[PdfRecord]] = None,
+               stats: Optional[dict] = None, snapshot=None) -> None:
+        # měřeno po fázích (self.perf) – dialog Performance, perf_log.jsonl, status bar
+        with self.perf.run("rescan"):
+            self._rescan_overview(records, stats, snapshot)
+
+    def _rescan_overview(self, records: Optional[List[PdfRecord]] = None,
+                         stats: Optional[dict] = None, snapshot=None) -> None:
         """Scan PDF root and repopulate the Overview table while preserving selection.
         Minimal-change: přidány nové sloupce, „Sorted“ zůstává poslední a je dopočten původními funkcemi.
+        ``records`` = už hotový record set (sken na pozadí) → bez skenu, ``stats`` jeho
+        manifest (cesta → (size, mtime_ns)). ``snapshot`` (ScanSnapshot) = warm start:
+        sloupce Sorted/Status se vezmou ze snapshotu, bez dotazů do Sorted DB.
         """
         from pathlib import Path
         from PySide6.QtCore import Qt, QItemSelectionModel
@@ -4896,99 +3999,73 @@ class MainWindow(QMainWindow):
             return
     
         # Scan
-        from app.pdf_scanner import PdfScanner
-        scanner = PdfScanner(root)
-        self.records = scanner.scan()
+        if snapshot is not None:
+            records, stats = snapshot.records, snapshot.stats
+        if records is None:
+            from app.pdf_scanner import PdfScanner
+            scanner = PdfScanner(root, workers=self._scan_workers())
+            records = scanner.scan()
+            stats = scanner.stats
+            self._perf_add_scan(scanner.timings, scanner.file_times, scanner.counts, scanner.file_profiles)
+        self.records = records
+        # manifest (size, mtime_ns) k record setu – pro warm-start snapshot
+        self._record_stats = dict(stats or {})
+        self.store = RecordStore.from_records(self.records)
+        self._proxy.set_store(self.store)
+
+        # SHA-256 spočítal už scanner ze stejného bufferu jako parsing →
+        # předvyplň cache, aby _hash_file nečetl každý soubor znovu.
+        for rec in self.records:
+            if rec.content_hash:
+                self._hash_cache.put(rec.path.resolve(), rec.content_hash, self._record_stats.get(str(rec.path)))
     
         # Vyprázdni a naplň
         if model.rowCount() > 0:
             model.removeRows(0, model.rowCount())
     
-        # Barevné skupiny (původní + nové)
-        COLS_APPLICATION = [1]
-        COLS_INSTITUTION = [2, 3]
-        COLS_RECOG      = [4, 5]
-        COLS_CONTACT    = [6, 7, 8, 9]
-        COLS_ELIG       = [10, 11, 12, 13, 14]
-        COLS_CONSENT    = [15, 16]          # NOVĚ
-        COLS_ISTQB_INT  = [17, 18, 19, 20]  # NOVĚ
-    
-        BRUSH_APP   = QBrush(QColor(58, 74, 110))
-        BRUSH_INST  = QBrush(QColor(74, 58, 110))
-        BRUSH_RECOG = QBrush(QColor(58, 110, 82))
-        BRUSH_CONT  = QBrush(QColor(110, 82, 58))
-        BRUSH_ELIG  = QBrush(QColor(92, 92, 92))
-        BRUSH_CONS  = QBrush(QColor(110, 58, 74))
-        BRUSH_ISTQB = QBrush(QColor(58, 92, 110))
-    
-        icon_yes = self.style().standardIcon(QStyle.SP_DialogApplyButton)
-        icon_no  = self.style().standardIcon(QStyle.SP_DialogCancelButton)
-    
-        def paint_group(items: list[QStandardItem], cols: list[int], brush: QBrush) -> None:
-            for c in cols:
-                if 0 <= c < len(items):
-                    items[c].setBackground(brush)
-    
-        def set_yesno_icon(item: QStandardItem) -> None:
-            val = (item.text() or "").strip().lower()
-            item.setIcon(icon_yes if val in {"yes", "on", "true", "1", "checked"} else icon_no)
-    
         found = 0
-        for rec in self.records:
-            row_vals = rec.as_row()  # odpovídá headers KROMĚ „Sorted“
-            items = [QStandardItem(v) for v in row_vals]
-            for it in items:
-                it.setEditable(False)
-            # doplň prázdný „Sorted“ a „Status“ (Status se naplní zvlášť)
-            items.append(QStandardItem(""))
-            items.append(QStandardItem(""))
-            paint_group(items, COLS_APPLICATION, BRUSH_APP)
-            paint_group(items, COLS_INSTITUTION, BRUSH_INST)
-            paint_group(items, COLS_RECOG,      BRUSH_RECOG)
-            paint_group(items, COLS_CONTACT,    BRUSH_CONT)
-            paint_group(items, COLS_ELIG,       BRUSH_ELIG)
-            paint_group(items, COLS_CONSENT,    BRUSH_CONS)
-            paint_group(items, COLS_ISTQB_INT,  BRUSH_ISTQB)
-            set_yesno_icon(items[4])  # Academia
-            set_yesno_icon(items[5])  # Certified
-    
-            # ulož absolutní cestu do „File name“ (UserRole+1)
-            if FILE_COL is not None and 0 <= FILE_COL < len(items):
-                items[FILE_COL].setData(str(rec.path), Qt.UserRole + 1)
-    
-            model.appendRow(items)
-            found += 1
+        with self.perf.phase("model fill", len(self.store.records)):
+            for rid, rec in enumerate(self.store.records):
+                model.appendRow(self._overview_row_items(rid, rec, FILE_COL))
+                found += 1
     
         # třídění a fit
-        self.table.sortByColumn(0, Qt.AscendingOrder)
-        try:
-            for c in range(len(headers)):
-                self.table.resizeColumnToContents(c)
-            for c in (10, 11, 12, 13, 14):
-                self.table.setColumnHidden(c, True)
-        except Exception:
-            pass
+        with self.perf.phase("sort + resize columns", len(headers)):
+            self.table.sortByColumn(0, Qt.AscendingOrder)
+            try:
+                for c in range(len(headers)):
+                    self.table.resizeColumnToContents(c)
+                for c in (10, 11, 12, 13, 14):
+                    self.table.setColumnHidden(c, True)
+            except Exception:
+                pass
     
         # označ „Sorted“ a aplikuj hiding (původní logika)
-        try:
-            self._overview_update_sorted_flags()
-            self._overview_apply_sorted_row_hiding()
-        except Exception:
-            pass
+        with self.perf.phase("sorted flags"):
+            try:
+                if snapshot is not None and snapshot.sorted_marks:
+                    self._overview_apply_sorted_marks(snapshot.sorted_marks)
+                else:
+                    self._overview_update_sorted_flags()
+                self._overview_apply_sorted_row_hiding()
+            except Exception:
+                pass
 
         # naplň sloupec Status, přesuň indikátory dopředu a obnov souhrn
-        try:
-            self._overview_apply_statuses()
-        except Exception:
-            pass
+        with self.perf.phase("statuses"):
+            try:
+                self._overview_apply_statuses(snapshot.statuses if snapshot is not None else None)
+            except Exception:
+                pass
         try:
             self._overview_reorder_columns()
         except Exception:
             pass
-        try:
-            self._refresh_summary()
-        except Exception:
-            pass
+        with self.perf.phase("summary"):
+            try:
+                self._refresh_summary()
+            except Exception:
+                pass
 
         # obnov výběr
         try:
@@ -5011,6 +4088,70 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _overview_row_items(self, rid: int, rec: PdfRecord, file_col: Optional[int]) -> list:
+        """Položky jednoho řádku Overview (data + barvy skupin + ikony Yes/No);
+        „Sorted“ a „Status“ zůstávají prázdné, plní je samostatné funkce."""
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QStandardItem, QBrush, QColor
+        from PySide6.QtWidgets import QStyle
+
+        style = getattr(self, "_overview_row_style", None)
+        if style is None:
+            # Barevné skupiny (původní + nové)
+            COLS_APPLICATION = [1]
+            COLS_INSTITUTION = [2, 3]
+            COLS_RECOG      = [4, 5]
+            COLS_CONTACT    = [6, 7, 8, 9]
+            COLS_ELIG       = [10, 11, 12, 13, 14]
+            COLS_CONSENT    = [15, 16]          # NOVĚ
+            COLS_ISTQB_INT  = [17, 18, 19, 20]  # NOVĚ
+
+            BRUSH_APP   = QBrush(QColor(58, 74, 110))
+            BRUSH_INST  = QBrush(QColor(74, 58, 110))
+            BRUSH_RECOG = QBrush(QColor(58, 110, 82))
+            BRUSH_CONT  = QBrush(QColor(110, 82, 58))
+            BRUSH_ELIG  = QBrush(QColor(92, 92, 92))
+            BRUSH_CONS  = QBrush(QColor(110, 58, 74))
+            BRUSH_ISTQB = QBrush(QColor(58, 92, 110))
+
+            icon_yes = self.style().standardIcon(QStyle.SP_DialogApplyButton)
+            icon_no  = self.style().standardIcon(QStyle.SP_DialogCancelButton)
+            style = self._overview_row_style = (
+                (
+                    (COLS_APPLICATION, BRUSH_APP),
+                    (COLS_INSTITUTION, BRUSH_INST),
+                    (COLS_RECOG, BRUSH_RECOG),
+                    (COLS_CONTACT, BRUSH_CONT),
+                    (COLS_ELIG, BRUSH_ELIG),
+                    (COLS_CONSENT, BRUSH_CONS),
+                    (COLS_ISTQB_INT, BRUSH_ISTQB),
+                ),
+                icon_yes,
+                icon_no,
+            )
+        groups, icon_yes, icon_no = style
+
+        row_vals = rec.as_row()  # odpovídá headers KROMĚ „Sorted“
+        items = [QStandardItem(v) for v in row_vals]
+        for it in items:
+            it.setEditable(False)
+        # doplň prázdný „Sorted“ a „Status“ (Status se naplní zvlášť)
+        items.append(QStandardItem(""))
+        items.append(QStandardItem(""))
+        for cols, brush in groups:
+            for c in cols:
+                if 0 <= c < len(items):
+                    items[c].setBackground(brush)
+        for item in (items[4], items[5]):  # Academia, Certified
+            val = (item.text() or "").strip().lower()
+            item.setIcon(icon_yes if val in {"yes", "on", "true", "1", "checked"} else icon_no)
+
+        # ulož absolutní cestu do „File name“ (UserRole+1)
+        if file_col is not None and 0 <= file_col < len(items):
+            items[file_col].setData(str(rec.path), Qt.UserRole + 1)
+            items[file_col].setData(rid, ROLE_RECORD_ID)
+        return items
+
     # ----- Actions -----
     from typing import Optional
     from PySide6.QtCore import Qt, QModelIndex
@@ -5070,10 +4211,7 @@ class MainWindow(QMainWindow):
             return None
     
         # Match against loaded records
-        for r in getattr(self, "records", []):
-            if str(r.path) == str(path_str):
-                return r
-        return None
+        return self.store.record(self.store.id_for_path(path_str))
     
     def _init_fs_watcher(self) -> None:
         from PySide6.QtCore import QTimer
@@ -5131,7 +4269,7 @@ class MainWindow(QMainWindow):
         Handle file system changes with loop prevention.
         """
         # CRITICAL: Ignore changes to DB files to prevent infinite reload loops
-        if path.endswith("sorted_db.json") or path.endswith("recognized_people.json"):
+        if Path(path).name.startswith("sorted_db.") or path.endswith("recognized_people.json"):
             return
         
         # Ignore changes inside Sorted PDFs (we manage that folder explicitly)
@@ -5215,15 +4353,7 @@ class MainWindow(QMainWindow):
         if not path.is_file():
             return
 
-        from .pdf_scanner import PdfScanner
-        scanner = PdfScanner(self.pdf_root)
-        rec: Optional[PdfRecord] = None
-        try:
-            rec = scanner._parse_one(path)
-        except Exception:
-            rec = None
-
-        self._update_detail_panel(rec)
+        self._update_detail_panel(self._parsed_record(path))
 
     def _renumber_rows(self) -> None:
         """Write 1..N into the 'No.' column in source model according to current proxy order."""
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .perf import append_jsonl
+
+# Log paměťových reportů vedle settings.json (rotace jako perf_log.jsonl)
+MEMORY_LOG_FILE = "memory_log.jsonl"
+# Hloubka stacku ukládaná u každé alokace; reporty seskupují podle řádku
+# (1 rámec), víc rámců jen zpomalí snapshoty
+MEMORY_FRAMES = 1
+# Kolik míst alokace se u reportu uvádí
+MEMORY_TOP = 15
+# Kolik posledních reportů drží ``MemoryTracker.recent``
+MEMORY_RECENT = 20
+
+_REPO = str(Path(__file__).resolve().parents[1])
+# místa, která se do reportu nevypisují (režie tracemalloc, importu a sledování samotného)
+_IGNORED = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap", "<unknown>")
+
+# řádek zdroje → (bajty, bloky)
+Sites = Dict[str, Tuple[int, int]]
+
+# Počet právě měřených operací (mezi begin a end) – během nich patří globální
+# špička tracemalloc (reset_peak) MemoryTrackeru, viz operation_active()
+_open_operations = 0
+
+
+def operation_active() -> bool:
+    """True, pokud nějaký MemoryTracker právě měří operaci – ostatní (StageClock)
+    pak nesmí volat ``tracemalloc.reset_peak()``."""
+    return _open_operations > 0
+
+
+def memory_log_path(settings_path: Path) -> Path:
+    """Log leží v config adresáři aplikace vedle settings.json."""
+    return Path(settings_path).parent / MEMORY_LOG_FILE
+
+
+def _sites() -> Sites:
+    """Snapshot seskupený podle řádku zdroje. Seskupuje se hned a syrový
+    snapshot se zahodí – filter_traces/compare_to jsou na velké haldě pomalé
+    a držený snapshot by sám zkreslil měřený přírůstek."""
+    out: Sites = {}
+    for stat in tracemalloc.take_snapshot().statistics("lineno"):
+        frame = stat.traceback[0]
+        name = frame.filename
+        if name.startswith(_IGNORED):
+            continue
+        if name.startswith(_REPO):
+            name = name[len(_REPO):].lstrip("/\\")
+        key = f"{name}:{frame.lineno}"
+        size, count = out.get(key, (0, 0))
+        out[key] = (size + stat.size, count + stat.count)
+    return out
+
+
+def _top(after: Sites, before: Sites, n: int) -> List[dict]:
+    """Místa s největším přírůstkem (záporné = uvolněno) mezi dvěma snapshoty."""
+    rows = []
+    for site, (size, count) in after.items():
+        b_size, b_count = before.get(site, (0, 0))
+        if size != b_size:
+            rows.append({"site": site, "size_diff": size - b_size, "count_diff": count - b_count, "size": size})
+    for site, (b_size, b_count) in before.items():
+        if site not in after:
+            rows.append({"site": site, "size_diff": -b_size, "count_diff": -b_count, "size": 0})
+    rows.sort(key=lambda r: r["size_diff"], reverse=True)
+    return rows[:n]
+
+
+class MemoryTracker:
+    """Volitelné sledování paměti přes tracemalloc.
+
+    ``start()`` zapne tracemalloc a uloží výchozí snapshot. ``begin(op)`` /
+    ``end(op)`` ohraničí jednu operaci (rescan, export, refresh …): report
+    obsahuje přírůstek paměti operace, místa s největším přírůstkem, a také
+    růst od startu sledování (co se drží napříč operacemi – úniky, nekonečné
+    cache). ``gauges`` vrací velikosti známých struktur (cache, počty položek
+    modelu) pro stejný report. Mimo sledování jsou begin/end bez nákladů.
+    """
+
+    def __init__(self, log_path: Optional[Path] = None, top: int = MEMORY_TOP,
+                 gauges: Optional[Callable[[], Dict[str, int]]] = None) -> None:
+        self.log_path = Path(log_path) if log_path else None
+        self.top = top
+        self.gauges = gauges
+        self.recent: Deque[dict] = deque(maxlen=MEMORY_RECENT)
+        self._baseline: Optional[Sites] = None
+        self._baseline_traced = 0
+        self._before: Optional[Tuple[Sites, int]] = None
+        self._owns_tracing = False
+
+    @property
+    def active(self) -> bool:
+        return self._baseline is not None and tracemalloc.is_tracing()
+
+    def start(self, frames: int = MEMORY_FRAMES) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._owns_tracing = True
+        self._baseline = _sites()
+        self._baseline_traced = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> None:
+        global _open_operations
+        if self._before is not None:
+            _open_operations -= 1
+        self._baseline = self._before = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def begin(self, op: str) -> None:
+        global _open_operations
+        if self.active:
+            sites = _sites()
+            if self._before is None:
+                _open_operations += 1
+            self._before = (sites, tracemalloc.get_traced_memory()[0])
+            tracemalloc.reset_peak()
+
+    def end(self, op: str) -> Optional[dict]:
+        global _open_operations
+        before, self._before = self._before, None
+        if before is not None:
+            _open_operations -= 1
+        if not self.active or before is None:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        t0 = time.perf_counter()
+        after = _sites()
+        report = {
+            "op": op,
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "growth": current - before[1],
+            "since_start": current - self._baseline_traced,
+            "traced": current,
+            "peak": peak,
+            "top": _top(after, before[0], self.top),
+            "top_since_start": _top(after, self._baseline, self.top),
+            "gauges": {},
+        }
+        if self.gauges is not None:
+            try:
+                report["gauges"] = dict(self.gauges())
+            except Exception:
+                pass
+        report["snapshot_seconds"] = round(time.perf_counter() - t0, 3)
+        self.recent.append(report)
+        if self.log_path is not None:
+            try:
+                append_jsonl(self.log_path, dict(report, event="memory"))
+            except Exception:
+                pass
+        return report
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:+,.0f} KiB"
+
+
+def format_report(report: dict) -> str:
+    """Textový report jedné operace (dialog / konzole)."""
+    lines = [f"{report['op']} @ {report['at']}: growth {_kib(report['growth'])}, "
+             f"since tracking start {_kib(report['since_start'])}, traced {report['traced'] / 1048576:.1f} MiB "
+             f"(peak {report['peak'] / 1048576:.1f} MiB)"]
+    if report.get("gauges"):
+        lines.append("Sizes: " + "  ".join(f"{k}={v}" for k, v in report["gauges"].items()))
+    for title, key in (("Top allocation sites (this operation)", "top"),
+                       ("Top retained growth since tracking start", "top_since_start")):
+        lines += ["", f"{title}:"]
+        lines += [f"{_kib(s['size_diff']):>14} {s['count_diff']:+8d} blocks  {s['site']}" for s in report[key]]
+    return "\n".join(lines)
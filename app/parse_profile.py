@@ -0,0 +1,163 @@
+"""Per-file parse profile of the PDF scanner (slowest / largest files report).
+
+Spuštění (z kořene repa):
+    python -m app.parse_profile [PDF_ROOT] [--top N] [--memory] [--json]
+
+``PdfScanner`` records for every parsed file the wall time of each stage
+(``read`` file, AcroForm ``fields``, page ``text``, regex ``parse``, content
+``hash``), which backend delivered fields and text, and – when ``tracemalloc``
+is tracing (``--memory``) – the peak memory allocated in each stage.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Etapy parsingu jednoho PDF v pořadí, v jakém běží
+STAGES = ("read", "fields", "text", "parse", "hash")
+
+
+@dataclass
+class FileProfile:
+    path: str
+    size_bytes: int = 0
+    total: float = 0.0
+    # etapa → sekundy / špička alokací v bajtech (jen při tracemalloc)
+    stages: Dict[str, float] = field(default_factory=dict)
+    memory: Dict[str, int] = field(default_factory=dict)
+    # "fields" / "text" → backend, který vrátil výsledek (pypdf, PyPDF2, pdfminer, none)
+    backends: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "total": round(self.total, 6),
+            "stages": {k: round(v, 6) for k, v in self.stages.items()},
+            "memory": dict(self.memory),
+            "backends": dict(self.backends),
+            "error": self.error,
+        }
+
+
+class StageClock:
+    """Stopky etap jednoho souboru: ``lap(etapa)`` připíše čas od minulého
+    ``lap``; když běží tracemalloc, i špičku alokací v té etapě.
+
+    Špička etapy se měří přes ``tracemalloc.reset_peak()`` po každém ``lap``.
+    Když ale běží měřená operace ``MemoryTracker`` (memtrack.operation_active),
+    globální špička patří jí a nenuluje se: špička etapy je pak nárůst
+    globální špičky (pokud ji etapa překonala), jinak aspoň čistý přírůstek."""
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.memory: Dict[str, int] = {}
+        self.backends: Dict[str, str] = {}
+        self._trace = tracemalloc.is_tracing()
+        if self._trace:
+            from .memtrack import operation_active
+            self._shared = operation_active
+            if not operation_active():
+                tracemalloc.reset_peak()
+            self._base, self._peak = tracemalloc.get_traced_memory()
+        self._t0 = self._t = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._t)
+        self._t = now
+        if self._trace:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._shared():
+                used = peak - self._base if peak > self._peak else current - self._base
+            else:
+                used = peak - self._base
+                tracemalloc.reset_peak()
+                peak = current
+            self.memory[stage] = max(self.memory.get(stage, 0), used)
+            self._base, self._peak = current, peak
+
+    def profile(self, path: str, size_bytes: int = 0, error: Optional[str] = None) -> FileProfile:
+        return FileProfile(path=path, size_bytes=size_bytes, total=time.perf_counter() - self._t0,
+                           stages=dict(self.stages), memory=dict(self.memory),
+                           backends=dict(self.backends), error=error)
+
+
+def slowest(profiles: Iterable[FileProfile], n: int = 20) -> List[FileProfile]:
+    return sorted(profiles, key=lambda p: p.total, reverse=True)[:n]
+
+
+def largest(profiles: Iterable[FileProfile], n: int = 20) -> List[FileProfile]:
+    return sorted(profiles, key=lambda p: p.size_bytes, reverse=True)[:n]
+
+
+def _mib(n: int) -> str:
+    return f"{n / (1024 * 1024):.2f}"
+
+
+def format_report(profiles: List[FileProfile], top: int = 20) -> str:
+    """Textový report: součty etap, nejpomalejší a největší soubory s rozpadem."""
+    memory = any(p.memory for p in profiles)
+    lines = [f"Parsed files: {len(profiles)}  total parse time: {sum(p.total for p in profiles):.3f} s"]
+    totals = {s: sum(p.stages.get(s, 0.0) for p in profiles) for s in STAGES}
+    lines.append("Stage totals: " + "  ".join(f"{s}={totals[s]:.3f} s" for s in STAGES))
+    backends: Dict[str, int] = {}
+    for p in profiles:
+        key = f"fields:{p.backends.get('fields', '?')} text:{p.backends.get('text', '?')}"
+        backends[key] = backends.get(key, 0) + 1
+    lines.append("Backends: " + "  ".join(f"{k} ×{v}" for k, v in sorted(backends.items(), key=lambda kv: -kv[1])))
+
+    head = f"{'total s':>8} {'MiB':>7} " + " ".join(f"{s:>7}" for s in STAGES)
+    if memory:
+        head += f" {'peak MiB':>8}"
+    head += "  backends            file"
+
+    def _row(p: FileProfile) -> str:
+        row = f"{p.total:8.3f} {_mib(p.size_bytes):>7} " + " ".join(f"{p.stages.get(s, 0.0):7.3f}" for s in STAGES)
+        if memory:
+            row += f" {_mib(max(p.memory.values(), default=0)):>8}"
+        back = f"{p.backends.get('fields', '?')}/{p.backends.get('text', '?')}"
+        return row + f"  {back:<18}  {p.path}" + (f"  [{p.error}]" if p.error else "")
+
+    for title, rows in (("Slowest files", slowest(profiles, top)), ("Largest files", largest(profiles, top))):
+        lines += ["", f"{title}:", head] + [_row(p) for p in rows]
+    return "\n".join(lines)
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("pdf_root", nargs="?", default=str(Path(__file__).resolve().parents[1] / "PDF"))
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--memory", action="store_true", help="measure peak memory per stage (tracemalloc, slower)")
+    ap.add_argument("--json", action="store_true", help="print all profiles as JSON lines")
+    args = ap.parse_args(argv[1:])
+
+    from .pdf_scanner import PdfScanner
+    # import backendů předem – jinak by se připsal prvnímu souboru
+    for mod in ("pypdf", "PyPDF2", "pdfminer.high_level"):
+        try:
+            __import__(mod)
+        except Exception:
+            pass
+    if args.memory:
+        tracemalloc.start()
+    scanner = PdfScanner(Path(args.pdf_root))
+    scanner.scan()
+    profiles = list(scanner.file_profiles.values())
+    if args.json:
+        for p in profiles:
+            print(json.dumps(p.to_dict(), ensure_ascii=False))
+    else:
+        print(format_report(profiles, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Soubory nad touto velikostí se mapují do paměti (mmap) místo read() do bytes.
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+class PdfBlob:
+    """Bytes of one PDF, read from disk exactly once.
+
+    The same buffer is used for the SHA-256 content hash and handed to the PDF
+    backends (pypdf → PyPDF2 → pdfminer.six) as a seekable stream, so a scan
+    costs one read per file instead of one per backend call. Small files are
+    read into an immutable ``bytes`` object (``io.BytesIO`` shares it without
+    copying); large files are memory-mapped.
+
+    Use as a context manager so the mapping/handle is released::
+
+        with PdfBlob.open(path) as blob:
+            fields = read_pdf_form_fields(blob)
+            text = read_pdf_text(blob)
+            digest = blob.sha256()
+    """
+
+    def __init__(self, path: Path, data: Union[bytes, mmap.mmap], fh: Any = None) -> None:
+        self.path = Path(path)
+        self._data = data
+        self._fh = fh
+        self._sha256: Optional[str] = None
+        self._readers: dict = {}
+        # "fields" / "text" → backend, který vrátil výsledek (parse profile)
+        self.backends: dict = {}
+
+    @classmethod
+    def open(cls, path: Path) -> "PdfBlob":
+        p = Path(path)
+        fh = p.open("rb")
+        try:
+            size = p.stat().st_size
+            if size >= MMAP_THRESHOLD:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                return cls(p, mm, fh)
+            data = fh.read()
+        except Exception:
+            fh.close()
+            raise
+        fh.close()
+        return cls(p, data)
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    def sha256(self) -> str:
+        """Hex SHA-256 of the file content (computed once, from the shared buffer)."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(memoryview(self._data)).hexdigest()
+        return self._sha256
+
+    def stream(self):
+        """Fresh seekable stream over the buffer (no copy of the file content)."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.seek(0)
+            return self._data
+        return io.BytesIO(self._data)
+
+    def reader(self, backend: str = "pypdf"):
+        """PdfReader of the given backend built once per blob and shared by the
+        field and text extraction (PDF structure is parsed only once)."""
+        if backend not in self._readers:
+            if backend == "pypdf":
+                from pypdf import PdfReader
+            else:
+                from PyPDF2 import PdfReader
+            self._readers[backend] = PdfReader(self.stream(), strict=False)
+        return self._readers[backend]
+
+    def close(self) -> None:
+        self._readers.clear()
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except Exception:
+                pass
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+
+    def __enter__(self) -> "PdfBlob":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
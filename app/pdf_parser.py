@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Dict, Optional, Any
-from pypdf import PdfReader
+from typing import Dict, Optional, Any, Union
 import logging
 
+from .pdf_io import PdfBlob
+
 def _quiet_pdf_logs() -> None:
     try:
         logging.getLogger("pypdf").setLevel(logging.ERROR)
@@ -17,20 +18,28 @@ def _quiet_pdf_logs() -> None:
         pass
 
 # --- robustní extrakce textu (pypdf → PyPDF2 → pdfminer.six) ---
-def read_pdf_text(path: Path) -> str:
+def _pages_text(r) -> str:
+    chunks = []
+    for p in r.pages:
+        try:
+            chunks.append(p.extract_text() or "")
+        except Exception:
+            pass
+    return "\n".join(chunks)
+
+def read_pdf_text(path: Union[Path, PdfBlob]) -> str:
+    """Text všech stránek. Přijímá cestu nebo už načtený PdfBlob – pak se
+    soubor znovu nečte a pypdf/PyPDF2 reader se sdílí s čtením polí."""
     _quiet_pdf_logs()
+    blob = path if isinstance(path, PdfBlob) else None
     try:
         from pypdf import PdfReader
         try:
-            r = PdfReader(str(path), strict=False)
-            chunks = []
-            for p in r.pages:
-                try:
-                    chunks.append(p.extract_text() or "")
-                except Exception:
-                    pass
-            t = "\n".join(chunks)
+            r = blob.reader("pypdf") if blob else PdfReader(str(path), strict=False)
+            t = _pages_text(r)
             if t.strip():
+                if blob:
+                    blob.backends["text"] = "pypdf"
                 return t
         except Exception:
             pass
@@ -39,23 +48,21 @@ def read_pdf_text(path: Path) -> str:
     try:
         from PyPDF2 import PdfReader
         try:
-            r = PdfReader(str(path), strict=False)
-            chunks = []
-            for p in r.pages:
-                try:
-                    chunks.append(p.extract_text() or "")
-                except Exception:
-                    pass
-            t = "\n".join(chunks)
+            r = blob.reader("PyPDF2") if blob else PdfReader(str(path), strict=False)
+            t = _pages_text(r)
             if t.strip():
+                if blob:
+                    blob.backends["text"] = "PyPDF2"
                 return t
         except Exception:
             pass
     except Exception:
         pass
     from pdfminer.high_level import extract_text  # povinné dle README
+    if blob:
+        blob.backends["text"] = "pdfminer"
     try:
-        return extract_text(str(path)) or ""
+        return extract_text(blob.stream() if blob else str(path)) or ""
     except Exception:
         return ""
 
@@ -154,37 +161,45 @@ def guess_signature_date(fields: dict, text: str) -> str | None:
         if iso: return iso
     return None
 
-def read_pdf_form_fields(path: Path) -> Dict[str, Any]:
+def read_pdf_form_fields(path: Union[Path, PdfBlob]) -> Dict[str, Any]:
     """
     Return AcroForm fields using pypdf/PyPDF2 with strict=False (tolerant).
+    Accepts a path or a PdfBlob (reuses its buffer and reader, no extra read).
     On any error, returns {} without raising.
     """
     _quiet_pdf_logs()
+    blob = path if isinstance(path, PdfBlob) else None
     # Try pypdf
     try:
         try:
             from pypdf import PdfReader  # type: ignore
-            reader = PdfReader(str(path), strict=False)
+            reader = blob.reader("pypdf") if blob else PdfReader(str(path), strict=False)
             get_fields = getattr(reader, "get_fields", None)
             if callable(get_fields):
                 fields = get_fields() or {}
                 if isinstance(fields, dict):
+                    if blob:
+                        blob.backends["fields"] = "pypdf"
                     return fields
         except Exception:
             pass
         # Fallback to PyPDF2
         try:
             from PyPDF2 import PdfReader  # type: ignore
-            reader = PdfReader(str(path), strict=False)
+            reader = blob.reader("PyPDF2") if blob else PdfReader(str(path), strict=False)
             get_fields = getattr(reader, "get_fields", None)
             if callable(get_fields):
                 fields = get_fields() or {}
                 if isinstance(fields, dict):
+                    if blob:
+                        blob.backends["fields"] = "PyPDF2"
                     return fields
         except Exception:
             pass
     except Exception:
         pass
+    if blob:
+        blob.backends["fields"] = "none"
     return {}
 
 RE_KV = re.compile(r"^\s*(?P<k>[A-Za-z \-/()®]+):\s*(?P<v>.*)$")
@@ -1,12 +1,48 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+import sys
+import time
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from .cache import file_stat
+from .pdf_io import PdfBlob
+from .parse_profile import FileProfile, StageClock
 from .pdf_parser import read_pdf_text, read_pdf_form_fields, parse_istqb_academia_application, guess_signature_date
 from .istqb_boards import KNOWN_BOARDS
 
-@dataclass
+# Hodnoty s nízkou kardinalitou (board, "Yes"/"No", typ žádosti, ...) se
+# internují: 100k záznamů pak sdílí jeden string místo 100k kopií.
+_INTERNED_FIELDS: Tuple[str, ...] = (
+    "board",
+    "application_type",
+    "recognition_academia",
+    "recognition_certified",
+    "receiving_member_board",
+    "signature_date",
+    "date_received",
+    "validity_start_date",
+    "validity_end_date",
+)
+
+# Sdílené rodičovské adresáře – části cesty (Path parts) jsou pak společné
+# pro všechna PDF v jedné složce boardu. Vyprázdní se na začátku každého skenu
+# (záznamy předchozích skenů si své rodiče drží samy) a nad limitem.
+_SHARED_PARENTS: Dict[str, Path] = {}
+_SHARED_PARENTS_MAX = 4096
+
+
+def _shared_path(path: Path) -> Path:
+    parent_key = sys.intern(str(path.parent))
+    parent = _SHARED_PARENTS.get(parent_key)
+    if parent is None:
+        if len(_SHARED_PARENTS) >= _SHARED_PARENTS_MAX:
+            _SHARED_PARENTS.clear()
+        parent = _SHARED_PARENTS[parent_key] = Path(parent_key)
+    return parent / path.name
+
+
+@dataclass(slots=True)
 class PdfRecord:
     board: str
     path: Path
@@ -36,8 +72,25 @@ class PdfRecord:
     board_known: bool
     # True = PDF bez AcroForm i bez vytěžitelných hodnot (sken/prázdný formulář)
     needs_manual_entry: bool = False
+    # SHA-256 obsahu spočtený při skenu ze stejného bufferu jako parsing
+    content_hash: Optional[str] = None
+    # Cache pro as_row()/to_dict(); záznam se po parsingu nemění.
+    _row: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in _INTERNED_FIELDS:
+            v = getattr(self, name)
+            if v is not None:
+                setattr(self, name, sys.intern(v))
+        self.path = _shared_path(Path(self.path))
 
     def as_row(self) -> List[str]:
+        if self._row is None:
+            self._row = tuple(self._build_row())
+        return list(self._row)
+
+    def _build_row(self) -> List[str]:
         # POŘADÍ MUSÍ SEDĚT S Overview HLAVIČKAMI
         return [
             self.board or "",
@@ -68,18 +121,89 @@ class PdfRecord:
         ]
 
     def to_dict(self) -> Dict:
-        d = asdict(self)
-        d["path"] = str(self.path)
-        return d
+        # Vrací kopii – volající si dict běžně doplňují (board, file_name, ...).
+        if self._dict is None:
+            d = {name: getattr(self, name) for name in _RECORD_FIELDS}
+            d["path"] = str(self.path)
+            self._dict = d
+        return dict(self._dict)
+
+
+# Klíč (pole záznamu / "file_name") pro každý sloupec as_row() – stejné pořadí
+# jako _build_row(), tj. jako datové sloupce Overview.
+ROW_FIELDS: Tuple[str, ...] = (
+    "board", "application_type", "institution_name", "candidate_name",
+    "recognition_academia", "recognition_certified",
+    "contact_full_name", "contact_email", "contact_phone", "contact_postal_address",
+    "syllabi_integration_description", "courses_modules_list",
+    "proof_of_istqb_certifications", "university_links", "additional_information_documents",
+    "printed_name_title", "signature_date",
+    "receiving_member_board", "date_received", "validity_start_date", "validity_end_date",
+    "file_name",
+)
+
+# Datová pole záznamu (bez interních cache) v pořadí deklarace.
+_RECORD_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(PdfRecord) if not f.name.startswith("_"))
+
+
+# ---- Paralelní parsing (PdfScanner(root, workers=n)) ----
+# Procesy, ne vlákna: parsing je čistý Python a GIL by vlákna serializoval.
+# Start "spawn" – fork procesu s běžícími Qt vlákny není bezpečný.
+_WORKER: Optional["PdfScanner"] = None
+
+
+def _worker_init(cls: type, root: Optional[Path]) -> None:
+    global _WORKER
+    _WORKER = cls(root)
+
+
+def _worker_parse(path: Path):
+    # do rodiče jdou jen hodnoty polí (PdfRecord se tam postaví znovu →
+    # internování a sdílené cesty) a profil souboru
+    try:
+        rec = _WORKER._timed_parse(path)
+        values = tuple(getattr(rec, n) for n in _RECORD_FIELDS)
+    except Exception:
+        values = None
+    prof = _WORKER.file_profiles.pop(str(path), None)
+    _WORKER._reset_timings()
+    return values, prof
 
 
 class PdfScanner:
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, workers: int = 1) -> None:
         self.root = root
+        # počet procesů pro parsing (1 = v aktuálním vlákně, beze změny chování)
+        self.workers = max(1, int(workers or 1))
+        self._reset_timings()
 
-    def _parse_one(self, path: Path) -> PdfRecord:
-        fields = read_pdf_form_fields(path)
-        text = read_pdf_text(path)
+    def _parse_one(self, path: Path, clock: Optional[StageClock] = None) -> PdfRecord:
+        # Jediné čtení souboru: hash i všechny PDF backendy jedou z jednoho bufferu.
+        blob = PdfBlob.open(path)
+        if clock is not None:
+            clock.lap("read")
+        try:
+            rec = self._parse_blob(path, blob, clock)
+            if clock is not None:
+                clock.lap("hash")  # content_hash se počítá až při stavbě záznamu
+            return rec
+        finally:
+            if clock is not None:
+                clock.backends = dict(blob.backends)
+            blob.close()
+
+    def parse_file(self, path: Path) -> PdfRecord:
+        """Naparsuje jediný PDF bez průchodu kořenem (detail v PDF Browser /
+        Sorted PDFs). Chyby čtení/parsingu propadají volajícímu."""
+        return self._parse_one(Path(path))
+
+    def _parse_blob(self, path: Path, blob: PdfBlob, clock: Optional[StageClock] = None) -> PdfRecord:
+        fields = read_pdf_form_fields(blob)
+        if clock is not None:
+            clock.lap("fields")
+        text = read_pdf_text(blob)
+        if clock is not None:
+            clock.lap("text")
 
         def fval(*keys: str) -> str | None:
             if not fields:
@@ -177,10 +301,12 @@ class PdfScanner:
         )
 
         board = self._derive_board(path) if hasattr(self, "_derive_board") else (path.parent.name or "Unknown")
+        if clock is not None:
+            clock.lap("parse")
         return PdfRecord(
             board=board,
             path=path,
-            size_bytes=path.stat().st_size,
+            size_bytes=blob.size,
             application_type=app_type or None,
             institution_name=institution or None,
             candidate_name=candidate or None,
@@ -203,13 +329,13 @@ class PdfScanner:
             validity_end_date=(validity_end or None),
             board_known=board in KNOWN_BOARDS,
             needs_manual_entry=needs_manual_entry,
+            content_hash=blob.sha256(),
         )
 
-    def scan(self) -> List[PdfRecord]:
-        records: List[PdfRecord] = []
+    def iter_pdf_paths(self):
+        """PDF soubory pod kořenem (rekurzivně, bez složek ``__archive__``)."""
         if self.root is None or not self.root.exists():
-            return records
-
+            return
         for path in self.root.rglob("*"):
             try:
                 if not path.is_file():
@@ -221,10 +347,154 @@ class PdfScanner:
                     continue
             except Exception:
                 continue
+            yield path
+
+    @staticmethod
+    def file_stat(path: Path) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) – položka manifestu adresáře pro warm-start snapshot."""
+        return file_stat(path)
+
+    def _timed_parse(self, path: Path) -> PdfRecord:
+        # čas parsingu po souborech (i neúspěšných) → self.file_times,
+        # rozpad na etapy (read/fields/text/parse/hash) → self.file_profiles
+        clock = StageClock()
+        error = None
+        size = 0
+        try:
+            rec = self._parse_one(path, clock)
+            size = rec.size_bytes
+            return rec
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            prof = clock.profile(str(path), size, error)
+            self.file_profiles[prof.path] = prof
+            self.file_times[prof.path] = prof.total
+            self.timings["parse"] = self.timings.get("parse", 0.0) + prof.total
+
+    def _reset_timings(self) -> None:
+        # timings: fáze → sekundy ("walk" = procházení adresáře, "parse" = součet
+        # parsingu); file_times: cesta → sekundy parsingu jednoho souboru;
+        # file_profiles: cesta → FileProfile (etapy, backendy, paměť);
+        # counts: fáze → počet souborů (prošlé cesty / soubory k parsingu)
+        self.timings: Dict[str, float] = {"walk": 0.0, "parse": 0.0}
+        self.counts: Dict[str, int] = {"walk": 0, "parse": 0}
+        self.file_times: Dict[str, float] = {}
+        self.file_profiles: Dict[str, FileProfile] = {}
 
+    def _parse_many(self, paths: List[Path]) -> List[Tuple[Path, Optional[PdfRecord]]]:
+        """(cesta, záznam nebo None při chybě) ve stejném pořadí jako ``paths``;
+        s ``workers > 1`` parsuje pool procesů (``timings["parse"]`` je pak
+        čas na hodinách, ne součet časů souborů)."""
+        if self.workers > 1 and len(paths) > 1:
             try:
-                rec = self._parse_one(path)
-                records.append(rec)
+                return self._parse_in_pool(paths)
             except Exception:
+                self._reset_timings_parse()  # pool nejde spustit → sériově
+        out: List[Tuple[Path, Optional[PdfRecord]]] = []
+        for path in paths:
+            try:
+                out.append((path, self._timed_parse(path)))
+            except Exception:
+                out.append((path, None))
+        return out
+
+    def _parse_in_pool(self, paths: List[Path]) -> List[Tuple[Path, Optional[PdfRecord]]]:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(self.workers, len(paths))
+        chunk = max(1, min(64, len(paths) // (workers * 4)))
+        t0 = time.perf_counter()
+        out: List[Tuple[Path, Optional[PdfRecord]]] = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_worker_init, initargs=(type(self), self.root)) as ex:
+            for path, (values, prof) in zip(paths, ex.map(_worker_parse, paths, chunksize=chunk)):
+                if prof is not None:
+                    self.file_profiles[prof.path] = prof
+                    self.file_times[prof.path] = prof.total
+                out.append((path, PdfRecord(*values) if values is not None else None))
+        self.timings["parse"] = time.perf_counter() - t0
+        return out
+
+    def _reset_timings_parse(self) -> None:
+        self.timings["parse"] = 0.0
+        self.file_times.clear()
+        self.file_profiles.clear()
+
+    def scan(self) -> List[PdfRecord]:
+        """Naparsuje všechna PDF; ``self.stats`` pak drží (size, mtime_ns) každého
+        naparsovaného souboru zjištěné před čtením (manifest tohoto skenu),
+        ``self.timings`` / ``self.file_times`` časy fází a souborů."""
+        records: List[PdfRecord] = []
+        self.stats: Dict[str, Tuple[int, int]] = {}
+        self._reset_timings()
+        _SHARED_PARENTS.clear()
+        t0 = time.perf_counter()
+        paths = list(self.iter_pdf_paths())
+        self.timings["walk"] = time.perf_counter() - t0
+        self.counts["walk"] = self.counts["parse"] = len(paths)
+        sts = [self.file_stat(path) for path in paths]
+        for (path, rec), st in zip(self._parse_many(paths), sts):
+            if rec is None:
+                continue
+            records.append(rec)
+            if st is not None:
+                self.stats[str(rec.path)] = st
+        return records
+
+    def rescan_changed(self, previous: List[PdfRecord], previous_stats: Dict[str, Tuple[int, int]]):
+        """Sladí dřívější record set s diskem podle manifestu (size, mtime_ns).
+
+        Nezměněné soubory se nečtou; znovu se parsují jen nové a změněné.
+        Vrací ``(records, added, changed, removed)`` – records v pořadí:
+        původní (bez odebraných, změněné na svém místě), pak nové; ostatní
+        jsou seznamy cest (str). ``self.stats`` drží manifest výsledku.
+        """
+        current: Dict[str, Path] = {}
+        self.stats = {}
+        self._reset_timings()
+        _SHARED_PARENTS.clear()
+        t0 = time.perf_counter()
+        for path in self.iter_pdf_paths():
+            self.counts["walk"] += 1
+            st = self.file_stat(path)
+            if st is not None:
+                current[str(path)] = path
+                self.stats[str(path)] = st
+        self.timings["walk"] = time.perf_counter() - t0
+        records: List[PdfRecord] = []
+        added: List[str] = []
+        changed: List[str] = []
+        removed: List[str] = []
+        seen = {str(rec.path) for rec in previous}
+        # co se musí znovu parsovat: změněné (size/mtime) a nové – jednou dávkou
+        todo = [current[str(rec.path)] for rec in previous
+                if str(rec.path) in current and previous_stats.get(str(rec.path)) != self.stats[str(rec.path)]]
+        todo += [path for key, path in current.items() if key not in seen]
+        self.counts["parse"] = len(todo)
+        parsed = {str(path): rec for path, rec in self._parse_many(todo)}
+        for rec in previous:
+            key = str(rec.path)
+            if key not in current:
+                removed.append(key)
+                continue
+            if key not in parsed:
+                records.append(rec)
+                continue
+            if parsed[key] is not None:
+                records.append(parsed[key])
+                changed.append(key)
+            else:
+                removed.append(key)
+                self.stats.pop(key, None)
+        for key in current:
+            if key in seen:
                 continue
-        return records
\ No newline at end of file
+            if parsed.get(key) is not None:
+                records.append(parsed[key])
+                added.append(key)
+            else:
+                self.stats.pop(key, None)
+        return records, added, changed, removed
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Log měření vedle settings.json; rotuje se po PERF_LOG_MAX_BYTES,
+# drží se PERF_LOG_BACKUPS starších souborů (perf_log.jsonl.1, .2, …).
+PERF_LOG_FILE = "perf_log.jsonl"
+PERF_LOG_MAX_BYTES = 1024 * 1024
+PERF_LOG_BACKUPS = 3
+# Kolik nejpomalejších souborů běhu se zapíše do logu (v paměti jsou všechny)
+PERF_LOG_FILES = 20
+# Kolik posledních běhů drží dialog Performance
+PERF_RECENT_RUNS = 20
+
+
+class PerfRun:
+    """Jedno měřené volání (rescan, refresh …): fáze v pořadí, v jakém běžely,
+    a časy jednotlivých souborů (cesta → sekundy)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.total = 0.0
+        # (fáze, sekundy, počet položek nebo None)
+        self.phases: List[Tuple[str, float, Optional[int]]] = []
+        self.files: Dict[str, float] = {}
+        # paměťový report (app.memtrack), jen když běží sledování paměti
+        self.memory: Optional[dict] = None
+        # cache → přírůstky počítadel během běhu (hits, misses, stale, evictions) + velikost
+        self.caches: Dict[str, Dict[str, int]] = {}
+        self._t0 = time.perf_counter()
+
+    def add_phase(self, name: str, seconds: float, count: Optional[int] = None) -> None:
+        # opakovaná fáze (např. několik volání téže funkce) se sčítá do jedné
+        for i, (n, s, c) in enumerate(self.phases):
+            if n == name:
+                if count is not None:
+                    c = (c or 0) + count
+                self.phases[i] = (n, s + seconds, c)
+                return
+        self.phases.append((name, seconds, count))
+
+    def slowest_files(self, n: int = PERF_LOG_FILES) -> List[Tuple[str, float]]:
+        return sorted(self.files.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+    def summary(self) -> str:
+        """Krátký text do status baru: celkový čas + fáze od nejdražší."""
+        parts = []
+        for name, sec, count in sorted(self.phases, key=lambda p: p[1], reverse=True)[:4]:
+            parts.append(f"{name} {sec:.2f} s" + (f" ({count})" if count is not None else ""))
+        if self.memory is not None:
+            parts.append(f"memory {self.memory.get('growth', 0) / 1048576:+.1f} MiB")
+        return f"{self.name}: {self.total:.2f} s" + (" • " + " • ".join(parts) if parts else "")
+
+    def to_dict(self) -> dict:
+        out = {
+            "run": self.name,
+            "started_at": self.started_at,
+            "total": round(self.total, 6),
+            "phases": [{"phase": n, "seconds": round(s, 6), "count": c} for n, s, c in self.phases],
+            "files": len(self.files),
+            "slowest_files": [{"path": p, "seconds": round(s, 6)} for p, s in self.slowest_files()],
+        }
+        if self.caches:
+            out["caches"] = self.caches
+        if self.memory is not None:
+            out["memory"] = {"growth": self.memory.get("growth"), "since_start": self.memory.get("since_start")}
+        return out
+
+
+class PerfRecorder:
+    """Lehká instrumentace pomalých cest GUI.
+
+    ``run(name)`` ohraničí jedno měřené volání; vnořené ``run`` (např. rescan
+    volaný z dokončení skenu na pozadí) se připojí k vnějšímu běhu. ``phase``
+    mimo běh nic neměří, takže se dá volat odkudkoli. Po skončení běhu se
+    záznam přidá do ``recent``, připíše do JSONL logu a předá ``on_finish``.
+    Je-li nastaven ``memory`` (``app.memtrack.MemoryTracker``), vnější běh
+    navíc ohraničí snapshoty paměti (mimo měřený čas). Cache registrované
+    přes ``register_cache`` (``app.cache.FileCache``) se do běhu zapíší
+    přírůstkem zásahů/minutí.
+    """
+
+    def __init__(self, log_path: Optional[Path] = None,
+                 on_finish: Optional[Callable[[PerfRun], None]] = None) -> None:
+        self.log_path = Path(log_path) if log_path else None
+        self.on_finish = on_finish
+        self.recent: Deque[PerfRun] = deque(maxlen=PERF_RECENT_RUNS)
+        self.current: Optional[PerfRun] = None
+        self.memory = None
+        self._caches: Dict[str, object] = {}
+        self._cache_start: Dict[str, Dict[str, int]] = {}
+        self._depth = 0
+
+    def register_cache(self, name: str, cache) -> None:
+        """Cache s ``counters()`` → dict (hits, misses …), sledovaná v každém běhu."""
+        self._caches[name] = cache
+
+    @contextmanager
+    def run(self, name: str, started: Optional[float] = None) -> Iterator[PerfRun]:
+        """``started`` = ``time.perf_counter()`` skutečného začátku práce
+        (např. spuštění skenu na pozadí), jinak teď."""
+        if self.current is None:
+            if self.memory is not None:
+                self.memory.begin(name)
+            self.current = PerfRun(name)
+            if started is not None:
+                self.current._t0 = started
+            self._cache_start = {n: dict(c.counters()) for n, c in self._caches.items()}
+        self._depth += 1
+        try:
+            yield self.current
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                run, self.current = self.current, None
+                run.total = time.perf_counter() - run._t0
+                run.caches = self._cache_deltas()
+                if self.memory is not None:
+                    try:
+                        run.memory = self.memory.end(name)
+                    except Exception:
+                        pass
+                self._finish(run)
+
+    def _cache_deltas(self) -> Dict[str, Dict[str, int]]:
+        out = {}
+        for name, cache in self._caches.items():
+            try:
+                now = cache.counters()
+            except Exception:
+                continue
+            start = self._cache_start.get(name, {})
+            delta = {k: now[k] - start.get(k, 0) for k in ("hits", "misses", "stale", "evictions") if k in now}
+            delta["size"] = now.get("size", 0)
+            out[name] = delta
+        return out
+
+    @contextmanager
+    def phase(self, name: str, count: Optional[int] = None) -> Iterator[None]:
+        run = self.current
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            if run is not None:
+                run.add_phase(name, time.perf_counter() - t0, count)
+
+    def add_phase(self, name: str, seconds: float, count: Optional[int] = None) -> None:
+        """Fáze změřená jinde (např. sken v pracovním vlákně)."""
+        if self.current is not None:
+            self.current.add_phase(name, seconds, count)
+
+    def add_files(self, times: Dict[str, float]) -> None:
+        if self.current is not None and times:
+            self.current.files.update(times)
+
+    def _finish(self, run: PerfRun) -> None:
+        self.recent.append(run)
+        try:
+            self._append_log(run.to_dict())
+        except Exception:
+            pass
+        if self.on_finish is not None:
+            try:
+                self.on_finish(run)
+            except Exception:
+                pass
+
+    def _append_log(self, entry: dict) -> None:
+        if self.log_path is not None:
+            append_jsonl(self.log_path, entry)
+
+
+def append_jsonl(path: Path, entry: dict, max_bytes: int = PERF_LOG_MAX_BYTES,
+                 backups: int = PERF_LOG_BACKUPS) -> None:
+    """Připíše jeden JSON řádek; soubor nad ``max_bytes`` se nejdřív odrotuje
+    (``path.1`` … ``path.<backups>``, nejstarší se zahodí)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if path.stat().st_size >= max_bytes:
+            base = str(path)
+            for i in range(backups - 1, 0, -1):
+                if os.path.exists(f"{base}.{i}"):
+                    os.replace(f"{base}.{i}", f"{base}.{i + 1}")
+            os.replace(base, f"{base}.1")
+    except OSError:
+        pass
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def perf_log_path(settings_path: Path) -> Path:
+    """Log leží v config adresáři aplikace vedle settings.json."""
+    return Path(settings_path).parent / PERF_LOG_FILE
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .pdf_scanner import PdfRecord, _RECORD_FIELDS
+
+# Sloupce s čísly/příznaky drží kompaktní array místo listu Python objektů.
+_INT_COLUMNS = {"size_bytes": "q"}
+_BOOL_COLUMNS = ("board_known", "needs_manual_entry")
+# Pole textu pro fulltext – stejná jako PdfRecord.as_row() (sloupce Overview)
+_SEARCH_FIELDS = (
+    "board", "application_type", "institution_name", "candidate_name",
+    "recognition_academia", "recognition_certified", "contact_full_name",
+    "contact_email", "contact_phone", "contact_postal_address",
+    "syllabi_integration_description", "courses_modules_list",
+    "proof_of_istqb_certifications", "university_links",
+    "additional_information_documents", "printed_name_title", "signature_date",
+    "receiving_member_board", "date_received", "validity_start_date",
+    "validity_end_date", "file_name",
+)
+
+
+class RecordStore:
+    """Columnar in-memory store of the scanned record set, shared by all tabs.
+
+    One column per PdfRecord field (plus a derived ``file_name``), records are
+    addressed by integer IDs (0..N-1, the order of the scan, which is also the
+    row order of the Overview source model). Dict indexes path → ID,
+    file name → IDs and content hash → IDs replace the linear
+    ``next(... for rec in self.records ...)`` scans; the name and hash indexes
+    return *all* matching IDs, so duplicate file names across boards stay
+    distinguishable.
+
+    Manual edits from the Sorted DB are kept as a per-ID overlay, so
+    ``value()``/``row_dict()`` return the *effective* data the Overview shows
+    without reading it back out of QStandardItems.
+    """
+
+    FIELDS: Sequence[str] = tuple(_RECORD_FIELDS) + ("file_name",)
+
+    def __init__(self) -> None:
+        self.records: List[PdfRecord] = []
+        self.columns: Dict[str, Any] = {name: self._empty_column(name) for name in self.FIELDS}
+        self._path_to_id: Dict[str, int] = {}
+        self._resolved_to_id: Optional[Dict[str, int]] = None
+        self._name_to_ids: Dict[str, List[int]] = {}
+        self._hash_to_ids: Dict[str, List[int]] = {}
+        self._overlay: Dict[int, Dict[str, Any]] = {}
+        self._haystack: Dict[int, str] = {}
+
+    @staticmethod
+    def _empty_column(name: str):
+        if name in _INT_COLUMNS:
+            return array(_INT_COLUMNS[name])
+        if name in _BOOL_COLUMNS:
+            return array("b")
+        return []
+
+    @classmethod
+    def from_records(cls, records: Iterable[PdfRecord]) -> "RecordStore":
+        store = cls()
+        for rec in records:
+            store.append(rec)
+        return store
+
+    def append(self, rec: PdfRecord) -> int:
+        rid = len(self.records)
+        self.records.append(rec)
+        for name in _RECORD_FIELDS:
+            v = getattr(rec, name)
+            if name == "path":
+                v = str(v)
+            self.columns[name].append(v)
+        self.columns["file_name"].append(rec.path.name)
+        self._path_to_id[str(rec.path)] = rid
+        self._resolved_to_id = None
+        self._name_to_ids.setdefault(rec.path.name.lower(), []).append(rid)
+        if rec.content_hash:
+            self._hash_to_ids.setdefault(rec.content_hash, []).append(rid)
+        return rid
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ---- lookups ----
+    def id_for_path(self, path) -> Optional[int]:
+        if path is None:
+            return None
+        rid = self._path_to_id.get(str(path))
+        if rid is not None:
+            return rid
+        # fallback: symlinky / relativní cesty – index resolvovaných cest (líně)
+        try:
+            if self._resolved_to_id is None:
+                self._resolved_to_id = {str(Path(p).resolve()): i for p, i in self._path_to_id.items()}
+            return self._resolved_to_id.get(str(Path(path).resolve()))
+        except Exception:
+            return None
+
+    def ids_for_name(self, file_name: str) -> List[int]:
+        """IDs of records with this file name (case-insensitive); may be several."""
+        return list(self._name_to_ids.get((file_name or "").strip().lower(), ()))
+
+    def ids_for_hash(self, digest: str) -> List[int]:
+        """IDs of records whose content SHA-256 equals ``digest``."""
+        return list(self._hash_to_ids.get(digest or "", ()))
+
+    def record(self, rid: Optional[int]) -> Optional[PdfRecord]:
+        if rid is None or not (0 <= rid < len(self.records)):
+            return None
+        return self.records[rid]
+
+    def column(self, name: str):
+        return self.columns[name]
+
+    # ---- manual edits overlay ----
+    def set_overlay(self, rid: int, data: Optional[Dict[str, Any]]) -> None:
+        """Effective values for record ``rid`` (non-empty values override parsed ones)."""
+        clean = {k: v for k, v in (data or {}).items() if k in self.columns and v not in (None, "")}
+        if clean:
+            self._overlay[rid] = clean
+        else:
+            self._overlay.pop(rid, None)
+        self._haystack.pop(rid, None)
+
+    def clear_overlay(self) -> None:
+        self._overlay.clear()
+        self._haystack.clear()
+
+    def is_overridden(self, rid: int) -> bool:
+        return rid in self._overlay
+
+    def value(self, rid: int, name: str, effective: bool = True) -> Any:
+        if effective:
+            ov = self._overlay.get(rid)
+            if ov and name in ov:
+                return ov[name]
+        return self.columns[name][rid]
+
+    def effective_column(self, name: str) -> List[Any]:
+        col = list(self.columns[name])
+        for rid, ov in self._overlay.items():
+            if name in ov:
+                col[rid] = ov[name]
+        return col
+
+    def row_dict(self, rid: int, effective: bool = True) -> Dict[str, Any]:
+        d = self.records[rid].to_dict()
+        if effective:
+            d.update(self._overlay.get(rid, {}))
+        d["file_name"] = self.columns["file_name"][rid]
+        return d
+
+    def iter_dicts(self, ids: Optional[Iterable[int]] = None, keys: Optional[Sequence[str]] = None,
+                   effective: bool = True) -> Iterator[Dict[str, Any]]:
+        keys = tuple(keys) if keys else self.FIELDS
+        for rid in (range(len(self.records)) if ids is None else ids):
+            yield {k: self.value(rid, k, effective) for k in keys}
+
+    def iter_rows(self, keys: Sequence[str], ids: Optional[Iterable[int]] = None,
+                  effective: bool = False) -> Iterator[List[str]]:
+        """Rows of display strings for export (columns in ``keys`` order)."""
+        cols = [self.effective_column(k) if effective else self.columns[k] for k in keys]
+        for rid in (range(len(self.records)) if ids is None else ids):
+            yield ["" if c[rid] is None else str(c[rid]) for c in cols]
+
+    # ---- aggregations / filters ----
+    def count_by(self, name: str, ids: Optional[Iterable[int]] = None) -> Counter:
+        col = self.columns[name]
+        if ids is None:
+            return Counter(col)
+        return Counter(col[i] for i in ids)
+
+    def ids_where_in(self, name: str, values: Iterable[Any], ids: Optional[Iterable[int]] = None) -> List[int]:
+        wanted = set(values)
+        col = self.columns[name]
+        rng = range(len(col)) if ids is None else ids
+        return [i for i in rng if col[i] in wanted]
+
+    def search_text(self, rid: int) -> str:
+        """Lower-cased text of all effective values of a record (fulltext filter)."""
+        hay = self._haystack.get(rid)
+        if hay is None:
+            if rid in self._overlay:
+                # overlay NAHRAZUJE parsované hodnoty – přepsaná hodnota se už nenajde
+                rec_row = ["" if v is None else str(v) for v in (self.value(rid, k) for k in _SEARCH_FIELDS)]
+            else:
+                rec_row = self.records[rid].as_row()
+            hay = self._haystack[rid] = "\x1f".join(rec_row).lower()
+        return hay
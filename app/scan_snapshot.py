@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import marshal
+import os
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .pdf_scanner import PdfRecord, _RECORD_FIELDS
+
+# Binární snapshot: hlavička + zlib(marshal(doc)); marshal zvládá jen
+# základní typy (tuple/str/int/bool/None), je rychlý a nespouští kód.
+SNAPSHOT_FILE = "scan_snapshot.bin"
+_MAGIC = b"IAPS"
+SNAPSHOT_VERSION = 2
+# JSON snapshot z 0.16m – při zápisu nového se smaže
+_LEGACY_FILE = "scan_snapshot.json"
+
+
+@dataclass
+class ScanSnapshot:
+    """Poslední record set Overview + co je potřeba k okamžitému vykreslení.
+
+    ``stats`` = manifest adresáře (cesta → (size, mtime_ns)) z doby skenu,
+    podle něj se při startu na pozadí zjistí, co se na disku změnilo.
+    ``sorted_marks`` / ``statuses`` jsou hodnoty sloupců Sorted a Status
+    (po řádcích ``records``), aby první vykreslení nemuselo sahat do Sorted DB.
+    """
+
+    root: str
+    records: List[PdfRecord]
+    stats: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    sorted_marks: List[str] = field(default_factory=list)
+    statuses: List[str] = field(default_factory=list)
+
+
+def snapshot_path(settings_path: Path) -> Path:
+    """Snapshot leží v config adresáři aplikace vedle settings.json."""
+    return Path(settings_path).parent / SNAPSHOT_FILE
+
+
+def save_snapshot(path: Path, snap: ScanSnapshot) -> None:
+    """Zapíše snapshot (atomicky přes dočasný soubor)."""
+    doc = (
+        snap.root,
+        _RECORD_FIELDS,
+        tuple(tuple(str(r.path) if n == "path" else getattr(r, n) for n in _RECORD_FIELDS)
+              for r in snap.records),
+        tuple(snap.stats.get(str(r.path), (-1, -1)) for r in snap.records),
+        tuple(snap.sorted_marks),
+        tuple(snap.statuses),
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC + bytes([SNAPSHOT_VERSION]))
+        f.write(zlib.compress(marshal.dumps(doc), 1))
+    os.replace(tmp, path)
+    try:
+        (path.parent / _LEGACY_FILE).unlink()
+    except OSError:
+        pass
+
+
+def load_snapshot(path: Path, root: Path) -> Optional[ScanSnapshot]:
+    """Snapshot posledního skenu stejného kořene, nebo None (chybí / jiný kořen / vadný)."""
+    try:
+        raw = Path(path).read_bytes()
+        if raw[:4] != _MAGIC or raw[4] != SNAPSHOT_VERSION:
+            return None
+        snap_root, names, rows, stats, marks, statuses = marshal.loads(zlib.decompress(raw[5:]))
+        if snap_root != str(root) or tuple(names) != tuple(_RECORD_FIELDS):
+            return None
+        records = [PdfRecord(*row) for row in rows]
+        return ScanSnapshot(
+            root=snap_root,
+            records=records,
+            stats={str(r.path): tuple(st) for r, st in zip(records, stats) if st[0] >= 0},
+            sorted_marks=list(marks) if len(marks) == len(records) else [],
+            statuses=list(statuses) if len(statuses) == len(records) else [],
+        )
+    except Exception:
+        return None
@@ -10,6 +10,12 @@ from PySide6.QtCore import QStandardPaths
 _DEFAULTS: Dict[str, Any] = {
     "pdf_root": None,
     "sorted_root": None,
+    "sorted_db_backend": "json",   # "json" | "journal" | "sqlite" (Sorted PDFs DB)
+    "sorted_copy_mode": "copy",    # "copy" | "reflink" | "link" (export do Sorted PDFs)
+    "export_last_manifest": None,  # manifest posledního exportu Overview (delta export)
+    "scan_workers": 1,             # procesy pro parsing PDF při skenu (1 = bez poolu)
+    "stall_threshold_ms": 750,     # watchdog GUI: zaseknutí delší než limit se loguje (0 = vypnuto)
+    "memory_tracking": False,      # tracemalloc snapshoty kolem rescanu/exportu/refresh → memory_log.jsonl
     "window_geometry": None,   # base64 string of QMainWindow.saveGeometry()
     "active_tab": 0,
     "filters": {
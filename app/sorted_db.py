@@ -1,10 +1,81 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Set
+
+
+def _json_default(o):
+    """json.dumps ``default=`` pro hodnoty, které JSON neumí (Path, dataclass, set)."""
+    # Nejčastější případ: pathlib.Path
+    if isinstance(o, Path):
+        return str(o)
+    # Případné dataclass zůstanou čitelné v JSON
+    if is_dataclass(o):
+        return asdict(o)
+    # Konzervativní doplněk: set -> list (pro jistotu)
+    if isinstance(o, set):
+        return list(o)
+    # Poslední záchrana: převod na str (minimal-change)
+    return str(o)
+
+
+def _rec_board(key: str, rec: Dict[str, Any]) -> str:
+    """Board záznamu: metadata → data → nadřazená složka klíče (jako strom Sorted PDFs)."""
+    return rec.get("board") or (rec.get("data") or {}).get("board") or PurePosixPath(key).parent.name
+
+
+def _rec_file_name(key: str, rec: Dict[str, Any]) -> str:
+    return rec.get("file_name") or (rec.get("data") or {}).get("file_name") or PurePosixPath(key).name
+
+
+class _SortedIndex:
+    """Sekundární indexy nad záznamy SortedDb: board, hash obsahu, název souboru, edited.
+
+    Pro každý klíč si pamatuje indexované hodnoty, takže ``remove()`` funguje
+    i když se záznam mezitím změnil na místě.
+    """
+
+    def __init__(self) -> None:
+        self.by_board: Dict[str, Set[str]] = {}
+        self.by_hash: Dict[str, Set[str]] = {}
+        self.by_name: Dict[str, Set[str]] = {}
+        self.edited: Set[str] = set()
+        self.no_hash: Set[str] = set()
+        self._entries: Dict[str, tuple] = {}
+
+    def add(self, key: str, rec: Dict[str, Any]) -> None:
+        self.remove(key)
+        board = _rec_board(key, rec)
+        name = _rec_file_name(key, rec).lower()
+        digest = rec.get("content_hash") or ""
+        self.by_board.setdefault(board, set()).add(key)
+        self.by_name.setdefault(name, set()).add(key)
+        if digest:
+            self.by_hash.setdefault(digest, set()).add(key)
+        else:
+            self.no_hash.add(key)
+        if rec.get("edited"):
+            self.edited.add(key)
+        self._entries[key] = (board, name, digest)
+
+    def remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for idx, value in zip((self.by_board, self.by_name, self.by_hash), entry):
+            keys = idx.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del idx[value]
+        self.edited.discard(key)
+        self.no_hash.discard(key)
 
 
 class SortedDb:
@@ -18,6 +89,7 @@ class SortedDb:
         "<rel_path_from_sorted_root>": {
           "board": "CaSQB",
           "file_name": "XYZ.pdf",
+          "content_hash": "<sha256 souboru>",   # volitelné (od 0.16g)
           "edited": false,
           "created": "ISO8601",
           "updated": "ISO8601",
@@ -26,12 +98,22 @@ class SortedDb:
         ...
       }
     }
+
+    Nad záznamy se (líně) drží sekundární indexy podle boardu, hashe obsahu,
+    názvu souboru a příznaku edited – viz ``keys_for_*()``.
     """
 
     def __init__(self, sorted_root: Path, db_name: str = "sorted_db.json") -> None:
         self.sorted_root = Path(sorted_root)
         self.db_path = self.sorted_root / db_name
         self.doc: Dict[str, Any] = {"version": "1.0", "updated": None, "records": {}}
+        # Generace obsahu: zvýší se při každé změně v procesu i při reloadu z disku.
+        # Volající (strom Sorted PDFs) podle ní poznají, že se DB nezměnila.
+        self.generation = 0
+        # Podpis souboru (mtime_ns, size) po posledním load()/save() – změnu
+        # jiným procesem pozná reload_if_changed() bez čtení souboru.
+        self._disk_sig: Any = None
+        self._index: Optional[_SortedIndex] = None
 
     def load(self) -> None:
         try:
@@ -43,6 +125,28 @@ class SortedDb:
             # poškozený soubor -> založ nový (bezpečný fallback)
             self.doc = {"version": "1.0", "updated": None, "records": {}}
             self._touch()
+        self.generation += 1
+        self._index = None
+        self._disk_sig = self._disk_signature()
+
+    @staticmethod
+    def _file_sig(path: Path):
+        try:
+            st = path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _disk_signature(self):
+        return self._file_sig(self.db_path)
+
+    def reload_if_changed(self) -> bool:
+        """Znovu načte DB jen pokud ji od posledního load()/save() změnil někdo jiný.
+        Vrací True, pokud proběhl reload."""
+        if self._disk_signature() == self._disk_sig:
+            return False
+        self.load()
+        return True
 
     def save(self) -> None:
         """
@@ -50,28 +154,13 @@ class SortedDb:
         nativní Python objekty, které JSON neumí (např. Path).
         Minimal-change: pouze serializace při zápisu, struktura self.doc se jinak nemění.
         """
-        from pathlib import Path as _Path
-        from dataclasses import is_dataclass as _is_dc, asdict as _asdict
-    
-        def _default(o):
-            # Nejčastější případ: pathlib.Path
-            if isinstance(o, _Path):
-                return str(o)
-            # Případné dataclass zůstanou čitelné v JSON
-            if _is_dc(o):
-                return _asdict(o)
-            # Konzervativní doplněk: set -> list (pro jistotu)
-            if isinstance(o, set):
-                return list(o)
-            # Poslední záchrana: převod na str (minimal-change)
-            return str(o)
-    
         self.doc["updated"] = datetime.utcnow().isoformat()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path.write_text(
-            json.dumps(self.doc, ensure_ascii=False, indent=2, default=_default),
+            json.dumps(self.doc, ensure_ascii=False, indent=2, default=_json_default),
             encoding="utf-8",
         )
+        self._disk_sig = self._disk_signature()
 
     def _touch(self) -> None:
         self.save()
@@ -85,16 +174,23 @@ class SortedDb:
         key = self.key_for(abs_path)
         return self.doc.get("records", {}).get(key)
 
-    def upsert_parsed(self, abs_path: Path, board: str, file_name: str, data: Dict[str, Any]) -> None:
+    def get_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Záznam podle relativního klíče (bez resolve() cesty)."""
+        return self.doc.get("records", {}).get(key)
+
+    def upsert_parsed(self, abs_path: Path, board: str, file_name: str, data: Dict[str, Any],
+                      content_hash: Optional[str] = None) -> None:
         """
         Vloží/aktualizuje záznam z parsingu.
         Pokud záznam existuje a 'edited' == True, data NEPŘEPISUJE (zůstává editovaný stav).
         Jinak data aktualizuje a nastaví edited=False.
+        ``content_hash`` (SHA-256 souboru, je-li znám) se uloží do metadat záznamu.
         """
         key = self.key_for(abs_path)
         now = datetime.utcnow().isoformat()
         recs: Dict[str, Any] = self.doc.setdefault("records", {})
         existing = recs.get(key)
+        self.generation += 1
         if existing and existing.get("edited"):
             # respektuj ruční editaci – pouze dotkni metadata
             existing["updated"] = now
@@ -102,16 +198,21 @@ class SortedDb:
                 existing["board"] = board
             if file_name:
                 existing["file_name"] = file_name
+            if content_hash:
+                existing["content_hash"] = content_hash
+            self._reindex(key)
             return
 
         recs[key] = {
             "board": board,
             "file_name": file_name,
+            "content_hash": content_hash,
             "edited": False,
             "created": existing.get("created") if existing else now,
             "updated": now,
             "data": data,
         }
+        self._reindex(key)
 
     def mark_edited(self, abs_path: Path, new_data: Dict[str, Any]) -> None:
         """Uloží ruční úpravu dat a nastaví edited=True."""
@@ -119,10 +220,666 @@ class SortedDb:
         now = datetime.utcnow().isoformat()
         recs: Dict[str, Any] = self.doc.setdefault("records", {})
         rec = recs.setdefault(key, {"created": now})
+        self.generation += 1
         rec["updated"] = now
         rec["edited"] = True
         rec["data"] = new_data
+        self._reindex(key)
+
+    def set_content_hash(self, abs_path: Path, digest: str) -> None:
+        """Doplní SHA-256 souboru do metadat existujícího záznamu (obsah se nemění)."""
+        key = self.key_for(abs_path)
+        rec = self.doc.get("records", {}).get(key)
+        if rec is not None and digest:
+            rec["content_hash"] = digest
+            self._reindex(key)
 
     def iter_items(self):
         for key, rec in self.doc.get("records", {}).items():
-            yield key, rec
\ No newline at end of file
+            yield key, rec
+
+    @contextmanager
+    def batch(self):
+        """Dávka změn uložená najednou: ``with db.batch(): db.upsert_parsed(...)``.
+        JSON/žurnál: jeden ``save()`` na konci; SQLite: jedna transakce."""
+        yield self
+        self.save()
+
+    # ---- sekundární indexy ----
+    def _indexes(self) -> _SortedIndex:
+        if self._index is None:
+            idx = _SortedIndex()
+            for key, rec in self.doc.get("records", {}).items():
+                if isinstance(rec, dict):
+                    idx.add(key, rec)
+            self._index = idx
+        return self._index
+
+    def _reindex(self, key: str) -> None:
+        # index se udržuje průběžně jen pokud už byl postaven (jinak vznikne líně)
+        if self._index is not None:
+            rec = self.doc.get("records", {}).get(key)
+            if isinstance(rec, dict):
+                self._index.add(key, rec)
+            else:
+                self._index.remove(key)
+
+    def boards(self) -> List[str]:
+        return sorted(self._indexes().by_board)
+
+    def keys_for_board(self, board: str) -> List[str]:
+        return sorted(self._indexes().by_board.get(board, ()))
+
+    def keys_for_hash(self, digest: str) -> List[str]:
+        return sorted(self._indexes().by_hash.get(digest or "", ()))
+
+    def keys_for_name(self, file_name: str) -> List[str]:
+        """Klíče záznamů s daným názvem souboru (case-insensitive)."""
+        return sorted(self._indexes().by_name.get((file_name or "").lower(), ()))
+
+    def edited_keys(self) -> List[str]:
+        return sorted(self._indexes().edited)
+
+    def keys_without_hash(self) -> List[str]:
+        """Záznamy bez uloženého hashe (starší DB) – pro jednorázové doplnění."""
+        return sorted(self._indexes().no_hash)
+
+    def hash_index(self) -> Dict[str, List[str]]:
+        """Hash obsahu → klíče záznamů (kopie indexu)."""
+        return {d: sorted(keys) for d, keys in self._indexes().by_hash.items()}
+
+    def file_names(self) -> Set[str]:
+        """Názvy souborů všech záznamů."""
+        return {_rec_file_name(k, r) for k, r in self.iter_items() if isinstance(r, dict)}
+
+
+class SqliteSortedDb(SortedDb):
+    """
+    SQLite varianta SortedDb (stejné API: get / upsert_parsed / mark_edited /
+    iter_items / key_for). Jeden řádek tabulky ``records`` = jeden záznam,
+    ``data`` je JSON text.
+
+    - WAL journal; každý upsert/mark_edited je vlastní transakce (commit hned),
+      ``save()`` je proto no-op a editace stojí zápis jednoho řádku.
+    - ``load()`` jen otevře spojení – nic se nenačítá do paměti, záznamy se čtou
+      až v ``get()`` / ``iter_items()``.
+    - ``sorted_db.json`` je společný formát všech backendů: při prvním otevření
+      se převezme, ``close()`` do něj změny zapíše zpět (a zahodí žurnál)
+      a pokud ho mezitím změnil jiný backend, převezme se při ``load()`` znovu.
+    - Sekundární indexy (board, hash, název souboru, edited) jsou SQL indexy.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS records (
+        key          TEXT PRIMARY KEY,
+        board        TEXT,
+        file_name    TEXT,
+        edited       INTEGER NOT NULL DEFAULT 0,
+        created      TEXT,
+        updated      TEXT,
+        data         TEXT,
+        content_hash TEXT
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    INDEXES = """
+    CREATE INDEX IF NOT EXISTS ix_records_board ON records (board);
+    CREATE INDEX IF NOT EXISTS ix_records_hash ON records (content_hash);
+    CREATE INDEX IF NOT EXISTS ix_records_name ON records (file_name COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS ix_records_edited ON records (edited);
+    """
+
+    _COLS = "board, file_name, edited, created, updated, data, content_hash"
+
+    def __init__(self, sorted_root: Path, db_name: str = "sorted_db.sqlite3",
+                 json_name: str = "sorted_db.json") -> None:
+        super().__init__(sorted_root, db_name)
+        self.json_path = self.sorted_root / json_name
+        self._conn = None
+        self._in_batch = False
+        # conn.total_changes po posledním převzetí/exportu JSON – close() pak
+        # nepřepisuje sorted_db.json, když se nic nezměnilo
+        self._exported_changes = 0
+        # soubor DB nejde otevřít (poškozený) – nastaví load(), viz _connect()
+        self.broken = False
+
+    # ---- spojení / migrace ----
+    def _connect(self):
+        if self._conn is None:
+            import sqlite3
+            if self.broken:
+                # prázdná DB jen pro čtení v paměti: čtení vrací prázdno, zápis
+                # skončí sqlite3.OperationalError (readonly) – poškozený soubor
+                # se znovu neotevírá
+                conn = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+                conn.executescript(self.SCHEMA)
+                conn.execute("PRAGMA query_only = ON")
+                self._conn = conn
+                return conn
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # isolation_level=None: transakce řídíme explicitně (BEGIN/COMMIT)
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            # DB založená před 0.16g nemá sloupec content_hash
+            if "content_hash" not in {r[1] for r in conn.execute("PRAGMA table_info(records)")}:
+                conn.execute("ALTER TABLE records ADD COLUMN content_hash TEXT")
+            conn.executescript(self.INDEXES)
+            self._conn = conn
+        return self._conn
+
+    def _tx(self):
+        """Kontext jedné transakce (BEGIN IMMEDIATE … COMMIT / ROLLBACK)."""
+        conn = self._connect()
+        in_batch = self._in_batch
+
+        class _Tx:
+            def __enter__(self_tx):
+                # uvnitř batch() běží už vnější transakce
+                if not in_batch:
+                    conn.execute("BEGIN IMMEDIATE")
+                return conn
+
+            def __exit__(self_tx, exc_type, exc, tb):
+                if not in_batch:
+                    conn.execute("ROLLBACK" if exc_type else "COMMIT")
+                return False
+
+        return _Tx()
+
+    @contextmanager
+    def batch(self):
+        """Všechny změny uvnitř bloku v jedné transakci (commit na konci)."""
+        if self._in_batch:
+            yield self
+            return
+        with self._tx():
+            self._in_batch = True
+            try:
+                yield self
+            finally:
+                self._in_batch = False
+
+    def _json_files(self) -> tuple:
+        # snapshot + žurnál JournaledSortedDb
+        return (self.json_path, self.json_path.with_name(self.json_path.name + ".journal"),
+                self.json_path.with_name(self.json_path.name + ".journal.old"))
+
+    def _json_signature(self) -> str:
+        return json.dumps([self._file_sig(p) for p in self._json_files()])
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _migrate_from_json(self) -> None:
+        """Převezme ``sorted_db.json`` (+ žurnál): poprvé vždy, potom jen když se
+        JSON od posledního převzetí/exportu změnil (zapsal ho jiný backend)."""
+        conn = self._connect()
+        migrated = self._meta("migrated_json") is not None
+        sig = self._json_signature()
+        stored = self._meta("json_sig")
+        # DB z doby před zpětným exportem (bez json_sig) je autoritativní
+        # a při close() se do JSON vyexportuje celá
+        if migrated and (stored is None or stored == sig):
+            self._exported_changes = conn.total_changes if stored is not None else -1
+            return
+        recs: Dict[str, Any] = {}
+        try:
+            if self.json_path.exists():
+                if migrated:
+                    # nečitelný snapshot nesmí smazat obsah SQLite
+                    json.loads(self.json_path.read_text(encoding="utf-8"))
+                # přes JournaledSortedDb, aby se započítal i případný žurnál
+                src = JournaledSortedDb(self.sorted_root, self.json_path.name)
+                src.load()
+                recs = src.doc.get("records", {}) or {}
+        except Exception:
+            if migrated:
+                return
+            recs = {}
+        with self._tx() as c:
+            if migrated:
+                # JSON je novější celý stav (editace jiným backendem) → nahradí tabulku
+                c.execute("DELETE FROM records")
+            for key, rec in recs.items():
+                if isinstance(rec, dict):
+                    c.execute(
+                        f"INSERT OR REPLACE INTO records (key, {self._COLS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        self._row_for(key, rec),
+                    )
+            c.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (datetime.utcnow().isoformat(),),
+            )
+            c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_sig', ?)", (sig,))
+        self._exported_changes = conn.total_changes
+
+    def _export_to_json(self) -> None:
+        """Zapíše všechny záznamy atomicky do ``sorted_db.json`` a zahodí žurnál,
+        aby JSON / žurnálový backend po přepnutí viděl změny provedené v SQLite."""
+        doc = {"version": "1.0", "updated": datetime.utcnow().isoformat(),
+               "records": {key: rec for key, rec in self.iter_items()}}
+        snap, journal, old_journal = self._json_files()
+        tmp = snap.with_name(snap.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps(doc, ensure_ascii=False, indent=2, default=_json_default))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, snap)
+        journal.unlink(missing_ok=True)
+        old_journal.unlink(missing_ok=True)
+        with self._tx() as c:
+            c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_sig', ?)",
+                      (self._json_signature(),))
+        self._exported_changes = self._connect().total_changes
+
+    @staticmethod
+    def _row_for(key: str, rec: Dict[str, Any]) -> tuple:
+        return (
+            key,
+            _rec_board(key, rec),
+            _rec_file_name(key, rec),
+            1 if rec.get("edited") else 0,
+            rec.get("created"),
+            rec.get("updated"),
+            json.dumps(rec.get("data") or {}, ensure_ascii=False, default=_json_default),
+            rec.get("content_hash"),
+        )
+
+    @staticmethod
+    def _rec_from_row(row) -> Dict[str, Any]:
+        board, file_name, edited, created, updated, data, content_hash = row
+        try:
+            data = json.loads(data) if data else {}
+        except Exception:
+            data = {}
+        return {
+            "board": board,
+            "file_name": file_name,
+            "content_hash": content_hash,
+            "edited": bool(edited),
+            "created": created,
+            "updated": updated,
+            "data": data,
+        }
+
+    # ---- API SortedDb ----
+    def load(self) -> None:
+        try:
+            self._connect()
+            self._migrate_from_json()
+        except Exception:
+            # poškozená DB -> dál jen prázdná read-only náhrada (get()/iter_items()
+            # vrátí prázdno, zápisy selžou); soubor ani sorted_db.json se nemění
+            self._disconnect()
+            self.broken = True
+        self.generation += 1
+        self._disk_sig = self._disk_signature()
+
+    def _disk_signature(self):
+        # data_version se mění jen po commitu z JINÉHO spojení (jiný proces)
+        try:
+            return self._connect().execute("PRAGMA data_version").fetchone()[0]
+        except Exception:
+            return None
+
+    def save(self) -> None:
+        # každá změna je commitnutá už v upsert_parsed / mark_edited
+        pass
+
+    def close(self) -> None:
+        """Změny zapíše zpět do sorted_db.json (viz ``_export_to_json``) a zavře spojení."""
+        if self._conn is not None and not self.broken:
+            try:
+                if self._conn.total_changes != self._exported_changes:
+                    self._export_to_json()
+            except Exception:
+                pass
+        self._disconnect()
+
+    def _disconnect(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def get(self, abs_path: Path) -> Optional[Dict[str, Any]]:
+        return self.get_key(self.key_for(abs_path))
+
+    def get_key(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            f"SELECT {self._COLS} FROM records WHERE key = ?", (key,)
+        ).fetchone()
+        return self._rec_from_row(row) if row else None
+
+    def upsert_parsed(self, abs_path: Path, board: str, file_name: str, data: Dict[str, Any],
+                      content_hash: Optional[str] = None) -> None:
+        """Stejná sémantika jako SortedDb.upsert_parsed (editovaný záznam se nepřepisuje)."""
+        key = self.key_for(abs_path)
+        now = datetime.utcnow().isoformat()
+        self.generation += 1
+        with self._tx() as c:
+            existing = c.execute("SELECT edited FROM records WHERE key = ?", (key,)).fetchone()
+            if existing and existing[0]:
+                # respektuj ruční editaci – pouze dotkni metadata
+                c.execute(
+                    "UPDATE records SET updated = ?, board = COALESCE(NULLIF(?, ''), board), "
+                    "file_name = COALESCE(NULLIF(?, ''), file_name), "
+                    "content_hash = COALESCE(NULLIF(?, ''), content_hash) WHERE key = ?",
+                    (now, board or "", file_name or "", content_hash or "", key),
+                )
+                return
+            c.execute(
+                f"INSERT INTO records (key, {self._COLS}) VALUES (?, ?, ?, 0, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET board = excluded.board, file_name = excluded.file_name, "
+                "edited = 0, updated = excluded.updated, data = excluded.data, "
+                "content_hash = excluded.content_hash",
+                (key, board or PurePosixPath(key).parent.name, file_name or PurePosixPath(key).name,
+                 now, now, json.dumps(data or {}, ensure_ascii=False, default=_json_default), content_hash),
+            )
+
+    def mark_edited(self, abs_path: Path, new_data: Dict[str, Any]) -> None:
+        """Uloží ruční úpravu dat a nastaví edited=True."""
+        key = self.key_for(abs_path)
+        now = datetime.utcnow().isoformat()
+        self.generation += 1
+        with self._tx() as c:
+            c.execute(
+                "INSERT INTO records (key, board, file_name, edited, created, updated, data) "
+                "VALUES (?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET edited = 1, updated = excluded.updated, data = excluded.data",
+                (key, PurePosixPath(key).parent.name, PurePosixPath(key).name, now, now,
+                 json.dumps(new_data or {}, ensure_ascii=False, default=_json_default)),
+            )
+
+    def set_content_hash(self, abs_path: Path, digest: str) -> None:
+        if digest:
+            with self._tx() as c:
+                c.execute("UPDATE records SET content_hash = ? WHERE key = ?", (digest, self.key_for(abs_path)))
+
+    def iter_items(self):
+        cur = self._connect().execute(f"SELECT key, {self._COLS} FROM records ORDER BY key")
+        for row in cur:
+            yield row[0], self._rec_from_row(row[1:])
+
+    # ---- sekundární indexy (SQL) ----
+    def _keys(self, where: str = "", params: tuple = ()) -> List[str]:
+        sql = "SELECT key FROM records" + (f" WHERE {where}" if where else "") + " ORDER BY key"
+        return [r[0] for r in self._connect().execute(sql, params)]
+
+    def boards(self) -> List[str]:
+        return [r[0] for r in self._connect().execute(
+            "SELECT DISTINCT board FROM records WHERE board IS NOT NULL ORDER BY board")]
+
+    def keys_for_board(self, board: str) -> List[str]:
+        return self._keys("board = ?", (board,))
+
+    def keys_for_hash(self, digest: str) -> List[str]:
+        return self._keys("content_hash = ?", (digest or "",))
+
+    def keys_for_name(self, file_name: str) -> List[str]:
+        return self._keys("file_name = ? COLLATE NOCASE", (file_name or "",))
+
+    def edited_keys(self) -> List[str]:
+        return self._keys("edited = 1")
+
+    def keys_without_hash(self) -> List[str]:
+        return self._keys("content_hash IS NULL OR content_hash = ''")
+
+    def hash_index(self) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for digest, key in self._connect().execute(
+                "SELECT content_hash, key FROM records WHERE content_hash IS NOT NULL AND content_hash != '' "
+                "ORDER BY key"):
+            out.setdefault(digest, []).append(key)
+        return out
+
+    def file_names(self) -> Set[str]:
+        return {r[0] for r in self._connect().execute("SELECT DISTINCT file_name FROM records") if r[0]}
+
+
+class JournaledSortedDb(SortedDb):
+    """
+    SortedDb ve formátu JSON s append-only žurnálem (``sorted_db.json.journal``).
+
+    - ``upsert_parsed`` / ``mark_edited`` mění paměť a přidají do bufferu jeden
+      JSONL řádek s *výsledným* záznamem (replay je idempotentní).
+    - ``save()`` buffer připíše na konec žurnálu a udělá jeden fsync – cena
+      nezávisí na velikosti DB, více změn před ``save()`` = jeden fsync.
+    - Po překročení prahu se žurnál „otočí“ (→ ``.journal.old``) a snapshot
+      ``sorted_db.json`` se na pozadí přepíše atomicky (tmp + fsync +
+      ``os.replace``); teprve potom se starý žurnál smaže.
+    - ``load()`` = snapshot + ``.journal.old`` (pád během kompakce) + žurnál;
+      neúplný poslední řádek (pád během zápisu) se přeskočí.
+
+    Záznamy se mění copy-on-write (nový dict na klíč), takže kompakce na pozadí
+    serializuje konzistentní mělkou kopii ``records``.
+    """
+
+    COMPACT_ENTRIES = 1000
+    COMPACT_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, sorted_root: Path, db_name: str = "sorted_db.json") -> None:
+        super().__init__(sorted_root, db_name)
+        self.journal_path = self.db_path.with_name(self.db_path.name + ".journal")
+        self.old_journal_path = self.db_path.with_name(self.db_path.name + ".journal.old")
+        self._pending: list = []
+        self._journal_entries = 0
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+    # ---- načtení ----
+    def load(self) -> None:
+        self.wait_for_compaction()
+        try:
+            if self.db_path.exists():
+                self.doc = json.loads(self.db_path.read_text(encoding="utf-8"))
+            else:
+                self.doc = {"version": "1.0", "updated": None, "records": {}}
+        except Exception:
+            # poškozený snapshot -> prázdný základ, žurnál se přesto přehraje
+            self.doc = {"version": "1.0", "updated": None, "records": {}}
+        self._pending = []
+        recs = self.doc.setdefault("records", {})
+        self._journal_entries = 0
+        for jp in (self.old_journal_path, self.journal_path):
+            self._journal_entries += self._replay(jp, recs)
+        self.generation += 1
+        self._index = None
+        self._disk_sig = self._disk_signature()
+
+    def _disk_signature(self):
+        return tuple(self._file_sig(p) for p in (self.db_path, self.journal_path, self.old_journal_path))
+
+    def reload_if_changed(self) -> bool:
+        t = self._compactor
+        if t is not None and t.is_alive():
+            # snapshot a .journal.old právě přepisuje kompakce na pozadí –
+            # změnu zvenku pozná jen žurnál
+            with self._lock:
+                if self._disk_sig is not None and self._file_sig(self.journal_path) == self._disk_sig[1]:
+                    return False
+        return super().reload_if_changed()
+
+    @staticmethod
+    def _replay(path: Path, recs: Dict[str, Any]) -> int:
+        n = 0
+        try:
+            if not path.exists():
+                return 0
+            with path.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except Exception:
+                        continue  # useknutý řádek po pádu
+                    if isinstance(entry, dict) and entry.get("key") and isinstance(entry.get("rec"), dict):
+                        recs[entry["key"]] = entry["rec"]
+                        n += 1
+        except Exception:
+            pass
+        return n
+
+    # ---- změny ----
+    def _cow(self, abs_path: Path) -> str:
+        key = self.key_for(abs_path)
+        recs = self.doc.setdefault("records", {})
+        if key in recs:
+            recs[key] = dict(recs[key])
+        return key
+
+    def _journal(self, key: str) -> None:
+        rec = self.doc["records"].get(key)
+        self._pending.append(
+            json.dumps({"key": key, "rec": rec}, ensure_ascii=False, default=_json_default) + "\n"
+        )
+
+    def upsert_parsed(self, abs_path: Path, board: str, file_name: str, data: Dict[str, Any],
+                      content_hash: Optional[str] = None) -> None:
+        key = self._cow(abs_path)
+        super().upsert_parsed(abs_path, board, file_name, data, content_hash)
+        self._journal(key)
+
+    def mark_edited(self, abs_path: Path, new_data: Dict[str, Any]) -> None:
+        key = self._cow(abs_path)
+        super().mark_edited(abs_path, new_data)
+        self._journal(key)
+
+    def set_content_hash(self, abs_path: Path, digest: str) -> None:
+        key = self._cow(abs_path)
+        if key in self.doc.get("records", {}):
+            super().set_content_hash(abs_path, digest)
+            self._journal(key)
+
+    # ---- zápis ----
+    def save(self) -> None:
+        """Připíše čekající změny do žurnálu (jeden fsync); případně spustí kompakci."""
+        if self._pending:
+            with self._lock:
+                lines, self._pending = self._pending, []
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._append(self.journal_path, "".join(lines))
+                self._journal_entries += len(lines)
+                self._disk_sig = self._disk_signature()
+        elif not self.db_path.exists():
+            # první spuštění – založ prázdný snapshot (jako SortedDb._touch)
+            self._write_snapshot(self._snapshot_doc())
+            self._disk_sig = self._disk_signature()
+            return
+        if self._needs_compaction():
+            self.compact(background=True)
+
+    @staticmethod
+    def _append(path: Path, text: str) -> None:
+        """Připíše ``text`` na konec žurnálu (fsync). Končí-li soubor useknutým
+        řádkem (pád během zápisu), nejdřív ho ukončí ``\\n`` – jinak by se první
+        nový záznam slepil se zbytkem a replay by ho zahodil."""
+        with path.open("a+b") as fh:
+            if fh.seek(0, os.SEEK_END) > 0:
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    text = "\n" + text
+            fh.write(text.encode("utf-8"))
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def _needs_compaction(self) -> bool:
+        if self._journal_entries >= self.COMPACT_ENTRIES:
+            return True
+        try:
+            return self.journal_path.exists() and self.journal_path.stat().st_size >= self.COMPACT_BYTES
+        except Exception:
+            return False
+
+    def _snapshot_doc(self) -> Dict[str, Any]:
+        doc = dict(self.doc)
+        doc["records"] = dict(self.doc.get("records", {}))
+        doc["updated"] = datetime.utcnow().isoformat()
+        return doc
+
+    def _write_snapshot(self, doc: Dict[str, Any]) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.db_path.with_name(self.db_path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps(doc, ensure_ascii=False, indent=2, default=_json_default))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.db_path)
+
+    def compact(self, background: bool = False) -> None:
+        """Přepíše snapshot (atomicky) a zahodí žurnál."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        with self._lock:
+            try:
+                if self.journal_path.exists():
+                    if self.old_journal_path.exists():
+                        # zbytek po předchozí přerušené kompakci – připoj
+                        self._append(self.old_journal_path, self.journal_path.read_text(encoding="utf-8"))
+                        self.journal_path.unlink()
+                    else:
+                        os.replace(self.journal_path, self.old_journal_path)
+            except Exception:
+                return
+            # přejmenování je vlastní zápis – bez toho by reload_if_changed()
+            # během kompakce zbytečně načetl celou DB znovu
+            self._disk_sig = self._disk_signature()
+            doc = self._snapshot_doc()
+            self._journal_entries = 0
+
+        def _run() -> None:
+            try:
+                self._write_snapshot(doc)
+                self.old_journal_path.unlink(missing_ok=True)
+                with self._lock:
+                    # vlastní zápis – neznamená změnu z venku
+                    self._disk_sig = self._disk_signature()
+            except Exception:
+                # .journal.old zůstává → load() ho přehraje
+                pass
+
+        if background:
+            self._compactor = threading.Thread(target=_run, name="sorted-db-compact", daemon=True)
+            self._compactor.start()
+        else:
+            _run()
+
+    def wait_for_compaction(self) -> None:
+        t = self._compactor
+        if t is not None:
+            t.join()
+        self._compactor = None
+
+    def close(self) -> None:
+        """Dopiš změny a slouč žurnál do snapshotu (ostatní backendy pak vidí vše)."""
+        try:
+            self.save()
+            self.wait_for_compaction()
+            if self.journal_path.exists() or self.old_journal_path.exists():
+                self.compact(background=False)
+        except Exception:
+            pass
+
+
+# Názvy backendů pro nastavení "sorted_db_backend"
+SORTED_DB_BACKENDS = {
+    "json": SortedDb,
+    "journal": JournaledSortedDb,
+    "sqlite": SqliteSortedDb,
+}
+
+
+def open_sorted_db(sorted_root: Path, backend: Optional[str] = None) -> SortedDb:
+    """Vytvoří (a načte) DB pro 'Sorted PDFs' podle zvoleného backendu; neznámý → JSON."""
+    cls = SORTED_DB_BACKENDS.get((backend or "json").lower(), SortedDb)
+    db = cls(sorted_root)
+    db.load()
+    return db
@@ -0,0 +1,7 @@
+"""Méně používané záložky hlavního okna (mixiny MainWindow).
+
+Každý modul drží metody jedné záložky. Neimportují se se startem aplikace:
+``MainWindow._ensure_tab_built`` při první aktivaci záložky modul naimportuje
+a jeho mixin zařadí mezi předky ``MainWindow`` (``_load_tab_mixin``), teprve
+pak záložku sestaví. Seznam záložek a jejich mixinů je v ``_lazy_tabs``.
+"""
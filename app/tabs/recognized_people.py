@@ -0,0 +1,850 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QLineEdit, QPushButton,
+    QLabel, QComboBox, QFormLayout, QMessageBox
+)
+
+
+class RecognizedTab:
+    """Záložka „Recognized People List“ – tabulka uznaných osob (JSON), filtry,
+    dialog Add/Edit s kandidáty ze Sorted PDFs a Overview.
+
+    Metody MainWindow (``self`` je hlavní okno); do MainWindow se doplní při
+    prvním použití, viz ``app.tabs``.
+    """
+
+    def _build_recognized_tab(self) -> None:
+        """
+        Recognized People List:
+          - Tabulka: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link
+          - Filtrace: fulltext + checkboxy (Valid / Near expiry / Expired)
+          - Akce: Add…, Edit…, Delete, Reload, Save
+          - JSON perzistence (recognized_people.json)
+          - Fitting sloupců + barevné zvýraznění řádků při přepnutí do záložky
+        """
+        from PySide6.QtWidgets import (
+            QVBoxLayout, QHBoxLayout, QWidget, QTableView, QPushButton, QHeaderView,
+            QLineEdit, QCheckBox, QLabel
+        )
+        from PySide6.QtGui import QStandardItemModel
+        from PySide6.QtCore import Qt, QTimer, QSortFilterProxyModel
+        from datetime import datetime, date
+    
+        layout = QVBoxLayout(self.recognized_tab)
+    
+        # Ovládací lišta
+        bar = QHBoxLayout()
+        self.btn_rec_add = QPushButton("Add person…")
+        self.btn_rec_edit = QPushButton("Edit…")
+        self.btn_rec_del  = QPushButton("Delete")
+        self.btn_rec_reload = QPushButton("Reload")
+        self.btn_rec_save = QPushButton("Save")
+        bar.addWidget(self.btn_rec_add)
+        bar.addWidget(self.btn_rec_edit)
+        bar.addWidget(self.btn_rec_del)
+        bar.addStretch(1)
+        bar.addWidget(self.btn_rec_reload)
+        bar.addWidget(self.btn_rec_save)
+        layout.addLayout(bar)
+    
+        # FILTRAČNÍ ŘÁDEK (fulltext + 3 checkboxy)
+        filt = QHBoxLayout()
+        self.rec_search = QLineEdit(self.recognized_tab)
+        self.rec_search.setPlaceholderText("Search…")
+        self.rec_chk_valid   = QCheckBox("Valid")
+        self.rec_chk_warning = QCheckBox("Near expiry")
+        self.rec_chk_expired = QCheckBox("Expired")
+        self.rec_chk_valid.setChecked(True)
+        self.rec_chk_warning.setChecked(True)
+        self.rec_chk_expired.setChecked(True)
+        filt.addWidget(QLabel("Filter:"))
+        filt.addWidget(self.rec_search, 1)
+        filt.addSpacing(12)
+        filt.addWidget(self.rec_chk_valid)
+        filt.addWidget(self.rec_chk_warning)
+        filt.addWidget(self.rec_chk_expired)
+        layout.addLayout(filt)
+    
+        # Tabulka + MODEL
+        self.tbl_recognized = QTableView(self.recognized_tab)
+        self.tbl_recognized.setSelectionBehavior(QTableView.SelectRows)
+        self.tbl_recognized.setSelectionMode(QTableView.ExtendedSelection)
+        self.tbl_recognized.setSortingEnabled(True)
+    
+        # Pořadí sloupců (0.10d)
+        self._recognized_headers = [
+            "Board", "Full Name", "Email", "Address",
+            "Recognition Date", "Valid Until", "Badge Types", "Badge Link"
+        ]
+        self._recognized_model = QStandardItemModel(0, len(self._recognized_headers), self)
+        self._recognized_model.setHorizontalHeaderLabels(self._recognized_headers)
+    
+        # PROXY MODEL pro filtraci
+        class _RecognizedProxy(QSortFilterProxyModel):
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                self.search = ""
+                self.show_valid = True
+                self.show_warn = True
+                self.show_expired = True
+    
+            def _status_for_row(self, row: int) -> str:
+                """Vrátí 'valid' / 'warn' / 'expired' dle 'Valid Until' (col 5)."""
+                try:
+                    idx = self.sourceModel().index(row, 5)
+                    s = self.sourceModel().data(idx)
+                    if not s:
+                        return "valid"
+                    vuntil = datetime.strptime(str(s), "%Y-%m-%d").date()
+                    days_left = (vuntil - date.today()).days
+                    if days_left > 30:
+                        return "valid"
+                    elif days_left >= 0:
+                        return "warn"
+                    else:
+                        return "expired"
+                except Exception:
+                    return "valid"
+    
+            def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+                # 1) Validitní checkboxy
+                st = self._status_for_row(source_row)
+                if st == "valid" and not self.show_valid:
+                    return False
+                if st == "warn" and not self.show_warn:
+                    return False
+                if st == "expired" and not self.show_expired:
+                    return False
+                # 2) Fulltext přes všechny sloupce
+                if self.search:
+                    s = self.search.lower()
+                    cols = self.sourceModel().columnCount()
+                    found = False
+                    for c in range(cols):
+                        idx = self.sourceModel().index(source_row, c)
+                        val = self.sourceModel().data(idx)
+                        if val and s in str(val).lower():
+                            found = True
+                            break
+                    if not found:
+                        return False
+                return True
+    
+        self._rec_proxy = _RecognizedProxy(self)
+        self._rec_proxy.setSourceModel(self._recognized_model)
+        self.tbl_recognized.setModel(self._rec_proxy)
+    
+        # Fit sloupců
+        hdr = self.tbl_recognized.horizontalHeader()
+        hdr.setStretchLastSection(True)
+        try:
+            hdr.setSectionResizeMode(QHeaderView.ResizeToContents)
+        except Exception:
+            try:
+                hdr.setResizeMode(0, QHeaderView.ResizeToContents)
+            except Exception:
+                pass
+    
+        layout.addWidget(self.tbl_recognized, 1)
+    
+        # Naplň data
+        self._recognized_rebuild_model()
+    
+        # Akce
+        self.btn_rec_add.clicked.connect(self._recognized_add)
+        self.btn_rec_edit.clicked.connect(self._recognized_edit)
+        self.btn_rec_del.clicked.connect(self._recognized_delete)
+        self.btn_rec_reload.clicked.connect(self._recognized_rebuild_model)
+        self.btn_rec_save.clicked.connect(lambda: self._save_recognized_json(self._recognized_collect_data()))
+    
+        # Filtrační signály
+        self.rec_search.textChanged.connect(lambda _t: self._recognized_update_filter())
+        self.rec_chk_valid.toggled.connect(lambda _b: self._recognized_update_filter())
+        self.rec_chk_warning.toggled.connect(lambda _b: self._recognized_update_filter())
+        self.rec_chk_expired.toggled.connect(lambda _b: self._recognized_update_filter())
+    
+        # Po vykreslení dofituj a aplikuj barvy
+        QTimer.singleShot(0, self._recognized_fit_columns)
+        QTimer.singleShot(0, self._recognized_apply_row_colors)
+    
+        # Spusť zvýraznění při přepnutí do záložky (napoj jednorázově)
+        if hasattr(self, "tabs") and not getattr(self, "_rec_tab_hooked", False):
+            try:
+                self.tabs.currentChanged.connect(self._recognized_on_tab_changed)
+                self._rec_tab_hooked = True
+            except Exception:
+                pass
+
+    def _recognized_update_filter(self) -> None:
+        """Aplikuje hodnoty z fulltextu a checkboxů do proxy a invaliduje filtr."""
+        try:
+            proxy = getattr(self, "_rec_proxy", None)
+            if not proxy:
+                return
+            proxy.search = (self.rec_search.text() or "").strip()
+            proxy.show_valid = bool(self.rec_chk_valid.isChecked())
+            proxy.show_warn = bool(self.rec_chk_warning.isChecked())
+            proxy.show_expired = bool(self.rec_chk_expired.isChecked())
+            proxy.invalidateFilter()
+        except Exception:
+            pass
+
+    def _recognized_on_tab_changed(self, index: int) -> None:
+        """
+        Při přepnutí na Recognized tab obnov barvy (a můžeš i dofit sloupce).
+        """
+        try:
+            w = self.tabs.widget(index)
+            if w is self.recognized_tab:
+                self._recognized_apply_row_colors()
+                self._recognized_fit_columns()
+        except Exception:
+            pass
+
+    def _recognized_json_path(self):
+        """Cesta k JSONu s recognized osobami (repo root)."""
+        from pathlib import Path
+        return Path(__file__).resolve().parents[3] / "recognized_people.json"
+
+    def _load_recognized_json(self) -> list[dict]:
+        """Načti JSON (list dictů). Neexistuje-li, vrať []."""
+        import json
+        p = self._recognized_json_path()
+        try:
+            if p.exists():
+                with p.open("r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                    if isinstance(data, list):
+                        return data
+        except Exception:
+            pass
+        return []
+
+    def _save_recognized_json(self, data: list[dict]) -> None:
+        """Ulož JSON s recognized osobami."""
+        import json
+        p = self._recognized_json_path()
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            with p.open("w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=2)
+            try:
+                self.statusBar().showMessage("Recognized people saved.")
+            except Exception:
+                pass
+        except Exception as e:
+            from PySide6.QtWidgets import QMessageBox
+            QMessageBox.warning(self, "Save recognized", f"Failed to save recognized_people.json:\n{e}")
+
+    def _recognized_rebuild_model(self) -> None:
+        """
+        Načti JSON a naplň model.
+        - Pokud záznam obsahuje oba badge (academia & certified), zobraz ho jako DVA řádky (sdruženě).
+        - 'Valid Until' = 'Recognition Date' + 365 dní (přepočet na load).
+        - POŘADÍ SLOUPCŮ: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link
+        """
+        from PySide6.QtGui import QStandardItem
+        from PySide6.QtCore import Qt
+        from datetime import datetime, timedelta
+    
+        data = self._load_recognized_json()
+        self._recognized_model.setRowCount(0)
+    
+        def _valid_until(date_str: str) -> str:
+            try:
+                dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+                return (dt + timedelta(days=365)).isoformat()
+            except Exception:
+                return ""
+    
+        def _append_row(board, full, mail, addr, rdate, acad, cert, blink):
+            badges = "; ".join([s for s, b in (("Academia", acad), ("Certified", cert)) if b])
+            vuntil = _valid_until(rdate)
+            # nový pořadník
+            vals = [board, full, mail, addr, rdate, vuntil, badges, blink]
+            items = [QStandardItem(str(v)) for v in vals]
+            for it in items:
+                it.setEditable(False)
+            self._recognized_model.appendRow(items)
+    
+        for rec in data:
+            board = rec.get("board", "") or ""
+            full  = rec.get("full_name", "") or ""
+            mail  = rec.get("email", "") or ""
+            addr  = rec.get("address", "") or ""
+            rdate = rec.get("recognition_date", "") or ""
+            acad  = bool(rec.get("academia", False))
+            cert  = bool(rec.get("certified", False))
+            blink = rec.get("badge_link", "") or ""
+    
+            if acad and cert:
+                _append_row(board, full, mail, addr, rdate, True,  False, blink)
+                _append_row(board, full, mail, addr, rdate, False, True,  blink)
+            else:
+                _append_row(board, full, mail, addr, rdate, acad, cert, blink)
+    
+        self._recognized_fit_columns()
+
+    def _recognized_collect_data(self) -> list[dict]:
+        """Převeď model -> JSON list."""
+        from PySide6.QtCore import Qt
+        out = []
+        for r in range(self._recognized_model.rowCount()):
+            board = self._recognized_model.index(r, 0).data(Qt.DisplayRole) or ""
+            full  = self._recognized_model.index(r, 1).data(Qt.DisplayRole) or ""
+            mail  = self._recognized_model.index(r, 2).data(Qt.DisplayRole) or ""
+            addr  = self._recognized_model.index(r, 3).data(Qt.DisplayRole) or ""
+            rdate = self._recognized_model.index(r, 4).data(Qt.DisplayRole) or ""
+            badges= (self._recognized_model.index(r, 5).data(Qt.DisplayRole) or "").lower()
+            blink = self._recognized_model.index(r, 6).data(Qt.DisplayRole) or ""
+            vuntil= self._recognized_model.index(r, 7).data(Qt.DisplayRole) or ""
+    
+            acad = "academia" in badges
+            cert = "certified" in badges
+    
+            out.append({
+                "board": board,
+                "full_name": full,
+                "email": mail,
+                "address": addr,
+                "recognition_date": rdate,
+                "academia": acad,
+                "certified": cert,
+                "badge_link": blink,
+                "valid_until": vuntil,
+            })
+        return out
+
+    def _recognized_candidates_from_sorted(self) -> list[dict]:
+        """
+        Najdi kandidáty pro Recognized Add dialog.
+        Preferujeme 'Sorted DB' v paměti; pokud není, zkusíme běžné JSON cesty.
+        Jako poslední fallback odvodíme kandidáty z Overview tabulky.
+    
+        Vrací list dictů:
+          { "board": str, "full_name": str, "email": str, "address": str,
+            "academia": bool, "certified": bool }
+        """
+        from pathlib import Path
+        candidates: list[dict] = []
+        seen: set[tuple] = set()
+    
+        def _add(board, full, mail, addr, acad, cert):
+            key = (str(board or ""), str(full or ""), str(mail or ""), str(addr or ""), bool(acad), bool(cert))
+            if key in seen:
+                return
+            seen.add(key)
+            candidates.append({
+                "board": str(board or ""),
+                "full_name": str(full or ""),
+                "email": str(mail or ""),
+                "address": str(addr or ""),
+                "academia": bool(acad),
+                "certified": bool(cert),
+            })
+    
+        # 0) SortedDb – jeden průchod iter_items() (data = extrahovaná/ručně upravená pole),
+        #    pořadí podle boardu a klíče jako ve stromu Sorted PDFs
+        db = getattr(self, "sorted_db", None)
+        if db is not None and hasattr(db, "iter_items"):
+            try:
+                from ..sorted_db import _rec_board
+                items = sorted(((_rec_board(k, r), k, r) for k, r in db.iter_items() if isinstance(r, dict)),
+                               key=lambda t: (t[0], t[1]))
+                for board_name, _key, rec in items:
+                    d = rec.get("data") or {}
+                    full = d.get("contact_full_name", "") or d.get("full_name", "")
+                    mail = d.get("contact_email", "") or d.get("email", "")
+                    addr = d.get("contact_postal_address", "") or d.get("address", "")
+                    acad_raw = d.get("recognition_academia", "")
+                    cert_raw = d.get("recognition_certified", "")
+                    acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
+                    cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
+                    if full or mail:
+                        _add(d.get("board") or board_name, full, mail, addr, acad, cert)
+            except Exception:
+                pass
+            if candidates:
+                return candidates
+
+        # 1) In-memory zdroje – různé názvy používané v projektu
+        for attr in ("sorted_db", "_sorted_db", "sorted_records", "_sorted_records", "sorted_data", "_sorted_data"):
+            container = getattr(self, attr, None)
+            if not container:
+                continue
+    
+            def _iter(container):
+                if isinstance(container, dict):
+                    for v in container.values():
+                        yield v
+                elif isinstance(container, list):
+                    for v in container:
+                        yield v
+    
+            for rec in _iter(container):
+                # rec může být objekt i dict
+                try:
+                    get = (lambda k, default="": getattr(rec, k, getattr(rec, k.replace(" ", "_"), None))
+                           if hasattr(rec, k) or hasattr(rec, k.replace(" ", "_"))
+                           else rec.get(k, rec.get(k.replace(" ", "_"), default)))
+                except Exception:
+                    # rec je nejspíš dict
+                    def get(k, default=""):
+                        return rec.get(k, rec.get(k.replace(" ", "_"), default))
+    
+                board = get("board", "")
+                full  = get("contact_full_name", "") or get("full_name", "")
+                mail  = get("contact_email", "") or get("email", "")
+                addr  = get("contact_postal_address", "") or get("address", "")
+    
+                acad_raw = get("recognition_academia", "")
+                cert_raw = get("recognition_certified", "")
+                # Interpretuj jakýkoli neprázdný string/true hodnotu jako True
+                acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
+                cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
+    
+                if full or mail:
+                    _add(board, full, mail, addr, acad, cert)
+    
+            if candidates:
+                return candidates  # máme výsledky, dál nehledáme
+    
+        # 2) JSON soubory – pár běžných cest/jmen (pokud existují)
+        try_paths = []
+        try:
+            repo_root = Path(__file__).resolve().parents[3]
+            try_paths.extend([
+                repo_root / "sorted_db.json",
+                repo_root / "sorted_records.json",
+                repo_root / "data" / "sorted_db.json",
+                repo_root / "Sorted PDFs" / "sorted_db.json",
+            ])
+        except Exception:
+            pass
+    
+        import json
+        for p in try_paths:
+            try:
+                if p.exists():
+                    with p.open("r", encoding="utf-8") as fh:
+                        data = json.load(fh)
+                    # projdi stejným způsobem jako in-memory
+                    def _iter2(container):
+                        if isinstance(container, dict):
+                            for v in container.values():
+                                yield v
+                        elif isinstance(container, list):
+                            for v in container:
+                                yield v
+                    for rec in _iter2(data):
+                        if isinstance(rec, dict):
+                            board = rec.get("board", "")
+                            full  = rec.get("contact_full_name", "") or rec.get("full_name", "")
+                            mail  = rec.get("contact_email", "") or rec.get("email", "")
+                            addr  = rec.get("contact_postal_address", "") or rec.get("address", "")
+                            acad_raw = rec.get("recognition_academia", "")
+                            cert_raw = rec.get("recognition_certified", "")
+                            acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
+                            cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
+                            if full or mail:
+                                _add(board, full, mail, addr, acad, cert)
+                    if candidates:
+                        return candidates
+            except Exception:
+                continue
+    
+        # 3) Fallback: odvoď z Overview tabulky (_source_model) — pokud existuje
+        for d in self._overview_iter_records_as_dicts():
+            board = d.get("board", "")
+            full  = d.get("contact_full_name", "") or d.get("full_name", "")
+            mail  = d.get("contact_email", "") or d.get("email", "")
+            addr  = d.get("contact_postal_address", "") or d.get("address", "")
+            acad_raw = d.get("recognition_academia", "")
+            cert_raw = d.get("recognition_certified", "")
+            acad = bool(acad_raw) and str(acad_raw).strip().lower() not in ("false", "0", "no", "none")
+            cert = bool(cert_raw) and str(cert_raw).strip().lower() not in ("false", "0", "no", "none")
+            if full or mail:
+                _add(board, full, mail, addr, acad, cert)
+    
+        return candidates
+
+    def _recognized_open_add_dialog(self, initial: dict | None = None) -> dict | None:
+        """
+        Add/Edit dialog pro recognized osobu.
+        - ADD: volba zdroje (From Sorted PDFs / Manual), badge typy editovatelné.
+        - EDIT: zdroj i badge typy jsou irelevantní → skryté/disable; typy zůstávají dle řádku.
+        Vrací dict se stejnými klíči jako JSON nebo None při Cancel.
+        """
+        from PySide6.QtWidgets import (
+            QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit, QPlainTextEdit,
+            QDialogButtonBox, QRadioButton, QComboBox, QDateEdit, QCheckBox, QMessageBox
+        )
+        from PySide6.QtCore import Qt, QDate
+        from datetime import timedelta, datetime as _dt
+    
+        is_edit = initial is not None
+    
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Edit recognized person" if is_edit else "Add recognized person")
+        lay = QVBoxLayout(dlg)
+    
+        # Zdroj dat (Sorted vs Manual) – v EDIT režimu skryjeme
+        src_row = QHBoxLayout()
+        rb_sorted = QRadioButton("From Sorted PDFs")
+        rb_manual = QRadioButton("Manual entry")
+        if not is_edit:
+            src_row.addWidget(rb_sorted); src_row.addWidget(rb_manual); src_row.addStretch(1)
+            lay.addLayout(src_row)
+    
+        # Kandidáti ze Sorted DB – v EDIT režimu neukazujeme
+        cb_sorted = QComboBox()
+        lbl_no_sorted = QLabel("No candidates found in Sorted PDFs database.")
+        lbl_no_sorted.setStyleSheet("color: #999;")
+        if not is_edit:
+            candidates = self._recognized_candidates_from_sorted()
+            for c in candidates:
+                disp = f"{c.get('full_name','')} — {c.get('email','')} — [{c.get('board','')}]"
+                cb_sorted.addItem(disp, c)
+            lay.addWidget(cb_sorted)
+            lay.addWidget(lbl_no_sorted)
+            # výchozí stav
+            if candidates:
+                rb_sorted.setChecked(True)
+            else:
+                rb_manual.setChecked(True)
+    
+        # Form
+        form = QFormLayout()
+        ed_board = QLineEdit()
+        ed_full  = QLineEdit()
+        ed_mail  = QLineEdit()
+        ed_addr  = QPlainTextEdit(); ed_addr.setMinimumHeight(64)
+    
+        ed_date  = QDateEdit(); ed_date.setCalendarPopup(True); ed_date.setDate(QDate.currentDate())
+        chk_acad = QCheckBox("Academia Recognition")
+        chk_cert = QCheckBox("Certified Recognition")
+        ed_link  = QLineEdit()
+    
+        form.addRow("Board:", ed_board)
+        form.addRow("Full Name:", ed_full)
+        form.addRow("Email:", ed_mail)
+        form.addRow("Address:", ed_addr)
+        form.addRow("Recognition Date:", ed_date)
+        # Badge types – v EDIT režimu jen zobrazíme/disable, v ADD editovatelné
+        if not is_edit:
+            form.addRow("Badge Types:", QLabel(""))
+            form.addRow("", chk_acad)
+            form.addRow("", chk_cert)
+        else:
+            # jen informativní řádek s textem badge, bez checků
+            self._lbl_badges_info = QLabel("(badge type unchanged in Edit)")
+            form.addRow("Badge Types:", self._lbl_badges_info)
+            chk_acad.setVisible(False)
+            chk_cert.setVisible(False)
+    
+        form.addRow("Badge Link:", ed_link)
+        lay.addLayout(form)
+    
+        # Předvyplnění z initial (Edit)
+        if is_edit:
+            ed_board.setText(initial.get("board", ""))
+            ed_full.setText(initial.get("full_name", ""))
+            ed_mail.setText(initial.get("email", ""))
+            ed_addr.setPlainText(initial.get("address", ""))
+            try:
+                y, m, d = map(int, (initial.get("recognition_date","") or "2000-01-01").split("-"))
+                ed_date.setDate(QDate(y, m, d))
+            except Exception:
+                pass
+            # Badge typy ponecháváme; jen je držíme v initial
+            chk_acad.setChecked(bool(initial.get("academia", False)))
+            chk_cert.setChecked(bool(initial.get("certified", False)))
+            ed_link.setText(initial.get("badge_link", ""))
+        else:
+            # ADD: předvyplnění po výběru kandidáta ze Sorted
+            def _apply_candidate():
+                data = cb_sorted.currentData()
+                if not data:
+                    return
+                ed_board.setText(data.get("board",""))
+                ed_full.setText(data.get("full_name",""))
+                ed_mail.setText(data.get("email",""))
+                ed_addr.setPlainText(data.get("address",""))
+                chk_acad.setChecked(bool(data.get("academia", False)))
+                chk_cert.setChecked(bool(data.get("certified", False)))
+            cb_sorted.currentIndexChanged.connect(_apply_candidate)
+            # přepínání zdroje
+            def _toggle_src():
+                use_sorted = rb_sorted.isChecked() if not is_edit else False
+                has_data = (cb_sorted.count() > 0) if not is_edit else False
+                if not is_edit:
+                    cb_sorted.setEnabled(use_sorted and has_data)
+                    lbl_no_sorted.setVisible(use_sorted and not has_data)
+            if not is_edit:
+                rb_sorted.toggled.connect(_toggle_src)
+                rb_manual.toggled.connect(_toggle_src)
+                # init
+                if cb_sorted.count() > 0:
+                    rb_sorted.setChecked(True)
+                    _apply_candidate()
+                _toggle_src()
+    
+        # Tlačítka
+        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, dlg)
+        lay.addWidget(btns)
+    
+        result: dict | None = None
+    
+        def _accept():
+            # Collect
+            board = ed_board.text().strip()
+            full  = ed_full.text().strip()
+            mail  = ed_mail.text().strip()
+            addr  = ed_addr.toPlainText().strip()
+            date_str = ed_date.date().toString("yyyy-MM-dd")
+            # v EDIT režimu použij původní typy, v ADD podle checkboxů
+            if is_edit:
+                acad = bool(initial.get("academia", False))
+                cert = bool(initial.get("certified", False))
+            else:
+                acad = chk_acad.isChecked()
+                cert = chk_cert.isChecked()
+            link = ed_link.text().strip()
+    
+            # Validate
+            if not full:
+                QMessageBox.information(dlg, "Validation", "Full Name is required.")
+                return
+            if not (acad or cert):
+                QMessageBox.information(dlg, "Validation", "Select at least one badge type.")
+                return
+            if not date_str:
+                QMessageBox.information(dlg, "Validation", "Recognition Date is required.")
+                return
+            if not link:
+                QMessageBox.information(dlg, "Validation", "Badge Link is required.")
+                return
+    
+            # Valid Until (+365 dní) – počítáme až při ukládání do modelu
+            nonlocal result
+            result = {
+                "board": board,
+                "full_name": full,
+                "email": mail,
+                "address": addr,
+                "recognition_date": date_str,
+                "academia": bool(acad),
+                "certified": bool(cert),
+                "badge_link": link,
+            }
+            dlg.accept()
+    
+        btns.accepted.connect(_accept)
+        btns.rejected.connect(dlg.reject)
+    
+        dlg.resize(640, 520)
+        return result if dlg.exec_() == QDialog.Accepted else None
+
+    def _recognized_add(self) -> None:
+        """
+        Přidání osoby. Při volbě obou badge vloží DVA řádky (po kontrole duplicit per-badge).
+        Duplikát: (full_name + badge_link) NEBO (full_name + recognition_date + badge-typ).
+        Nový pořádek sloupců: Board, Full Name, Email, Address, Recognition Date, Valid Until, Badge Types, Badge Link.
+        """
+        from PySide6.QtWidgets import QMessageBox
+        from PySide6.QtGui import QStandardItem
+        from PySide6.QtCore import Qt
+        from datetime import datetime, timedelta
+    
+        new = self._recognized_open_add_dialog(None)
+        if not new:
+            return
+    
+        def _badge_rows(n: dict) -> list[tuple[bool, bool]]:
+            a = bool(n.get("academia"))
+            c = bool(n.get("certified"))
+            if a and c:
+                return [(True, False), (False, True)]
+            return [(a, c)]
+    
+        def _dup_exists(full_l, link_l, dstr, acad, cert) -> bool:
+            bkey = f"{int(bool(acad))}-{int(bool(cert))}"
+            for r in range(self._recognized_model.rowCount()):
+                f2 = (self._recognized_model.index(r, 1).data(Qt.DisplayRole) or "").strip().lower()
+                l2 = (self._recognized_model.index(r, 7).data(Qt.DisplayRole) or "").strip().lower()  # Badge Link
+                d2 = (self._recognized_model.index(r, 4).data(Qt.DisplayRole) or "").strip()          # Recognition Date
+                b2s= (self._recognized_model.index(r, 6).data(Qt.DisplayRole) or "").lower()          # Badge Types
+                b2 = f"{int('academia' in b2s)}-{int('certified' in b2s)}"
+                if f2 == full_l and (l2 == link_l or (d2 == dstr and b2 == bkey)):
+                    return True
+            return False
+    
+        board = new.get("board","")
+        full  = new.get("full_name","")
+        mail  = new.get("email","")
+        addr  = new.get("address","")
+        rdate = new.get("recognition_date","")
+        link  = new.get("badge_link","")
+    
+        full_l = (full or "").strip().lower()
+        link_l = (link or "").strip().lower()
+        dstr   = (rdate or "").strip()
+    
+        rows_to_add = []
+        for acad, cert in _badge_rows(new):
+            if _dup_exists(full_l, link_l, dstr, acad, cert):
+                continue
+            try:
+                dt = datetime.strptime(rdate, "%Y-%m-%d").date()
+                vuntil = (dt + timedelta(days=365)).isoformat()
+            except Exception:
+                vuntil = ""
+            badges = "; ".join([s for s,b in (("Academia", acad), ("Certified", cert)) if b])
+            vals = [board, full, mail, addr, rdate, vuntil, badges, link]
+            rows_to_add.append([QStandardItem(str(v)) for v in vals])
+    
+        if not rows_to_add:
+            QMessageBox.information(self, "Duplicate", "This person/badge already exists.")
+            return
+    
+        for items in rows_to_add:
+            for it in items:
+                it.setEditable(False)
+            self._recognized_model.appendRow(items)
+    
+        self._recognized_fit_columns()
+        self._recognized_apply_row_colors()
+
+    def _recognized_edit(self) -> None:
+        """
+        Edit vybraného řádku.
+        V EDIT režimu jsou badge typy i volba Sorted zdroje irelevantní (skryty).
+        Výběr z tabulky mapujeme z proxy na zdrojový model.
+        """
+        from PySide6.QtWidgets import QMessageBox
+        from PySide6.QtCore import Qt
+        from datetime import datetime, timedelta
+    
+        sel = self.tbl_recognized.selectionModel().selectedRows()
+        if not sel:
+            QMessageBox.information(self, "Edit", "Select a row to edit.")
+            return
+        # map proxy -> source row
+        proxy_idx = sel[0]
+        try:
+            src_idx = self._rec_proxy.mapToSource(proxy_idx)
+            r = src_idx.row()
+        except Exception:
+            r = proxy_idx.row()
+    
+        # Původní hodnoty
+        cur = {
+            "board": self._recognized_model.index(r,0).data(Qt.DisplayRole) or "",
+            "full_name": self._recognized_model.index(r,1).data(Qt.DisplayRole) or "",
+            "email": self._recognized_model.index(r,2).data(Qt.DisplayRole) or "",
+            "address": self._recognized_model.index(r,3).data(Qt.DisplayRole) or "",
+            "recognition_date": self._recognized_model.index(r,4).data(Qt.DisplayRole) or "",
+            "badge_link": self._recognized_model.index(r,7).data(Qt.DisplayRole) or "",
+        }
+        btxt = (self._recognized_model.index(r,6).data(Qt.DisplayRole) or "").lower()
+        cur["academia"]  = "academia"  in btxt
+        cur["certified"] = "certified" in btxt
+    
+        upd = self._recognized_open_add_dialog(cur)
+        if not upd:
+            return
+    
+        # Přepočítej Valid Until = +365 dní
+        try:
+            dt = datetime.strptime(upd.get("recognition_date",""), "%Y-%m-%d").date()
+            vuntil = (dt + timedelta(days=365)).isoformat()
+        except Exception:
+            vuntil = ""
+    
+        # Badge typy se v EDIT režimu nemění (ponecháme původní)
+        acad_keep = cur["academia"]; cert_keep = cur["certified"]
+        badges_txt = "; ".join([s for s,b in (("Academia", acad_keep), ("Certified", cert_keep)) if b])
+    
+        vals = [
+            upd.get("board",""), upd.get("full_name",""), upd.get("email",""), upd.get("address",""),
+            upd.get("recognition_date",""), vuntil, badges_txt, upd.get("badge_link",""),
+        ]
+        for c, v in enumerate(vals):
+            self._recognized_model.setData(self._recognized_model.index(r, c), str(v))
+    
+        self._recognized_fit_columns()
+        self._recognized_apply_row_colors()
+
+    def _recognized_apply_row_colors(self) -> None:
+        """
+        Podbarvení řádků podle platnosti (Valid Until vs dnešek):
+          - > 30 dnů: zelená
+          - 0..30 dnů: žlutá
+          - < 0 dnů: červená
+        (Valid Until je ve sloupci index 5.)
+        """
+        from PySide6.QtGui import QColor, QBrush
+        from PySide6.QtCore import Qt
+        from datetime import datetime, date
+    
+        try:
+            today = date.today()
+            rows = self._recognized_model.rowCount()
+            for r in range(rows):
+                vuntil_s = self._recognized_model.index(r, 5).data(Qt.DisplayRole) or ""
+                col_brush = None
+                try:
+                    vuntil = datetime.strptime(vuntil_s, "%Y-%m-%d").date()
+                    days_left = (vuntil - today).days
+                    if days_left > 30:
+                        col_brush = QBrush(QColor(40, 140, 60, 60))    # zelená (jemná)
+                    elif days_left >= 0:
+                        col_brush = QBrush(QColor(200, 160, 20, 70))   # žlutá
+                    else:
+                        col_brush = QBrush(QColor(200, 60, 60, 80))    # červená
+                except Exception:
+                    col_brush = None
+    
+                if col_brush:
+                    for c in range(self._recognized_model.columnCount()):
+                        self._recognized_model.item(r, c).setBackground(col_brush)
+                else:
+                    for c in range(self._recognized_model.columnCount()):
+                        self._recognized_model.item(r, c).setBackground(QBrush())
+        except Exception:
+            pass
+
+    def _recognized_delete(self) -> None:
+        """Smazání vybraných řádků (s potvrzením). Mapování výběru z proxy na zdrojový model."""
+        from PySide6.QtWidgets import QMessageBox
+        sel = self.tbl_recognized.selectionModel().selectedRows()
+        if not sel:
+            QMessageBox.information(self, "Delete", "Select one or more rows to delete.")
+            return
+        if QMessageBox.question(self, "Delete", f"Delete {len(sel)} selected item(s)?") != QMessageBox.Yes:
+            return
+        # proxy -> source rows
+        rows = []
+        for pidx in sel:
+            try:
+                sidx = self._rec_proxy.mapToSource(pidx)
+                rows.append(sidx.row())
+            except Exception:
+                rows.append(pidx.row())
+        for r in sorted(set(rows), reverse=True):
+            self._recognized_model.removeRow(r)
+
+    def _recognized_fit_columns(self) -> None:
+        """Do-fit sloupců po naplnění/změnách."""
+        try:
+            hdr = self.tbl_recognized.horizontalHeader()
+            for c in range(self._recognized_model.columnCount()):
+                self.tbl_recognized.resizeColumnToContents(c)
+            hdr.setStretchLastSection(True)
+        except Exception:
+            pass
@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel,
+    QFormLayout, QSplitter, QMessageBox
+)
+
+from ..pdf_scanner import PdfScanner, PdfRecord
+
+
+class SortedTab:
+    """Záložka „Sorted PDFs“ – strom Board/PDF nad Sorted DB, detail záznamu
+    a ruční editace (Edit → Save to DB).
+
+    Metody MainWindow (``self`` je hlavní okno); do MainWindow se doplní při
+    prvním použití, viz ``app.tabs``.
+    """
+
+    def _build_sorted_tab(self) -> None:
+        """
+        Záložka 'Sorted PDFs': vlevo strom, vpravo formulář.
+        Přidány editory pro: Printed Name, Title; Receiving Member Board; Date Received; Validity Start/End.
+        DOPLNĚNO: File name (read-only) + lbl_sorted_status.
+        """
+        from PySide6.QtWidgets import (
+            QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem, QSplitter,
+            QWidget, QFormLayout, QLineEdit, QPlainTextEdit, QPushButton, QSizePolicy, QLabel
+        )
+        from PySide6.QtCore import Qt
+    
+        layout = QVBoxLayout()
+        self.split_sorted = QSplitter(self.sorted_tab)
+        self.split_sorted.setOrientation(Qt.Horizontal)
+    
+        # LEVÁ strana – strom
+        self.tree_sorted = QTreeWidget()
+        self.tree_sorted.setHeaderLabels(["Board / PDF"])
+        self.tree_sorted.itemSelectionChanged.connect(self._sorted_on_item_changed)
+        # Abecední řazení (boards i soubory)
+        self.tree_sorted.setSortingEnabled(True)
+        self.tree_sorted.sortItems(0, Qt.AscendingOrder)
+    
+        # PRAVÁ strana – formulář
+        right = QWidget()
+        right_layout = QVBoxLayout(right)
+        self.form_sorted = QFormLayout()
+        self.form_sorted.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.form_sorted.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+    
+        def _mkline() -> QLineEdit:
+            e = QLineEdit()
+            e.setClearButtonEnabled(True)
+            return e
+    
+        def _mktxt() -> QPlainTextEdit:
+            t = QPlainTextEdit()
+            t.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            t.setMaximumBlockCount(100000)
+            return t
+    
+        # Základní pole
+        self.ed_board = _mkline(); self.ed_board.setReadOnly(True)
+        self.ed_app_type = _mkline()
+        self.ed_inst_name = _mkline()
+        self.ed_cand_name = _mkline()
+        self.ed_rec_acad = _mkline()
+        self.ed_rec_cert = _mkline()
+        self.ed_fullname = _mkline()
+        self.ed_email = _mkline()
+        self.ed_phone = _mkline()
+        self.ed_address = _mktxt()
+        self.ed_syllabi = _mktxt()
+        self.ed_courses = _mktxt()
+        self.ed_proof = _mktxt()
+        self.ed_links = _mktxt()
+        self.ed_additional = _mktxt()
+        # Consent
+        self.ed_printed_name_title = _mkline()   # NOVĚ
+        self.ed_sigdate = _mkline()
+        # ISTQB internal
+        self.ed_receiving_member_board = _mkline()  # NOVĚ
+        self.ed_date_received = _mkline()           # NOVĚ
+        self.ed_validity_start_date = _mkline()     # NOVĚ
+        self.ed_validity_end_date = _mkline()       # NOVĚ
+        # File name (read-only) – DOPLNĚNO
+        self.ed_filename = _mkline()
+        self.ed_filename.setReadOnly(True)
+    
+        # Alias (stávající jména používaná jinde v kódu nechávám)
+        self.ed_contact_full_name = self.ed_fullname
+        self.ed_contact_email = self.ed_email
+        self.ed_contact_phone = self.ed_phone
+        self.ed_postal_address = self.ed_address
+        self.ed_syllabi_integration_description = self.ed_syllabi
+        self.ed_courses_modules_list = self.ed_courses
+        self.ed_proof_of_istqb_certifications = self.ed_proof
+        self.ed_university_links = self.ed_links
+        self.ed_additional_information_documents = self.ed_additional
+    
+        # Form – pořadí (Printed Name před Signature Date; sekce 7 za ním)
+        self.form_sorted.addRow("File name:", self.ed_filename)  # DOPLNĚNO – read-only
+        self.form_sorted.addRow("Board:", self.ed_board)
+        self.form_sorted.addRow("Application Type:", self.ed_app_type)
+        self.form_sorted.addRow("Institution Name:", self.ed_inst_name)
+        self.form_sorted.addRow("Candidate Name:", self.ed_cand_name)
+        self.form_sorted.addRow("Academia Recognition:", self.ed_rec_acad)
+        self.form_sorted.addRow("Certified Recognition:", self.ed_rec_cert)
+        self.form_sorted.addRow("Full Name:", self.ed_fullname)
+        self.form_sorted.addRow("Email Address:", self.ed_email)
+        self.form_sorted.addRow("Phone Number:", self.ed_phone)
+        self.form_sorted.addRow("Postal Address:", self.ed_address)
+        self.form_sorted.addRow("Syllabi Integration:", self.ed_syllabi)
+        self.form_sorted.addRow("Courses/Modules:", self.ed_courses)
+        self.form_sorted.addRow("Proof of ISTQB Certifications:", self.ed_proof)
+        self.form_sorted.addRow("University Links:", self.ed_links)
+        self.form_sorted.addRow("Additional Info/Documents:", self.ed_additional)
+        # Consent
+        self.form_sorted.addRow("Printed Name, Title:", self.ed_printed_name_title)
+        self.form_sorted.addRow("Signature Date:", self.ed_sigdate)
+        # ISTQB internal
+        self.form_sorted.addRow("Receiving Member Board:", self.ed_receiving_member_board)
+        self.form_sorted.addRow("Date Received:", self.ed_date_received)
+        self.form_sorted.addRow("Validity Start Date:", self.ed_validity_start_date)
+        self.form_sorted.addRow("Validity End Date:", self.ed_validity_end_date)
+    
+        right_layout.addLayout(self.form_sorted)
+    
+        # Tlačítka + stav (DOPLNĚNO lbl_sorted_status)
+        btn_row = QHBoxLayout()
+        self.lbl_sorted_status = QLabel("—")  # DOPLNĚNO: používá _sorted_set_status(...)
+        self.btn_sorted_edit = QPushButton("Edit")
+        self.btn_sorted_save = QPushButton("Save to DB")
+        self.btn_sorted_export = QPushButton("Export…")
+        self.btn_sorted_rescan = QPushButton("Rescan Sorted")
+        btn_row.addWidget(self.lbl_sorted_status)   # jemný status vlevo
+        btn_row.addSpacing(12)
+        btn_row.addWidget(self.btn_sorted_edit)
+        btn_row.addWidget(self.btn_sorted_save)
+        btn_row.addStretch(1)
+        btn_row.addWidget(self.btn_sorted_export)
+        btn_row.addWidget(self.btn_sorted_rescan)
+        right_layout.addLayout(btn_row)
+    
+        self.btn_sorted_edit.clicked.connect(lambda: self._sorted_set_editable(True))
+        self.btn_sorted_save.clicked.connect(self._sorted_save_changes)
+        self.btn_sorted_export.clicked.connect(
+            lambda _checked=False: self._measured("export Sorted DB", self.export_sorted_db))
+        self.btn_sorted_rescan.clicked.connect(
+            lambda _checked=False: self._measured("refresh Sorted", self.rescan_sorted))
+    
+        # Výchozí – read-only; Board a File name vždy read-only
+        self._sorted_set_editable(False)
+    
+        # Osazení splitteru a layoutu
+        self.split_sorted.addWidget(self.tree_sorted)
+        self.split_sorted.addWidget(right)
+        self.split_sorted.setStretchFactor(0, 2)
+        self.split_sorted.setStretchFactor(1, 1)
+        layout.addWidget(self.split_sorted, 1)
+        self.sorted_tab.setLayout(layout)
+
+    def _sorted_db_path(self) -> Path:
+        return self.sorted_db.db_path
+
+    def _sorted_key_for(self, abs_path: Path) -> str:
+        return self.sorted_db.key_for(abs_path)
+
+    def _sorted_on_item_changed(self) -> None:
+        """Výběr ve stromu 'Sorted PDFs' → ulož kontext a naplň detail."""
+        from pathlib import Path
+        from PySide6.QtCore import Qt
+    
+        sel = self.tree_sorted.selectedItems()
+        if not sel:
+            self._sorted_fill_details(None)
+            return
+    
+        item = sel[0]
+        parent = item.parent()
+        board = parent.text(0) if parent else ""
+        file_name = item.text(0)
+    
+        db_key = item.data(0, Qt.UserRole)            # relativní klíč vůči sorted_root
+        abs_sorted = item.data(0, Qt.UserRole + 1)    # absolutní cesta v 'Sorted PDFs'
+    
+        # ulož pro _sorted_fill_details
+        self._sorted_sel_db_key = db_key or ""
+        self._sorted_sel_abs_sorted = abs_sorted or ""
+        self._sorted_sel_board = board or ""
+        self._sorted_sel_file_name = file_name or ""
+    
+        # preferuj ABS cestu v sorted_root, ale vlastní naplnění si ještě dopočítá kandidátní cesty
+        self._sorted_fill_details(Path(abs_sorted) if abs_sorted else None)
+
+    def _sorted_fill_details(self, abs_path: Optional[Path]) -> None:
+        from pathlib import Path
+    
+        def _set(w, val: str):
+            if hasattr(w, "setPlainText"):
+                w.setPlainText(val or "")
+            else:
+                w.setText(val or "")
+    
+        def _blank():
+            for w in (self.ed_board, self.ed_app_type, self.ed_inst_name, self.ed_cand_name,
+                      self.ed_rec_acad, self.ed_rec_cert, self.ed_fullname, self.ed_email,
+                      self.ed_phone, self.ed_address, self.ed_syllabi, self.ed_courses,
+                      self.ed_proof, self.ed_links, self.ed_additional,
+                      self.ed_printed_name_title, self.ed_sigdate,
+                      self.ed_receiving_member_board, self.ed_date_received,
+                      self.ed_validity_start_date, self.ed_validity_end_date):
+                _set(w, "")
+            _set(self.ed_filename, "")
+            self._sorted_set_editable(False)
+            self._sorted_set_status(None)
+    
+        if abs_path is None:
+            # zkusí si ještě složit kandidáty z uloženého kontextu
+            pass
+    
+        # 1) načti DB, pokud to jde (pouze pokud je cesta v sorted_root)
+        rec = None
+        try:
+            if abs_path is not None:
+                rec = self.sorted_db.get(abs_path)  # může vyžadovat path pod sorted_root
+        except Exception:
+            rec = None
+    
+        data = rec.get("data", {}) if rec else {}
+    
+        # 2) sestav KANDIDÁTNÍ cesty k PDF v pořadí:
+        #    a) původní cesta uložená v DB (data["path"])
+        #    b) absolutní cesta v sorted_root (UserRole+1 / abs_path)
+        #    c) odvozená cesta: pdf_root / <board> / <file_name>
+        candidates: list[Path] = []
+        if isinstance(data, dict):
+            p = data.get("path")
+            if p:
+                try:
+                    pp = Path(p)
+                    candidates.append(pp)
+                except Exception:
+                    pass
+    
+        if abs_path:
+            candidates.append(abs_path)
+    
+        try:
+            board = getattr(self, "_sorted_sel_board", "") or ""
+            fname = getattr(self, "_sorted_sel_file_name", "") or ""
+            if getattr(self, "pdf_root", None) and board and fname:
+                p3 = Path(self.pdf_root) / board / fname
+                candidates.append(p3)
+        except Exception:
+            pass
+    
+        # 3) pokud je DB nekompletní nebo prázdná, zkus parse prvního existujícího kandidáta
+        REQUIRED_KEYS = [
+            "board", "application_type", "institution_name", "candidate_name",
+            "recognition_academia", "recognition_certified",
+            "contact_full_name", "contact_email", "contact_phone", "contact_postal_address",
+            "syllabi_integration_description", "courses_modules_list",
+            "proof_of_istqb_certifications", "university_links", "additional_information_documents",
+            "printed_name_title", "signature_date",
+            "receiving_member_board", "date_received",
+            "validity_start_date", "validity_end_date",
+            "file_name",
+        ]
+    
+        def _is_incomplete(d: dict) -> bool:
+            if not d:
+                return True
+            for k in REQUIRED_KEYS:
+                if k not in d:  # klíč chybí → doplnit z parsingu
+                    return True
+            return False
+    
+        merged = dict(data) if isinstance(data, dict) else {}
+    
+        if _is_incomplete(merged):
+            try:
+                # projdi kandidáty, první existující zparsuj a doplň chybějící klíče
+                # (jen daný soubor: poslední sken / LRU / parsing jednoho PDF)
+                for cand in candidates:
+                    try:
+                        if not cand:
+                            continue
+                        cpath = Path(cand).resolve()
+                        if not cpath.exists():
+                            continue
+                        parsed_rec = self._parsed_record(cpath)
+                        if parsed_rec is not None:
+                            parsed = parsed_rec.to_dict()
+                            # slouč: existující DB hodnoty nechme, doplňme jen chybějící
+                            for k, v in parsed.items():
+                                if (k not in merged) or (merged.get(k) in (None, "")):
+                                    merged[k] = v
+                        if not _is_incomplete(merged):
+                            break
+                    except Exception:
+                        continue
+            except Exception:
+                pass  # když parse selže, zobrazíme co je
+    
+        # 4) Naplň UI — prázdné zůstává prázdné
+        def get(k: str) -> str:
+            return "" if not merged else str(merged.get(k, "") or "")
+    
+        _set(self.ed_board, get("board"))
+        _set(self.ed_app_type, get("application_type"))
+        _set(self.ed_inst_name, get("institution_name"))
+        _set(self.ed_cand_name, get("candidate_name"))
+        _set(self.ed_rec_acad, get("recognition_academia"))
+        _set(self.ed_rec_cert, get("recognition_certified"))
+        _set(self.ed_fullname, get("contact_full_name"))
+        _set(self.ed_email, get("contact_email"))
+        _set(self.ed_phone, get("contact_phone"))
+        _set(self.ed_address, get("contact_postal_address"))
+        _set(self.ed_syllabi, get("syllabi_integration_description"))
+        _set(self.ed_courses, get("courses_modules_list"))
+        _set(self.ed_proof, get("proof_of_istqb_certifications"))
+        _set(self.ed_links, get("university_links"))
+        _set(self.ed_additional, get("additional_information_documents"))
+        _set(self.ed_printed_name_title, get("printed_name_title"))
+        _set(self.ed_sigdate, get("signature_date"))
+        _set(self.ed_receiving_member_board, get("receiving_member_board"))
+        _set(self.ed_date_received, get("date_received"))
+        _set(self.ed_validity_start_date, get("validity_start_date"))
+        _set(self.ed_validity_end_date, get("validity_end_date"))
+        # File name: vždy smysluplná hodnota
+        fname = merged.get("file_name") if isinstance(merged, dict) else None
+        if not fname:
+            try:
+                fname = getattr(self, "_sorted_sel_file_name", "") or (abs_path.name if abs_path else "")
+            except Exception:
+                fname = ""
+        _set(self.ed_filename, fname)
+    
+        self._sorted_set_editable(False)
+        _identity_empty = not any(
+            get(k) for k in (
+                "candidate_name", "contact_full_name", "contact_email",
+                "contact_phone", "signature_date", "printed_name_title",
+            )
+        )
+        if rec and rec.get("edited"):
+            self._sorted_set_status("Edited")
+        elif bool(merged.get("needs_manual_entry")) or _identity_empty:
+            self._sorted_set_status("⚠ Scanned/empty form – fill in manually (Edit → Save to DB)")
+        else:
+            self._sorted_set_status("Parsed (unmodified)")
+        self._sorted_current_path = abs_path if abs_path else None
+
+    def _sorted_set_status(self, txt: Optional[str]) -> None:
+        self.lbl_sorted_status.setText("—" if not txt else txt)
+
+    def _sorted_set_editable(self, can_edit: bool) -> None:
+        # Board a File name necháme read-only; ostatní podle can_edit
+        ro_lines = (self.ed_board, self.ed_filename)
+        for w in ro_lines:
+            w.setReadOnly(True)
+    
+        lines = (self.ed_app_type, self.ed_inst_name, self.ed_cand_name,
+                 self.ed_rec_acad, self.ed_rec_cert, self.ed_fullname,
+                 self.ed_email, self.ed_phone,
+                 self.ed_printed_name_title, self.ed_sigdate,
+                 self.ed_receiving_member_board, self.ed_date_received,
+                 self.ed_validity_start_date, self.ed_validity_end_date)
+        for w in lines:
+            w.setReadOnly(not can_edit)
+    
+        texts = (self.ed_address, self.ed_syllabi, self.ed_courses,
+                 self.ed_proof, self.ed_links, self.ed_additional)
+        for w in texts:
+            w.setReadOnly(not can_edit)
+
+    def _sorted_save_changes(self) -> None:
+        from PySide6.QtWidgets import QMessageBox
+        from pathlib import Path
+    
+        abs_path = getattr(self, "_sorted_current_path", None)
+        if not abs_path:
+            QMessageBox.information(self, "Save to DB", "No PDF selected.")
+            return
+    
+        def _get(w):
+            return w.toPlainText() if hasattr(w, "toPlainText") else w.text()
+    
+        file_name_value = None
+        if hasattr(self, "ed_filename"):
+            try:
+                file_name_value = _get(self.ed_filename).strip()
+            except Exception:
+                file_name_value = None
+        if not file_name_value:
+            file_name_value = Path(abs_path).name  # fallback, aby to nikdy nepadalo
+    
+        new_data = {
+            "board": self.ed_board.text().strip(),
+            "application_type": _get(self.ed_app_type).strip(),
+            "institution_name": _get(self.ed_inst_name).strip(),
+            "candidate_name": _get(self.ed_cand_name).strip(),
+            "recognition_academia": _get(self.ed_rec_acad).strip(),
+            "recognition_certified": _get(self.ed_rec_cert).strip(),
+            "contact_full_name": _get(self.ed_fullname).strip(),
+            "contact_email": _get(self.ed_email).strip(),
+            "contact_phone": _get(self.ed_phone).strip(),
+            "contact_postal_address": _get(self.ed_address).strip(),
+            "syllabi_integration_description": _get(self.ed_syllabi).strip(),
+            "courses_modules_list": _get(self.ed_courses).strip(),
+            "proof_of_istqb_certifications": _get(self.ed_proof).strip(),
+            "university_links": _get(self.ed_links).strip(),
+            "additional_information_documents": _get(self.ed_additional).strip(),
+            # NOVÁ POLE
+            "printed_name_title": _get(self.ed_printed_name_title).strip(),
+            "signature_date": _get(self.ed_sigdate).strip(),
+            "receiving_member_board": _get(self.ed_receiving_member_board).strip(),
+            "date_received": _get(self.ed_date_received).strip(),
+            "validity_start_date": _get(self.ed_validity_start_date).strip(),
+            "validity_end_date": _get(self.ed_validity_end_date).strip(),
+            # meta
+            "file_name": file_name_value,
+            "path": str(Path(abs_path).resolve()),
+        }
+    
+        self.sorted_db.mark_edited(Path(abs_path), new_data)
+        self.sorted_db.save()
+
+        self._sorted_set_editable(False)
+        self._sorted_set_status("Edited")
+        # Promítni úpravu zpět do Overview (hodnoty + 'Edited' indikátor) a souhrn.
+        try:
+            self._overview_update_sorted_flags()
+            self._overview_apply_sorted_row_hiding()
+            self._overview_apply_statuses()
+            self._refresh_summary()
+        except Exception:
+            pass
+        try:
+            self.statusBar().showMessage("Saved to DB.")
+        except Exception:
+            pass
+
+    def _filter_board_sorted(self, txt: str) -> None:
+        from ..main_window import RecordsModel
+        proxy = self.table_sorted.model()
+        if isinstance(proxy, RecordsModel):
+            proxy.set_board(txt)
+
+    def _filter_text_sorted(self, txt: str) -> None:
+        from ..main_window import RecordsModel
+        proxy = self.table_sorted.model()
+        if isinstance(proxy, RecordsModel):
+            proxy.set_search(txt)
+
+    def _selected_sorted_record(self) -> Optional[PdfRecord]:
+        sel = self.table_sorted.selectionModel()
+        if not sel or not sel.hasSelection():
+            return None
+        index = sel.selectedRows()[0]
+        FILE_COL = 16
+        proxy = self.table_sorted.model()
+        if isinstance(proxy, QSortFilterProxyModel):
+            sidx = proxy.mapToSource(proxy.index(index.row(), FILE_COL))
+            src = proxy.sourceModel()
+        else:
+            sidx = index
+            src = self.table_sorted.model()
+        path_str = src.index(sidx.row(), FILE_COL).data(Qt.UserRole + 1)
+        for r in self.records_sorted:
+            if str(r.path) == path_str:
+                return r
+        return None
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .perf import append_jsonl
+
+# Log zaseknutí GUI vedle settings.json (rotace jako perf_log.jsonl)
+STALL_LOG_FILE = "stall_log.jsonl"
+# Jak často GUI vlákno „tepe“ a jak často to hlídací vlákno kontroluje
+HEARTBEAT_MS = 100
+# Kolik posledních zaseknutí drží ``GuiWatchdog.recent``
+RECENT_STALLS = 20
+
+
+def stall_log_path(settings_path: Path) -> Path:
+    """Log leží v config adresáři aplikace vedle settings.json."""
+    return Path(settings_path).parent / STALL_LOG_FILE
+
+
+class GuiWatchdog(QObject):
+    """Hlídá, zda event loop GUI vlákna nestojí.
+
+    QTimer v GUI vlákně každých ``HEARTBEAT_MS`` obnoví čas posledního tepu;
+    pracovní vlákno kontroluje, jak je starý. Když GUI stojí déle než
+    ``threshold_ms``, vezme přes ``sys._current_frames`` Python stack GUI
+    vlákna, určí aktivní handler (metody ``owner`` na stacku, např.
+    ``rescan > _rescan_overview > _refresh_summary``) a zapíše záznam do
+    JSONL logu. Po uvolnění GUI zapíše délku zaseknutí a vyšle ``stalled``
+    (v GUI vlákně, např. pro status bar).
+    """
+
+    # (sekundy zaseknutí, handler)
+    stalled = Signal(float, str)
+
+    def __init__(self, owner: object, threshold_ms: int, log_path: Optional[Path] = None,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.owner = owner
+        self.threshold = max(0.05, threshold_ms / 1000.0)
+        self.log_path = Path(log_path) if log_path else None
+        self.recent: Deque[dict] = deque(maxlen=RECENT_STALLS)
+        self._beat = time.monotonic()
+        self._gui_ident: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._heartbeat)
+
+    def start(self) -> None:
+        """Volat z GUI vlákna."""
+        if self._thread is not None:
+            return
+        self._gui_ident = threading.get_ident()
+        self._beat = time.monotonic()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="gui-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _heartbeat(self) -> None:
+        self._beat = time.monotonic()
+
+    # ---- hlídací vlákno ----
+
+    def _watch(self) -> None:
+        stall: Optional[dict] = None
+        while not self._stop.wait(HEARTBEAT_MS / 2000.0):
+            beat = self._beat
+            blocked = time.monotonic() - beat
+            if stall is None:
+                if blocked >= self.threshold:
+                    stall = self._capture(blocked)
+                    stall["_beat"] = beat
+                    self._log(stall, event="stall")
+            elif self._beat != stall["_beat"]:
+                # GUI se uvolnilo – celková délka = od posledního tepu po nový tep
+                duration = self._beat - stall["_beat"]
+                entry = {k: v for k, v in stall.items() if not k.startswith("_")}
+                entry["duration"] = round(duration, 3)
+                self.recent.append(entry)
+                self._log({k: v for k, v in entry.items() if k != "stack"}, event="stall_end")
+                try:
+                    self.stalled.emit(duration, stall.get("handler", ""))
+                except Exception:
+                    pass
+                stall = None
+
+    def _owner_codes(self) -> set:
+        # code objekty metod třídy okna vč. mixinů záložek z app.tabs, které
+        # MainWindow dědí (předka přidá _ensure_tab_built, proto se MRO čte až tady)
+        codes = set()
+        for cls in type(self.owner).__mro__:
+            if not cls.__module__.startswith("app."):
+                continue
+            for value in vars(cls).values():
+                code = getattr(value, "__code__", None)
+                if code is not None:
+                    codes.add(code)
+        return codes
+
+    def _capture(self, blocked: float) -> dict:
+        frame = sys._current_frames().get(self._gui_ident)
+        stack: List[str] = []
+        handlers: List[str] = []
+        if frame is not None:
+            stack = traceback.format_stack(frame)
+            codes = self._owner_codes()
+            f = frame
+            while f is not None:
+                if f.f_code in codes:
+                    handlers.append(f.f_code.co_name)
+                f = f.f_back
+        return {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "threshold": self.threshold,
+            "blocked": round(blocked, 3),
+            # vnější → vnitřní
+            "handler": " > ".join(reversed(handlers)),
+            "stack": "".join(stack),
+        }
+
+    def _log(self, entry: dict, event: str) -> None:
+        if self.log_path is None:
+            return
+        try:
+            append_jsonl(self.log_path, dict({k: v for k, v in entry.items() if not k.startswith("_")},
+                                             event=event))
+        except Exception:
+            pass
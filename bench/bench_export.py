@@ -0,0 +1,68 @@
+"""Peak memory of the streaming CSV/XLSX export engine vs. row count.
+
+Spuštění (z kořene repa):
+    python bench/bench_export.py [N ...]
+
+For each N writes N synthetic Overview rows (22 columns) through
+``app.export_engine.write_csv`` / ``write_xlsx`` from a generator and prints
+the tracemalloc peak. With streaming the peak should stay roughly flat as N
+grows (the XLSX writer keeps only the width sample in memory).
+
+Then compares writing CSV + XLSX one after another (two passes over the
+rows) with ``fan_out`` (one pass, both writers concurrently); the fan-out
+time should be close to the slower of the two formats, not their sum.
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.export_engine import Sink, fan_out, write_csv, write_xlsx  # noqa: E402
+from app.pdf_scanner import ROW_FIELDS  # noqa: E402
+
+
+def _rows(n: int) -> Iterator[List[str]]:
+    for i in range(n):
+        yield [f"{key}-{i}" for key in ROW_FIELDS]
+
+
+def measure(writer, path: str, n: int) -> tuple:
+    tracemalloc.start()
+    t = time.perf_counter()
+    writer(path, list(ROW_FIELDS), _rows(n))
+    dt = time.perf_counter() - t
+    _cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, dt
+
+
+def main(argv: List[str]) -> int:
+    sizes = [int(a) for a in argv[1:]] or [1_000, 10_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            for name, writer in (("csv", write_csv), ("xlsx", write_xlsx)):
+                peak, dt = measure(writer, f"{tmp}/out.{name}", n)
+                print(f"{name:4s} rows={n:>8d}  peak={peak / 2**20:7.2f} MiB  time={dt:6.2f} s")
+        for n in sizes:
+            heads = list(ROW_FIELDS)
+            t = time.perf_counter()
+            write_csv(f"{tmp}/seq.csv", heads, _rows(n))
+            write_xlsx(f"{tmp}/seq.xlsx", heads, _rows(n))
+            seq = time.perf_counter() - t
+            sinks = [Sink("csv", f"{tmp}/fan.csv", lambda r: write_csv(f"{tmp}/fan.csv", heads, r)),
+                     Sink("xlsx", f"{tmp}/fan.xlsx", lambda r: write_xlsx(f"{tmp}/fan.xlsx", heads, r))]
+            t = time.perf_counter()
+            fan_out(((None, row) for row in _rows(n)), sinks)
+            fan = time.perf_counter() - t
+            print(f"csv+xlsx rows={n:>8d}  sequential={seq:6.2f} s  fan-out={fan:6.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
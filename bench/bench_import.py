@@ -0,0 +1,91 @@
+"""Import time of ``app.main_window`` with a budget.
+
+Spuštění (z kořene repa):
+    python bench/bench_import.py [--runs N] [--budget SECONDS] [--top N]
+
+Each run is a fresh interpreter with ``-X importtime``. Reports the median
+wall time of ``import app.main_window``, the slowest imported modules
+(cumulative) and checks that modules which must stay lazy (PDF backends,
+openpyxl, ``app.tabs.*``) are not pulled in at import. Exits with status 1 when the
+median exceeds ``--budget`` (default 0.5 s) or a lazy module was imported,
+so it can guard against import-time regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+
+# nesmí se importovat spolu s hlavním oknem (načítají se až při použití)
+LAZY_PREFIXES = ("pypdf", "PyPDF2", "pdfminer", "openpyxl", "app.tabs")
+
+_CHILD = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import app.main_window\n"
+    "print('WALL', time.perf_counter() - t)\n"
+    "print('MODS', ' '.join(sorted(sys.modules)))\n"
+)
+
+
+def _run_once() -> tuple:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", _CHILD],
+                         cwd=REPO, env=env, capture_output=True, text=True, check=True)
+    wall = 0.0
+    mods: list = []
+    for line in out.stdout.splitlines():
+        if line.startswith("WALL "):
+            wall = float(line.split()[1])
+        elif line.startswith("MODS "):
+            mods = line.split()[1:]
+    cumulative = {}
+    for line in out.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative[parts[2].strip()] = int(parts[1])
+        except (IndexError, ValueError):
+            continue
+    return wall, mods, cumulative
+
+
+def main(argv: list) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget", type=float, default=0.5)
+    ap.add_argument("--top", type=int, default=10)
+    args = ap.parse_args(argv[1:])
+
+    walls = []
+    mods: list = []
+    cumulative: dict = {}
+    for i in range(max(1, args.runs)):
+        wall, mods, cumulative = _run_once()
+        walls.append(wall)
+        print(f"run {i + 1}: {wall:.3f} s")
+
+    print("slowest imports (cumulative, last run):")
+    for name, us in sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    lazy = [m for m in mods if m.startswith(LAZY_PREFIXES)]
+    if lazy:
+        print("imported eagerly (should be lazy): " + ", ".join(lazy))
+
+    median = statistics.median(walls)
+    ok = median <= args.budget and not lazy
+    print(f"median import app.main_window = {median:.3f} s (budget {args.budget:.3f} s) -> "
+          f"{'OK' if ok else 'OVER BUDGET'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
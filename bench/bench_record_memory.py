@@ -0,0 +1,120 @@
+"""Per-record memory footprint of PdfRecord (before/after __slots__ + interning).
+
+Spuštění (z kořene repa):
+    python bench/bench_record_memory.py [N]
+
+Builds N records with the legacy layout (plain dataclass with per-instance
+__dict__, no interning) and N with the current PdfRecord, measures both with
+tracemalloc and prints bytes per record. Values are built dynamically so that
+equal strings are distinct objects, the same way they come out of parsing.
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.pdf_scanner import PdfRecord  # noqa: E402
+
+BOARDS = ["CFTL", "CaSQB", "LTSTQB", "FISTB", "GTB", "HTB", "ISTQB-RU", "SSTQB"]
+APP_TYPES = ["New Application", "Additional Recognition"]
+
+
+@dataclass
+class LegacyPdfRecord:
+    """Layout PdfRecord před 0.16a (bez slots, bez internování)."""
+    board: str
+    path: Path
+    size_bytes: int
+    application_type: Optional[str]
+    institution_name: Optional[str]
+    candidate_name: Optional[str]
+    recognition_academia: Optional[str]
+    recognition_certified: Optional[str]
+    contact_full_name: Optional[str]
+    contact_email: Optional[str]
+    contact_phone: Optional[str]
+    contact_postal_address: Optional[str]
+    proof_of_istqb_certifications: Optional[str]
+    syllabi_integration_description: Optional[str]
+    courses_modules_list: Optional[str]
+    university_links: Optional[str]
+    additional_information_documents: Optional[str]
+    printed_name_title: Optional[str]
+    signature_date: Optional[str]
+    receiving_member_board: Optional[str]
+    date_received: Optional[str]
+    validity_start_date: Optional[str]
+    validity_end_date: Optional[str]
+    board_known: bool
+    needs_manual_entry: bool = False
+    content_hash: Optional[str] = None
+
+
+def _fresh(s: str) -> str:
+    # nový objekt se stejnou hodnotou (jako z parseru), ne literál z konstanty
+    return "".join(list(s))
+
+
+def _kwargs(i: int) -> dict:
+    board = BOARDS[i % len(BOARDS)]
+    return dict(
+        board=_fresh(board),
+        path=Path(f"/data/PDF/{board}/application_{i:06d}.pdf"),
+        size_bytes=200_000 + i,
+        application_type=_fresh(APP_TYPES[i % 2]),
+        institution_name=f"University {i % 500}",
+        candidate_name=f"Candidate {i}",
+        recognition_academia=_fresh("Yes" if i % 3 else "No"),
+        recognition_certified=_fresh("No" if i % 3 else "Yes"),
+        contact_full_name=f"Contact {i}",
+        contact_email=f"contact{i}@uni{i % 500}.edu",
+        contact_phone=f"+420 {i:09d}",
+        contact_postal_address=f"Street {i}, City",
+        proof_of_istqb_certifications=None,
+        syllabi_integration_description=None,
+        courses_modules_list=None,
+        university_links=None,
+        additional_information_documents=None,
+        printed_name_title=f"Contact {i}, Professor",
+        signature_date=_fresh(f"2025-0{1 + i % 9}-1{i % 10}"),
+        receiving_member_board=_fresh(board),
+        date_received=None,
+        validity_start_date=None,
+        validity_end_date=None,
+        board_known=True,
+        needs_manual_entry=False,
+        content_hash=f"{i:064x}",
+    )
+
+
+def measure(factory: Callable[..., object], n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items: List[object] = [factory(**_kwargs(i)) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del items
+    return grown / n
+
+
+def main(argv: List[str]) -> int:
+    n = int(argv[1]) if len(argv) > 1 else 100_000
+    legacy = measure(LegacyPdfRecord, n)
+    current = measure(PdfRecord, n)
+    print(f"records: {n}")
+    print(f"legacy  (dict, no interning): {legacy:8.0f} B/record  {legacy * n / 2**20:8.1f} MiB")
+    print(f"current (slots + interning):  {current:8.0f} B/record  {current * n / 2**20:8.1f} MiB")
+    print(f"saving: {100.0 * (1 - current / legacy):.1f} %")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
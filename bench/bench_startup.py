@@ -0,0 +1,88 @@
+"""Startup time of the main window (time to first paint) with a budget.
+
+Spuštění (z kořene repa):
+    python bench/bench_startup.py [PDF_ROOT] [--runs N] [--budget SECONDS]
+
+Each run is a fresh interpreter (``QT_QPA_PLATFORM=offscreen``, private config
+dir) that measures
+
+* ``import``  – ``import app.main_window``,
+* ``window``  – ``MainWindow(...)`` + ``show()`` + first event loop pass,
+* ``scan``    – until the background scan has repopulated the Overview.
+
+The first run starts without a snapshot; the following runs start from the
+snapshot written when the previous window closed (the normal warm start).
+Exits with status 1 when the median warm ``import + window`` time exceeds
+``--budget`` (default 1.5 s), so it can guard against startup regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _child(pdf_root: str) -> None:
+    t0 = time.perf_counter()
+    sys.path.insert(0, str(REPO))
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    import app.main_window as mw
+    t_import = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    w = mw.MainWindow(default_pdf_root=Path(pdf_root), cli_pdf_root=Path(pdf_root))
+    w.show()
+    app.processEvents()
+    t_window = time.perf_counter() - t1
+    cached_rows = len(w.store)
+
+    while not hasattr(w, "_bg_scan") or w._bg_scan is not None:
+        app.processEvents()
+        time.sleep(0.005)
+    t_scan = time.perf_counter() - t1
+    w.close()  # zapíše snapshot pro další běh
+    print(json.dumps({"import": t_import, "window": t_window, "scan": t_scan,
+                      "cached_rows": cached_rows, "rows": len(w.store)}))
+
+
+def main(argv: list) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("pdf_root", nargs="?", default=str(REPO / "PDF"))
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget", type=float, default=1.5)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv[1:])
+    if args.child:
+        _child(args.pdf_root)
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", XDG_CONFIG_HOME=tmp, HOME=tmp)
+        for i in range(max(2, args.runs)):
+            out = subprocess.run([sys.executable, __file__, args.pdf_root, "--child"],
+                                 env=env, cwd=tmp, capture_output=True, text=True, check=True)
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            results.append(r)
+            kind = "cold" if i == 0 else "warm"
+            print(f"run {i + 1} ({kind}): import={r['import']:.3f} s  window={r['window']:.3f} s  "
+                  f"scan done={r['scan']:.3f} s  rows at first paint={r['cached_rows']}/{r['rows']}")
+
+    warm = [r["import"] + r["window"] for r in results[1:]]
+    median = statistics.median(warm)
+    ok = median <= args.budget
+    print(f"median warm import+window = {median:.3f} s (budget {args.budget:.3f} s) -> {'OK' if ok else 'OVER BUDGET'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,297 @@
+"""Benchmark suite with stored baselines and a regression gate.
+
+Spuštění (z kořene repa):
+    python bench/bench_suite.py [--only SUBSTR,...] [--docs N] [--db-records N]
+                                [--gui-rows N] [--repeat R] [--tolerance 0.25]
+                                [--baseline bench/baselines.json] [--save-baseline]
+                                [--json OUT]
+
+Benchmarks (median of ``--repeat`` runs, on a synthetic corpus from
+``bench/synth_corpus.py`` in a temp dir):
+
+* ``parser.normalize_signature_date``   – 8 date formats × 2 500 calls,
+* ``parser.parse_application[acroform|flat]`` – text + fields of the corpus,
+* ``parser.extract_no_acroform_text``   – flattened texts only,
+* ``scanner.scan[workers=1|2|4|8]``      – ``PdfScanner(root, workers=n).scan()``,
+* ``sorted_db.save`` / ``sorted_db.load`` – JSON Sorted DB with N records,
+* ``gui.rescan`` / ``gui.model_fill``    – offscreen ``MainWindow.rescan()`` with
+  N ready records (total and the ``model fill`` phase from ``app.perf``).
+
+Results are compared with the baseline file; a benchmark slower than
+``baseline × (1 + tolerance)`` (and by more than 2 ms) is a regression and the
+script exits with status 1. Baselines are machine specific – regenerate them
+with ``--save-baseline`` on the reference machine.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines.json"
+# rozdíl pod touto hranicí se za regresi nepovažuje (šum u mikrobenchmarků)
+MIN_ABS_REGRESSION = 0.002
+# mikrobenchmarky se opakují, aby jeden vzorek trval aspoň tolik sekund
+MIN_SAMPLE = 0.2
+
+_DATES = ["2025-09-26", "26/09/2025", "2025.8.19", "21st March 2025", "March 21, 2025",
+          "2025 3 21", "  7 Sept 2024 ", "not a date"]
+
+
+def _median_time(fn: Callable[[], object], repeat: int, min_sample: float = 0.0) -> float:
+    """Median of ``repeat`` samples (seconds per one ``fn()`` call).
+
+    With ``min_sample`` the call is looped so that one sample lasts at least
+    that long – short microbenchmarks are otherwise dominated by noise.
+    """
+    loops = 1
+    if min_sample > 0:
+        t = time.perf_counter()
+        fn()
+        one = time.perf_counter() - t
+        loops = max(1, int(min_sample / one) + 1) if one > 0 else 1000
+    times = []
+    for _ in range(max(1, repeat)):
+        t = time.perf_counter()
+        for _i in range(loops):
+            fn()
+        times.append((time.perf_counter() - t) / loops)
+    return statistics.median(times)
+
+
+class Suite:
+    def __init__(self, tmp: Path, args) -> None:
+        self.tmp = tmp
+        self.args = args
+        self.corpus = tmp / "corpus"
+        self._generated = None
+        self._texts = None
+
+    # -- data --
+    def generated(self):
+        if self._generated is None:
+            from synth_corpus import generate_corpus
+            self._generated = generate_corpus(self.corpus, self.args.docs,
+                                              mix={"acroform": 70, "flat": 20, "blank": 10}, seed=7)
+        return self._generated
+
+    def texts(self) -> Dict[str, list]:
+        """(text, fields) po druzích – čtení PDF se do parser benchmarků nepočítá."""
+        if self._texts is None:
+            from app.pdf_io import PdfBlob
+            from app.pdf_parser import read_pdf_form_fields, read_pdf_text
+            self._texts = {"acroform": [], "flat": []}
+            for path, kind, _d in self.generated():
+                if kind in self._texts and len(self._texts[kind]) < 50:
+                    with PdfBlob.open(path) as blob:
+                        self._texts[kind].append((read_pdf_text(blob), read_pdf_form_fields(blob)))
+        return self._texts
+
+    # -- benchmarks --
+    def bench_normalize(self) -> dict:
+        from app.pdf_parser import normalize_signature_date
+        values = _DATES * 2500
+
+        def run():
+            for v in values:
+                normalize_signature_date(v)
+        return {"seconds": _median_time(run, self.args.repeat, MIN_SAMPLE), "n": len(values)}
+
+    def bench_parse(self, kind: str) -> dict:
+        from app.pdf_parser import parse_istqb_academia_application
+        items = self.texts()[kind]
+
+        def run():
+            for text, fields in items:
+                parse_istqb_academia_application(text, fields)
+        return {"seconds": _median_time(run, self.args.repeat, MIN_SAMPLE), "n": len(items)}
+
+    def bench_extract_flat(self) -> dict:
+        from app.pdf_parser import _extract_no_acroform_text
+        norms = [(t or "").replace("\xa0", " ") for t, _f in self.texts()["flat"]]
+
+        def run():
+            for n in norms:
+                _extract_no_acroform_text(n)
+        return {"seconds": _median_time(run, self.args.repeat, MIN_SAMPLE), "n": len(norms)}
+
+    def bench_scan(self, workers: int) -> dict:
+        from app.pdf_scanner import PdfScanner
+        self.generated()
+        n = {}
+
+        def run():
+            n["records"] = len(PdfScanner(self.corpus, workers=workers).scan())
+        # sken je drahý → nejvýš 3 opakování
+        return {"seconds": _median_time(run, min(3, self.args.repeat)), "n": n["records"]}
+
+    def _db_records(self) -> list:
+        from synth_corpus import fake_form
+        import random
+        rng = random.Random(3)
+        out = []
+        for i in range(self.args.db_records):
+            d = fake_form(rng, "CaSQB")
+            data = {k: v for k, v in dataclasses.asdict(d).items() if k != "blank"}
+            out.append((f"{d.board}/app_{i:06d}.pdf", d.board, data))
+        return out
+
+    def bench_db_save(self) -> dict:
+        from app.sorted_db import SortedDb
+        root = self.tmp / "sorted"
+        root.mkdir(exist_ok=True)
+        db = SortedDb(root)
+        db.load()
+        with db.batch():
+            for rel, board, data in self._db_records():
+                db.upsert_parsed(root / rel, board, Path(rel).name, data, content_hash="0" * 64)
+        return {"seconds": _median_time(db.save, self.args.repeat), "n": self.args.db_records}
+
+    def bench_db_load(self) -> dict:
+        from app.sorted_db import SortedDb
+        root = self.tmp / "sorted"
+        if not (root / "sorted_db.json").exists():
+            self.bench_db_save()
+
+        def run():
+            SortedDb(root).load()
+        return {"seconds": _median_time(run, self.args.repeat), "n": self.args.db_records}
+
+    def bench_gui(self) -> Dict[str, dict]:
+        from PySide6.QtWidgets import QApplication
+        from app.pdf_scanner import PdfScanner
+        app = QApplication.instance() or QApplication([])
+        from app.main_window import MainWindow
+
+        base = PdfScanner(self.corpus).scan() if self.generated() else []
+        records = []
+        for i in range(self.args.gui_rows):
+            rec = base[i % len(base)]
+            records.append(dataclasses.replace(rec, path=rec.path.with_name(f"{i:06d}_{rec.path.name}")))
+        w = MainWindow(default_pdf_root=self.corpus, cli_pdf_root=self.corpus)
+        while getattr(w, "_bg_scan", 0) is not None:  # dokonči úvodní sken na pozadí
+            app.processEvents()
+            time.sleep(0.005)
+        totals, fills = [], []
+        for _ in range(max(1, min(3, self.args.repeat))):
+            t = time.perf_counter()
+            w.rescan(records=records, stats={})
+            totals.append(time.perf_counter() - t)
+            phases = {n: s for n, s, _c in w.perf.recent[-1].phases}
+            fills.append(phases.get("model fill", 0.0))
+        w.close()
+        # okno zrušit ještě za běhu QApplication (jinak pád při finalizaci interpretu)
+        w.deleteLater()
+        app.processEvents()
+        del w
+        n = len(records)
+        return {"gui.rescan": {"seconds": statistics.median(totals), "n": n},
+                "gui.model_fill": {"seconds": statistics.median(fills), "n": n}}
+
+    def plan(self) -> Dict[str, Callable[[], object]]:
+        plan: Dict[str, Callable[[], object]] = {
+            "parser.normalize_signature_date": self.bench_normalize,
+            "parser.parse_application[acroform]": lambda: self.bench_parse("acroform"),
+            "parser.parse_application[flat]": lambda: self.bench_parse("flat"),
+            "parser.extract_no_acroform_text": self.bench_extract_flat,
+        }
+        for n in (1, 2, 4, 8):
+            plan[f"scanner.scan[workers={n}]"] = (lambda n=n: self.bench_scan(n))
+        plan["sorted_db.save"] = self.bench_db_save
+        plan["sorted_db.load"] = self.bench_db_load
+        plan["gui.*"] = self.bench_gui
+        return plan
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Vypíše tabulku proti baseline; vrací názvy regresí."""
+    regressions = []
+    print(f"{'benchmark':42s} {'seconds':>10s} {'baseline':>10s} {'ratio':>7s}")
+    for name, r in results.items():
+        b = baseline.get(name)
+        if not b:
+            print(f"{name:42s} {r['seconds']:10.4f} {'—':>10s} {'new':>7s}")
+            continue
+        ratio = r["seconds"] / b["seconds"] if b["seconds"] > 0 else 1.0
+        bad = ratio > 1.0 + tolerance and r["seconds"] - b["seconds"] > MIN_ABS_REGRESSION
+        if bad:
+            regressions.append(name)
+        print(f"{name:42s} {r['seconds']:10.4f} {b['seconds']:10.4f} {ratio:6.2f}x" + ("  REGRESSION" if bad else ""))
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--only", default="", help="comma separated substrings of benchmark names")
+    ap.add_argument("--docs", type=int, default=200)
+    ap.add_argument("--db-records", type=int, default=10_000)
+    ap.add_argument("--gui-rows", type=int, default=2_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--json", default=None, help="write results to this file")
+    args = ap.parse_args(argv[1:])
+
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # GUI: offscreen, vlastní config a pracovní adresář (nic se nezapíše mimo tmp)
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        os.environ["XDG_CONFIG_HOME"] = str(Path(tmp) / "config")
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            suite = Suite(Path(tmp), args)
+            for name, fn in suite.plan().items():
+                if only and not any(s in name for s in only):
+                    continue
+                out = fn()
+                for key, r in (out.items() if name.endswith("*") else [(name, out)]):
+                    results[key] = r
+                    per = r["seconds"] / r["n"] * 1e6 if r.get("n") else 0.0
+                    print(f"  {key:42s} {r['seconds']:10.4f} s  ({r.get('n', 0)} items, {per:.1f} µs/item)", flush=True)
+        finally:
+            os.chdir(cwd)
+
+    meta = {"python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count(), "docs": args.docs, "db_records": args.db_records,
+            "gui_rows": args.gui_rows, "date": time.strftime("%Y-%m-%d")}
+    if args.json:
+        Path(args.json).write_text(json.dumps({"meta": meta, "results": results}, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    baseline: Dict[str, dict] = {}
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("results", {})
+    except Exception:
+        pass
+    print()
+    regressions = compare(results, baseline, args.tolerance)
+    if args.save_baseline:
+        merged = dict(baseline)
+        merged.update({k: {"seconds": round(v["seconds"], 6), "n": v.get("n")} for k, v in results.items()})
+        baseline_path.write_text(json.dumps({"meta": meta, "results": merged}, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline saved -> {baseline_path}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("no regressions" if baseline else "no baseline (run with --save-baseline)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
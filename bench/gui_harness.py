@@ -0,0 +1,221 @@
+"""Offscreen Qt harness for the MainWindow hot paths.
+
+Spuštění (z kořene repa):
+    python bench/gui_harness.py [--docs N] [--rows N] [--repeat R] [--only NAME,...]
+                                [--profile DIR] [--top N] [--no-alloc] [--json OUT]
+
+Builds ``MainWindow`` under ``QT_QPA_PLATFORM=offscreen`` in a temp dir
+(own config dir and working dir, so nothing outside it is touched) against a
+synthetic corpus from ``bench/synth_corpus.py``. Every second PDF is copied
+into the Sorted PDFs DB, and the Recognized People list gets one row per
+document. Then these paths are driven directly:
+
+* ``rescan``                         – Overview from ``--rows`` ready records,
+* ``_overview_update_sorted_flags``  – Sorted column / overlay,
+* ``_recognized_rebuild_model``      – Recognized People model from JSON,
+* ``rescan_sorted``                  – full rebuild of the Sorted PDFs tree,
+* ``_apply_browser_sizes``           – PDF Browser column fit.
+
+For each path it reports the median wall time of ``--repeat`` calls (pending
+Qt events included), and from one extra call under ``tracemalloc`` the peak
+and retained allocations. With ``--profile DIR`` one more call runs under
+cProfile; it is dumped to ``DIR/<path>.prof``, and the top functions by
+cumulative time are printed.
+"""
+from __future__ import annotations
+
+import argparse
+import cProfile
+import dataclasses
+import gc
+import json
+import os
+import pstats
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+PATHS = ("rescan", "_overview_update_sorted_flags", "_recognized_rebuild_model",
+         "rescan_sorted", "_apply_browser_sizes")
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:.0f}"
+
+
+class Harness:
+    def __init__(self, tmp: Path, docs: int, rows: int) -> None:
+        from PySide6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication([])
+        self.tmp = tmp
+        self.corpus = tmp / "corpus"
+        self._prepare(docs)
+        from app.main_window import MainWindow
+        self.w = MainWindow(default_pdf_root=self.corpus, cli_pdf_root=self.corpus)
+        # Recognized People JSON jinak leží vedle repa
+        self.w._recognized_json_path = lambda: tmp / "recognized_people.json"
+        self._settle()
+        for tab in (self.w.browser_tab, self.w.sorted_tab, self.w.recognized_tab):
+            self.w._ensure_tab_built(tab)
+        self._settle()
+        base = list(self.w.records)
+        self.records = [dataclasses.replace(base[i % len(base)],
+                                            path=base[i % len(base)].path.with_name(f"{i:06d}_{base[i % len(base)].path.name}"))
+                        for i in range(rows)] if base else []
+
+    def _prepare(self, docs: int) -> None:
+        """Korpus, Sorted PDFs (každý druhý soubor) a recognized_people.json."""
+        import hashlib
+        from synth_corpus import generate_corpus
+        from app.pdf_scanner import PdfScanner
+        from app.sorted_db import SortedDb
+        generated = generate_corpus(self.corpus, docs, mix={"acroform": 70, "flat": 20, "blank": 10}, seed=11)
+        sorted_root = self.tmp / "Sorted PDFs"  # výchozí sorted_root = cwd / "Sorted PDFs"
+        db = SortedDb(sorted_root)
+        db.load()
+        by_path = {r.path: r for r in PdfScanner(self.corpus).scan()}
+        with db.batch():
+            for path, _kind, _d in generated[::2]:
+                rec = by_path.get(path)
+                if rec is None:
+                    continue
+                dest = sorted_root / rec.board / path.name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, dest)
+                data = rec.to_dict()
+                data["file_name"] = path.name
+                db.upsert_parsed(dest, rec.board, path.name, data,
+                                 content_hash=hashlib.sha256(dest.read_bytes()).hexdigest())
+        db.save()
+        people = [{"board": d.board, "full_name": d.contact_full_name, "email": d.contact_email,
+                   "address": d.contact_postal_address,
+                   "recognition_date": "2025-03-21", "academia": i % 2 == 0, "certified": i % 3 == 0,
+                   "badge_link": ""} for i, (_p, _k, d) in enumerate(generated)]
+        (self.tmp / "recognized_people.json").write_text(json.dumps(people), encoding="utf-8")
+
+    def _settle(self) -> None:
+        """Dokončí sken na pozadí a odložené události (QTimer.singleShot apod.)."""
+        while getattr(self.w, "_bg_scan", None) is not None:
+            self.app.processEvents()
+            time.sleep(0.005)
+        self.app.processEvents()
+
+    def call(self, name: str) -> Callable[[], None]:
+        w = self.w
+        if name == "rescan":
+            def fn():
+                w.rescan(records=self.records, stats={})
+        elif name == "rescan_sorted":
+            def fn():
+                w._sorted_tree_db = None  # jinak je strom aktuální a nic se nedělá
+                w.rescan_sorted()
+        else:
+            method = getattr(w, name)
+
+            def fn():
+                method()
+
+        def run():
+            fn()
+            self.app.processEvents()
+        return run
+
+    def measure(self, name: str, repeat: int, alloc: bool, profile_dir: Optional[Path], top: int) -> dict:
+        run = self.call(name)
+        run()  # zahřátí (líné importy, první layout)
+        times = []
+        for _ in range(max(1, repeat)):
+            gc.collect()
+            t = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - t)
+        out = {"seconds": statistics.median(times), "min": min(times), "repeat": len(times)}
+        if alloc:
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            run()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            out["alloc_peak"] = peak - before
+            out["alloc_retained"] = current - before
+        if profile_dir is not None:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            prof = cProfile.Profile()
+            prof.runcall(run)
+            dump = profile_dir / f"{name.strip('_')}.prof"
+            prof.dump_stats(str(dump))
+            out["profile"] = str(dump)
+            print(f"\n== {name} (cProfile, top {top} by cumulative time) ==")
+            pstats.Stats(prof).sort_stats("cumulative").print_stats(top)
+        return out
+
+    def close(self) -> None:
+        self.w.close()
+        # okno zrušit ještě za běhu QApplication (jinak pád při finalizaci interpretu)
+        self.w.deleteLater()
+        self.app.processEvents()
+        del self.w
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--docs", type=int, default=300, help="synthetic PDFs in the corpus")
+    ap.add_argument("--rows", type=int, default=2000, help="records passed to rescan()")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--only", default="", help="comma separated path names")
+    ap.add_argument("--profile", default=None, help="directory for cProfile dumps")
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc run")
+    ap.add_argument("--json", default=None, help="write results to this file")
+    args = ap.parse_args(argv[1:])
+
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    unknown = [s for s in only if s not in PATHS]
+    if unknown:
+        ap.error(f"unknown path(s): {', '.join(unknown)}; choose from {', '.join(PATHS)}")
+    profile_dir = Path(args.profile).resolve() if args.profile else None
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        os.environ["XDG_CONFIG_HOME"] = str(Path(tmp) / "config")
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            h = Harness(Path(tmp), args.docs, args.rows)
+            print(f"corpus {args.docs} PDFs, {len(h.records)} rescan rows, "
+                  f"Sorted DB {len(list(h.w.sorted_db.iter_items()))} records")
+            for name in PATHS:
+                if only and name not in only:
+                    continue
+                results[name] = h.measure(name, args.repeat, not args.no_alloc, profile_dir, args.top)
+            h.close()
+        finally:
+            os.chdir(cwd)
+
+    print()
+    head = f"{'path':32s} {'median s':>9s} {'min s':>8s}"
+    if not args.no_alloc:
+        head += f" {'peak KiB':>9s} {'kept KiB':>9s}"
+    print(head)
+    for name, r in results.items():
+        row = f"{name:32s} {r['seconds']:9.4f} {r['min']:8.4f}"
+        if "alloc_peak" in r:
+            row += f" {_kib(r['alloc_peak']):>9s} {_kib(r['alloc_retained']):>9s}"
+        print(row)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,344 @@
+"""Synthetic ISTQB Academia application forms for benchmarks (no real applicant data).
+
+Spuštění (z kořene repa):
+    python bench/synth_corpus.py OUT_DIR [-n N] [--boards B1,B2,...]
+                                 [--mix acroform=70,flat=15,blank=10,attach=5]
+                                 [--attachment-mb MB] [--seed S] [--verify K]
+
+Writes ``OUT_DIR/<board>/<kind>_<n>.pdf`` with a tiny dependency-free PDF
+writer (Helvetica text layer, AcroForm widgets, embedded files). Kinds:
+
+* ``acroform`` – filled AcroForm fields (same field names as the real form),
+* ``flat``     – flattened form, values only in the text layer (the layout
+  the no-AcroForm fallback of ``parse_istqb_academia_application`` reads),
+* ``blank``    – AcroForm with most fields left empty,
+* ``attach``   – filled AcroForm plus an incompressible embedded attachment
+  of ``--attachment-mb`` MiB (large-file path: mmap, hashing).
+
+Output is deterministic for a given ``--seed``. ``--verify K`` parses K
+generated files with ``PdfScanner`` and reports how many fields came back
+as generated, per kind. Other bench scripts import ``generate_corpus``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+KINDS = ("acroform", "flat", "blank", "attach")
+DEFAULT_MIX = {"acroform": 70, "flat": 15, "blank": 10, "attach": 5}
+DEFAULT_BOARDS = ("CaSQB", "GTB", "CFTL", "UKITB", "SSTQB", "PSTB", "ISTB", "HTB")
+
+_FIRST = ["Jana", "Petr", "Marie", "Tomas", "Eva", "Lukas", "Anna", "Martin", "Sophie", "Jan",
+          "Laura", "David", "Elena", "Pavel", "Claire", "Marco", "Ines", "Karel", "Olga", "Hugo"]
+_LAST = ["Novak", "Svoboda", "Dvorak", "Muller", "Schmidt", "Dubois", "Rossi", "Garcia",
+         "Kowalski", "Nielsen", "Horvath", "Popescu", "Papadopoulos", "Smith", "Lefebvre", "Bauer"]
+_CITIES = ["Prague", "Brno", "Berlin", "Paris", "Lyon", "London", "Madrid", "Warsaw",
+           "Rome", "Athens", "Vienna", "Munich", "Ostrava", "Krakow", "Milan", "Seville"]
+_SCHOOLS = ["University of {c}", "{c} University of Technology", "Technical University {c}",
+            "{c} School of Applied Sciences", "Polytechnic of {c}"]
+_TITLES = ["Professor", "Associate Professor", "Dean", "Head of Department", "Lecturer"]
+_MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August",
+           "September", "October", "November", "December"]
+
+
+@dataclass
+class FormData:
+    board: str
+    application_type: str
+    institution_name: str
+    candidate_name: str
+    recognition_academia: bool
+    recognition_certified: bool
+    contact_full_name: str
+    contact_email: str
+    contact_phone: str
+    contact_postal_address: str
+    syllabi_integration_description: str
+    courses_modules_list: str
+    proof_of_istqb_certifications: str
+    university_links: str
+    additional_information_documents: str
+    printed_name_title: str
+    signature_date: str  # ISO
+    blank: Dict[str, bool] = field(default_factory=dict)
+
+
+def fake_form(rng: random.Random, board: str) -> FormData:
+    city = rng.choice(_CITIES)
+    school = rng.choice(_SCHOOLS).format(c=city)
+    first, last = rng.choice(_FIRST), rng.choice(_LAST)
+    name = f"{first} {last}"
+    dom = school.lower().replace(" of ", " ").replace(" ", "-")[:24].strip("-") + ".edu"
+    y, m, d = 2024 + rng.randint(0, 1), rng.randint(1, 12), rng.randint(1, 28)
+    courses = "\n".join(f"{rng.choice(['Software Testing', 'Test Automation', 'Quality Engineering', 'Agile Testing'])} "
+                        f"{rng.randint(1, 4)} ({rng.randint(2, 8)} ECTS)" for _ in range(rng.randint(1, 4)))
+    return FormData(
+        board=board,
+        application_type=rng.choice(["New Application", "Additional Recognition", "Renewal"]),
+        institution_name=school,
+        candidate_name=name,
+        recognition_academia=rng.random() < 0.8,
+        recognition_certified=rng.random() < 0.4,
+        contact_full_name=name if rng.random() < 0.7 else f"{rng.choice(_FIRST)} {rng.choice(_LAST)}",
+        contact_email=f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@{dom}",
+        contact_phone=f"+420 {rng.randint(600, 799)} {rng.randint(100, 999)} {rng.randint(100, 999)}",
+        contact_postal_address=f"{rng.choice(['Main', 'Station', 'College', 'Park'])} Street {rng.randint(1, 200)}, "
+                               f"{rng.randint(10000, 99999)} {city}",
+        syllabi_integration_description="ISTQB Foundation Level syllabus is integrated into the "
+                                        f"{rng.choice(['bachelor', 'master'])} curriculum.",
+        courses_modules_list=courses,
+        proof_of_istqb_certifications=f"{rng.randint(1, 5)} lecturers hold CTFL certificates",
+        university_links=f"https://www.{dom}/testing https://www.{dom}/courses",
+        additional_information_documents=f"Course catalogue {y}",
+        printed_name_title=f"{name}, {rng.choice(_TITLES)}",
+        signature_date=f"{y:04d}-{m:02d}-{d:02d}",
+    )
+
+
+# ---- minimální PDF writer ----
+
+def _pdf_str(s: str) -> bytes:
+    b = s.encode("cp1252", "replace")
+    return b"(" + b.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").replace(b"\r", b"").replace(b"\n", b"\\n") + b")"
+
+
+class _PdfWriter:
+    """Objekty se číslují v pořadí ``add``; ``save`` dopíše xref a trailer."""
+
+    def __init__(self) -> None:
+        self.objs: List[Optional[bytes]] = []
+
+    def reserve(self) -> int:
+        self.objs.append(None)
+        return len(self.objs)
+
+    def set(self, num: int, body: bytes) -> None:
+        self.objs[num - 1] = body
+
+    def add(self, body: bytes) -> int:
+        self.objs.append(body)
+        return len(self.objs)
+
+    def stream(self, data: bytes, extra: bytes = b"", compress: bool = True) -> int:
+        if compress:
+            data = zlib.compress(data, 6)
+            extra += b" /Filter /FlateDecode"
+        return self.add(b"<< /Length %d%s >>\nstream\n" % (len(data), extra) + data + b"\nendstream")
+
+    def save(self, path: Path, root: int) -> int:
+        out = bytearray(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for i, body in enumerate(self.objs, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % i + (body or b"null") + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(self.objs) + 1)
+        for off in offsets:
+            out += b"%010d 00000 n \n" % off
+        out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(self.objs) + 1, root, xref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(bytes(out))
+        return len(out)
+
+
+def _text_lines(d: FormData, flat: bool) -> List[str]:
+    if flat:
+        # bloky hodnot bez labelů – layout, který čte fallback bez AcroForm
+        return [
+            "ISTQB Academia Recognition Program - Application Form",
+            "1. Application",
+            f"Application Type: {d.application_type}",
+            "2. Name of Your Academic Institution",
+            d.institution_name, d.candidate_name, d.contact_full_name,
+            d.contact_email, d.contact_phone, d.contact_postal_address,
+            "5. Eligibility Evidence",
+            f"University website links: {d.university_links}",
+            f"Any additional relevant information or documents: {d.additional_information_documents}",
+            "",
+            "6. Declaration and Consent",
+            d.printed_name_title,
+            d.signature_date,
+        ]
+    return [
+        "ISTQB Academia Recognition Program - Application Form",
+        "1. Application Type",
+        "2. Name of Your Academic Institution",
+        "3. Wished Recognitions",
+        "4. Contact details for Information exchange",
+        "5. Eligibility Evidence",
+        "6. Declaration and Consent",
+        "7. For ISTQB Academia Purpose Only",
+    ]
+
+
+def _acro_fields(d: FormData) -> List[Tuple[str, str, object]]:
+    """(typ, název pole, hodnota) – názvy polí jako ve skutečném formuláři."""
+    b = d.blank
+    v = lambda key, val: "" if b.get(key) else val  # noqa: E731
+    return [
+        ("Tx", "Application Type", v("application_type", d.application_type)),
+        ("Tx", "Name of University, High or Technical School", v("institution_name", d.institution_name)),
+        ("Tx", "Name of Candidate", v("candidate_name", d.candidate_name)),
+        ("Btn", "AcademiaRecognitionCheck", d.recognition_academia and not b.get("recognition_academia")),
+        ("Btn", "CertifiedRecognitionCheck", d.recognition_certified and not b.get("recognition_certified")),
+        ("Tx", "Contact Name (Full Name)", v("contact_full_name", d.contact_full_name)),
+        ("Tx", "Contact Email", v("contact_email", d.contact_email)),
+        ("Tx", "Contact Phone", v("contact_phone", d.contact_phone)),
+        ("Tx", "Postal Address", v("contact_postal_address", d.contact_postal_address)),
+        ("Tx", "Description of how syllabi are integrated",
+         v("syllabi_integration_description", d.syllabi_integration_description)),
+        ("Tx", "List of courses and modules", v("courses_modules_list", d.courses_modules_list)),
+        ("Tx", "Proof of ISTQB Certifications", v("proof_of_istqb_certifications", d.proof_of_istqb_certifications)),
+        ("Tx", "University website links", v("university_links", d.university_links)),
+        ("Tx", "Additional relevant information or documents",
+         v("additional_information_documents", d.additional_information_documents)),
+        ("Tx", "Signature Date", v("signature_date", d.signature_date)),
+        ("Tx", "Printed Name, Title", v("printed_name_title", d.printed_name_title)),
+        ("Tx", "Receiving Member Board", ""),
+        ("Tx", "Date Received", ""),
+        ("Tx", "Validity Start Date", ""),
+        ("Tx", "Validity End Date", ""),
+    ]
+
+
+def write_application_pdf(path: Path, d: FormData, kind: str, attachment: bytes = b"") -> int:
+    """Zapíše jeden formulář; vrací velikost souboru v bajtech."""
+    w = _PdfWriter()
+    catalog = w.reserve()
+    pages = w.reserve()
+    page = w.reserve()
+    font = w.add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    lines = _text_lines(d, flat=(kind == "flat"))
+    content = bytearray(b"BT /F1 10 Tf 14 TL 50 800 Td\n")
+    for ln in lines:
+        content += _pdf_str(ln) + b" Tj T*\n"
+    content += b"ET\n"
+    contents = w.stream(bytes(content))
+
+    annots: List[int] = []
+    if kind != "flat":
+        y = 760
+        for ft, name, value in _acro_fields(d):
+            rect = b"[300 %d 560 %d]" % (y, y + 16)
+            if ft == "Btn":
+                state = b"/Yes" if value else b"/Off"
+                body = (b"<< /Type /Annot /Subtype /Widget /FT /Btn /T %s /V %s /AS %s /Rect %s /P %d 0 R /F 4 >>"
+                        % (_pdf_str(name), state, state, rect, page))
+            else:
+                body = (b"<< /Type /Annot /Subtype /Widget /FT /Tx /T %s /V %s /Rect %s /P %d 0 R /F 4 /DA (/F1 9 Tf 0 g) >>"
+                        % (_pdf_str(name), _pdf_str(str(value)), rect, page))
+            annots.append(w.add(body))
+            y -= 22
+
+    annot_refs = b" ".join(b"%d 0 R" % a for a in annots)
+    w.set(page, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] /Contents %d 0 R "
+                b"/Resources << /Font << /F1 %d 0 R >> >>%s >>"
+          % (pages, contents, font, (b" /Annots [" + annot_refs + b"]") if annots else b""))
+    w.set(pages, b"<< /Type /Pages /Kids [%d 0 R] /Count 1 >>" % page)
+
+    extra = b""
+    if annots:
+        extra += b" /AcroForm << /Fields [%s] /NeedAppearances true /DR << /Font << /F1 %d 0 R >> >> >>" % (
+            annot_refs, font)
+    if attachment:
+        ef = w.stream(attachment, b" /Type /EmbeddedFile", compress=False)
+        spec = w.add(b"<< /Type /Filespec /F (evidence.bin) /UF (evidence.bin) /EF << /F %d 0 R >> >>" % ef)
+        extra += b" /Names << /EmbeddedFiles << /Names [(evidence.bin) %d 0 R] >> >>" % spec
+    w.set(catalog, b"<< /Type /Catalog /Pages %d 0 R%s >>" % (pages, extra))
+    return w.save(Path(path), catalog)
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        k, _, v = part.partition("=")
+        k = k.strip()
+        if k not in KINDS:
+            raise ValueError(f"unknown kind {k!r} (expected one of {', '.join(KINDS)})")
+        mix[k] = int(v or 1)
+    return mix
+
+
+def generate_corpus(out: Path, n: int, boards: Sequence[str] = DEFAULT_BOARDS,
+                    mix: Optional[Dict[str, int]] = None, seed: int = 0,
+                    attachment_mb: float = 4.0) -> List[Tuple[Path, str, FormData]]:
+    """Vygeneruje ``n`` formulářů rovnoměrně do ``boards``; druh podle vah ``mix``.
+    Vrací (cesta, druh, data) – pro ověření výsledku parsingu."""
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    kinds, weights = list(mix), [mix[k] for k in mix]
+    # jedna sdílená příloha (náhodná → nekomprimovatelná); soubory se liší hlavičkou
+    attach_blob = random.Random(seed + 1).randbytes(int(attachment_mb * 1024 * 1024)) if "attach" in mix else b""
+    out = Path(out)
+    result = []
+    for i in range(n):
+        board = boards[i % len(boards)]
+        kind = rng.choices(kinds, weights)[0]
+        d = fake_form(rng, board)
+        if kind == "blank":
+            d.blank = {k: rng.random() < 0.8 for k in d.__dataclass_fields__ if k not in ("board", "blank")}
+        path = out / board / f"{kind}_{i:06d}.pdf"
+        write_application_pdf(path, d, kind, attach_blob if kind == "attach" else b"")
+        result.append((path, kind, d))
+    return result
+
+
+_CHECK = ("institution_name", "candidate_name", "contact_email", "contact_phone",
+          "contact_postal_address", "signature_date", "printed_name_title")
+
+
+def verify(generated: List[Tuple[Path, str, FormData]], k: int) -> Dict[str, Tuple[int, int]]:
+    """Naparsuje prvních ``k`` souborů a spočítá (shodná pole, kontrolovaná pole) po druzích."""
+    from app.pdf_scanner import PdfScanner
+    scanner = PdfScanner(None)
+    stats: Dict[str, List[int]] = {}
+    for path, kind, d in generated[:k]:
+        rec = scanner._parse_one(path)
+        st = stats.setdefault(kind, [0, 0])
+        for key in _CHECK:
+            expected = "" if d.blank.get(key) else getattr(d, key)
+            st[0] += (getattr(rec, key) or "") == expected
+            st[1] += 1
+    return {k: (v[0], v[1]) for k, v in stats.items()}
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("out")
+    ap.add_argument("-n", type=int, default=1000)
+    ap.add_argument("--boards", default=",".join(DEFAULT_BOARDS))
+    ap.add_argument("--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()))
+    ap.add_argument("--attachment-mb", type=float, default=4.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--verify", type=int, default=0, metavar="K")
+    args = ap.parse_args(argv[1:])
+
+    boards = [b.strip() for b in args.boards.split(",") if b.strip()]
+    t = time.perf_counter()
+    generated = generate_corpus(Path(args.out), args.n, boards, parse_mix(args.mix), args.seed, args.attachment_mb)
+    dt = time.perf_counter() - t
+    counts: Dict[str, int] = {}
+    for _p, kind, _d in generated:
+        counts[kind] = counts.get(kind, 0) + 1
+    size = sum(p.stat().st_size for p, _k, _d in generated)
+    print(f"{len(generated)} PDFs in {len(boards)} boards ({', '.join(f'{k}={v}' for k, v in counts.items())}), "
+          f"{size / 2**20:.1f} MiB, {dt:.2f} s -> {args.out}")
+    if args.verify:
+        for kind, (ok, total) in sorted(verify(generated, args.verify).items()):
+            print(f"verify {kind:8s}: {ok}/{total} fields parsed as generated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))